@@ -0,0 +1,2 @@
+export PYTHONPATH=$PWD/func:$PWD
+python -m benchmarks.${1:-precondition_concurrency} "${@:2}"
@@ -0,0 +1,95 @@
+import asyncio
+import os
+from statistics import median
+from time import perf_counter
+from unittest.mock import patch
+
+os.environ.setdefault("PERSEPHONE_TOPIC_USER", "benchmark")
+os.environ.setdefault("MONGODB_DATABASE_NAME", "benchmark")
+os.environ.setdefault("MONGODB_USER_COLLECTION", "users")
+
+from src.domain.models.request.model import (
+    PoliticallyExposedCondition,
+    PoliticallyExposedRequest,
+)
+from src.infrastructures.loop_registry.infrastructure import LoopResourceRegistry
+from src.infrastructures.mongo_db.infrastructure import MongoDBInfrastructure
+from src.repositories.user.repository import UserRepository
+from src.services.employ_data.service import PoliticallyExposedService
+from src.services.warmup.service import WarmupService
+from tests.stand_ins.mongo import MongoClientStandIn
+from tests.stand_ins.persephone import PersephoneStandIn
+from tests.stand_ins.step_server import StepServerStandIn
+
+MONGO_CONNECT_LATENCY_IN_SECONDS = 0.08
+STEP_HANDSHAKE_LATENCY_IN_SECONDS = 0.04
+WARM_REQUESTS = 20
+
+politically_exposed_request = PoliticallyExposedRequest(
+    x_thebes_answer="x_thebes_answer",
+    unique_id="unique_id",
+    politically_exposed=PoliticallyExposedCondition(is_politically_exposed=False),
+)
+
+
+async def reset_clients() -> MongoClientStandIn:
+    await LoopResourceRegistry.close_loop_resources()
+    WarmupService.readiness = {}
+    WarmupService.warmup_task = None
+    mongo_client = MongoClientStandIn(
+        connect_latency_in_seconds=MONGO_CONNECT_LATENCY_IN_SECONDS
+    )
+    users = mongo_client[UserRepository.database][UserRepository.collection]
+    users.documents.append(
+        {"_id": 1, "unique_id": "unique_id", "suitability": {"score": 1}}
+    )
+    return mongo_client
+
+
+async def update() -> float:
+    start = perf_counter()
+    await PoliticallyExposedService.update_politically_exposed_data_for_us(
+        politically_exposed_request=politically_exposed_request
+    )
+    return perf_counter() - start
+
+
+async def measure(label: str, warm_up: bool):
+    mongo_client = await reset_clients()
+    with patch.object(MongoDBInfrastructure, "get_client", return_value=mongo_client):
+        warmup_duration = 0.0
+        if warm_up:
+            start = perf_counter()
+            await WarmupService.warm_up()
+            warmup_duration = perf_counter() - start
+        first_request = await update()
+        warm_requests = [await update() for _ in range(WARM_REQUESTS)]
+    print(
+        f"{label:<14} warmup={warmup_duration * 1000:7.2f}ms "
+        f"first_request={first_request * 1000:7.2f}ms "
+        f"warm_p50={median(warm_requests) * 1000:7.2f}ms"
+    )
+    if warm_up:
+        print(f"{'':<14} readiness={WarmupService.get_readiness()}")
+
+
+async def run_benchmark():
+    step_server = StepServerStandIn(
+        handshake_latency_in_seconds=STEP_HANDSHAKE_LATENCY_IN_SECONDS
+    )
+    base_url = await step_server.start()
+    os.environ["URL_ONBOARDING_STEP_BR"] = f"{base_url}/steps_br"
+    os.environ["URL_ONBOARDING_STEP_US"] = f"{base_url}/steps_us"
+    try:
+        with patch.object(
+            PoliticallyExposedService, "persephone_client", PersephoneStandIn()
+        ):
+            await measure("cold", warm_up=False)
+            await measure("with warmup", warm_up=True)
+    finally:
+        await reset_clients()
+        await step_server.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
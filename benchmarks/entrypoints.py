@@ -0,0 +1,154 @@
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from json import dumps
+from statistics import quantiles
+from time import perf_counter
+from unittest.mock import patch
+
+from flask import Flask
+from motor import motor_asyncio
+
+os.environ.setdefault("PERSEPHONE_TOPIC_USER", "benchmark")
+os.environ.setdefault("MONGODB_DATABASE_NAME", "benchmark")
+os.environ.setdefault("MONGODB_USER_COLLECTION", "users")
+os.environ.setdefault("MONGO_CONNECTION_URL", "mongodb://benchmark")
+
+from heimdall_client import Heimdall, HeimdallStatusResponses
+
+from asgi import app as asgi_app
+from main import update_politically_exposed_us
+from src.repositories.user.repository import UserRepository
+from src.services.employ_data.service import PoliticallyExposedService
+from tests.stand_ins.mongo import MongoClientStandIn
+from tests.stand_ins.persephone import PersephoneStandIn
+from tests.stand_ins.step_server import StepServerStandIn
+
+MONGO_CONNECT_LATENCY_IN_SECONDS = 0.02
+STEP_HANDSHAKE_LATENCY_IN_SECONDS = 0.01
+STEP_LATENCY_IN_SECONDS = 0.002
+CONCURRENCY = 32
+REQUESTS = 1000
+PATH = "/onboarding/politically_exposed_us"
+BODY = dumps({"is_politically_exposed": True, "politically_exposed_names": ["Name"]})
+
+
+def build_mongo_client(url: str) -> MongoClientStandIn:
+    mongo_client = MongoClientStandIn(
+        connect_latency_in_seconds=MONGO_CONNECT_LATENCY_IN_SECONDS
+    )
+    users = mongo_client[UserRepository.database][UserRepository.collection]
+    users.documents.append(
+        {"_id": 1, "unique_id": "unique_id", "suitability": {"score": 1}}
+    )
+    return mongo_client
+
+
+async def decode_payload(jwt: str):
+    jwt_content = {
+        "is_payload_decoded": True,
+        "decoded_jwt": {"user": {"unique_id": "unique_id"}},
+        "message": "Jwt decoded",
+    }
+    return jwt_content, HeimdallStatusResponses.SUCCESS
+
+
+def start_step_server() -> str:
+    step_server = StepServerStandIn(
+        latency_in_seconds=STEP_LATENCY_IN_SECONDS,
+        handshake_latency_in_seconds=STEP_HANDSHAKE_LATENCY_IN_SECONDS,
+    )
+    loop = asyncio.new_event_loop()
+    base_url = loop.run_until_complete(step_server.start())
+    threading.Thread(target=loop.run_forever, daemon=True).start()
+    return base_url
+
+
+def report(label: str, latencies: list, elapsed: float):
+    percentiles = quantiles(latencies, n=100)
+    print(
+        f"{label:<8} {len(latencies) / elapsed:8.0f} req/s "
+        f"p50={percentiles[49] * 1000:7.2f}ms p99={percentiles[98] * 1000:7.2f}ms"
+    )
+
+
+def run_flask():
+    flask_app = Flask(__name__)
+    flask_app.add_url_rule(
+        PATH, view_func=update_politically_exposed_us, methods=["PUT"]
+    )
+    thread_local = threading.local()
+
+    def put() -> float:
+        if not hasattr(thread_local, "client"):
+            thread_local.client = flask_app.test_client()
+        start = perf_counter()
+        response = thread_local.client.put(
+            PATH,
+            data=BODY,
+            content_type="application/json",
+            headers={"x-thebes-answer": "x_thebes_answer"},
+        )
+        assert response.status_code == 200, response.data
+        return perf_counter() - start
+
+    start = perf_counter()
+    with ThreadPoolExecutor(max_workers=CONCURRENCY) as executor:
+        latencies = list(executor.map(lambda _: put(), range(REQUESTS)))
+    report("flask", latencies, perf_counter() - start)
+
+
+async def run_asgi():
+    scope = {
+        "type": "http",
+        "method": "PUT",
+        "path": PATH,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"x-thebes-answer", b"x_thebes_answer"),
+        ],
+    }
+    pending = iter(range(REQUESTS))
+    latencies = []
+
+    async def put():
+        sent = []
+
+        async def receive():
+            return {"type": "http.request", "body": BODY.encode()}
+
+        async def send(message):
+            sent.append(message)
+
+        start = perf_counter()
+        await asgi_app(scope, receive, send)
+        assert sent[0]["status"] == 200, sent
+        latencies.append(perf_counter() - start)
+
+    async def worker():
+        for _ in pending:
+            await put()
+
+    start = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+    report("asgi", latencies, perf_counter() - start)
+
+
+def run_benchmark():
+    base_url = start_step_server()
+    os.environ["URL_ONBOARDING_STEP_BR"] = f"{base_url}/steps_br"
+    os.environ["URL_ONBOARDING_STEP_US"] = f"{base_url}/steps_us"
+    with patch.object(
+        motor_asyncio, "AsyncIOMotorClient", side_effect=build_mongo_client
+    ), patch.object(
+        Heimdall, "decode_payload", side_effect=decode_payload
+    ), patch.object(
+        PoliticallyExposedService, "persephone_client", PersephoneStandIn()
+    ):
+        run_flask()
+        asyncio.run(run_asgi())
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,155 @@
+import argparse
+import asyncio
+import json
+import os
+from collections import Counter
+from statistics import quantiles
+from time import perf_counter
+
+from benchmarks.harness import (
+    StandIns,
+    StandInSettings,
+    close_clients,
+    run_load,
+    run_with_stand_ins,
+)
+from benchmarks.run_load import RESULTS_DIRECTORY, get_git_commit
+from src.infrastructures.circuit_breaker.infrastructure import CircuitBreakerRegistry
+from src.infrastructures.deadline.infrastructure import StageRunner
+from src.infrastructures.metrics.infrastructure import MetricsRegistry
+from src.transport.user_step.transport import StepChecker
+from tests.stand_ins.faults import FaultProfile
+
+
+def load_scenario(path: str) -> dict:
+    with open(path) as scenario_file:
+        scenario = json.load(scenario_file)
+    unknown_dependencies = set(scenario.get("faults", {})) - set(StandIns.dependencies)
+    if unknown_dependencies:
+        raise ValueError(
+            f"Unknown dependencies {sorted(unknown_dependencies)}, "
+            f"expected any of {list(StandIns.dependencies)}"
+        )
+    return scenario
+
+
+def build_fault_profiles(scenario: dict) -> dict:
+    fault_profiles = {
+        name: FaultProfile(name=name, seed=scenario.get("seed", 0), **settings)
+        for name, settings in scenario.get("faults", {}).items()
+    }
+    return fault_profiles
+
+
+def get_stage_outcomes() -> dict:
+    stage_outcomes = {}
+    for (stage, outcome), histogram in MetricsRegistry.histograms.items():
+        stage_outcomes.setdefault(stage, {})[outcome] = histogram.count
+    return stage_outcomes
+
+
+def summarize(results: list, elapsed: float) -> dict:
+    latencies = [latency for _, latency in results]
+    statuses = Counter(status for status, _ in results)
+    percentiles = quantiles(latencies, n=100)
+    summary = {
+        "requests": len(results),
+        "error_rate": 1 - statuses[200] / len(results),
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+        "requests_per_second": len(results) / elapsed,
+        "p50_in_ms": percentiles[49] * 1000,
+        "p95_in_ms": percentiles[94] * 1000,
+        "p99_in_ms": percentiles[98] * 1000,
+        "max_in_ms": max(latencies) * 1000,
+    }
+    return summary
+
+
+async def run_scenario(scenario: dict, stand_ins: StandIns) -> dict:
+    users = scenario.get("users", 1000)
+    stand_ins.set_faults_enabled(False)
+    await run_load(requests=users, concurrency=scenario["concurrency"], users=users)
+    MetricsRegistry.histograms.clear()
+    stand_ins.set_faults_enabled(True)
+
+    start = perf_counter()
+    results = await run_load(
+        requests=scenario["requests"],
+        concurrency=scenario["concurrency"],
+        users=users,
+    )
+    elapsed = perf_counter() - start
+    await close_clients()
+    report = {
+        "scenario": scenario,
+        "git_commit": get_git_commit(),
+        "summary": summarize(results=results, elapsed=elapsed),
+        "injected_faults": stand_ins.get_fault_stats(),
+        "stage_outcomes": get_stage_outcomes(),
+        "circuit_breakers": CircuitBreakerRegistry.get_stats(),
+        "hedging": StepChecker.get_hedging_stats(),
+        "expired_deadlines": StageRunner.expired,
+    }
+    return report
+
+
+def print_report(report: dict):
+    summary = report["summary"]
+    print(
+        f"{report['scenario']['name']}: {summary['requests_per_second']:.0f} req/s "
+        f"p50={summary['p50_in_ms']:.2f}ms p95={summary['p95_in_ms']:.2f}ms "
+        f"p99={summary['p99_in_ms']:.2f}ms max={summary['max_in_ms']:.2f}ms "
+        f"errors={summary['error_rate']:.3f} statuses={summary['statuses']}"
+    )
+    for name, stats in report["injected_faults"].items():
+        print(f"  injected {name}: {stats}")
+    for stage, outcomes in sorted(report["stage_outcomes"].items()):
+        failures = {
+            outcome: count
+            for outcome, count in outcomes.items()
+            if outcome != "success"
+        }
+        if failures:
+            print(f"  {stage}: {failures}")
+    for endpoint, stats in report["hedging"].items():
+        print(
+            f"  hedging {endpoint}: hedges={stats['hedges']} wins={stats['hedge_wins']}"
+        )
+    for name, stats in report["circuit_breakers"].items():
+        print(
+            f"  circuit {name}: state={stats['state']} opened={stats['opened']} "
+            f"rejected={stats['rejected']}"
+        )
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Replay a fault-injection scenario against the dependency stand-ins"
+    )
+    parser.add_argument("scenario")
+    parser.add_argument("--output")
+    return parser.parse_args()
+
+
+def run_benchmark():
+    args = parse_args()
+    scenario = load_scenario(args.scenario)
+    os.environ.update(scenario.get("env", {}))
+    stand_ins = StandIns(
+        settings=StandInSettings(users=scenario.get("users", 1000)),
+        fault_profiles=build_fault_profiles(scenario),
+    )
+    with run_with_stand_ins(stand_ins):
+        report = asyncio.run(run_scenario(scenario=scenario, stand_ins=stand_ins))
+    print_report(report)
+    output = args.output or os.path.join(
+        RESULTS_DIRECTORY, f"scenario_{scenario['name']}.json"
+    )
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with open(output, "w") as output_file:
+        json.dump(report, output_file, indent=2)
+    print(f"results stored in {output}")
+
+
+if __name__ == "__main__":
+    run_benchmark()
@@ -0,0 +1,157 @@
+import asyncio
+import os
+import threading
+from contextlib import contextmanager
+from json import dumps
+from time import perf_counter
+from typing import Dict
+from unittest.mock import patch
+
+os.environ.setdefault("PERSEPHONE_TOPIC_USER", "benchmark")
+os.environ.setdefault("MONGODB_DATABASE_NAME", "benchmark")
+os.environ.setdefault("MONGODB_USER_COLLECTION", "users")
+os.environ.setdefault("MONGO_CONNECTION_URL", "mongodb://benchmark")
+
+from heimdall_client import Heimdall
+from motor import motor_asyncio
+
+from asgi import app as asgi_app
+from src.infrastructures.loop_registry.infrastructure import LoopResourceRegistry
+from src.repositories.user.repository import UserRepository
+from src.services.employ_data.service import PoliticallyExposedService
+from tests.stand_ins.faults import FaultProfile
+from tests.stand_ins.heimdall import HeimdallStandIn
+from tests.stand_ins.mongo import MongoClientStandIn
+from tests.stand_ins.persephone import PersephoneStandIn
+from tests.stand_ins.step_server import StepServerStandIn
+
+PATH = "/onboarding/politically_exposed_us"
+BODY = dumps(
+    {"is_politically_exposed": True, "politically_exposed_names": ["Name"]}
+).encode()
+
+
+class StandInSettings:
+    def __init__(
+        self,
+        users: int = 1000,
+        heimdall_latency_in_seconds: float = 0.001,
+        step_latency_in_seconds: float = 0.002,
+        mongo_connect_latency_in_seconds: float = 0.02,
+        persephone_latency_in_seconds: float = 0.001,
+    ):
+        self.users = users
+        self.heimdall_latency_in_seconds = heimdall_latency_in_seconds
+        self.step_latency_in_seconds = step_latency_in_seconds
+        self.mongo_connect_latency_in_seconds = mongo_connect_latency_in_seconds
+        self.persephone_latency_in_seconds = persephone_latency_in_seconds
+
+    def to_dict(self) -> dict:
+        return dict(vars(self))
+
+
+class StandIns:
+    dependencies = ("heimdall", "step_service", "mongo", "persephone")
+
+    def __init__(
+        self, settings: StandInSettings, fault_profiles: Dict[str, FaultProfile] = None
+    ):
+        self.settings = settings
+        self.fault_profiles = fault_profiles or {}
+        self.heimdall = HeimdallStandIn(
+            latency_in_seconds=settings.heimdall_latency_in_seconds,
+            fault_profile=self.fault_profiles.get("heimdall"),
+        )
+        self.persephone = PersephoneStandIn(
+            latency_in_seconds=settings.persephone_latency_in_seconds,
+            record_messages=False,
+            fault_profile=self.fault_profiles.get("persephone"),
+        )
+        self.step_server = StepServerStandIn(
+            latency_in_seconds=settings.step_latency_in_seconds,
+            fault_profile=self.fault_profiles.get("step_service"),
+        )
+        self.mongo_clients = []
+
+    def build_mongo_client(self, *args, **kwargs) -> MongoClientStandIn:
+        mongo_client = MongoClientStandIn(
+            connect_latency_in_seconds=self.settings.mongo_connect_latency_in_seconds,
+            fault_profile=self.fault_profiles.get("mongo"),
+        )
+        users = mongo_client[UserRepository.database][UserRepository.collection]
+        users.documents.extend(
+            {"_id": user, "unique_id": f"user-{user}", "suitability": {"score": 1}}
+            for user in range(self.settings.users)
+        )
+        self.mongo_clients.append(mongo_client)
+        return mongo_client
+
+    def set_faults_enabled(self, enabled: bool):
+        for fault_profile in self.fault_profiles.values():
+            fault_profile.enabled = enabled
+
+    def get_fault_stats(self) -> dict:
+        return {
+            name: fault_profile.get_stats()
+            for name, fault_profile in self.fault_profiles.items()
+        }
+
+    def start_step_server(self) -> str:
+        loop = asyncio.new_event_loop()
+        base_url = loop.run_until_complete(self.step_server.start())
+        threading.Thread(target=loop.run_forever, daemon=True).start()
+        return base_url
+
+
+@contextmanager
+def run_with_stand_ins(stand_ins: StandIns):
+    base_url = stand_ins.start_step_server()
+    os.environ["URL_ONBOARDING_STEP_BR"] = f"{base_url}/steps_br"
+    os.environ["URL_ONBOARDING_STEP_US"] = f"{base_url}/steps_us"
+    with patch.object(
+        motor_asyncio, "AsyncIOMotorClient", stand_ins.build_mongo_client
+    ), patch.object(
+        Heimdall, "decode_payload", stand_ins.heimdall.decode_payload
+    ), patch.object(
+        PoliticallyExposedService, "persephone_client", stand_ins.persephone
+    ):
+        yield stand_ins
+
+
+async def put(user: int) -> tuple:
+    scope = {
+        "type": "http",
+        "method": "PUT",
+        "path": PATH,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"x-thebes-answer", f"user-{user}".encode()),
+        ],
+    }
+    sent = []
+
+    async def receive():
+        return {"type": "http.request", "body": BODY}
+
+    async def send(message):
+        sent.append(message)
+
+    start = perf_counter()
+    await asgi_app(scope, receive, send)
+    return sent[0]["status"], perf_counter() - start
+
+
+async def run_load(requests: int, concurrency: int, users: int) -> list:
+    pending = iter(range(requests))
+    results = []
+
+    async def worker():
+        for request in pending:
+            results.append(await put(user=request % users))
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return results
+
+
+async def close_clients():
+    await LoopResourceRegistry.close_loop_resources()
@@ -0,0 +1,62 @@
+import asyncio
+import os
+from statistics import quantiles
+from time import perf_counter
+
+from src.infrastructures.loop_registry.infrastructure import LoopResourceRegistry
+from src.transport.user_step.transport import StepChecker
+from tests.stand_ins.step_server import StepServerStandIn
+
+STEP_LATENCY_IN_SECONDS = 0.002
+SLOW_RATIO = 0.03
+SLOW_LATENCY_IN_SECONDS = 0.1
+CONCURRENCY = 16
+REQUESTS = 2000
+
+
+async def measure(label: str, hedging_enabled: bool):
+    os.environ["ONBOARDING_STEP_HEDGING_ENABLED"] = str(hedging_enabled)
+    StepChecker.hedgers = {}
+    pending = iter(range(REQUESTS))
+    latencies = []
+
+    async def worker():
+        for _ in pending:
+            start = perf_counter()
+            await StepChecker._get_step_us(x_thebes_answer="x_thebes_answer")
+            latencies.append(perf_counter() - start)
+
+    start = perf_counter()
+    await asyncio.gather(*(worker() for _ in range(CONCURRENCY)))
+    elapsed = perf_counter() - start
+    percentiles = quantiles(latencies, n=100)
+    print(
+        f"{label:<12} {len(latencies) / elapsed:8.0f} req/s "
+        f"p50={percentiles[49] * 1000:7.2f}ms p99={percentiles[98] * 1000:7.2f}ms"
+    )
+    for endpoint, stats in StepChecker.get_hedging_stats().items():
+        print(
+            f"{'':<12} {endpoint} hedges={stats['hedges']} "
+            f"hedge_rate={stats['hedge_rate']:.3f} wins={stats['hedge_wins']} "
+            f"delay={stats['hedge_delay_in_seconds'] * 1000:.2f}ms"
+        )
+
+
+async def run_benchmark():
+    step_server = StepServerStandIn(
+        latency_in_seconds=STEP_LATENCY_IN_SECONDS,
+        slow_ratio=SLOW_RATIO,
+        slow_latency_in_seconds=SLOW_LATENCY_IN_SECONDS,
+    )
+    base_url = await step_server.start()
+    os.environ["URL_ONBOARDING_STEP_US"] = f"{base_url}/steps_us"
+    try:
+        await measure("no hedging", hedging_enabled=False)
+        await measure("hedging", hedging_enabled=True)
+    finally:
+        await LoopResourceRegistry.close_loop_resources()
+        await step_server.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
@@ -0,0 +1,75 @@
+import asyncio
+from statistics import quantiles
+from time import perf_counter
+
+from src.services.persephone_producer.service import BatchingPersephoneProducer
+from tests.stand_ins.persephone import PersephoneStandIn
+
+ROUND_TRIP_IN_SECONDS = 0.002
+CONCURRENT_CALLERS = 500
+MESSAGES_PER_CALLER = 10
+
+
+async def send(persephone_sender, sequence: int) -> float:
+    start = perf_counter()
+    await persephone_sender.send_to_persephone(
+        topic="benchmark",
+        partition=8,
+        message={"sequence": sequence},
+        schema_name="benchmark_schema",
+    )
+    return perf_counter() - start
+
+
+async def caller(persephone_sender, caller_id: int) -> list:
+    latencies = []
+    for sequence in range(MESSAGES_PER_CALLER):
+        latencies.append(await send(persephone_sender, caller_id * 1000 + sequence))
+    return latencies
+
+
+async def measure(label: str, persephone_sender):
+    start = perf_counter()
+    results = await asyncio.gather(
+        *(
+            caller(persephone_sender, caller_id)
+            for caller_id in range(CONCURRENT_CALLERS)
+        )
+    )
+    elapsed = perf_counter() - start
+    latencies = [latency for latencies in results for latency in latencies]
+    percentiles = quantiles(latencies, n=100)
+    print(
+        f"{label:<28} {len(latencies) / elapsed:9.0f} msg/s "
+        f"p50={percentiles[49] * 1000:7.2f}ms p99={percentiles[98] * 1000:7.2f}ms"
+    )
+
+
+async def run_benchmark():
+    await measure("direct", PersephoneStandIn(latency_in_seconds=ROUND_TRIP_IN_SECONDS))
+    for linger_in_seconds, max_in_flight in (
+        (0.001, 1000),
+        (0.005, 1000),
+        (0.005, 100),
+    ):
+        producer = BatchingPersephoneProducer(
+            persephone_client=PersephoneStandIn(
+                latency_in_seconds=ROUND_TRIP_IN_SECONDS
+            ),
+            linger_in_seconds=linger_in_seconds,
+            max_batch_size=100,
+            max_in_flight=max_in_flight,
+        )
+        await measure(
+            f"batched linger={linger_in_seconds * 1000:g}ms in_flight={max_in_flight}",
+            producer,
+        )
+        stats = producer.get_stats()
+        print(
+            f"{'':<28} batches={stats['batches']} "
+            f"average_batch_size={stats['average_batch_size']:.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
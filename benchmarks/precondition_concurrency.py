@@ -0,0 +1,88 @@
+import asyncio
+import os
+from statistics import quantiles
+from time import perf_counter
+from unittest.mock import patch
+
+os.environ.setdefault("PERSEPHONE_TOPIC_USER", "benchmark")
+os.environ.setdefault("MONGODB_DATABASE_NAME", "benchmark")
+os.environ.setdefault("MONGODB_USER_COLLECTION", "users")
+
+from src.domain.models.request.model import (
+    PoliticallyExposedCondition,
+    PoliticallyExposedRequest,
+)
+from src.domain.models.user_data.onboarding_step.model import UserOnboardingStep
+from src.repositories.user.repository import UserRepository
+from src.services.employ_data.service import PoliticallyExposedService
+from src.transport.user_step.transport import StepChecker
+
+STEP_LATENCY_IN_SECONDS = 0.03
+SUITABILITY_LATENCY_IN_SECONDS = 0.02
+REQUESTS = 200
+
+politically_exposed_request = PoliticallyExposedRequest(
+    x_thebes_answer="x_thebes_answer",
+    unique_id="unique_id",
+    politically_exposed=PoliticallyExposedCondition(is_politically_exposed=False),
+)
+
+
+async def get_onboarding_step(**kwargs):
+    await asyncio.sleep(STEP_LATENCY_IN_SECONDS)
+    return UserOnboardingStep(step_br="finished", step_us="politically_exposed")
+
+
+async def verify_if_user_has_suitability(user_data):
+    await asyncio.sleep(SUITABILITY_LATENCY_IN_SECONDS)
+    return True
+
+
+async def send_to_persephone(**kwargs):
+    return True, 0
+
+
+async def update_user(user_data):
+    return None
+
+
+async def measure_latencies(concurrent: bool) -> list:
+    PoliticallyExposedService.get_precondition_pipeline().concurrent = concurrent
+    latencies = []
+    for _ in range(REQUESTS):
+        start = perf_counter()
+        await PoliticallyExposedService.update_politically_exposed_data_for_us(
+            politically_exposed_request=politically_exposed_request
+        )
+        latencies.append(perf_counter() - start)
+    return latencies
+
+
+def report(label: str, latencies: list):
+    percentiles = quantiles(latencies, n=100)
+    print(
+        f"{label:<12} p50={percentiles[49] * 1000:7.2f}ms "
+        f"p99={percentiles[98] * 1000:7.2f}ms"
+    )
+
+
+async def run_benchmark():
+    with patch.object(
+        StepChecker, "get_onboarding_step", side_effect=get_onboarding_step
+    ), patch.object(
+        UserRepository,
+        "verify_if_user_has_suitability",
+        side_effect=verify_if_user_has_suitability,
+    ), patch.object(
+        UserRepository, "update_user", side_effect=update_user
+    ), patch.object(
+        PoliticallyExposedService.persephone_client,
+        "send_to_persephone",
+        side_effect=send_to_persephone,
+    ):
+        report("sequential", await measure_latencies(concurrent=False))
+        report("concurrent", await measure_latencies(concurrent=True))
+
+
+if __name__ == "__main__":
+    asyncio.run(run_benchmark())
@@ -0,0 +1,195 @@
+import argparse
+import asyncio
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import tracemalloc
+from collections import Counter
+from datetime import datetime, timezone
+from statistics import quantiles
+from time import perf_counter
+
+from benchmarks.harness import (
+    StandIns,
+    StandInSettings,
+    close_clients,
+    run_load,
+    run_with_stand_ins,
+)
+
+RESULTS_DIRECTORY = os.path.join(os.path.dirname(__file__), "results")
+BASELINE_PATH = os.path.join(RESULTS_DIRECTORY, "baseline.json")
+LATEST_PATH = os.path.join(RESULTS_DIRECTORY, "latest.json")
+
+
+def get_git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+async def measure_memory(requests: int, concurrency: int, users: int) -> dict:
+    tracemalloc.start()
+    try:
+        baseline_in_bytes, _ = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        await run_load(requests=requests, concurrency=concurrency, users=users)
+        current_in_bytes, peak_in_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    memory = {
+        "peak_per_in_flight_request_in_bytes": round(
+            (peak_in_bytes - baseline_in_bytes) / concurrency
+        ),
+        "retained_per_request_in_bytes": round(
+            (current_in_bytes - baseline_in_bytes) / requests
+        ),
+    }
+    return memory
+
+
+def summarize(concurrency: int, results: list, elapsed: float, memory: dict) -> dict:
+    latencies = [latency for _, latency in results]
+    statuses = Counter(status for status, _ in results)
+    percentiles = quantiles(latencies, n=100)
+    summary = {
+        "concurrency": concurrency,
+        "requests": len(results),
+        "error_rate": 1 - statuses[200] / len(results),
+        "statuses": {str(status): count for status, count in sorted(statuses.items())},
+        "requests_per_second": len(results) / elapsed,
+        "p50_in_ms": percentiles[49] * 1000,
+        "p95_in_ms": percentiles[94] * 1000,
+        "p99_in_ms": percentiles[98] * 1000,
+        **memory,
+    }
+    return summary
+
+
+async def run_levels(
+    concurrency_levels: list, requests: int, memory_requests: int, users: int
+) -> list:
+    await run_load(requests=users, concurrency=max(concurrency_levels), users=users)
+    summaries = []
+    for concurrency in concurrency_levels:
+        start = perf_counter()
+        results = await run_load(
+            requests=requests, concurrency=concurrency, users=users
+        )
+        elapsed = perf_counter() - start
+        memory = await measure_memory(
+            requests=memory_requests, concurrency=concurrency, users=users
+        )
+        summary = summarize(concurrency, results, elapsed, memory)
+        summaries.append(summary)
+        print(
+            f"c={concurrency:<4} {summary['requests_per_second']:8.0f} req/s "
+            f"p50={summary['p50_in_ms']:7.2f}ms p95={summary['p95_in_ms']:7.2f}ms "
+            f"p99={summary['p99_in_ms']:7.2f}ms "
+            f"errors={summary['error_rate']:.3f} "
+            f"mem/in-flight={summary['peak_per_in_flight_request_in_bytes']}B "
+            f"retained/req={summary['retained_per_request_in_bytes']}B"
+        )
+    await close_clients()
+    return summaries
+
+
+def compare(baseline: dict, current: dict, tolerance: float) -> list:
+    baseline_levels = {
+        summary["concurrency"]: summary for summary in baseline["results"]
+    }
+    regressions = []
+    for summary in current["results"]:
+        baseline_summary = baseline_levels.get(summary["concurrency"])
+        if baseline_summary is None:
+            continue
+        checks = {
+            "requests_per_second": baseline_summary["requests_per_second"]
+            * (1 - tolerance),
+            "p99_in_ms": baseline_summary["p99_in_ms"] * (1 + tolerance),
+            "error_rate": baseline_summary["error_rate"] + tolerance / 10,
+        }
+        for metric, limit in checks.items():
+            value = summary[metric]
+            regressed = (
+                value < limit if metric == "requests_per_second" else value > limit
+            )
+            if regressed:
+                regressions.append(
+                    f"c={summary['concurrency']} {metric}: "
+                    f"{baseline_summary[metric]:.3f} -> {value:.3f}"
+                )
+    return regressions
+
+
+def build_report(summaries: list, settings: StandInSettings, args) -> dict:
+    report = {
+        "metadata": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "git_commit": get_git_commit(),
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "requests": args.requests,
+            "memory_requests": args.memory_requests,
+            "stand_ins": settings.to_dict(),
+            "max_rss_in_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        },
+        "results": summaries,
+    }
+    return report
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(
+        description="Load test update_politically_exposed_us against local stand-ins"
+    )
+    parser.add_argument("--concurrency", default="1,8,32,128")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--memory-requests", type=int, default=500)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--output", default=LATEST_PATH)
+    parser.add_argument("--baseline", default=BASELINE_PATH)
+    parser.add_argument("--tolerance", type=float, default=0.2)
+    return parser.parse_args()
+
+
+def run_benchmark():
+    args = parse_args()
+    concurrency_levels = [int(level) for level in args.concurrency.split(",")]
+    settings = StandInSettings(users=args.users)
+    with run_with_stand_ins(StandIns(settings=settings)):
+        summaries = asyncio.run(
+            run_levels(
+                concurrency_levels=concurrency_levels,
+                requests=args.requests,
+                memory_requests=args.memory_requests,
+                users=args.users,
+            )
+        )
+    report = build_report(summaries=summaries, settings=settings, args=args)
+    os.makedirs(os.path.dirname(os.path.abspath(args.output)), exist_ok=True)
+    with open(args.output, "w") as output_file:
+        json.dump(report, output_file, indent=2)
+    print(f"results stored in {args.output}")
+
+    if not os.path.exists(args.baseline) or args.baseline == args.output:
+        return
+    with open(args.baseline) as baseline_file:
+        regressions = compare(json.load(baseline_file), report, args.tolerance)
+    for regression in regressions:
+        print(f"regression {regression}")
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    run_benchmark()
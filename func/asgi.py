@@ -0,0 +1,155 @@
+from http import HTTPStatus
+from json import loads
+
+from decouple import config
+from etria_logger import Gladsheim
+
+from main import (
+    handle_metrics,
+    handle_profiles,
+    handle_readiness,
+    handle_update_politically_exposed_us,
+    log_error,
+)
+from src.domain.enums.response.code import InternalCode
+from src.domain.exceptions.model import RequestBodyTooLargeError
+from src.domain.models.response.model import ResponseModel
+from src.infrastructures.loop_monitor.infrastructure import EventLoopMonitor
+from src.infrastructures.loop_registry.infrastructure import LoopResourceRegistry
+from src.infrastructures.metrics_exporter.infrastructure import PrometheusTextExporter
+from src.services.employ_data.service import PoliticallyExposedService
+from src.services.warmup.service import WarmupService
+
+
+async def _read_body(receive, content_length: str = None) -> bytes:
+    max_body_size = config("REQUEST_MAX_BODY_SIZE_IN_BYTES", default=16384, cast=int)
+    if content_length is not None and int(content_length) > max_body_size:
+        raise RequestBodyTooLargeError(f"Request body exceeds {max_body_size} bytes")
+    body = bytearray()
+    more_body = True
+    while more_body:
+        message = await receive()
+        body += message.get("body", b"")
+        if len(body) > max_body_size:
+            raise RequestBodyTooLargeError(
+                f"Request body exceeds {max_body_size} bytes"
+            )
+        more_body = message.get("more_body", False)
+    return bytes(body)
+
+
+def _parse_json(body: bytes):
+    raw_params = loads(body) if body else None
+    if raw_params is not None and not isinstance(raw_params, dict):
+        raise ValueError("Request body must be a JSON object")
+    return raw_params
+
+
+async def _send_body(send, body: bytes, status: HTTPStatus, content_type: str):
+    await send(
+        {
+            "type": "http.response.start",
+            "status": int(status),
+            "headers": [
+                (b"content-type", content_type.encode()),
+                (b"content-length", str(len(body)).encode()),
+            ],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _send_response(send, response: ResponseModel, status: HTTPStatus):
+    await _send_body(
+        send,
+        body=response.response.encode(),
+        status=status,
+        content_type="application/json",
+    )
+
+
+async def _handle_lifespan(receive, send):
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            try:
+                EventLoopMonitor.ensure_started()
+                PoliticallyExposedService.start_outbox_relay()
+                await WarmupService.ensure_warm()
+            except Exception as ex:
+                Gladsheim.error(error=ex, message="Failed to warm up dependencies")
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            EventLoopMonitor.stop()
+            await PoliticallyExposedService.stop_outbox_relay()
+            await LoopResourceRegistry.close_loop_resources()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
+
+
+async def _handle_http(scope, receive, send):
+    headers = {
+        name.decode().lower(): value.decode() for name, value in scope["headers"]
+    }
+    method = scope["method"]
+    path = scope["path"].rstrip("/")
+    if method == "GET" and path.endswith("/metrics"):
+        metrics, status = await handle_metrics()
+        await _send_body(
+            send,
+            body=metrics.encode(),
+            status=status,
+            content_type=PrometheusTextExporter.content_type,
+        )
+        return
+    if method == "GET" and path.endswith("/profiles"):
+        profiles, status = await handle_profiles()
+        await _send_body(
+            send,
+            body=profiles.encode(),
+            status=status,
+            content_type="text/plain; charset=utf-8",
+        )
+        return
+    if method == "GET" and path.endswith("/readiness"):
+        response, status = await handle_readiness()
+    elif method == "PUT":
+        try:
+            body = await _read_body(
+                receive, content_length=headers.get("content-length")
+            )
+            raw_params = _parse_json(body)
+        except RequestBodyTooLargeError as ex:
+            message = "Request body too large"
+            log_error(error=ex, message=message)
+            response = ResponseModel(
+                success=False, code=InternalCode.INVALID_PARAMS, message=message
+            )
+            status = HTTPStatus.REQUEST_ENTITY_TOO_LARGE
+        except ValueError as ex:
+            message = "Invalid parameters"
+            log_error(error=ex, message=message)
+            response = ResponseModel(
+                success=False, code=InternalCode.INVALID_PARAMS, message=message
+            )
+            status = HTTPStatus.BAD_REQUEST
+        else:
+            response, status = await handle_update_politically_exposed_us(
+                x_thebes_answer=headers.get("x-thebes-answer"),
+                raw_params=raw_params,
+                content_length=len(body),
+                traceparent=headers.get("traceparent"),
+            )
+    else:
+        response = ResponseModel(
+            success=False, code=InternalCode.INVALID_PARAMS, message="Not found"
+        )
+        status = HTTPStatus.NOT_FOUND
+    await _send_response(send, response=response, status=status)
+
+
+async def app(scope, receive, send):
+    if scope["type"] == "lifespan":
+        await _handle_lifespan(receive, send)
+    elif scope["type"] == "http":
+        await _handle_http(scope, receive, send)
@@ -1,10 +1,13 @@
 from http import HTTPStatus
+from typing import Tuple
 
 from etria_logger import Gladsheim
 from flask import request, Request, Response
 
+from src.domain.enums.profile import CpuSection
 from src.domain.enums.response.code import InternalCode
 from src.domain.exceptions.model import (
+    DeadlineExceededError,
     UnauthorizedError,
     InternalServerError,
     InvalidStepError,
@@ -12,81 +15,159 @@ from src.domain.exceptions.model import (
 )
 from src.domain.models.request.model import PoliticallyExposedRequest
 from src.domain.models.response.model import ResponseModel
+from src.infrastructures.deadline.infrastructure import StageRunner
+from src.infrastructures.instrumentation.infrastructure import Instrumentation
+from src.infrastructures.metrics_exporter.infrastructure import PrometheusTextExporter
+from src.infrastructures.profiler.infrastructure import RequestProfiler
 from src.services.employ_data.service import PoliticallyExposedService
+from src.services.metrics.service import MetricsService
+from src.services.warmup.service import WarmupService
 
 
-async def update_politically_exposed_us(request: Request = request) -> Response:
-    raw_params = request.json
-    x_thebes_answer = request.headers.get("x-thebes-answer")
+def log_error(error: Exception, message: str):
+    with RequestProfiler.cpu_section(CpuSection.LOGGING):
+        Gladsheim.error(error=error, message=message)
 
+
+async def handle_update_politically_exposed_us(
+    x_thebes_answer: str,
+    raw_params: dict,
+    content_length: int = None,
+    traceparent: str = None,
+) -> Tuple[ResponseModel, HTTPStatus]:
+    deadline_token = StageRunner.start_request_deadline()
+    profile_token = RequestProfiler.start(name="update_politically_exposed_us")
     try:
-        politically_exposed_request = await PoliticallyExposedRequest.build(
-            x_thebes_answer=x_thebes_answer,
-            parameters=raw_params,
-        )
+        with Instrumentation.stage(name="request", traceparent=traceparent):
+            politically_exposed_request = await PoliticallyExposedRequest.build(
+                x_thebes_answer=x_thebes_answer,
+                parameters=raw_params,
+                content_length=content_length,
+            )
 
-        politically_exposed = (
-            await PoliticallyExposedService.update_politically_exposed_data_for_us(
-                politically_exposed_request=politically_exposed_request
+            politically_exposed = (
+                await PoliticallyExposedService.update_politically_exposed_data_for_us(
+                    politically_exposed_request=politically_exposed_request
+                )
             )
-        )
 
         response = ResponseModel(
             result=politically_exposed,
             success=True,
             code=InternalCode.SUCCESS,
             message="Register Updated.",
-        ).build_http_response(status=HTTPStatus.OK)
-        return response
+        )
+        return response, HTTPStatus.OK
 
     except ValueError as ex:
         message = "Invalid parameters"
-        Gladsheim.error(error=ex, message=message)
+        log_error(error=ex, message=message)
         response = ResponseModel(
             success=False, code=InternalCode.INVALID_PARAMS, message=message
-        ).build_http_response(status=HTTPStatus.BAD_REQUEST)
-        return response
+        )
+        return response, HTTPStatus.BAD_REQUEST
 
     except UnauthorizedError as ex:
         message = "JWT invalid or not supplied"
-        Gladsheim.error(error=ex, message=message)
+        log_error(error=ex, message=message)
         response = ResponseModel(
             success=False,
             code=InternalCode.JWT_INVALID,
             message=message,
-        ).build_http_response(status=HTTPStatus.UNAUTHORIZED)
-        return response
+        )
+        return response, HTTPStatus.UNAUTHORIZED
 
     except InvalidStepError as ex:
         message = "User in invalid onboarding step"
-        Gladsheim.error(error=ex, message=message)
+        log_error(error=ex, message=message)
         response = ResponseModel(
             success=False, code=InternalCode.INVALID_PARAMS, message=message
-        ).build_http_response(status=HTTPStatus.UNAUTHORIZED)
-        return response
+        )
+        return response, HTTPStatus.UNAUTHORIZED
 
     except SuitabilityRequiredError as ex:
         message = (
             "The user needs to have a suitability profile to do the onboarding in US"
         )
-        Gladsheim.error(error=ex, message=message)
+        log_error(error=ex, message=message)
         response = ResponseModel(
             success=False, code=InternalCode.INVALID_PARAMS, message=message
-        ).build_http_response(status=HTTPStatus.UNAUTHORIZED)
-        return response
+        )
+        return response, HTTPStatus.UNAUTHORIZED
+
+    except DeadlineExceededError as ex:
+        message = "Request deadline exceeded"
+        log_error(error=ex, message=message)
+        response = ResponseModel(
+            success=False, code=InternalCode.DEADLINE_EXCEEDED, message=message
+        )
+        return response, HTTPStatus.GATEWAY_TIMEOUT
 
     except InternalServerError as ex:
         message = "Failed to update register"
-        Gladsheim.error(error=ex, message=message)
+        log_error(error=ex, message=message)
         response = ResponseModel(
             success=False, code=InternalCode.INTERNAL_SERVER_ERROR, message=message
-        ).build_http_response(status=HTTPStatus.INTERNAL_SERVER_ERROR)
-        return response
+        )
+        return response, HTTPStatus.INTERNAL_SERVER_ERROR
 
     except Exception as ex:
         message = "Unexpected error occurred"
-        Gladsheim.error(error=ex, message=message)
+        log_error(error=ex, message=message)
         response = ResponseModel(
             success=False, code=InternalCode.INTERNAL_SERVER_ERROR, message=message
-        ).build_http_response(status=HTTPStatus.INTERNAL_SERVER_ERROR)
-        return response
+        )
+        return response, HTTPStatus.INTERNAL_SERVER_ERROR
+
+    finally:
+        RequestProfiler.finish(profile_token)
+        StageRunner.reset(deadline_token)
+
+
+async def update_politically_exposed_us(request: Request = request) -> Response:
+    raw_params = request.json
+    x_thebes_answer = request.headers.get("x-thebes-answer")
+    response, status = await handle_update_politically_exposed_us(
+        x_thebes_answer=x_thebes_answer,
+        raw_params=raw_params,
+        content_length=request.content_length,
+        traceparent=request.headers.get("traceparent"),
+    )
+    return response.build_http_response(status=status)
+
+
+async def handle_readiness() -> Tuple[ResponseModel, HTTPStatus]:
+    readiness = WarmupService.get_readiness()
+    status = HTTPStatus.OK if readiness["ready"] else HTTPStatus.SERVICE_UNAVAILABLE
+    response = ResponseModel(
+        result=readiness,
+        success=readiness["ready"],
+        code=InternalCode.SUCCESS,
+        message="Readiness",
+    )
+    return response, status
+
+
+async def get_readiness() -> Response:
+    response, status = await handle_readiness()
+    return response.build_http_response(status=status)
+
+
+async def handle_metrics() -> Tuple[str, HTTPStatus]:
+    return MetricsService.get_prometheus_metrics(), HTTPStatus.OK
+
+
+async def get_metrics() -> Response:
+    metrics, status = await handle_metrics()
+    return Response(
+        metrics, content_type=PrometheusTextExporter.content_type, status=status
+    )
+
+
+async def handle_profiles() -> Tuple[str, HTTPStatus]:
+    return RequestProfiler.get_collapsed_stacks(), HTTPStatus.OK
+
+
+async def get_profiles() -> Response:
+    profiles, status = await handle_profiles()
+    return Response(profiles, content_type="text/plain; charset=utf-8", status=status)
@@ -0,0 +1,14 @@
+from enum import Enum
+
+
+class CircuitBreakerDependency(Enum):
+    MONGO_DB = "mongo_db"
+    ONBOARDING_STEP_BR = "onboarding_step_br"
+    ONBOARDING_STEP_US = "onboarding_step_us"
+    PERSEPHONE = "persephone"
+
+
+class CircuitState(Enum):
+    CLOSED = 0
+    HALF_OPEN = 1
+    OPEN = 2
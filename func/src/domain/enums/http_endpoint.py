@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class HttpEndpoint(Enum):
+    ONBOARDING_STEP_BR = "onboarding_step_br"
+    ONBOARDING_STEP_US = "onboarding_step_us"
+    SIGNING_KEYS = "signing_keys"
@@ -0,0 +1,13 @@
+from enum import Enum
+
+
+class PersephoneDeliveryMode(Enum):
+    DIRECT = "direct"
+    OUTBOX = "outbox"
+    BATCHED = "batched"
+
+
+class OutboxStatus(Enum):
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
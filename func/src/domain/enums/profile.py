@@ -0,0 +1,7 @@
+from enum import Enum
+
+
+class CpuSection(Enum):
+    PYDANTIC_VALIDATION = "pydantic_validation"
+    JSON_ENCODING = "json_encoding"
+    LOGGING = "logging"
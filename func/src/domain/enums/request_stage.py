@@ -0,0 +1,15 @@
+from enum import Enum, IntEnum
+
+
+class RequestStage(Enum):
+    BODY_SIZE_CHECK = "body_size_check"
+    SCHEMA_VALIDATION = "schema_validation"
+    AUTH = "auth"
+    STEP_CHECK = "step_check"
+    SUITABILITY_LOOKUP = "suitability_lookup"
+
+
+class StageCost(IntEnum):
+    LOCAL_CHECK = 1
+    LOCAL_VALIDATION = 10
+    NETWORK_CALL = 100
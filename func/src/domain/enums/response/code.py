@@ -11,3 +11,4 @@ class InternalCode(IntEnum):
     DATA_ALREADY_EXISTS = 98
     DATA_NOT_FOUND = 99
     INTERNAL_SERVER_ERROR = 100
+    DEADLINE_EXCEEDED = 101
@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class StepResolutionMode(Enum):
+    HTTP = "http"
+    USER_DOCUMENT = "user_document"
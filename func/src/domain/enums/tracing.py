@@ -0,0 +1,6 @@
+from enum import Enum
+
+
+class SpanExporterName(Enum):
+    LOG = "log"
+    NONE = "none"
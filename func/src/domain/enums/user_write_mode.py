@@ -0,0 +1,12 @@
+from enum import Enum
+
+
+class UserWriteMode(Enum):
+    TWO_STEP = "two_step"
+    CONDITIONAL = "conditional"
+
+
+class UserUpdateStatus(Enum):
+    UPDATED = "updated"
+    SUITABILITY_REQUIRED = "suitability_required"
+    USER_NOT_FOUND = "user_not_found"
@@ -0,0 +1,15 @@
+from enum import Enum
+
+
+class WarmupDependency(Enum):
+    MONGO_DB = "mongo_db"
+    ONBOARDING_STEP_BR = "onboarding_step_br"
+    ONBOARDING_STEP_US = "onboarding_step_us"
+    SIGNING_KEYS = "signing_keys"
+
+
+class WarmupStatus(Enum):
+    PENDING = "pending"
+    WARM = "warm"
+    FAILED = "failed"
+    SKIPPED = "skipped"
@@ -12,3 +12,19 @@ class SuitabilityRequiredError(Exception):
 
 class InternalServerError(Exception):
     pass
+
+
+class SigningKeyNotFoundError(Exception):
+    pass
+
+
+class CircuitOpenError(InternalServerError):
+    pass
+
+
+class DeadlineExceededError(Exception):
+    pass
+
+
+class RequestBodyTooLargeError(Exception):
+    pass
@@ -0,0 +1,19 @@
+from time import monotonic
+from typing import Optional
+
+
+class Deadline:
+    def __init__(self, budget_in_seconds: float):
+        self.budget_in_seconds = budget_in_seconds
+        self.started_at = monotonic()
+        self.expires_at = self.started_at + budget_in_seconds
+        self.last_stage: Optional[str] = None
+
+    def get_remaining(self) -> float:
+        return max(self.expires_at - monotonic(), 0.0)
+
+    def get_elapsed(self) -> float:
+        return monotonic() - self.started_at
+
+    def is_expired(self) -> bool:
+        return self.get_remaining() <= 0
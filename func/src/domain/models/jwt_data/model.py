@@ -1,20 +1,141 @@
+from hashlib import sha256
+from time import perf_counter, time
+
+from decouple import config, Csv
+from etria_logger import Gladsheim
 from heimdall_client import Heimdall, HeimdallStatusResponses
 
-from src.domain.exceptions.model import UnauthorizedError
+from src.domain.exceptions.model import UnauthorizedError, SigningKeyNotFoundError
+from src.domain.models.signing_keys.model import SigningKeySet
+from src.infrastructures.cache.infrastructure import TtlLruCache
+from src.infrastructures.deadline.infrastructure import StageRunner
+from src.transport.signing_keys.transport import SigningKeysTransport
 
 
 class Jwt:
+    decode_cache = None
+    signing_key_set = None
+    decode_latency_in_seconds = 0.0
+    heimdall_fallbacks = 0
+
     def __init__(self, unique_id: str):
         self.unique_id = unique_id
 
+    @classmethod
+    def get_decode_cache(cls) -> TtlLruCache:
+        if cls.decode_cache is None:
+            cls.decode_cache = TtlLruCache(
+                max_size=config("JWT_DECODE_CACHE_MAX_SIZE", default=10000, cast=int),
+                ttl_in_seconds=config(
+                    "JWT_DECODE_CACHE_MAX_TTL_IN_SECONDS", default=30, cast=float
+                ),
+            )
+        return cls.decode_cache
+
+    @classmethod
+    def get_signing_key_set(cls) -> SigningKeySet:
+        if cls.signing_key_set is None:
+            cls.signing_key_set = SigningKeySet(
+                transport=SigningKeysTransport,
+                algorithms=config(
+                    "JWT_OFFLINE_VERIFICATION_ALGORITHMS", default="RS256", cast=Csv()
+                ),
+                refresh_interval_in_seconds=config(
+                    "JWT_SIGNING_KEYS_REFRESH_INTERVAL_IN_SECONDS",
+                    default=300,
+                    cast=float,
+                ),
+                min_refresh_interval_in_seconds=config(
+                    "JWT_SIGNING_KEYS_MIN_REFRESH_INTERVAL_IN_SECONDS",
+                    default=30,
+                    cast=float,
+                ),
+            )
+        return cls.signing_key_set
+
+    @classmethod
+    def get_decode_cache_stats(cls) -> dict:
+        stats = cls.get_decode_cache().get_stats()
+        misses = stats["misses"]
+        average_decode_latency = (
+            cls.decode_latency_in_seconds / misses if misses else 0.0
+        )
+        stats["average_decode_latency_in_seconds"] = average_decode_latency
+        stats["estimated_saved_latency_in_seconds"] = (
+            average_decode_latency * stats["hits"]
+        )
+        return stats
+
+    @staticmethod
+    def __hash_jwt(jwt: str) -> str:
+        return sha256(jwt.encode()).hexdigest()
+
+    @staticmethod
+    def __get_ttl_until_expiration(jwt_content: dict) -> float:
+        expiration = jwt_content.get("decoded_jwt", {}).get("exp")
+        if not isinstance(expiration, (int, float)):
+            return 0
+        return expiration - time()
+
     @staticmethod
-    async def decode_and_validate_jwt(jwt: str):
+    async def __decode_with_heimdall(jwt: str) -> dict:
         jwt_content, heimdall_status = await Heimdall.decode_payload(jwt=jwt)
         if heimdall_status != HeimdallStatusResponses.SUCCESS:
             raise UnauthorizedError()
         return jwt_content
 
     @classmethod
+    async def __decode_offline(cls, jwt: str) -> dict:
+        signing_key_set = cls.get_signing_key_set()
+        signing_key_set.start_background_refresh()
+        decoded_jwt = await signing_key_set.decode(token=jwt)
+        jwt_content = {
+            "is_payload_decoded": True,
+            "decoded_jwt": decoded_jwt,
+            "message": "Jwt decoded",
+        }
+        return jwt_content
+
+    @classmethod
+    async def __decode(cls, jwt: str) -> dict:
+        start = perf_counter()
+        try:
+            offline_verification_enabled = config(
+                "JWT_OFFLINE_VERIFICATION_ENABLED", default=False, cast=bool
+            )
+            if offline_verification_enabled is True and isinstance(jwt, str):
+                try:
+                    return await cls.__decode_offline(jwt=jwt)
+                except SigningKeyNotFoundError as ex:
+                    cls.heimdall_fallbacks += 1
+                    Gladsheim.warning(
+                        message=f"Jwt::__decode::Falling back to Heimdall::{ex}"
+                    )
+            return await cls.__decode_with_heimdall(jwt=jwt)
+        finally:
+            cls.decode_latency_in_seconds += perf_counter() - start
+
+    @classmethod
+    async def decode_and_validate_jwt(cls, jwt: str):
+        cache_enabled = config("JWT_DECODE_CACHE_ENABLED", default=False, cast=bool)
+        if cache_enabled is not True or not isinstance(jwt, str):
+            return await cls.__decode(jwt=jwt)
+
+        decode_cache = cls.get_decode_cache()
+        jwt_hash = cls.__hash_jwt(jwt=jwt)
+        if (jwt_content := decode_cache.get(jwt_hash)) is not None:
+            return jwt_content
+
+        jwt_content = await cls.__decode(jwt=jwt)
+        ttl_in_seconds = min(
+            cls.__get_ttl_until_expiration(jwt_content=jwt_content),
+            decode_cache.ttl_in_seconds,
+        )
+        decode_cache.set(jwt_hash, jwt_content, ttl_in_seconds=ttl_in_seconds)
+        return jwt_content
+
+    @classmethod
+    @StageRunner.stage("Jwt::build")
     async def build(cls, jwt: str):
         jwt_data = await cls.decode_and_validate_jwt(jwt=jwt)
         unique_id = jwt_data["decoded_jwt"]["user"]["unique_id"]
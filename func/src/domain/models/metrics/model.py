@@ -0,0 +1,66 @@
+from bisect import bisect_left
+from typing import Dict, List, Tuple
+
+
+class LatencyHistogram:
+    default_buckets = (
+        0.001,
+        0.0025,
+        0.005,
+        0.01,
+        0.025,
+        0.05,
+        0.1,
+        0.25,
+        0.5,
+        1,
+        2.5,
+        5,
+        10,
+    )
+
+    def __init__(self, buckets: Tuple[float, ...] = default_buckets):
+        self.buckets = buckets
+        self.bucket_counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.bucket_counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def get_cumulative_counts(self) -> List[Tuple[str, int]]:
+        cumulative_counts = []
+        total = 0
+        for upper_bound, bucket_count in zip(self.buckets, self.bucket_counts):
+            total += bucket_count
+            cumulative_counts.append((repr(float(upper_bound)), total))
+        cumulative_counts.append(("+Inf", self.count))
+        return cumulative_counts
+
+    def copy(self) -> "LatencyHistogram":
+        histogram = LatencyHistogram(buckets=self.buckets)
+        histogram.bucket_counts = list(self.bucket_counts)
+        histogram.count = self.count
+        histogram.sum = self.sum
+        return histogram
+
+
+class MetricsSnapshot:
+    def __init__(
+        self,
+        namespace: str,
+        histograms: Dict[Tuple[str, str], LatencyHistogram],
+        gauges: Dict[str, Dict[Tuple[Tuple[str, str], ...], float]],
+    ):
+        self.namespace = namespace
+        self.histograms = histograms
+        self.gauges = gauges
+
+    def get_outcome_counts(self, stage: str) -> Dict[str, int]:
+        return {
+            outcome: histogram.count
+            for (histogram_stage, outcome), histogram in self.histograms.items()
+            if histogram_stage == stage
+        }
@@ -0,0 +1,65 @@
+from datetime import datetime
+
+from src.domain.enums.persephone_delivery import OutboxStatus
+
+
+class OutboxRecord:
+    def __init__(
+        self,
+        unique_id: str,
+        topic: str,
+        partition: int,
+        schema_name: str,
+        message: dict,
+        created_at: datetime = None,
+        next_attempt_at: datetime = None,
+        attempts: int = 0,
+        status: OutboxStatus = OutboxStatus.PENDING,
+        record_id=None,
+        sequence: int = None,
+    ):
+        self.unique_id = unique_id
+        self.topic = topic
+        self.partition = partition
+        self.schema_name = schema_name
+        self.message = message
+        self.created_at = created_at or datetime.utcnow()
+        self.next_attempt_at = next_attempt_at or self.created_at
+        self.attempts = attempts
+        self.status = status
+        self.record_id = record_id
+        self.sequence = sequence
+
+    def to_document(self) -> dict:
+        document = {
+            "unique_id": self.unique_id,
+            "topic": self.topic,
+            "partition": self.partition,
+            "schema_name": self.schema_name,
+            "message": self.message,
+            "created_at": self.created_at,
+            "next_attempt_at": self.next_attempt_at,
+            "attempts": self.attempts,
+            "status": self.status.value,
+            "lease_until": None,
+            "sequence": self.sequence,
+        }
+        if self.record_id is not None:
+            document["_id"] = self.record_id
+        return document
+
+    @classmethod
+    def from_document(cls, document: dict):
+        return cls(
+            unique_id=document["unique_id"],
+            topic=document["topic"],
+            partition=document["partition"],
+            schema_name=document["schema_name"],
+            message=document["message"],
+            created_at=document["created_at"],
+            next_attempt_at=document["next_attempt_at"],
+            attempts=document["attempts"],
+            status=OutboxStatus(document["status"]),
+            record_id=document["_id"],
+            sequence=document["sequence"],
+        )
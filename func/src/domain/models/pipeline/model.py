@@ -0,0 +1,128 @@
+import asyncio
+from time import perf_counter
+from typing import Awaitable, Callable, List, Optional
+
+from src.domain.enums.request_stage import RequestStage, StageCost
+from src.infrastructures.instrumentation.infrastructure import Instrumentation
+
+
+class PipelineStage:
+    def __init__(
+        self,
+        name: RequestStage,
+        cost: StageCost,
+        handler: Callable[[dict], Awaitable],
+    ):
+        self.name = name
+        self.cost = cost
+        self.handler = handler
+        self.executions = 0
+        self.short_circuits = 0
+        self.skipped = 0
+        self.duration_in_seconds = 0.0
+        self.saved_cost = 0
+        self.saved_seconds = 0.0
+
+    def get_average_duration(self) -> float:
+        if not self.executions:
+            return 0.0
+        return self.duration_in_seconds / self.executions
+
+    def get_stats(self) -> dict:
+        stats = {
+            "cost": int(self.cost),
+            "executions": self.executions,
+            "short_circuits": self.short_circuits,
+            "skipped": self.skipped,
+            "average_duration_in_seconds": self.get_average_duration(),
+            "saved_cost": self.saved_cost,
+            "saved_seconds": self.saved_seconds,
+        }
+        return stats
+
+
+class StagedPipeline:
+    def __init__(self, stages: List[PipelineStage], concurrent: bool = False):
+        self.stages = sorted(stages, key=lambda stage: stage.cost)
+        self.concurrent = concurrent
+
+    @staticmethod
+    def __record_short_circuit(stage: PipelineStage, skipped_stages: list):
+        stage.short_circuits += 1
+        for skipped_stage in skipped_stages:
+            skipped_stage.skipped += 1
+            stage.saved_cost += skipped_stage.cost
+            stage.saved_seconds += skipped_stage.get_average_duration()
+
+    @staticmethod
+    async def __run_stage(stage: PipelineStage, context: dict):
+        start = perf_counter()
+        try:
+            with Instrumentation.stage(name=stage.name.value):
+                await stage.handler(context)
+        finally:
+            stage.executions += 1
+            stage.duration_in_seconds += perf_counter() - start
+
+    async def __run_sequentially(self, context: dict):
+        for index, stage in enumerate(self.stages):
+            try:
+                await self.__run_stage(stage=stage, context=context)
+            except Exception:
+                self.__record_short_circuit(
+                    stage=stage, skipped_stages=self.stages[index + 1 :]
+                )
+                raise
+
+    @staticmethod
+    def __get_first_failure(tasks: List[asyncio.Task]) -> Optional[int]:
+        for index, task in enumerate(tasks):
+            if task.done() and not task.cancelled() and task.exception():
+                return index
+        return None
+
+    async def __run_concurrently(self, context: dict):
+        tasks = [
+            asyncio.ensure_future(self.__run_stage(stage=stage, context=context))
+            for stage in self.stages
+        ]
+        cancelled_stages = []
+        try:
+            pending = set(tasks)
+            while pending:
+                _, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_EXCEPTION
+                )
+                if (first_failure := self.__get_first_failure(tasks)) is None:
+                    continue
+
+                for stage, task in zip(
+                    self.stages[first_failure + 1 :], tasks[first_failure + 1 :]
+                ):
+                    if not task.done():
+                        task.cancel()
+                        cancelled_stages.append(stage)
+                pending = {task for task in tasks[:first_failure] if not task.done()}
+                if pending:
+                    continue
+
+                self.__record_short_circuit(
+                    stage=self.stages[first_failure], skipped_stages=cancelled_stages
+                )
+                raise tasks[first_failure].exception()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def run(self, context: dict) -> dict:
+        if self.concurrent:
+            await self.__run_concurrently(context=context)
+        else:
+            await self.__run_sequentially(context=context)
+        return context
+
+    def get_stats(self) -> dict:
+        stats = {stage.name.value: stage.get_stats() for stage in self.stages}
+        return stats
@@ -0,0 +1,51 @@
+from time import perf_counter, time
+from typing import Dict, Optional, Tuple
+
+
+class ProfileFrame:
+    def __init__(
+        self,
+        profile: "RequestProfile",
+        stack: Tuple[str, ...],
+        parent: Optional["ProfileFrame"] = None,
+    ):
+        self.profile = profile
+        self.stack = stack
+        self.parent = parent
+        self.children_in_seconds = 0.0
+
+    def create_child(self, name: str) -> "ProfileFrame":
+        return ProfileFrame(
+            profile=self.profile, stack=self.stack + (name,), parent=self
+        )
+
+    def close(self, total_in_seconds: float):
+        self_in_seconds = max(total_in_seconds - self.children_in_seconds, 0.0)
+        self.profile.add(stack=self.stack, seconds=self_in_seconds)
+        if self.parent is not None:
+            self.parent.children_in_seconds += total_in_seconds
+
+
+class RequestProfile:
+    def __init__(self, name: str):
+        self.name = name
+        self.started_at = time()
+        self.__started_at_counter = perf_counter()
+        self.duration_in_seconds: Optional[float] = None
+        self.self_times: Dict[Tuple[str, ...], float] = {}
+        self.root = ProfileFrame(profile=self, stack=(name,))
+
+    def add(self, stack: Tuple[str, ...], seconds: float):
+        self.self_times[stack] = self.self_times.get(stack, 0.0) + seconds
+
+    def finish(self):
+        self.duration_in_seconds = perf_counter() - self.__started_at_counter
+        self.root.close(total_in_seconds=self.duration_in_seconds)
+
+    def to_collapsed_stacks(self) -> str:
+        lines = [
+            f"{';'.join(stack)} {round(seconds * 1_000_000)}"
+            for stack, seconds in self.self_times.items()
+            if seconds > 0
+        ]
+        return "\n".join(lines)
@@ -1,8 +1,15 @@
+from hashlib import sha256
+from json import dumps
 from typing import Optional, Dict, Any, List
 
+from decouple import config
 from pydantic import BaseModel, root_validator, constr
 
+from src.domain.enums.profile import CpuSection
+from src.domain.enums.request_stage import RequestStage, StageCost
 from src.domain.models.jwt_data.model import Jwt
+from src.domain.models.pipeline.model import PipelineStage, StagedPipeline
+from src.infrastructures.profiler.infrastructure import RequestProfiler
 
 
 class PoliticallyExposedCondition(BaseModel):
@@ -24,6 +31,8 @@ class PoliticallyExposedCondition(BaseModel):
 
 
 class PoliticallyExposedRequest:
+    pipeline = None
+
     def __init__(
         self,
         x_thebes_answer: str,
@@ -34,12 +43,67 @@ class PoliticallyExposedRequest:
         self.unique_id = unique_id
         self.politically_exposed = politically_exposed
 
+    def get_payload_hash(self) -> str:
+        payload = dumps(self.politically_exposed.dict(), sort_keys=True)
+        return sha256(payload.encode()).hexdigest()
+
+    @staticmethod
+    async def __check_body_size(context: dict):
+        content_length = context.get("content_length")
+        max_body_size = config(
+            "REQUEST_MAX_BODY_SIZE_IN_BYTES", default=16384, cast=int
+        )
+        if content_length is not None and content_length > max_body_size:
+            raise ValueError(f"Request body exceeds {max_body_size} bytes")
+
+    @staticmethod
+    async def __validate_schema(context: dict):
+        with RequestProfiler.cpu_section(CpuSection.PYDANTIC_VALIDATION):
+            context["politically_exposed"] = PoliticallyExposedCondition(
+                **context["parameters"]
+            )
+
+    @staticmethod
+    async def __authenticate(context: dict):
+        context["jwt"] = await Jwt.build(jwt=context["x_thebes_answer"])
+
+    @classmethod
+    def get_pipeline(cls) -> StagedPipeline:
+        if cls.pipeline is None:
+            cls.pipeline = StagedPipeline(
+                stages=[
+                    PipelineStage(
+                        name=RequestStage.BODY_SIZE_CHECK,
+                        cost=StageCost.LOCAL_CHECK,
+                        handler=cls.__check_body_size,
+                    ),
+                    PipelineStage(
+                        name=RequestStage.SCHEMA_VALIDATION,
+                        cost=StageCost.LOCAL_VALIDATION,
+                        handler=cls.__validate_schema,
+                    ),
+                    PipelineStage(
+                        name=RequestStage.AUTH,
+                        cost=StageCost.NETWORK_CALL,
+                        handler=cls.__authenticate,
+                    ),
+                ]
+            )
+        return cls.pipeline
+
     @classmethod
-    async def build(cls, x_thebes_answer: str, parameters: dict):
-        jwt = await Jwt.build(jwt=x_thebes_answer)
-        politically_exposed = PoliticallyExposedCondition(**parameters)
+    async def build(
+        cls, x_thebes_answer: str, parameters: dict, content_length: int = None
+    ):
+        context = await cls.get_pipeline().run(
+            context={
+                "x_thebes_answer": x_thebes_answer,
+                "parameters": parameters,
+                "content_length": content_length,
+            }
+        )
         return cls(
             x_thebes_answer=x_thebes_answer,
-            unique_id=jwt.unique_id,
-            politically_exposed=politically_exposed,
+            unique_id=context["jwt"].unique_id,
+            politically_exposed=context["politically_exposed"],
         )
@@ -2,7 +2,9 @@ from json import dumps
 
 from flask import Response
 
+from src.domain.enums.profile import CpuSection
 from src.domain.enums.response.code import InternalCode
+from src.infrastructures.profiler.infrastructure import RequestProfiler
 
 
 class ResponseModel:
@@ -16,14 +18,15 @@ class ResponseModel:
         self.response = self.to_dumps()
 
     def to_dumps(self) -> str:
-        response_model = dumps(
-            {
-                "result": self.result,
-                "message": self.message,
-                "success": self.success,
-                "code": self.code,
-            }
-        )
+        with RequestProfiler.cpu_section(CpuSection.JSON_ENCODING):
+            response_model = dumps(
+                {
+                    "result": self.result,
+                    "message": self.message,
+                    "success": self.success,
+                    "code": self.code,
+                }
+            )
         self.response = response_model
         return response_model
 
@@ -0,0 +1,130 @@
+import asyncio
+from time import monotonic
+from typing import List, Optional
+
+import jwt
+from etria_logger import Gladsheim
+
+from src.domain.exceptions.model import SigningKeyNotFoundError, UnauthorizedError
+from src.infrastructures.deadline.infrastructure import StageRunner
+
+
+class SigningKeySet:
+    def __init__(
+        self,
+        transport,
+        algorithms: List[str],
+        refresh_interval_in_seconds: float,
+        min_refresh_interval_in_seconds: float,
+    ):
+        self.transport = transport
+        self.algorithms = algorithms
+        self.refresh_interval_in_seconds = refresh_interval_in_seconds
+        self.min_refresh_interval_in_seconds = min_refresh_interval_in_seconds
+        self.refreshes = 0
+        self.refresh_failures = 0
+        self.__keys = {}
+        self.__last_refresh = None
+        self.__refresh_lock = None
+        self.__background_refresh = None
+
+    @staticmethod
+    def __parse_signing_keys(signing_keys: dict) -> dict:
+        keys = {}
+        for signing_key in signing_keys.get("keys", []):
+            try:
+                keys[signing_key["kid"]] = jwt.PyJWK(signing_key)
+            except (KeyError, jwt.PyJWKError, jwt.InvalidKeyError) as ex:
+                Gladsheim.error(
+                    error=ex,
+                    message="SigningKeySet::__parse_signing_keys::Ignoring invalid signing key",
+                )
+        return keys
+
+    def __get_refresh_lock(self) -> asyncio.Lock:
+        if self.__refresh_lock is None:
+            self.__refresh_lock = asyncio.Lock()
+        return self.__refresh_lock
+
+    def __can_refresh_on_demand(self) -> bool:
+        if self.__last_refresh is None:
+            return True
+        elapsed = monotonic() - self.__last_refresh
+        return elapsed >= self.min_refresh_interval_in_seconds
+
+    async def refresh(self):
+        requested_at = monotonic()
+        async with self.__get_refresh_lock():
+            if self.__last_refresh is not None and self.__last_refresh >= requested_at:
+                return
+            signing_keys = await self.transport.get_signing_keys()
+            self.__keys = self.__parse_signing_keys(signing_keys=signing_keys)
+            self.__last_refresh = monotonic()
+            self.refreshes += 1
+
+    async def __refresh_periodically(self):
+        while True:
+            await asyncio.sleep(self.refresh_interval_in_seconds)
+            try:
+                await self.refresh()
+            except Exception as ex:
+                self.refresh_failures += 1
+                Gladsheim.warning(
+                    error=ex,
+                    message="SigningKeySet::__refresh_periodically::Failed to refresh signing keys",
+                )
+
+    def start_background_refresh(self):
+        if self.__background_refresh is None or self.__background_refresh.done():
+            self.__background_refresh = StageRunner.create_detached_task(
+                self.__refresh_periodically()
+            )
+
+    def stop_background_refresh(self):
+        if self.__background_refresh is not None:
+            self.__background_refresh.cancel()
+            self.__background_refresh = None
+
+    async def get_signing_key(self, kid: Optional[str]) -> jwt.PyJWK:
+        if kid not in self.__keys and self.__can_refresh_on_demand():
+            try:
+                await self.refresh()
+            except Exception as ex:
+                raise SigningKeyNotFoundError(
+                    "Unable to refresh the signing keys"
+                ) from ex
+
+        if (signing_key := self.__keys.get(kid)) is None:
+            raise SigningKeyNotFoundError(f"Unknown signing key id: {kid}")
+        return signing_key
+
+    async def decode(self, token: str) -> dict:
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.InvalidTokenError as ex:
+            raise UnauthorizedError() from ex
+
+        signing_key = await self.get_signing_key(kid=header.get("kid"))
+        try:
+            payload = jwt.decode(
+                token,
+                key=signing_key.key,
+                algorithms=self.algorithms,
+                options={"require": ["exp"], "verify_aud": False},
+            )
+        except jwt.InvalidTokenError as ex:
+            raise UnauthorizedError() from ex
+        return payload
+
+    def get_stats(self) -> dict:
+        stats = {
+            "keys": len(self.__keys),
+            "refreshes": self.refreshes,
+            "refresh_failures": self.refresh_failures,
+            "seconds_since_last_refresh": (
+                monotonic() - self.__last_refresh
+                if self.__last_refresh is not None
+                else None
+            ),
+        }
+        return stats
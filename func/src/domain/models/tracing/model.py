@@ -0,0 +1,80 @@
+import re
+from random import getrandbits
+from time import perf_counter, time
+from typing import Optional
+
+
+class SpanContext:
+    traceparent_pattern = re.compile(
+        r"^00-(?P<trace_id>[0-9a-f]{32})-(?P<span_id>[0-9a-f]{16})-(?P<flags>[0-9a-f]{2})$"
+    )
+
+    def __init__(self, trace_id: str, span_id: str, sampled: bool = True):
+        self.trace_id = trace_id
+        self.span_id = span_id
+        self.sampled = sampled
+
+    @staticmethod
+    def __generate_span_id() -> str:
+        return f"{getrandbits(64) or 1:016x}"
+
+    @classmethod
+    def generate(cls) -> "SpanContext":
+        trace_id = f"{getrandbits(128) or 1:032x}"
+        return cls(trace_id=trace_id, span_id=cls.__generate_span_id())
+
+    @classmethod
+    def from_traceparent(cls, traceparent: Optional[str]) -> Optional["SpanContext"]:
+        match = cls.traceparent_pattern.match((traceparent or "").strip().lower())
+        if match is None:
+            return None
+        trace_id, span_id = match.group("trace_id"), match.group("span_id")
+        if not int(trace_id, 16) or not int(span_id, 16):
+            return None
+        sampled = bool(int(match.group("flags"), 16) & 1)
+        return cls(trace_id=trace_id, span_id=span_id, sampled=sampled)
+
+    def create_child(self) -> "SpanContext":
+        return SpanContext(
+            trace_id=self.trace_id,
+            span_id=self.__generate_span_id(),
+            sampled=self.sampled,
+        )
+
+    def to_traceparent(self) -> str:
+        flags = "01" if self.sampled else "00"
+        return f"00-{self.trace_id}-{self.span_id}-{flags}"
+
+
+class Span:
+    def __init__(
+        self, name: str, context: SpanContext, parent_span_id: Optional[str] = None
+    ):
+        self.name = name
+        self.context = context
+        self.parent_span_id = parent_span_id
+        self.started_at = time()
+        self.__started_at_counter = perf_counter()
+        self.duration_in_seconds: Optional[float] = None
+        self.outcome: Optional[str] = None
+        self.attributes = {}
+
+    def set_attribute(self, name: str, value):
+        self.attributes[name] = value
+
+    def finish(self, outcome: str):
+        self.duration_in_seconds = perf_counter() - self.__started_at_counter
+        self.outcome = outcome
+
+    def to_dict(self) -> dict:
+        span_dict = {
+            "name": self.name,
+            "trace_id": self.context.trace_id,
+            "span_id": self.context.span_id,
+            "parent_span_id": self.parent_span_id,
+            "started_at": self.started_at,
+            "duration_in_seconds": self.duration_in_seconds,
+            "outcome": self.outcome,
+            "attributes": self.attributes,
+        }
+        return span_dict
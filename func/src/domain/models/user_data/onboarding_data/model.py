@@ -0,0 +1,96 @@
+from typing import Optional, List
+
+from src.domain.models.user_data.onboarding_step.model import UserOnboardingStep
+from src.domain.models.user_data.politically_exposed.model import PoliticallyExposedData
+
+
+class UserOnboardingData:
+    __is_politically_exposed_field = (
+        "external_exchange_requirements.us.is_politically_exposed"
+    )
+    __politically_exposed_names_field = (
+        "external_exchange_requirements.us.politically_exposed_names"
+    )
+    __published_version_field = (
+        "external_exchange_requirements.us.politically_exposed_published_version"
+    )
+
+    def __init__(
+        self,
+        unique_id: str,
+        step_br: Optional[str],
+        step_us: Optional[str],
+        has_suitability: bool,
+        is_politically_exposed: Optional[bool],
+        politically_exposed_names: Optional[List[str]],
+        published_version: Optional[str] = None,
+    ):
+        self.unique_id = unique_id
+        self.step_br = step_br
+        self.step_us = step_us
+        self.has_suitability = has_suitability
+        self.is_politically_exposed = is_politically_exposed
+        self.politically_exposed_names = politically_exposed_names
+        self.published_version = published_version
+
+    @staticmethod
+    def __get_field(document: dict, field: str):
+        value = document
+        for key in field.split("."):
+            if not isinstance(value, dict):
+                return None
+            value = value.get(key)
+        return value
+
+    @staticmethod
+    def get_suitability_condition() -> dict:
+        empty_values = [None, False, 0, "", {"$literal": {}}, {"$literal": []}]
+        condition = {
+            "$not": [{"$in": [{"$ifNull": ["$suitability", None]}, empty_values]}]
+        }
+        return condition
+
+    @classmethod
+    def get_projection(cls, step_br_field: str, step_us_field: str) -> dict:
+        projection = {
+            "_id": False,
+            "suitability": True,
+            step_br_field: True,
+            step_us_field: True,
+            cls.__is_politically_exposed_field: True,
+            cls.__politically_exposed_names_field: True,
+            cls.__published_version_field: True,
+        }
+        return projection
+
+    @classmethod
+    def from_document(
+        cls, unique_id: str, document: dict, step_br_field: str, step_us_field: str
+    ):
+        return cls(
+            unique_id=unique_id,
+            step_br=cls.__get_field(document, step_br_field),
+            step_us=cls.__get_field(document, step_us_field),
+            has_suitability=bool(document.get("suitability")),
+            is_politically_exposed=cls.__get_field(
+                document, cls.__is_politically_exposed_field
+            ),
+            politically_exposed_names=cls.__get_field(
+                document, cls.__politically_exposed_names_field
+            ),
+            published_version=cls.__get_field(document, cls.__published_version_field),
+        )
+
+    def get_onboarding_step(self) -> Optional[UserOnboardingStep]:
+        if self.step_br is None or self.step_us is None:
+            return None
+        return UserOnboardingStep(step_br=self.step_br, step_us=self.step_us)
+
+    def get_politically_exposed_data(self) -> Optional[PoliticallyExposedData]:
+        if self.is_politically_exposed is None:
+            return None
+        return PoliticallyExposedData(
+            unique_id=self.unique_id,
+            is_politically_exposed=self.is_politically_exposed,
+            politically_exposed_names=self.politically_exposed_names,
+        )
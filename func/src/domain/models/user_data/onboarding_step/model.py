@@ -6,8 +6,16 @@ class UserOnboardingStep:
         self.step_br = step_br
         self.step_us = step_us
 
+    @classmethod
+    def is_expected_step_br(cls, step_br: str) -> bool:
+        return step_br == cls.__expected_step_br
+
+    @classmethod
+    def is_expected_step_us(cls, step_us: str) -> bool:
+        return step_us == cls.__expected_step_us
+
     def is_in_correct_step(self):
-        is_correct_step_br = self.step_br == self.__expected_step_br
-        is_correct_step_us = self.step_us == self.__expected_step_us
+        is_correct_step_br = self.is_expected_step_br(self.step_br)
+        is_correct_step_us = self.is_expected_step_us(self.step_us)
         are_steps_ok = is_correct_step_br and is_correct_step_us
         return are_steps_ok
@@ -1,4 +1,5 @@
-from typing import Optional, List
+from hashlib import sha256
+from typing import Optional, List, Tuple
 
 from src.domain.models.user_data.model import UserData
 
@@ -20,3 +21,26 @@ class PoliticallyExposedData(UserData):
             "external_exchange_requirements.us.politically_exposed_names": self.politically_exposed_names,
         }
         return data
+
+    def get_normalized_names(self) -> Tuple[str, ...]:
+        names = self.politically_exposed_names or []
+        normalized_names = tuple(sorted({name.strip() for name in names}))
+        return normalized_names
+
+    def has_same_content(self, other: "PoliticallyExposedData") -> bool:
+        same_content = (
+            self.is_politically_exposed == other.is_politically_exposed
+            and self.get_normalized_names() == other.get_normalized_names()
+        )
+        return same_content
+
+    def get_content_version(self) -> str:
+        content = repr((self.is_politically_exposed, self.get_normalized_names()))
+        content_version = sha256(content.encode()).hexdigest()
+        return content_version
+
+    def get_published_representation(self) -> dict:
+        data = {
+            "external_exchange_requirements.us.politically_exposed_published_version": self.get_content_version(),
+        }
+        return data
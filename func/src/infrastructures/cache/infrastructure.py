@@ -0,0 +1,63 @@
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Hashable, Optional
+
+
+class TtlLruCache:
+    def __init__(self, max_size: int, ttl_in_seconds: float):
+        self.max_size = max_size
+        self.ttl_in_seconds = ttl_in_seconds
+        self.__entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self.__entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        value, expires_at = entry
+        if expires_at <= monotonic():
+            del self.__entries[key]
+            self.misses += 1
+            return None
+
+        self.__entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl_in_seconds: float = None):
+        ttl_in_seconds = (
+            self.ttl_in_seconds if ttl_in_seconds is None else ttl_in_seconds
+        )
+        if ttl_in_seconds <= 0:
+            return
+
+        self.__entries[key] = (value, monotonic() + ttl_in_seconds)
+        self.__entries.move_to_end(key)
+        while len(self.__entries) > self.max_size:
+            self.__entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, key: Hashable):
+        self.__entries.pop(key, None)
+
+    def clear(self):
+        self.__entries.clear()
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def get_stats(self) -> dict:
+        lookups = self.hits + self.misses
+        stats = {
+            "size": len(self.__entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+        }
+        return stats
@@ -0,0 +1,246 @@
+import asyncio
+from collections import deque
+from functools import wraps
+from time import monotonic
+from typing import Any, Awaitable, Callable
+
+from decouple import config
+from etria_logger import Gladsheim
+
+from src.domain.enums.circuit_breaker import CircuitBreakerDependency, CircuitState
+from src.domain.exceptions.model import CircuitOpenError
+
+
+class CircuitBreaker:
+    def __init__(
+        self,
+        name: str,
+        window_in_seconds: float,
+        minimum_calls: int,
+        failure_rate_threshold: float,
+        slow_call_threshold_in_seconds: float,
+        slow_call_rate_threshold: float,
+        open_duration_in_seconds: float,
+        half_open_max_calls: int,
+        bucket_count: int = 10,
+    ):
+        self.name = name
+        self.window_in_seconds = window_in_seconds
+        self.minimum_calls = minimum_calls
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_threshold_in_seconds = slow_call_threshold_in_seconds
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.open_duration_in_seconds = open_duration_in_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self.bucket_width_in_seconds = window_in_seconds / bucket_count
+        self.state = CircuitState.CLOSED
+        self.opened = 0
+        self.rejected = 0
+        self.__opened_at = 0.0
+        self.__half_open_in_flight = 0
+        self.__half_open_successes = 0
+        self.__buckets = deque()
+
+    def __prune_buckets(self, now: float):
+        while self.__buckets and self.__buckets[0][0] <= now - self.window_in_seconds:
+            self.__buckets.popleft()
+
+    def __get_bucket(self, now: float) -> list:
+        self.__prune_buckets(now)
+        bucket_start = now - now % self.bucket_width_in_seconds
+        if not self.__buckets or self.__buckets[-1][0] != bucket_start:
+            self.__buckets.append([bucket_start, 0, 0, 0])
+        return self.__buckets[-1]
+
+    def __get_window_totals(self, now: float) -> tuple:
+        self.__prune_buckets(now)
+        calls = sum(bucket[1] for bucket in self.__buckets)
+        failures = sum(bucket[2] for bucket in self.__buckets)
+        slow_calls = sum(bucket[3] for bucket in self.__buckets)
+        return calls, failures, slow_calls
+
+    def __transition(self, state: CircuitState, now: float):
+        Gladsheim.warning(
+            message="CircuitBreaker::__transition::Circuit state changed",
+            dependency=self.name,
+            previous_state=self.state.name,
+            state=state.name,
+        )
+        self.state = state
+        if state == CircuitState.OPEN:
+            self.opened += 1
+            self.__opened_at = now
+        elif state == CircuitState.HALF_OPEN:
+            self.__half_open_in_flight = 0
+            self.__half_open_successes = 0
+        else:
+            self.__buckets.clear()
+
+    def __reject(self):
+        self.rejected += 1
+        raise CircuitOpenError(f"Circuit open for {self.name}")
+
+    def __acquire_permission(self, now: float) -> bool:
+        if self.state == CircuitState.OPEN:
+            if now - self.__opened_at < self.open_duration_in_seconds:
+                self.__reject()
+            self.__transition(CircuitState.HALF_OPEN, now=now)
+        if self.state == CircuitState.HALF_OPEN:
+            if self.__half_open_in_flight >= self.half_open_max_calls:
+                self.__reject()
+            self.__half_open_in_flight += 1
+            return True
+        return False
+
+    def __release_probe(self):
+        self.__half_open_in_flight = max(self.__half_open_in_flight - 1, 0)
+
+    def __record_probe(self, now: float, failed: bool, slow: bool):
+        self.__release_probe()
+        if self.state != CircuitState.HALF_OPEN:
+            return
+        if failed or slow:
+            self.__transition(CircuitState.OPEN, now=now)
+            return
+        self.__half_open_successes += 1
+        if self.__half_open_successes >= self.half_open_max_calls:
+            self.__transition(CircuitState.CLOSED, now=now)
+
+    def __record_call(self, now: float, failed: bool, slow: bool):
+        bucket = self.__get_bucket(now)
+        bucket[1] += 1
+        bucket[2] += int(failed)
+        bucket[3] += int(slow)
+        if self.state != CircuitState.CLOSED:
+            return
+        calls, failures, slow_calls = self.__get_window_totals(now)
+        if calls < self.minimum_calls:
+            return
+        if (
+            failures / calls >= self.failure_rate_threshold
+            or slow_calls / calls >= self.slow_call_rate_threshold
+        ):
+            self.__transition(CircuitState.OPEN, now=now)
+
+    def __record(self, is_probe: bool, started_at: float, failed: bool):
+        now = monotonic()
+        slow = now - started_at >= self.slow_call_threshold_in_seconds
+        if is_probe:
+            self.__record_probe(now=now, failed=failed, slow=slow)
+        else:
+            self.__record_call(now=now, failed=failed, slow=slow)
+
+    async def call(self, operation: Callable[[], Awaitable[Any]]) -> Any:
+        started_at = monotonic()
+        is_probe = self.__acquire_permission(started_at)
+        try:
+            result = await operation()
+        except Exception:
+            self.__record(is_probe=is_probe, started_at=started_at, failed=True)
+            raise
+        except asyncio.CancelledError:
+            if monotonic() - started_at >= self.slow_call_threshold_in_seconds:
+                self.__record(is_probe=is_probe, started_at=started_at, failed=True)
+            elif is_probe:
+                self.__release_probe()
+            raise
+        except BaseException:
+            if is_probe:
+                self.__release_probe()
+            raise
+        self.__record(is_probe=is_probe, started_at=started_at, failed=False)
+        return result
+
+    def get_stats(self) -> dict:
+        calls, failures, slow_calls = self.__get_window_totals(monotonic())
+        stats = {
+            "state": self.state.name.lower(),
+            "state_code": self.state.value,
+            "calls": calls,
+            "failures": failures,
+            "slow_calls": slow_calls,
+            "failure_rate": failures / calls if calls else 0,
+            "slow_call_rate": slow_calls / calls if calls else 0,
+            "opened": self.opened,
+            "rejected": self.rejected,
+        }
+        return stats
+
+
+class CircuitBreakerRegistry:
+    breakers = {}
+
+    @staticmethod
+    def __is_enabled() -> bool:
+        circuit_breaker_enabled = config(
+            "CIRCUIT_BREAKER_ENABLED", default=False, cast=bool
+        )
+        return circuit_breaker_enabled is True
+
+    @staticmethod
+    def __get_setting(
+        dependency: CircuitBreakerDependency, name: str, default, cast
+    ) -> Any:
+        value = config(f"CIRCUIT_BREAKER_{name}", default=default, cast=cast)
+        value = config(
+            f"CIRCUIT_BREAKER_{dependency.value.upper()}_{name}",
+            default=value,
+            cast=cast,
+        )
+        return value
+
+    @classmethod
+    def __build_breaker(cls, dependency: CircuitBreakerDependency) -> CircuitBreaker:
+        circuit_breaker = CircuitBreaker(
+            name=dependency.value,
+            window_in_seconds=cls.__get_setting(
+                dependency, "WINDOW_IN_SECONDS", default=10, cast=float
+            ),
+            minimum_calls=cls.__get_setting(
+                dependency, "MINIMUM_CALLS", default=20, cast=int
+            ),
+            failure_rate_threshold=cls.__get_setting(
+                dependency, "FAILURE_RATE_THRESHOLD", default=0.5, cast=float
+            ),
+            slow_call_threshold_in_seconds=cls.__get_setting(
+                dependency, "SLOW_CALL_THRESHOLD_IN_SECONDS", default=2, cast=float
+            ),
+            slow_call_rate_threshold=cls.__get_setting(
+                dependency, "SLOW_CALL_RATE_THRESHOLD", default=0.8, cast=float
+            ),
+            open_duration_in_seconds=cls.__get_setting(
+                dependency, "OPEN_DURATION_IN_SECONDS", default=5, cast=float
+            ),
+            half_open_max_calls=cls.__get_setting(
+                dependency, "HALF_OPEN_MAX_CALLS", default=3, cast=int
+            ),
+        )
+        return circuit_breaker
+
+    @classmethod
+    def get_breaker(cls, dependency: CircuitBreakerDependency) -> CircuitBreaker:
+        if dependency not in cls.breakers:
+            cls.breakers[dependency] = cls.__build_breaker(dependency)
+        return cls.breakers[dependency]
+
+    @classmethod
+    def protect(cls, dependency: CircuitBreakerDependency):
+        def decorator(function):
+            @wraps(function)
+            async def protected(*args, **kwargs):
+                if not cls.__is_enabled():
+                    return await function(*args, **kwargs)
+                return await cls.get_breaker(dependency).call(
+                    lambda: function(*args, **kwargs)
+                )
+
+            return protected
+
+        return decorator
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        return {
+            dependency.value: circuit_breaker.get_stats()
+            for dependency, circuit_breaker in cls.breakers.items()
+        }
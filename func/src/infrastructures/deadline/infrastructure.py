@@ -0,0 +1,106 @@
+import asyncio
+from contextvars import ContextVar, Token, copy_context
+from functools import wraps
+from typing import Any, Awaitable, Callable, Coroutine, Optional
+
+from decouple import config
+from etria_logger import Gladsheim
+
+from src.domain.exceptions.model import DeadlineExceededError
+from src.domain.models.deadline.model import Deadline
+from src.infrastructures.instrumentation.infrastructure import Instrumentation
+
+current_deadline: ContextVar[Optional[Deadline]] = ContextVar(
+    "current_deadline", default=None
+)
+
+
+class StageRunner:
+    expired = 0
+
+    @staticmethod
+    def start_request_deadline() -> Optional[Token]:
+        request_deadline_enabled = config(
+            "REQUEST_DEADLINE_ENABLED", default=False, cast=bool
+        )
+        if request_deadline_enabled is not True:
+            return None
+        deadline = Deadline(
+            budget_in_seconds=config(
+                "REQUEST_DEADLINE_IN_SECONDS", default=55, cast=float
+            )
+        )
+        return current_deadline.set(deadline)
+
+    @staticmethod
+    def reset(token: Optional[Token]):
+        if token is not None:
+            current_deadline.reset(token)
+
+    @staticmethod
+    def get_deadline() -> Optional[Deadline]:
+        return current_deadline.get()
+
+    @staticmethod
+    def create_detached_task(
+        coroutine: Coroutine, loop: asyncio.AbstractEventLoop = None
+    ) -> asyncio.Task:
+        loop = loop or asyncio.get_running_loop()
+        context = copy_context()
+        context.run(current_deadline.set, None)
+        return loop.create_task(coroutine, context=context)
+
+    @classmethod
+    def get_remaining(cls) -> Optional[float]:
+        deadline = cls.get_deadline()
+        if deadline is None:
+            return None
+        return deadline.get_remaining()
+
+    @classmethod
+    def __expire(cls, deadline: Deadline, stage: str):
+        cls.expired += 1
+        Gladsheim.warning(
+            message="StageRunner::run::Request deadline exceeded",
+            stage=stage,
+            previous_stage=deadline.last_stage,
+            budget_in_seconds=deadline.budget_in_seconds,
+            elapsed_in_seconds=deadline.get_elapsed(),
+        )
+        raise DeadlineExceededError(f"Deadline exceeded at {stage}")
+
+    @classmethod
+    async def run(cls, stage: str, operation: Callable[[], Awaitable[Any]]) -> Any:
+        with Instrumentation.stage(name=stage):
+            return await cls.__run_within_deadline(stage=stage, operation=operation)
+
+    @classmethod
+    async def __run_within_deadline(
+        cls, stage: str, operation: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        deadline = cls.get_deadline()
+        if deadline is None:
+            return await operation()
+        if deadline.is_expired():
+            cls.__expire(deadline=deadline, stage=stage)
+        try:
+            return await asyncio.wait_for(operation(), timeout=deadline.get_remaining())
+        except asyncio.TimeoutError:
+            if not deadline.is_expired():
+                raise
+            cls.__expire(deadline=deadline, stage=stage)
+        finally:
+            deadline.last_stage = stage
+
+    @classmethod
+    def stage(cls, name: str):
+        def decorator(function):
+            @wraps(function)
+            async def bounded(*args, **kwargs):
+                return await cls.run(
+                    stage=name, operation=lambda: function(*args, **kwargs)
+                )
+
+            return bounded
+
+        return decorator
@@ -0,0 +1,110 @@
+import asyncio
+from collections import deque
+from time import perf_counter
+from typing import Any, Awaitable, Callable
+
+
+class RequestHedger:
+    def __init__(
+        self,
+        percentile: float,
+        min_delay_in_seconds: float,
+        max_delay_in_seconds: float,
+        budget_ratio: float,
+        budget_burst: float,
+        min_samples: int = 20,
+        window_size: int = 1000,
+        refresh_interval: int = 32,
+    ):
+        self.percentile = percentile
+        self.min_delay_in_seconds = min_delay_in_seconds
+        self.max_delay_in_seconds = max_delay_in_seconds
+        self.budget_ratio = budget_ratio
+        self.budget_burst = budget_burst
+        self.min_samples = min_samples
+        self.refresh_interval = refresh_interval
+        self.requests = 0
+        self.hedges = 0
+        self.hedge_wins = 0
+        self.budget_exhausted = 0
+        self.__budget = budget_burst
+        self.__samples = deque(maxlen=window_size)
+        self.__new_samples = 0
+        self.__hedge_delay_in_seconds = max_delay_in_seconds
+
+    def __record_latency(self, latency_in_seconds: float):
+        self.__samples.append(latency_in_seconds)
+        self.__new_samples += 1
+        if len(self.__samples) < self.min_samples:
+            return
+        if (
+            self.__new_samples < self.refresh_interval
+            and len(self.__samples) != self.min_samples
+        ):
+            return
+        self.__new_samples = 0
+        samples = sorted(self.__samples)
+        index = min(int(len(samples) * self.percentile / 100), len(samples) - 1)
+        self.__hedge_delay_in_seconds = min(
+            max(samples[index], self.min_delay_in_seconds), self.max_delay_in_seconds
+        )
+
+    def get_hedge_delay(self) -> float:
+        return self.__hedge_delay_in_seconds
+
+    def __try_spend_budget(self) -> bool:
+        if self.__budget < 1:
+            self.budget_exhausted += 1
+            return False
+        self.__budget -= 1
+        return True
+
+    async def __attempt(self, operation: Callable[[], Awaitable[Any]]) -> Any:
+        started_at = perf_counter()
+        result = await operation()
+        self.__record_latency(perf_counter() - started_at)
+        return result
+
+    @staticmethod
+    async def __first_successful(attempts: set) -> asyncio.Task:
+        pending = set(attempts)
+        while True:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for attempt in done:
+                if attempt.exception() is None:
+                    return attempt
+            if not pending:
+                return done.pop()
+
+    async def run(self, operation: Callable[[], Awaitable[Any]]) -> Any:
+        self.requests += 1
+        self.__budget = min(self.__budget + self.budget_ratio, self.budget_burst)
+        primary = asyncio.ensure_future(self.__attempt(operation))
+        attempts = {primary}
+        try:
+            done, _ = await asyncio.wait(attempts, timeout=self.get_hedge_delay())
+            if done or not self.__try_spend_budget():
+                return await primary
+            self.hedges += 1
+            attempts.add(asyncio.ensure_future(self.__attempt(operation)))
+            winner = await self.__first_successful(attempts)
+            if winner is not primary:
+                self.hedge_wins += 1
+            return winner.result()
+        finally:
+            for attempt in attempts:
+                if not attempt.done():
+                    attempt.cancel()
+
+    def get_stats(self) -> dict:
+        stats = {
+            "requests": self.requests,
+            "hedges": self.hedges,
+            "hedge_wins": self.hedge_wins,
+            "budget_exhausted": self.budget_exhausted,
+            "hedge_rate": self.hedges / self.requests if self.requests else 0,
+            "hedge_delay_in_seconds": self.__hedge_delay_in_seconds,
+        }
+        return stats
@@ -0,0 +1,16 @@
+from contextlib import contextmanager
+from typing import Optional
+
+from src.infrastructures.metrics.infrastructure import MetricsRegistry
+from src.infrastructures.profiler.infrastructure import RequestProfiler
+from src.infrastructures.tracing.infrastructure import Tracer
+
+
+class Instrumentation:
+    @staticmethod
+    @contextmanager
+    def stage(name: str, traceparent: Optional[str] = None):
+        with MetricsRegistry.measure(stage=name), Tracer.span(
+            name=name, traceparent=traceparent
+        ), RequestProfiler.frame(name=name):
+            yield
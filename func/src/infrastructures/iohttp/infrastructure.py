@@ -1,12 +1,223 @@
+from time import perf_counter
+from types import SimpleNamespace
+
 import aiohttp
+from decouple import config
+
+from src.domain.enums.http_endpoint import HttpEndpoint
+from src.domain.exceptions.model import DeadlineExceededError
+from src.infrastructures.deadline.infrastructure import StageRunner
+from src.infrastructures.loop_registry.infrastructure import LoopResourceRegistry
+
+
+class HttpClientMetrics:
+    def __init__(self):
+        self.requests = 0
+        self.failures = 0
+        self.latency_in_seconds = 0.0
+        self.max_latency_in_seconds = 0.0
+        self.pool_waits = 0
+        self.pool_wait_in_seconds = 0.0
+        self.max_pool_wait_in_seconds = 0.0
+        self.connections_created = 0
+        self.connections_reused = 0
+
+    def record_request(self, latency_in_seconds: float, failed: bool):
+        self.requests += 1
+        self.failures += int(failed)
+        self.latency_in_seconds += latency_in_seconds
+        self.max_latency_in_seconds = max(
+            self.max_latency_in_seconds, latency_in_seconds
+        )
+
+    def record_pool_wait(self, pool_wait_in_seconds: float):
+        self.pool_waits += 1
+        self.pool_wait_in_seconds += pool_wait_in_seconds
+        self.max_pool_wait_in_seconds = max(
+            self.max_pool_wait_in_seconds, pool_wait_in_seconds
+        )
+
+    def get_stats(self) -> dict:
+        stats = {
+            "requests": self.requests,
+            "failures": self.failures,
+            "average_latency_in_seconds": (
+                self.latency_in_seconds / self.requests if self.requests else 0
+            ),
+            "max_latency_in_seconds": self.max_latency_in_seconds,
+            "pool_waits": self.pool_waits,
+            "average_pool_wait_in_seconds": (
+                self.pool_wait_in_seconds / self.pool_waits if self.pool_waits else 0
+            ),
+            "max_pool_wait_in_seconds": self.max_pool_wait_in_seconds,
+            "connections_created": self.connections_created,
+            "connections_reused": self.connections_reused,
+        }
+        return stats
 
 
 class RequestInfrastructure:
-    __session = None
+    metrics = {}
+
+    @classmethod
+    def get_metrics(cls, endpoint_name: str) -> HttpClientMetrics:
+        if endpoint_name not in RequestInfrastructure.metrics:
+            RequestInfrastructure.metrics[endpoint_name] = HttpClientMetrics()
+        return RequestInfrastructure.metrics[endpoint_name]
+
+    @classmethod
+    def get_http_client_stats(cls) -> dict:
+        return {
+            endpoint_name: metrics.get_stats()
+            for endpoint_name, metrics in RequestInfrastructure.metrics.items()
+        }
+
+    @staticmethod
+    def __get_endpoint_name(trace_config_ctx: SimpleNamespace) -> str:
+        trace_request_ctx = trace_config_ctx.trace_request_ctx or {}
+        return trace_request_ctx.get("endpoint", "default")
+
+    @classmethod
+    async def __on_request_start(cls, session, trace_config_ctx, params):
+        LoopResourceRegistry.check_loop(name="http_session", resource=session)
+        trace_config_ctx.request_started_at = perf_counter()
+
+    @classmethod
+    async def __on_request_end(cls, session, trace_config_ctx, params):
+        cls.get_metrics(cls.__get_endpoint_name(trace_config_ctx)).record_request(
+            latency_in_seconds=perf_counter() - trace_config_ctx.request_started_at,
+            failed=params.response.status >= 500,
+        )
+
+    @classmethod
+    async def __on_request_exception(cls, session, trace_config_ctx, params):
+        cls.get_metrics(cls.__get_endpoint_name(trace_config_ctx)).record_request(
+            latency_in_seconds=perf_counter() - trace_config_ctx.request_started_at,
+            failed=True,
+        )
+
+    @classmethod
+    async def __on_connection_queued_start(cls, session, trace_config_ctx, params):
+        trace_config_ctx.queued_at = perf_counter()
+
+    @classmethod
+    async def __on_connection_queued_end(cls, session, trace_config_ctx, params):
+        cls.get_metrics(cls.__get_endpoint_name(trace_config_ctx)).record_pool_wait(
+            pool_wait_in_seconds=perf_counter() - trace_config_ctx.queued_at
+        )
+
+    @classmethod
+    async def __on_connection_create_end(cls, session, trace_config_ctx, params):
+        cls.get_metrics(
+            cls.__get_endpoint_name(trace_config_ctx)
+        ).connections_created += 1
+
+    @classmethod
+    async def __on_connection_reuseconn(cls, session, trace_config_ctx, params):
+        cls.get_metrics(
+            cls.__get_endpoint_name(trace_config_ctx)
+        ).connections_reused += 1
+
+    @classmethod
+    def __build_trace_config(cls) -> aiohttp.TraceConfig:
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_request_start.append(cls.__on_request_start)
+        trace_config.on_request_end.append(cls.__on_request_end)
+        trace_config.on_request_exception.append(cls.__on_request_exception)
+        trace_config.on_connection_queued_start.append(cls.__on_connection_queued_start)
+        trace_config.on_connection_queued_end.append(cls.__on_connection_queued_end)
+        trace_config.on_connection_create_end.append(cls.__on_connection_create_end)
+        trace_config.on_connection_reuseconn.append(cls.__on_connection_reuseconn)
+        return trace_config
+
+    @staticmethod
+    def __build_connector() -> aiohttp.TCPConnector:
+        connector = aiohttp.TCPConnector(
+            limit=config("HTTP_CLIENT_MAX_CONNECTIONS", default=100, cast=int),
+            limit_per_host=config(
+                "HTTP_CLIENT_MAX_CONNECTIONS_PER_HOST", default=50, cast=int
+            ),
+            use_dns_cache=True,
+            ttl_dns_cache=config(
+                "HTTP_CLIENT_DNS_CACHE_TTL_IN_SECONDS", default=60, cast=int
+            ),
+            keepalive_timeout=config(
+                "HTTP_CLIENT_KEEPALIVE_TIMEOUT_IN_SECONDS", default=30, cast=float
+            ),
+        )
+        return connector
+
+    @staticmethod
+    def get_timeout(endpoint: HttpEndpoint = None) -> aiohttp.ClientTimeout:
+        timeouts = {"total": 30, "connect": 2, "read": 10}
+        prefixes = ["HTTP_CLIENT"]
+        if endpoint is not None:
+            prefixes.append(f"HTTP_CLIENT_{endpoint.value.upper()}")
+        for prefix in prefixes:
+            for name, default in timeouts.items():
+                timeouts[name] = config(
+                    f"{prefix}_{name.upper()}_TIMEOUT_IN_SECONDS",
+                    default=default,
+                    cast=float,
+                )
+        timeout = aiohttp.ClientTimeout(
+            total=timeouts["total"],
+            connect=timeouts["connect"],
+            sock_read=timeouts["read"],
+        )
+        return timeout
+
+    @classmethod
+    def __get_deadline_bound_timeout(
+        cls, endpoint: HttpEndpoint
+    ) -> aiohttp.ClientTimeout:
+        timeout = cls.get_timeout(endpoint=endpoint)
+        remaining = StageRunner.get_remaining()
+        if remaining is None or remaining >= timeout.total:
+            return timeout
+        if remaining <= 0:
+            raise DeadlineExceededError(
+                f"Deadline exceeded before calling {endpoint.value}"
+            )
+        return aiohttp.ClientTimeout(
+            total=remaining, connect=timeout.connect, sock_read=timeout.sock_read
+        )
+
+    @classmethod
+    def get_request_options(cls, endpoint: HttpEndpoint) -> dict:
+        request_options = {
+            "timeout": cls.__get_deadline_bound_timeout(endpoint=endpoint),
+            "trace_request_ctx": {"endpoint": endpoint.value},
+        }
+        return request_options
+
+    @classmethod
+    def __create_session(cls) -> aiohttp.ClientSession:
+        client_session = aiohttp.ClientSession(
+            connector=cls.__build_connector(),
+            timeout=cls.get_timeout(),
+            trace_configs=[cls.__build_trace_config()],
+        )
+        return client_session
+
+    @staticmethod
+    def __close_session(client_session: aiohttp.ClientSession):
+        return client_session.close()
 
     @classmethod
     def get_session(cls):
-        if cls.__session is None:
-            client_session = aiohttp.ClientSession()
-            cls.__session = client_session
-        return cls.__session
+        client_session = LoopResourceRegistry.get(
+            name="http_session",
+            factory=cls.__create_session,
+            closer=cls.__close_session,
+        )
+        return client_session
+
+    @classmethod
+    async def pre_connect(cls, url: str, endpoint: HttpEndpoint = None) -> int:
+        session = cls.get_session()
+        request_options = {} if endpoint is None else cls.get_request_options(endpoint)
+        async with session.head(
+            url, allow_redirects=False, **request_options
+        ) as response:
+            return response.status
@@ -0,0 +1,199 @@
+import asyncio
+import logging
+import sys
+import threading
+import traceback
+from collections import deque
+from time import perf_counter
+from typing import List, Optional, Tuple
+
+from decouple import config
+from etria_logger import Gladsheim
+
+
+class LoopLagMonitor:
+    def __init__(
+        self,
+        interval_in_seconds: float,
+        spike_threshold_in_seconds: float,
+        max_stack_depth: int = 20,
+        window_size: int = 600,
+    ):
+        self.interval_in_seconds = interval_in_seconds
+        self.spike_threshold_in_seconds = spike_threshold_in_seconds
+        self.max_stack_depth = max_stack_depth
+        self.samples = 0
+        self.spikes = 0
+        self.stalls = 0
+        self.last_lag_in_seconds = 0.0
+        self.max_lag_in_seconds = 0.0
+        self.last_blocking_stack: Optional[str] = None
+        self.__lags = deque(maxlen=window_size)
+        self.__loop = None
+        self.__loop_thread_id = None
+        self.__task = None
+        self.__watchdog = None
+        self.__stopped = threading.Event()
+        self.__heartbeat = perf_counter()
+        self.__stall_reported = False
+
+    def is_running_on(self, loop: asyncio.AbstractEventLoop) -> bool:
+        return (
+            self.__loop is loop and self.__task is not None and not self.__task.done()
+        )
+
+    def start(self):
+        self.__loop = asyncio.get_running_loop()
+        self.__loop_thread_id = threading.get_ident()
+        self.__heartbeat = perf_counter()
+        self.__stopped = threading.Event()
+        self.__task = self.__loop.create_task(self.__sample_lag(self.__stopped))
+        self.__watchdog = threading.Thread(
+            target=self.__watch,
+            args=(self.__loop, self.__stopped),
+            name="loop-lag-watchdog",
+            daemon=True,
+        )
+        self.__watchdog.start()
+
+    def stop(self):
+        self.__stopped.set()
+        if self.__task is not None and not self.__task.done():
+            self.__task.cancel()
+        self.__task = None
+
+    def __record_lag(self, lag_in_seconds: float):
+        self.samples += 1
+        self.last_lag_in_seconds = lag_in_seconds
+        self.max_lag_in_seconds = max(self.max_lag_in_seconds, lag_in_seconds)
+        self.__lags.append(lag_in_seconds)
+        if lag_in_seconds >= self.spike_threshold_in_seconds:
+            self.spikes += 1
+
+    async def __sample_lag(self, stopped: threading.Event):
+        try:
+            while True:
+                expected_at = perf_counter() + self.interval_in_seconds
+                await asyncio.sleep(self.interval_in_seconds)
+                self.__heartbeat = perf_counter()
+                self.__stall_reported = False
+                self.__record_lag(max(self.__heartbeat - expected_at, 0.0))
+        finally:
+            stopped.set()
+
+    def __get_loop_stack(self) -> Optional[str]:
+        frame = sys._current_frames().get(self.__loop_thread_id)
+        if frame is None:
+            return None
+        stack = traceback.format_stack(frame)[-self.max_stack_depth :]
+        return "".join(stack)
+
+    def __watch(self, loop: asyncio.AbstractEventLoop, stopped: threading.Event):
+        while not stopped.wait(self.interval_in_seconds):
+            if loop.is_closed() or not loop.is_running():
+                return
+            blocked_in_seconds = perf_counter() - self.__heartbeat
+            stall_threshold = self.interval_in_seconds + self.spike_threshold_in_seconds
+            if self.__stall_reported or blocked_in_seconds < stall_threshold:
+                continue
+            self.__stall_reported = True
+            self.stalls += 1
+            self.last_blocking_stack = self.__get_loop_stack()
+            Gladsheim.warning(
+                message="LoopLagMonitor::__watch::Event loop is blocked",
+                blocked_for_in_seconds=blocked_in_seconds,
+                stack=self.last_blocking_stack,
+            )
+
+    def __get_percentile(self, percentile: float) -> float:
+        if not self.__lags:
+            return 0.0
+        lags = sorted(self.__lags)
+        return lags[min(int(len(lags) * percentile / 100), len(lags) - 1)]
+
+    def get_stats(self) -> dict:
+        stats = {
+            "samples": self.samples,
+            "spikes": self.spikes,
+            "stalls": self.stalls,
+            "lag_in_seconds": self.last_lag_in_seconds,
+            "p99_lag_in_seconds": self.__get_percentile(99),
+            "max_lag_in_seconds": self.max_lag_in_seconds,
+        }
+        return stats
+
+
+class EventLoopMonitor:
+    monitor = None
+
+    @staticmethod
+    def __is_enabled() -> bool:
+        loop_monitor_enabled = config("LOOP_MONITOR_ENABLED", default=False, cast=bool)
+        return loop_monitor_enabled is True
+
+    @classmethod
+    def get_monitor(cls) -> LoopLagMonitor:
+        if cls.monitor is None:
+            cls.monitor = LoopLagMonitor(
+                interval_in_seconds=config(
+                    "LOOP_MONITOR_INTERVAL_IN_SECONDS", default=0.1, cast=float
+                ),
+                spike_threshold_in_seconds=config(
+                    "LOOP_MONITOR_SPIKE_THRESHOLD_IN_SECONDS", default=0.05, cast=float
+                ),
+            )
+        return cls.monitor
+
+    @classmethod
+    def ensure_started(cls):
+        if cls.monitor is None and not cls.__is_enabled():
+            return
+        monitor = cls.get_monitor()
+        loop = asyncio.get_running_loop()
+        if monitor.is_running_on(loop):
+            return
+        monitor.stop()
+        monitor.start()
+
+    @classmethod
+    def stop(cls):
+        if cls.monitor is not None:
+            cls.monitor.stop()
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        if cls.monitor is None:
+            return {}
+        return cls.monitor.get_stats()
+
+
+class BlockingCallDetector(logging.Handler):
+    def __init__(self, threshold_in_seconds: float = 0.05):
+        super().__init__(level=logging.WARNING)
+        self.threshold_in_seconds = threshold_in_seconds
+        self.blocking_calls: List[Tuple[str, float]] = []
+        self.__loop = None
+        self.__previous_settings = None
+
+    def emit(self, record: logging.LogRecord):
+        if record.msg.startswith("Executing") and len(record.args) == 2:
+            callback, duration_in_seconds = record.args
+            self.blocking_calls.append((str(callback), duration_in_seconds))
+
+    async def __aenter__(self) -> "BlockingCallDetector":
+        self.__loop = asyncio.get_running_loop()
+        self.__previous_settings = (
+            self.__loop.get_debug(),
+            self.__loop.slow_callback_duration,
+        )
+        self.__loop.set_debug(True)
+        self.__loop.slow_callback_duration = self.threshold_in_seconds
+        logging.getLogger("asyncio").addHandler(self)
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await asyncio.sleep(0)
+        logging.getLogger("asyncio").removeHandler(self)
+        debug, slow_callback_duration = self.__previous_settings
+        self.__loop.set_debug(debug)
+        self.__loop.slow_callback_duration = slow_callback_duration
@@ -0,0 +1,159 @@
+import asyncio
+from inspect import isawaitable
+from typing import Any, Awaitable, Callable, Optional
+
+from etria_logger import Gladsheim
+
+
+class LoopResourceRegistry:
+    resources = {}
+    closers = {}
+    owners = {}
+    watchers = {}
+    discards = set()
+    created = 0
+    reused = 0
+    closed = 0
+    cross_loop_uses = 0
+
+    @staticmethod
+    def __get_running_loop() -> Optional[asyncio.AbstractEventLoop]:
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    @classmethod
+    async def __watch_loop(cls, loop: asyncio.AbstractEventLoop):
+        try:
+            yield
+        finally:
+            await cls.close_loop_resources(loop=loop)
+
+    @classmethod
+    async def __start_watcher(cls, watcher):
+        await watcher.__anext__()
+
+    @classmethod
+    def __register_loop(cls, loop: Optional[asyncio.AbstractEventLoop]) -> dict:
+        cls.resources[loop] = {}
+        if loop is not None:
+            watcher = cls.__watch_loop(loop=loop)
+            cls.watchers[loop] = watcher
+            loop.create_task(cls.__start_watcher(watcher))
+        return cls.resources[loop]
+
+    @classmethod
+    def __release_closed_loops(cls):
+        for loop in list(cls.resources):
+            if loop is None or not loop.is_closed():
+                continue
+            for name, resource in cls.__pop_loop_resources(loop=loop).items():
+                cls.__discard(name=name, resource=resource)
+
+    @classmethod
+    def __pop_loop_resources(cls, loop: Optional[asyncio.AbstractEventLoop]) -> dict:
+        cls.watchers.pop(loop, None)
+        loop_resources = cls.resources.pop(loop, {})
+        for resource in loop_resources.values():
+            cls.owners.pop(id(resource), None)
+        cls.closed += len(loop_resources)
+        return loop_resources
+
+    @classmethod
+    async def __finish_discard(cls, name: str, closing: Awaitable):
+        try:
+            await closing
+        except Exception as ex:
+            Gladsheim.warning(
+                message="LoopResourceRegistry::__discard::Failed to discard resource",
+                resource=name,
+                error=repr(ex),
+            )
+
+    @classmethod
+    def __discard(cls, name: str, resource: Any):
+        closer = cls.closers.get(name)
+        try:
+            closing = closer(resource) if closer is not None else None
+        except Exception as ex:
+            Gladsheim.warning(
+                message="LoopResourceRegistry::__discard::Failed to discard resource",
+                resource=name,
+                error=repr(ex),
+            )
+            return
+        if not isawaitable(closing):
+            return
+        loop = cls.__get_running_loop()
+        if loop is None:
+            temporary_loop = asyncio.new_event_loop()
+            try:
+                temporary_loop.run_until_complete(
+                    cls.__finish_discard(name=name, closing=closing)
+                )
+            finally:
+                temporary_loop.close()
+            return
+        discard = loop.create_task(cls.__finish_discard(name=name, closing=closing))
+        cls.discards.add(discard)
+        discard.add_done_callback(cls.discards.discard)
+
+    @classmethod
+    def get(cls, name: str, factory: Callable[[], Any], closer: Callable = None):
+        loop = cls.__get_running_loop()
+        cls.__release_closed_loops()
+        loop_resources = cls.resources.get(loop)
+        if loop_resources is None:
+            loop_resources = cls.__register_loop(loop=loop)
+        if name in loop_resources:
+            cls.reused += 1
+            return loop_resources[name]
+
+        resource = factory()
+        cls.created += 1
+        loop_resources[name] = resource
+        cls.closers[name] = closer
+        cls.owners[id(resource)] = loop
+        return resource
+
+    @classmethod
+    def check_loop(cls, name: str, resource: Any) -> bool:
+        owner = cls.owners.get(id(resource))
+        loop = cls.__get_running_loop()
+        if owner is None or loop is None or owner is loop:
+            return True
+        cls.cross_loop_uses += 1
+        Gladsheim.warning(
+            message="LoopResourceRegistry::check_loop::Resource used from a different event loop",
+            resource=name,
+        )
+        return False
+
+    @classmethod
+    async def close_loop_resources(cls, loop: asyncio.AbstractEventLoop = None):
+        loop = loop or cls.__get_running_loop()
+        for name, resource in cls.__pop_loop_resources(loop=loop).items():
+            closer = cls.closers.get(name)
+            try:
+                closing = closer(resource) if closer is not None else None
+                if isawaitable(closing):
+                    await closing
+            except Exception as ex:
+                Gladsheim.warning(
+                    message="LoopResourceRegistry::close_loop_resources::Failed to close resource",
+                    resource=name,
+                    error=repr(ex),
+                )
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        stats = {
+            "loops": len(cls.resources),
+            "resources": sum(len(resources) for resources in cls.resources.values()),
+            "created": cls.created,
+            "reused": cls.reused,
+            "closed": cls.closed,
+            "cross_loop_uses": cls.cross_loop_uses,
+        }
+        return stats
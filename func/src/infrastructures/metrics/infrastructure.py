@@ -0,0 +1,106 @@
+import re
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Callable, Dict, Optional
+
+from decouple import config
+from etria_logger import Gladsheim
+
+from src.domain.models.metrics.model import LatencyHistogram, MetricsSnapshot
+
+
+class MetricsRegistry:
+    enabled = None
+    histograms = {}
+    collectors = {}
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        if cls.enabled is None:
+            metrics_enabled = config("METRICS_ENABLED", default=True, cast=bool)
+            cls.enabled = metrics_enabled is True
+        return cls.enabled
+
+    @staticmethod
+    def get_outcome(error: Optional[BaseException]) -> str:
+        if error is None:
+            return "success"
+        return type(error).__name__
+
+    @classmethod
+    def observe(cls, stage: str, outcome: str, duration_in_seconds: float):
+        if not cls.is_enabled():
+            return
+        key = (stage, outcome)
+        histogram = cls.histograms.get(key)
+        if histogram is None:
+            histogram = cls.histograms[key] = LatencyHistogram()
+        histogram.observe(duration_in_seconds)
+
+    @classmethod
+    @contextmanager
+    def measure(cls, stage: str):
+        started_at = perf_counter()
+        error = None
+        try:
+            yield
+        except BaseException as ex:
+            error = ex
+            raise
+        finally:
+            cls.observe(
+                stage=stage,
+                outcome=cls.get_outcome(error),
+                duration_in_seconds=perf_counter() - started_at,
+            )
+
+    @classmethod
+    def register_collector(cls, name: str, collector: Callable[[], Optional[dict]]):
+        cls.collectors[name] = collector
+
+    @staticmethod
+    def __sanitize(name: str) -> str:
+        return re.sub(r"[^a-zA-Z0-9_]", "_", name)
+
+    @classmethod
+    def __flatten(cls, gauges: dict, prefix: str, stats: dict, path: tuple = ()):
+        for key, value in stats.items():
+            if isinstance(value, dict):
+                cls.__flatten(gauges, prefix, value, path + (str(key),))
+                continue
+            if isinstance(value, bool):
+                value = int(value)
+            if not isinstance(value, (int, float)):
+                continue
+            labels = (("key", ".".join(path)),) if path else ()
+            metric_name = cls.__sanitize(f"{prefix}_{key}")
+            gauges.setdefault(metric_name, {})[labels] = value
+
+    @classmethod
+    def __collect_gauges(cls, namespace: str) -> Dict[str, dict]:
+        gauges = {}
+        for name, collector in cls.collectors.items():
+            try:
+                stats = collector()
+            except Exception as ex:
+                Gladsheim.warning(
+                    message="MetricsRegistry::__collect_gauges::Failed to collect metrics",
+                    collector=name,
+                    error=repr(ex),
+                )
+                continue
+            if stats:
+                cls.__flatten(gauges, prefix=f"{namespace}_{name}", stats=stats)
+        return gauges
+
+    @classmethod
+    def get_snapshot(cls) -> MetricsSnapshot:
+        namespace = config("METRICS_NAMESPACE", default="onboarding_pep_us")
+        snapshot = MetricsSnapshot(
+            namespace=namespace,
+            histograms={
+                key: histogram.copy() for key, histogram in cls.histograms.items()
+            },
+            gauges=cls.__collect_gauges(namespace=namespace),
+        )
+        return snapshot
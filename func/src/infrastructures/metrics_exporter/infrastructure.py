@@ -0,0 +1,69 @@
+from abc import ABC, abstractmethod
+from typing import List, Tuple
+
+from src.domain.models.metrics.model import MetricsSnapshot
+
+
+class MetricsExporter(ABC):
+    @abstractmethod
+    def export(self, snapshot: MetricsSnapshot):
+        pass
+
+
+class InMemoryMetricsExporter(MetricsExporter):
+    def __init__(self):
+        self.snapshots: List[MetricsSnapshot] = []
+
+    def export(self, snapshot: MetricsSnapshot):
+        self.snapshots.append(snapshot)
+
+
+class PrometheusTextExporter(MetricsExporter):
+    content_type = "text/plain; version=0.0.4; charset=utf-8"
+
+    @staticmethod
+    def __escape(value: str) -> str:
+        return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+    @classmethod
+    def __format_labels(cls, labels: Tuple[Tuple[str, str], ...]) -> str:
+        if not labels:
+            return ""
+        formatted_labels = ",".join(
+            f'{name}="{cls.__escape(value)}"' for name, value in labels
+        )
+        return f"{{{formatted_labels}}}"
+
+    @classmethod
+    def __render_histograms(cls, snapshot: MetricsSnapshot) -> List[str]:
+        duration_name = f"{snapshot.namespace}_stage_duration_seconds"
+        outcomes_name = f"{snapshot.namespace}_stage_outcomes_total"
+        duration_lines = [f"# TYPE {duration_name} histogram"]
+        outcome_lines = [f"# TYPE {outcomes_name} counter"]
+        for (stage, outcome), histogram in sorted(snapshot.histograms.items()):
+            labels = (("stage", stage), ("outcome", outcome))
+            for upper_bound, count in histogram.get_cumulative_counts():
+                bucket_labels = cls.__format_labels(labels + (("le", upper_bound),))
+                duration_lines.append(f"{duration_name}_bucket{bucket_labels} {count}")
+            formatted_labels = cls.__format_labels(labels)
+            duration_lines.append(
+                f"{duration_name}_sum{formatted_labels} {histogram.sum}"
+            )
+            duration_lines.append(
+                f"{duration_name}_count{formatted_labels} {histogram.count}"
+            )
+            outcome_lines.append(f"{outcomes_name}{formatted_labels} {histogram.count}")
+        return duration_lines + outcome_lines
+
+    @classmethod
+    def __render_gauges(cls, snapshot: MetricsSnapshot) -> List[str]:
+        lines = []
+        for metric_name, samples in sorted(snapshot.gauges.items()):
+            lines.append(f"# TYPE {metric_name} gauge")
+            for labels, value in sorted(samples.items()):
+                lines.append(f"{metric_name}{cls.__format_labels(labels)} {value}")
+        return lines
+
+    def export(self, snapshot: MetricsSnapshot) -> str:
+        lines = self.__render_histograms(snapshot) + self.__render_gauges(snapshot)
+        return "\n".join(lines) + "\n"
@@ -1,15 +1,39 @@
+from typing import Any, Awaitable, Callable
+
 from decouple import config
 
 from motor import motor_asyncio
 
+from src.infrastructures.loop_registry.infrastructure import LoopResourceRegistry
+
 
 class MongoDBInfrastructure:
+    @staticmethod
+    def __create_client():
+        url = config("MONGO_CONNECTION_URL")
+        return motor_asyncio.AsyncIOMotorClient(url)
 
-    client = None
+    @staticmethod
+    def __close_client(client):
+        client.close()
 
     @classmethod
     def get_client(cls):
-        if cls.client is None:
-            url = config("MONGO_CONNECTION_URL")
-            cls.client = motor_asyncio.AsyncIOMotorClient(url)
-        return cls.client
+        client = LoopResourceRegistry.get(
+            name="mongo_client",
+            factory=cls.__create_client,
+            closer=cls.__close_client,
+        )
+        return client
+
+    @classmethod
+    async def run_in_transaction(cls, callback: Callable[[Any], Awaitable[Any]]) -> Any:
+        client = cls.get_client()
+        LoopResourceRegistry.check_loop(name="mongo_client", resource=client)
+        async with await client.start_session() as session:
+            return await session.with_transaction(callback)
+
+    @classmethod
+    async def ping(cls):
+        client = cls.get_client()
+        await client.admin.command("ping")
@@ -0,0 +1,156 @@
+from collections import deque
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from random import random
+from time import monotonic, perf_counter, thread_time
+from typing import List, Optional
+
+from decouple import config
+
+from src.domain.enums.profile import CpuSection
+from src.domain.models.profile.model import ProfileFrame, RequestProfile
+
+current_frame: ContextVar[Optional[ProfileFrame]] = ContextVar(
+    "current_frame", default=None
+)
+
+
+class SlowRequestSampler:
+    def __init__(
+        self,
+        latency_threshold_in_seconds: float,
+        sample_ratio: float,
+        max_captures_per_minute: float,
+        ring_buffer_size: int,
+    ):
+        self.latency_threshold_in_seconds = latency_threshold_in_seconds
+        self.sample_ratio = sample_ratio
+        self.max_captures_per_minute = max_captures_per_minute
+        self.profiles = deque(maxlen=ring_buffer_size)
+        self.sampled = 0
+        self.captured = 0
+        self.rate_limited = 0
+        self.__tokens = max_captures_per_minute
+        self.__refilled_at = monotonic()
+
+    def should_sample(self) -> bool:
+        if random() >= self.sample_ratio:
+            return False
+        if not self.__try_take_token():
+            return False
+        self.sampled += 1
+        return True
+
+    def __try_take_token(self) -> bool:
+        now = monotonic()
+        refill = (now - self.__refilled_at) * self.max_captures_per_minute / 60
+        self.__tokens = min(self.__tokens + refill, self.max_captures_per_minute)
+        self.__refilled_at = now
+        if self.__tokens < 1:
+            self.rate_limited += 1
+            return False
+        self.__tokens -= 1
+        return True
+
+    def capture(self, profile: RequestProfile) -> bool:
+        if profile.duration_in_seconds < self.latency_threshold_in_seconds:
+            return False
+        self.profiles.append(profile)
+        self.captured += 1
+        return True
+
+    def get_stats(self) -> dict:
+        stats = {
+            "sampled": self.sampled,
+            "captured": self.captured,
+            "rate_limited": self.rate_limited,
+            "buffered": len(self.profiles),
+        }
+        return stats
+
+
+class RequestProfiler:
+    enabled = None
+    sampler = None
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        if cls.enabled is None:
+            profiler_enabled = config("PROFILER_ENABLED", default=False, cast=bool)
+            cls.enabled = profiler_enabled is True
+        return cls.enabled
+
+    @classmethod
+    def get_sampler(cls) -> SlowRequestSampler:
+        if cls.sampler is None:
+            cls.sampler = SlowRequestSampler(
+                latency_threshold_in_seconds=config(
+                    "PROFILER_LATENCY_THRESHOLD_IN_SECONDS", default=1, cast=float
+                ),
+                sample_ratio=config("PROFILER_SAMPLE_RATIO", default=0.01, cast=float),
+                max_captures_per_minute=config(
+                    "PROFILER_MAX_CAPTURES_PER_MINUTE", default=6, cast=float
+                ),
+                ring_buffer_size=config(
+                    "PROFILER_RING_BUFFER_SIZE", default=50, cast=int
+                ),
+            )
+        return cls.sampler
+
+    @classmethod
+    def start(cls, name: str) -> Optional[Token]:
+        if not cls.is_enabled() or not cls.get_sampler().should_sample():
+            return None
+        return current_frame.set(RequestProfile(name=name).root)
+
+    @classmethod
+    def finish(cls, token: Optional[Token]):
+        if token is None:
+            return
+        profile = current_frame.get().profile
+        current_frame.reset(token)
+        profile.finish()
+        cls.get_sampler().capture(profile)
+
+    @staticmethod
+    @contextmanager
+    def __record(name: str, clock):
+        parent = current_frame.get()
+        if parent is None:
+            yield
+            return
+        frame = parent.create_child(name)
+        token = current_frame.set(frame)
+        started_at = clock()
+        try:
+            yield
+        finally:
+            frame.close(total_in_seconds=clock() - started_at)
+            current_frame.reset(token)
+
+    @classmethod
+    def frame(cls, name: str):
+        return cls.__record(name=name, clock=perf_counter)
+
+    @classmethod
+    def cpu_section(cls, section: CpuSection):
+        return cls.__record(name=f"[cpu] {section.value}", clock=thread_time)
+
+    @classmethod
+    def get_profiles(cls) -> List[RequestProfile]:
+        if cls.sampler is None:
+            return []
+        return list(cls.sampler.profiles)
+
+    @classmethod
+    def get_collapsed_stacks(cls) -> str:
+        collapsed_stacks = [
+            profile.to_collapsed_stacks() for profile in cls.get_profiles()
+        ]
+        return "\n".join(collapsed_stacks)
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        if cls.sampler is None:
+            return {}
+        return cls.sampler.get_stats()
@@ -0,0 +1,127 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import List, Optional
+
+from decouple import config
+from etria_logger import Gladsheim
+
+from src.domain.enums.tracing import SpanExporterName
+from src.domain.models.tracing.model import Span, SpanContext
+from src.infrastructures.metrics.infrastructure import MetricsRegistry
+from src.infrastructures.tracing_exporter.infrastructure import (
+    LogSpanExporter,
+    SpanExporter,
+)
+
+current_span: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+class Tracer:
+    enabled = None
+    exporters = None
+    exported = 0
+    unsampled = 0
+    export_failures = 0
+
+    @classmethod
+    def is_enabled(cls) -> bool:
+        if cls.enabled is None:
+            tracing_enabled = config("TRACING_ENABLED", default=False, cast=bool)
+            cls.enabled = tracing_enabled is True
+        return cls.enabled
+
+    @classmethod
+    def get_exporters(cls) -> List[SpanExporter]:
+        if cls.exporters is None:
+            exporter_name = config(
+                "TRACING_EXPORTER", default=SpanExporterName.LOG.value
+            )
+            cls.exporters = []
+            if exporter_name == SpanExporterName.LOG.value:
+                cls.exporters.append(LogSpanExporter())
+        return cls.exporters
+
+    @classmethod
+    def register_exporter(cls, exporter: SpanExporter):
+        cls.get_exporters().append(exporter)
+
+    @staticmethod
+    def get_current_span() -> Optional[Span]:
+        return current_span.get()
+
+    @classmethod
+    def get_traceparent(cls) -> Optional[str]:
+        span = cls.get_current_span()
+        if span is None:
+            return None
+        return span.context.to_traceparent()
+
+    @classmethod
+    def inject(cls, headers: dict) -> dict:
+        traceparent = cls.get_traceparent()
+        if traceparent is not None:
+            headers["traceparent"] = traceparent
+        return headers
+
+    @classmethod
+    def __start_span(cls, name: str, traceparent: Optional[str]) -> Span:
+        parent_span = cls.get_current_span()
+        parent_context = (
+            parent_span.context
+            if parent_span is not None
+            else SpanContext.from_traceparent(traceparent)
+        )
+        if parent_context is None:
+            return Span(name=name, context=SpanContext.generate())
+        return Span(
+            name=name,
+            context=parent_context.create_child(),
+            parent_span_id=parent_context.span_id,
+        )
+
+    @classmethod
+    def __export(cls, span: Span):
+        if not span.context.sampled:
+            cls.unsampled += 1
+            return
+        for exporter in cls.get_exporters():
+            try:
+                exporter.export(span)
+                cls.exported += 1
+            except Exception as ex:
+                cls.export_failures += 1
+                Gladsheim.warning(
+                    message="Tracer::__export::Failed to export span",
+                    exporter=type(exporter).__name__,
+                    span=span.name,
+                    error=repr(ex),
+                )
+
+    @classmethod
+    @contextmanager
+    def span(cls, name: str, traceparent: Optional[str] = None):
+        if not cls.is_enabled():
+            yield None
+            return
+        span = cls.__start_span(name=name, traceparent=traceparent)
+        token = current_span.set(span)
+        error = None
+        try:
+            yield span
+        except BaseException as ex:
+            error = ex
+            raise
+        finally:
+            current_span.reset(token)
+            span.finish(outcome=MetricsRegistry.get_outcome(error))
+            cls.__export(span)
+
+    @classmethod
+    def get_stats(cls) -> dict:
+        stats = {
+            "enabled": cls.is_enabled(),
+            "exported": cls.exported,
+            "unsampled": cls.unsampled,
+            "export_failures": cls.export_failures,
+        }
+        return stats
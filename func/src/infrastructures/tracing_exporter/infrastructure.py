@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+from typing import List
+
+from etria_logger import Gladsheim
+
+from src.domain.models.tracing.model import Span
+
+
+class SpanExporter(ABC):
+    @abstractmethod
+    def export(self, span: Span):
+        pass
+
+
+class InMemorySpanExporter(SpanExporter):
+    def __init__(self):
+        self.spans: List[Span] = []
+
+    def export(self, span: Span):
+        self.spans.append(span)
+
+    def get_spans(self, name: str) -> List[Span]:
+        return [span for span in self.spans if span.name == name]
+
+
+class LogSpanExporter(SpanExporter):
+    def export(self, span: Span):
+        Gladsheim.info(message="Span finished", **span.to_dict())
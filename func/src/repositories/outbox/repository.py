@@ -0,0 +1,177 @@
+from datetime import datetime, timedelta
+from typing import List
+
+from bson import ObjectId
+from decouple import config
+from etria_logger import Gladsheim
+from pymongo import ReturnDocument
+
+from src.domain.enums.persephone_delivery import OutboxStatus
+from src.domain.exceptions.model import InternalServerError
+from src.domain.models.outbox.model import OutboxRecord
+from src.infrastructures.mongo_db.infrastructure import MongoDBInfrastructure
+
+
+class OutboxRepository:
+    infra = MongoDBInfrastructure
+    database = config("MONGODB_DATABASE_NAME")
+    collection = config("MONGODB_OUTBOX_COLLECTION", default="persephone_outbox")
+    sequence_collection = config(
+        "MONGODB_OUTBOX_SEQUENCE_COLLECTION", default="persephone_outbox_sequences"
+    )
+
+    @classmethod
+    async def __get_collection(cls, collection_name: str = None):
+        mongo_client = cls.infra.get_client()
+        try:
+            database = mongo_client[cls.database]
+            collection = database[collection_name or cls.collection]
+            return collection
+        except Exception as ex:
+            message = f"OutboxRepository::__get_collection::Error when trying to get collection"
+            Gladsheim.error(
+                error=ex,
+                message=message,
+                database=cls.database,
+                collection=collection_name or cls.collection,
+            )
+            raise ex
+
+    @classmethod
+    async def __next_sequence(cls, unique_id: str, session=None) -> int:
+        sequence_collection = await cls.__get_collection(cls.sequence_collection)
+        sequence_document = await sequence_collection.find_one_and_update(
+            {"_id": unique_id},
+            {"$inc": {"sequence": 1}},
+            upsert=True,
+            return_document=ReturnDocument.AFTER,
+            session=session,
+        )
+        return sequence_document["sequence"]
+
+    @classmethod
+    async def enqueue(cls, outbox_record: OutboxRecord, session=None):
+        try:
+            collection = await cls.__get_collection()
+            if outbox_record.record_id is None:
+                outbox_record.record_id = ObjectId()
+            outbox_record.sequence = await cls.__next_sequence(
+                unique_id=outbox_record.unique_id, session=session
+            )
+            await collection.insert_one(outbox_record.to_document(), session=session)
+        except Exception as ex:
+            Gladsheim.error(
+                error=ex,
+                message="OutboxRepository::enqueue::Failed to enqueue outbox record",
+                unique_id=outbox_record.unique_id,
+            )
+            raise InternalServerError("Error enqueuing outbox record")
+
+    @classmethod
+    async def get_pending(
+        cls, limit: int, now: datetime = None, excluded_unique_ids: list = None
+    ) -> List[OutboxRecord]:
+        now = now or datetime.utcnow()
+        collection = await cls.__get_collection()
+        pending_filter = {
+            "status": OutboxStatus.PENDING.value,
+            "next_attempt_at": {"$lte": now},
+            "$or": [{"lease_until": None}, {"lease_until": {"$lte": now}}],
+        }
+        if excluded_unique_ids:
+            pending_filter["unique_id"] = {"$nin": excluded_unique_ids}
+        cursor = collection.find(pending_filter).sort([("_id", 1)]).limit(limit)
+        documents = await cursor.to_list(length=limit)
+        return [OutboxRecord.from_document(document) for document in documents]
+
+    @classmethod
+    async def get_blocked_unique_ids(cls, now: datetime) -> list:
+        collection = await cls.__get_collection()
+        cursor = collection.find(
+            {
+                "status": OutboxStatus.PENDING.value,
+                "$or": [
+                    {"next_attempt_at": {"$gt": now}},
+                    {"lease_until": {"$gt": now}},
+                ],
+            },
+            projection={"unique_id": True},
+        )
+        documents = await cursor.to_list(length=None)
+        return list({document["unique_id"] for document in documents})
+
+    @classmethod
+    async def get_pending_by_user(cls, unique_ids: list) -> dict:
+        if not unique_ids:
+            return {}
+        collection = await cls.__get_collection()
+        cursor = collection.find(
+            {
+                "unique_id": {"$in": unique_ids},
+                "status": OutboxStatus.PENDING.value,
+            }
+        ).sort([("sequence", 1)])
+        pending_by_user = {}
+        for document in await cursor.to_list(length=None):
+            pending_by_user.setdefault(document["unique_id"], []).append(
+                OutboxRecord.from_document(document)
+            )
+        return pending_by_user
+
+    @classmethod
+    async def claim(
+        cls, outbox_record: OutboxRecord, owner: str, lease_in_seconds: float
+    ) -> bool:
+        now = datetime.utcnow()
+        collection = await cls.__get_collection()
+        claimed_record = await collection.find_one_and_update(
+            {
+                "_id": outbox_record.record_id,
+                "status": OutboxStatus.PENDING.value,
+                "$or": [{"lease_until": None}, {"lease_until": {"$lt": now}}],
+            },
+            {
+                "$set": {
+                    "lease_until": now + timedelta(seconds=lease_in_seconds),
+                    "lease_owner": owner,
+                }
+            },
+            projection={"_id": True},
+        )
+        return claimed_record is not None
+
+    @classmethod
+    async def mark_as_sent(cls, record_ids: list):
+        if not record_ids:
+            return
+        collection = await cls.__get_collection()
+        await collection.update_many(
+            {"_id": {"$in": record_ids}},
+            {
+                "$set": {
+                    "status": OutboxStatus.SENT.value,
+                    "sent_at": datetime.utcnow(),
+                    "lease_until": None,
+                }
+            },
+        )
+
+    @classmethod
+    async def mark_as_failed(
+        cls,
+        outbox_record: OutboxRecord,
+        next_attempt_at: datetime,
+        status: OutboxStatus,
+    ):
+        collection = await cls.__get_collection()
+        await collection.update_one(
+            {"_id": outbox_record.record_id},
+            {
+                "$set": {
+                    "status": status.value,
+                    "next_attempt_at": next_attempt_at,
+                    "lease_until": None,
+                },
+                "$inc": {"attempts": 1},
+            },
+        )
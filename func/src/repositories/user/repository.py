@@ -1,15 +1,29 @@
+from typing import Optional, Tuple
+
 from decouple import config
 from etria_logger import Gladsheim
+from pymongo import ReturnDocument
 
+from src.domain.enums.circuit_breaker import CircuitBreakerDependency
+from src.domain.enums.user_write_mode import UserUpdateStatus
 from src.domain.exceptions.model import InternalServerError
 from src.domain.models.user_data.model import UserData
+from src.domain.models.user_data.onboarding_data.model import UserOnboardingData
+from src.domain.models.user_data.politically_exposed.model import (
+    PoliticallyExposedData,
+)
+from src.infrastructures.circuit_breaker.infrastructure import CircuitBreakerRegistry
+from src.infrastructures.deadline.infrastructure import StageRunner
 from src.infrastructures.mongo_db.infrastructure import MongoDBInfrastructure
+from src.infrastructures.tracing.infrastructure import Tracer
+from src.repositories.user_write_coalescer.repository import UserWriteCoalescer
 
 
 class UserRepository:
     infra = MongoDBInfrastructure
     database = config("MONGODB_DATABASE_NAME")
     collection = config("MONGODB_USER_COLLECTION")
+    write_coalescer = None
 
     @classmethod
     async def __get_collection(cls):
@@ -31,12 +45,53 @@ class UserRepository:
             raise ex
 
     @classmethod
-    async def update_user(cls, user_data: UserData):
-        user_filter = {"unique_id": user_data.unique_id}
+    def get_write_coalescer(cls) -> UserWriteCoalescer:
+        if cls.write_coalescer is None:
+            cls.write_coalescer = UserWriteCoalescer(
+                get_collection=cls.__get_collection,
+                flush_interval_in_seconds=config(
+                    "USER_WRITE_COALESCING_FLUSH_INTERVAL_IN_SECONDS",
+                    default=0.005,
+                    cast=float,
+                ),
+                max_batch_size=config(
+                    "USER_WRITE_COALESCING_MAX_BATCH_SIZE", default=500, cast=int
+                ),
+            )
+        return cls.write_coalescer
+
+    @staticmethod
+    def __build_user_filter(unique_id: str) -> dict:
+        user_filter = {"unique_id": unique_id}
+        traceparent = Tracer.get_traceparent()
+        if traceparent is not None:
+            user_filter["$comment"] = traceparent
+        return user_filter
+
+    @staticmethod
+    def __uses_write_coalescing(session) -> bool:
+        write_coalescing_enabled = config(
+            "USER_WRITE_COALESCING_ENABLED", default=False, cast=bool
+        )
+        return session is None and write_coalescing_enabled is True
+
+    @classmethod
+    @StageRunner.stage("UserRepository::update_user")
+    @CircuitBreakerRegistry.protect(CircuitBreakerDependency.MONGO_DB)
+    async def update_user(cls, user_data: UserData, session=None):
+        user_filter = cls.__build_user_filter(unique_id=user_data.unique_id)
         try:
+            if cls.__uses_write_coalescing(session):
+                await cls.get_write_coalescer().update_user(
+                    unique_id=user_data.unique_id,
+                    update_set=user_data.get_data_representation(),
+                )
+                return
             collection = await cls.__get_collection()
             await collection.update_one(
-                user_filter, {"$set": user_data.get_data_representation()}
+                user_filter,
+                {"$set": user_data.get_data_representation()},
+                session=session,
             )
         except Exception as ex:
             Gladsheim.error(
@@ -47,8 +102,33 @@ class UserRepository:
             raise InternalServerError("Error updating user data")
 
     @classmethod
+    @StageRunner.stage("UserRepository::update_published_version")
+    @CircuitBreakerRegistry.protect(CircuitBreakerDependency.MONGO_DB)
+    async def update_published_version(
+        cls, politically_exposed_data: PoliticallyExposedData
+    ):
+        user_filter = cls.__build_user_filter(
+            unique_id=politically_exposed_data.unique_id
+        )
+        try:
+            collection = await cls.__get_collection()
+            await collection.update_one(
+                user_filter,
+                {"$set": politically_exposed_data.get_published_representation()},
+            )
+        except Exception as ex:
+            Gladsheim.error(
+                error=ex,
+                message="UserRepository::update_published_version::Failed to update published version",
+                query=user_filter,
+            )
+            raise InternalServerError("Error updating user data")
+
+    @classmethod
+    @StageRunner.stage("UserRepository::verify_if_user_has_suitability")
+    @CircuitBreakerRegistry.protect(CircuitBreakerDependency.MONGO_DB)
     async def verify_if_user_has_suitability(cls, user_data: UserData) -> bool:
-        user_filter = {"unique_id": user_data.unique_id}
+        user_filter = cls.__build_user_filter(unique_id=user_data.unique_id)
         try:
             collection = await cls.__get_collection()
             user_suitability = await collection.find_one(
@@ -65,3 +145,95 @@ class UserRepository:
                 query=user_filter,
             )
             raise InternalServerError("Error updating user data")
+
+    @staticmethod
+    def __get_step_fields() -> Tuple[str, str]:
+        step_br_field = config(
+            "USER_DOCUMENT_STEP_BR_FIELD", default="onboarding_step.br"
+        )
+        step_us_field = config(
+            "USER_DOCUMENT_STEP_US_FIELD", default="onboarding_step.us"
+        )
+        return step_br_field, step_us_field
+
+    @classmethod
+    @StageRunner.stage("UserRepository::get_user_onboarding_data")
+    @CircuitBreakerRegistry.protect(CircuitBreakerDependency.MONGO_DB)
+    async def get_user_onboarding_data(
+        cls, user_data: UserData
+    ) -> Optional[UserOnboardingData]:
+        user_filter = cls.__build_user_filter(unique_id=user_data.unique_id)
+        step_br_field, step_us_field = cls.__get_step_fields()
+        try:
+            collection = await cls.__get_collection()
+            user_document = await collection.find_one(
+                user_filter,
+                UserOnboardingData.get_projection(
+                    step_br_field=step_br_field, step_us_field=step_us_field
+                ),
+            )
+        except Exception as ex:
+            Gladsheim.error(
+                error=ex,
+                message="UserRepository::get_user_onboarding_data::Failed to get user onboarding data",
+                query=user_filter,
+            )
+            raise InternalServerError("Error getting user onboarding data")
+
+        if user_document is None:
+            return None
+        return UserOnboardingData.from_document(
+            unique_id=user_data.unique_id,
+            document=user_document,
+            step_br_field=step_br_field,
+            step_us_field=step_us_field,
+        )
+
+    @staticmethod
+    def __build_update_if_has_suitability(user_data: UserData) -> list:
+        suitability_condition = UserOnboardingData.get_suitability_condition()
+        conditional_set = {
+            field: {"$cond": [suitability_condition, {"$literal": value}, f"${field}"]}
+            for field, value in user_data.get_data_representation().items()
+        }
+        return [{"$set": conditional_set}]
+
+    @classmethod
+    @StageRunner.stage("UserRepository::update_user_if_has_suitability")
+    @CircuitBreakerRegistry.protect(CircuitBreakerDependency.MONGO_DB)
+    async def update_user_if_has_suitability(
+        cls, user_data: UserData, session=None
+    ) -> Tuple[UserUpdateStatus, Optional[UserOnboardingData]]:
+        user_filter = cls.__build_user_filter(unique_id=user_data.unique_id)
+        step_br_field, step_us_field = cls.__get_step_fields()
+        try:
+            collection = await cls.__get_collection()
+            previous_document = await collection.find_one_and_update(
+                user_filter,
+                cls.__build_update_if_has_suitability(user_data=user_data),
+                projection=UserOnboardingData.get_projection(
+                    step_br_field=step_br_field, step_us_field=step_us_field
+                ),
+                return_document=ReturnDocument.BEFORE,
+                session=session,
+            )
+        except Exception as ex:
+            Gladsheim.error(
+                error=ex,
+                message="UserRepository::update_user_if_has_suitability::Failed to update user",
+                query=user_filter,
+            )
+            raise InternalServerError("Error updating user data")
+
+        if previous_document is None:
+            return UserUpdateStatus.USER_NOT_FOUND, None
+
+        previous_user_data = UserOnboardingData.from_document(
+            unique_id=user_data.unique_id,
+            document=previous_document,
+            step_br_field=step_br_field,
+            step_us_field=step_us_field,
+        )
+        if not previous_user_data.has_suitability:
+            return UserUpdateStatus.SUITABILITY_REQUIRED, previous_user_data
+        return UserUpdateStatus.UPDATED, previous_user_data
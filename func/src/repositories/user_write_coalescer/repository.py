@@ -0,0 +1,182 @@
+import asyncio
+from time import perf_counter
+from typing import Awaitable, Callable, Dict, List
+
+from etria_logger import Gladsheim
+from pymongo import UpdateOne
+from pymongo.errors import BulkWriteError
+
+from src.infrastructures.deadline.infrastructure import StageRunner
+
+
+class PendingUserWrite:
+    def __init__(self, unique_id: str, update_set: dict):
+        self.unique_id = unique_id
+        self.update_set = update_set
+        self.futures: List[asyncio.Future] = []
+
+
+class CoalescerLoopState:
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.pending: Dict[str, PendingUserWrite] = {}
+        self.flush_handle = None
+        self.flushes = set()
+
+
+class UserWriteCoalescer:
+    def __init__(
+        self,
+        get_collection: Callable[[], Awaitable],
+        flush_interval_in_seconds: float,
+        max_batch_size: int,
+    ):
+        self.get_collection = get_collection
+        self.flush_interval_in_seconds = flush_interval_in_seconds
+        self.max_batch_size = max_batch_size
+        self.flushes = 0
+        self.operations = 0
+        self.requests = 0
+        self.superseded = 0
+        self.failed = 0
+        self.last_batch_size = 0
+        self.flush_latency_in_seconds = 0.0
+        self.max_flush_latency_in_seconds = 0.0
+        self.adopted = 0
+        self.__states: Dict[asyncio.AbstractEventLoop, CoalescerLoopState] = {}
+
+    def __release_closed_loops(self) -> List[PendingUserWrite]:
+        orphans = []
+        for loop, state in list(self.__states.items()):
+            if loop.is_closed():
+                del self.__states[loop]
+                orphans.extend(state.pending.values())
+        return orphans
+
+    def __get_loop_state(self) -> CoalescerLoopState:
+        loop = asyncio.get_running_loop()
+        state = self.__states.get(loop)
+        if state is None:
+            orphans = self.__release_closed_loops()
+            state = CoalescerLoopState(loop=loop)
+            self.__states[loop] = state
+            if orphans:
+                Gladsheim.warning(
+                    message="UserWriteCoalescer::__get_loop_state::Flushing writes left on a closed event loop",
+                    writes=len(orphans),
+                )
+                self.adopted += len(orphans)
+                for pending_write in orphans:
+                    state.pending[pending_write.unique_id] = pending_write
+                self.__flush(state)
+        return state
+
+    @staticmethod
+    def __resolve(pending_write: PendingUserWrite, error: Exception = None):
+        for future in pending_write.futures:
+            if future.done() or future.get_loop().is_closed():
+                continue
+            if error is None:
+                future.set_result(True)
+            else:
+                future.set_exception(error)
+
+    async def __write_batch(self, pending_writes: List[PendingUserWrite]):
+        start = perf_counter()
+        write_errors = {}
+        try:
+            collection = await self.get_collection()
+            await collection.bulk_write(
+                [
+                    UpdateOne(
+                        {"unique_id": pending_write.unique_id},
+                        {"$set": pending_write.update_set},
+                    )
+                    for pending_write in pending_writes
+                ],
+                ordered=False,
+            )
+        except BulkWriteError as ex:
+            for write_error in ex.details.get("writeErrors", []):
+                write_errors[write_error["index"]] = BulkWriteError(
+                    {"writeErrors": [write_error]}
+                )
+        except Exception as ex:
+            Gladsheim.error(
+                error=ex,
+                message="UserWriteCoalescer::__write_batch::Failed to bulk write users",
+                batch_size=len(pending_writes),
+            )
+            write_errors = {index: ex for index in range(len(pending_writes))}
+
+        flush_latency_in_seconds = perf_counter() - start
+        self.flush_latency_in_seconds += flush_latency_in_seconds
+        self.max_flush_latency_in_seconds = max(
+            self.max_flush_latency_in_seconds, flush_latency_in_seconds
+        )
+        self.failed += len(write_errors)
+        for index, pending_write in enumerate(pending_writes):
+            self.__resolve(pending_write, error=write_errors.get(index))
+
+    def __flush(self, state: CoalescerLoopState):
+        if state.flush_handle is not None:
+            state.flush_handle.cancel()
+            state.flush_handle = None
+        pending_writes = list(state.pending.values())
+        state.pending = {}
+        if not pending_writes:
+            return
+        self.flushes += 1
+        self.operations += len(pending_writes)
+        self.last_batch_size = len(pending_writes)
+        flush = StageRunner.create_detached_task(
+            self.__write_batch(pending_writes), loop=state.loop
+        )
+        state.flushes.add(flush)
+        flush.add_done_callback(state.flushes.discard)
+
+    async def update_user(self, unique_id: str, update_set: dict) -> bool:
+        state = self.__get_loop_state()
+        future = state.loop.create_future()
+        self.requests += 1
+        pending_write = state.pending.pop(unique_id, None)
+        if pending_write is None:
+            pending_write = PendingUserWrite(unique_id=unique_id, update_set=update_set)
+        else:
+            self.superseded += 1
+            pending_write.update_set = update_set
+        pending_write.futures.append(future)
+        state.pending[unique_id] = pending_write
+
+        if len(state.pending) >= self.max_batch_size:
+            self.__flush(state)
+        elif state.flush_handle is None:
+            state.flush_handle = state.loop.call_later(
+                self.flush_interval_in_seconds, self.__flush, state
+            )
+        return await asyncio.shield(future)
+
+    async def flush(self):
+        state = self.__states.get(asyncio.get_running_loop())
+        if state is not None:
+            self.__flush(state)
+            await asyncio.gather(*state.flushes)
+
+    def get_stats(self) -> dict:
+        stats = {
+            "requests": self.requests,
+            "operations": self.operations,
+            "superseded": self.superseded,
+            "failed": self.failed,
+            "adopted": self.adopted,
+            "flushes": self.flushes,
+            "last_batch_size": self.last_batch_size,
+            "average_batch_size": (
+                self.operations / self.flushes if self.flushes else 0
+            ),
+            "average_flush_latency_in_seconds": (
+                self.flush_latency_in_seconds / self.flushes if self.flushes else 0
+            ),
+            "max_flush_latency_in_seconds": self.max_flush_latency_in_seconds,
+        }
+        return stats
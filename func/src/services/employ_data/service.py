@@ -1,20 +1,46 @@
+import asyncio
+
 from decouple import config
+from etria_logger import Gladsheim
 from persephone_client import Persephone
 
+from src.domain.enums.circuit_breaker import CircuitBreakerDependency
+from src.domain.enums.persephone_delivery import PersephoneDeliveryMode
 from src.domain.enums.persephone_queue import PersephoneQueue
+from src.domain.enums.request_stage import RequestStage, StageCost
+from src.domain.enums.step_resolution_mode import StepResolutionMode
+from src.domain.enums.user_write_mode import UserWriteMode, UserUpdateStatus
 from src.domain.exceptions.model import (
     InternalServerError,
     InvalidStepError,
     SuitabilityRequiredError,
 )
+from src.domain.models.outbox.model import OutboxRecord
+from src.domain.models.pipeline.model import PipelineStage, StagedPipeline
 from src.domain.models.request.model import PoliticallyExposedRequest
+from src.domain.models.user_data.onboarding_data.model import UserOnboardingData
+from src.domain.models.user_data.onboarding_step.model import UserOnboardingStep
 from src.domain.models.user_data.politically_exposed.model import PoliticallyExposedData
+from src.infrastructures.circuit_breaker.infrastructure import CircuitBreakerRegistry
+from src.infrastructures.deadline.infrastructure import StageRunner
+from src.infrastructures.mongo_db.infrastructure import MongoDBInfrastructure
+from src.repositories.outbox.repository import OutboxRepository
 from src.repositories.user.repository import UserRepository
+from src.services.outbox_relay.service import OutboxRelay
+from src.services.persephone_producer.service import BatchingPersephoneProducer
+from src.services.single_flight.service import SingleFlightGroup
 from src.transport.user_step.transport import StepChecker
 
 
 class PoliticallyExposedService:
     persephone_client = Persephone
+    precondition_pipeline = None
+    outbox_relay = None
+    persephone_producer = None
+    single_flight_group = None
+    skipped_writes = 0
+    skipped_publishes = 0
+    unpublished_writes = 0
 
     @staticmethod
     def __model_politically_exposed_data_to_persephone(
@@ -27,46 +53,395 @@ class PoliticallyExposedService:
         }
         return data
 
+    @staticmethod
+    def __resolves_step_from_user_document() -> bool:
+        step_resolution_mode = config(
+            "ONBOARDING_STEP_RESOLUTION_MODE", default=StepResolutionMode.HTTP.value
+        )
+        return step_resolution_mode == StepResolutionMode.USER_DOCUMENT.value
+
+    @staticmethod
+    def __uses_conditional_write() -> bool:
+        user_write_mode = config(
+            "USER_WRITE_MODE", default=UserWriteMode.TWO_STEP.value
+        )
+        return user_write_mode == UserWriteMode.CONDITIONAL.value
+
+    @staticmethod
+    def __uses_idempotent_writes() -> bool:
+        idempotent_writes_enabled = config(
+            "IDEMPOTENT_WRITES_ENABLED", default=False, cast=bool
+        )
+        return idempotent_writes_enabled is True
+
+    @staticmethod
+    def __uses_single_flight() -> bool:
+        single_flight_enabled = config(
+            "SINGLE_FLIGHT_ENABLED", default=False, cast=bool
+        )
+        return single_flight_enabled is True
+
+    @staticmethod
+    def __get_persephone_delivery_mode() -> str:
+        persephone_delivery_mode = config(
+            "PERSEPHONE_DELIVERY_MODE", default=PersephoneDeliveryMode.DIRECT.value
+        )
+        return persephone_delivery_mode
+
     @classmethod
-    async def update_politically_exposed_data_for_us(
-        cls, politically_exposed_request: PoliticallyExposedRequest
-    ):
+    def __uses_outbox(cls) -> bool:
+        persephone_delivery_mode = cls.__get_persephone_delivery_mode()
+        return persephone_delivery_mode == PersephoneDeliveryMode.OUTBOX.value
+
+    @classmethod
+    def get_persephone_producer(cls) -> BatchingPersephoneProducer:
+        if cls.persephone_producer is None:
+            cls.persephone_producer = BatchingPersephoneProducer(
+                persephone_client=cls.persephone_client,
+                linger_in_seconds=config(
+                    "PERSEPHONE_BATCH_LINGER_IN_SECONDS", default=0.005, cast=float
+                ),
+                max_batch_size=config(
+                    "PERSEPHONE_BATCH_MAX_SIZE", default=100, cast=int
+                ),
+                max_in_flight=config(
+                    "PERSEPHONE_BATCH_MAX_IN_FLIGHT", default=1000, cast=int
+                ),
+            )
+        return cls.persephone_producer
+
+    @classmethod
+    def __get_persephone_sender(cls):
+        persephone_delivery_mode = cls.__get_persephone_delivery_mode()
+        if persephone_delivery_mode == PersephoneDeliveryMode.BATCHED.value:
+            return cls.get_persephone_producer()
+        return cls.persephone_client
+
+    @classmethod
+    def get_single_flight_group(cls) -> SingleFlightGroup:
+        if cls.single_flight_group is None:
+            cls.single_flight_group = SingleFlightGroup()
+        return cls.single_flight_group
+
+    @classmethod
+    def get_outbox_relay(cls) -> OutboxRelay:
+        if cls.outbox_relay is None:
+            cls.outbox_relay = OutboxRelay(
+                persephone_client=cls.persephone_client,
+                batch_size=config("OUTBOX_RELAY_BATCH_SIZE", default=100, cast=int),
+                poll_interval_in_seconds=config(
+                    "OUTBOX_RELAY_POLL_INTERVAL_IN_SECONDS", default=1, cast=float
+                ),
+                lease_in_seconds=config(
+                    "OUTBOX_RELAY_LEASE_IN_SECONDS", default=30, cast=float
+                ),
+                max_attempts=config("OUTBOX_RELAY_MAX_ATTEMPTS", default=10, cast=int),
+                retry_base_delay_in_seconds=config(
+                    "OUTBOX_RELAY_RETRY_BASE_DELAY_IN_SECONDS", default=1, cast=float
+                ),
+                retry_max_delay_in_seconds=config(
+                    "OUTBOX_RELAY_RETRY_MAX_DELAY_IN_SECONDS", default=60, cast=float
+                ),
+                send_timeout_in_seconds=config(
+                    "OUTBOX_RELAY_SEND_TIMEOUT_IN_SECONDS", default=10, cast=float
+                ),
+            )
+        return cls.outbox_relay
+
+    @classmethod
+    def start_outbox_relay(cls):
+        if cls.__uses_outbox():
+            cls.get_outbox_relay().start()
+
+    @classmethod
+    async def stop_outbox_relay(cls):
+        if cls.outbox_relay is not None:
+            await cls.outbox_relay.stop()
+
+    @staticmethod
+    async def __load_user_onboarding_data(
+        politically_exposed_data: PoliticallyExposedData,
+    ) -> UserOnboardingData:
+        user_onboarding_data = await UserRepository.get_user_onboarding_data(
+            politically_exposed_data
+        )
+        if user_onboarding_data is None:
+            raise InternalServerError("User not found")
+        return user_onboarding_data
+
+    @classmethod
+    async def __get_user_onboarding_data(cls, context: dict) -> UserOnboardingData:
+        if "user_onboarding_data" not in context:
+            context["user_onboarding_data"] = asyncio.ensure_future(
+                cls.__load_user_onboarding_data(context["politically_exposed_data"])
+            )
+        return await asyncio.shield(context["user_onboarding_data"])
+
+    @classmethod
+    async def __get_onboarding_step(cls, context: dict) -> UserOnboardingStep:
+        politically_exposed_request = context["politically_exposed_request"]
+        if cls.__resolves_step_from_user_document():
+            user_onboarding_data = await cls.__get_user_onboarding_data(context)
+            if (user_step := user_onboarding_data.get_onboarding_step()) is not None:
+                return user_step
+            http_fallback_enabled = config(
+                "ONBOARDING_STEP_HTTP_FALLBACK_ENABLED", default=True, cast=bool
+            )
+            if http_fallback_enabled is not True:
+                raise InternalServerError("Onboarding step not found in user document")
 
         user_step = await StepChecker.get_onboarding_step(
-            x_thebes_answer=politically_exposed_request.x_thebes_answer
+            x_thebes_answer=politically_exposed_request.x_thebes_answer,
+            unique_id=politically_exposed_request.unique_id,
         )
+        return user_step
+
+    @classmethod
+    async def __check_onboarding_step(cls, context: dict):
+        user_step = await cls.__get_onboarding_step(context)
         if not user_step.is_in_correct_step():
             raise InvalidStepError(
                 f"Step BR: {user_step.step_br} | Step US: {user_step.step_us}"
             )
 
-        politically_exposed = politically_exposed_request.politically_exposed
-        politically_exposed_data = PoliticallyExposedData(
-            unique_id=politically_exposed_request.unique_id,
-            is_politically_exposed=politically_exposed.is_politically_exposed,
-            politically_exposed_names=politically_exposed.politically_exposed_names,
-        )
-
-        user_has_suitability = (
-            await UserRepository.verify_if_user_has_suitability(
-                politically_exposed_data
+    @classmethod
+    async def __check_suitability(cls, context: dict):
+        if cls.__uses_conditional_write():
+            return
+        if cls.__resolves_step_from_user_document() or cls.__uses_idempotent_writes():
+            user_onboarding_data = await cls.__get_user_onboarding_data(context)
+            user_has_suitability = user_onboarding_data.has_suitability
+        else:
+            user_has_suitability = await UserRepository.verify_if_user_has_suitability(
+                context["politically_exposed_data"]
             )
-        )
         if not user_has_suitability:
             raise SuitabilityRequiredError()
 
-        (
-            sent_to_persephone,
-            status_sent_to_persephone,
-        ) = await cls.persephone_client.send_to_persephone(
+    @classmethod
+    def get_precondition_pipeline(cls) -> StagedPipeline:
+        if cls.precondition_pipeline is None:
+            cls.precondition_pipeline = StagedPipeline(
+                stages=[
+                    PipelineStage(
+                        name=RequestStage.STEP_CHECK,
+                        cost=StageCost.NETWORK_CALL,
+                        handler=cls.__check_onboarding_step,
+                    ),
+                    PipelineStage(
+                        name=RequestStage.SUITABILITY_LOOKUP,
+                        cost=StageCost.NETWORK_CALL,
+                        handler=cls.__check_suitability,
+                    ),
+                ],
+                concurrent=True,
+            )
+        return cls.precondition_pipeline
+
+    @classmethod
+    def __build_outbox_record(
+        cls, politically_exposed_data: PoliticallyExposedData
+    ) -> OutboxRecord:
+        outbox_record = OutboxRecord(
+            unique_id=politically_exposed_data.unique_id,
             topic=config("PERSEPHONE_TOPIC_USER"),
             partition=PersephoneQueue.USER_POLITICALLY_EXPOSED_IN_US.value,
+            schema_name="user_politically_exposed_us_schema",
             message=cls.__model_politically_exposed_data_to_persephone(
                 politically_exposed_data=politically_exposed_data
             ),
-            schema_name="user_politically_exposed_us_schema",
+        )
+        return outbox_record
+
+    @classmethod
+    @StageRunner.stage("PoliticallyExposedService::__send_to_persephone")
+    @CircuitBreakerRegistry.protect(CircuitBreakerDependency.PERSEPHONE)
+    async def __send_to_persephone(
+        cls, politically_exposed_data: PoliticallyExposedData
+    ):
+        outbox_record = cls.__build_outbox_record(
+            politically_exposed_data=politically_exposed_data
+        )
+        persephone_sender = cls.__get_persephone_sender()
+        (
+            sent_to_persephone,
+            status_sent_to_persephone,
+        ) = await persephone_sender.send_to_persephone(
+            topic=outbox_record.topic,
+            partition=outbox_record.partition,
+            message=outbox_record.message,
+            schema_name=outbox_record.schema_name,
         )
         if sent_to_persephone is False:
             raise InternalServerError("Error sending data to Persephone")
 
-        await UserRepository.update_user(politically_exposed_data)
+    @staticmethod
+    async def __update_user_if_has_suitability(
+        politically_exposed_data: PoliticallyExposedData, session=None
+    ) -> UserOnboardingData:
+        (
+            user_update_status,
+            previous_user_data,
+        ) = await UserRepository.update_user_if_has_suitability(
+            politically_exposed_data, session=session
+        )
+        if user_update_status == UserUpdateStatus.USER_NOT_FOUND:
+            raise InternalServerError("User not found")
+        if user_update_status == UserUpdateStatus.SUITABILITY_REQUIRED:
+            raise SuitabilityRequiredError()
+        return previous_user_data
+
+    @staticmethod
+    def __has_same_stored_data(
+        politically_exposed_data: PoliticallyExposedData,
+        user_onboarding_data: UserOnboardingData,
+    ) -> bool:
+        stored_data = user_onboarding_data.get_politically_exposed_data()
+        if stored_data is None:
+            return False
+        return politically_exposed_data.has_same_content(stored_data)
+
+    @staticmethod
+    def __has_published_stored_data(
+        politically_exposed_data: PoliticallyExposedData,
+        user_onboarding_data: UserOnboardingData,
+    ) -> bool:
+        published_version = politically_exposed_data.get_content_version()
+        return user_onboarding_data.published_version == published_version
+
+    @classmethod
+    async def __is_unchanged(cls, context: dict) -> bool:
+        if not cls.__uses_idempotent_writes():
+            return False
+        if "user_onboarding_data" not in context:
+            return False
+        user_onboarding_data = await cls.__get_user_onboarding_data(context)
+        politically_exposed_data = context["politically_exposed_data"]
+        if not cls.__has_same_stored_data(
+            politically_exposed_data, user_onboarding_data
+        ):
+            return False
+        if cls.__uses_outbox() or not cls.__uses_conditional_write():
+            return True
+        return cls.__has_published_stored_data(
+            politically_exposed_data, user_onboarding_data
+        )
+
+    @classmethod
+    async def __publish_stored_data(
+        cls, politically_exposed_data: PoliticallyExposedData
+    ):
+        try:
+            await cls.__send_to_persephone(politically_exposed_data)
+        except Exception as ex:
+            cls.unpublished_writes += 1
+            Gladsheim.error(
+                error=ex,
+                message="PoliticallyExposedService::__publish_stored_data::User data was stored but not published",
+                unique_id=politically_exposed_data.unique_id,
+            )
+            raise
+
+    @classmethod
+    async def __update_user_and_send_if_changed(
+        cls, politically_exposed_data: PoliticallyExposedData
+    ):
+        previous_user_data = await cls.__update_user_if_has_suitability(
+            politically_exposed_data
+        )
+        if not cls.__uses_idempotent_writes():
+            await cls.__publish_stored_data(politically_exposed_data)
+            return
+        if cls.__has_same_stored_data(
+            politically_exposed_data, previous_user_data
+        ) and cls.__has_published_stored_data(
+            politically_exposed_data, previous_user_data
+        ):
+            cls.skipped_publishes += 1
+            return
+        await cls.__publish_stored_data(politically_exposed_data)
+        await UserRepository.update_published_version(politically_exposed_data)
+
+    @classmethod
+    def get_idempotency_stats(cls) -> dict:
+        stats = {
+            "skipped_writes": cls.skipped_writes,
+            "skipped_publishes": cls.skipped_publishes,
+            "unpublished_writes": cls.unpublished_writes,
+        }
+        return stats
+
+    @classmethod
+    async def __update_user_with_outbox(
+        cls, politically_exposed_data: PoliticallyExposedData
+    ):
+        outbox_record = cls.__build_outbox_record(
+            politically_exposed_data=politically_exposed_data
+        )
+        uses_conditional_write = cls.__uses_conditional_write()
+
+        async def update_user_and_enqueue(session):
+            if uses_conditional_write:
+                await cls.__update_user_if_has_suitability(
+                    politically_exposed_data, session=session
+                )
+            else:
+                await UserRepository.update_user(
+                    politically_exposed_data, session=session
+                )
+            await OutboxRepository.enqueue(outbox_record, session=session)
+
+        await MongoDBInfrastructure.run_in_transaction(update_user_and_enqueue)
+        outbox_relay = cls.get_outbox_relay()
+        outbox_relay.start()
+        outbox_relay.notify()
+
+    @classmethod
+    async def __update_politically_exposed_data_for_us(
+        cls, politically_exposed_request: PoliticallyExposedRequest
+    ):
+        politically_exposed = politically_exposed_request.politically_exposed
+        politically_exposed_data = PoliticallyExposedData(
+            unique_id=politically_exposed_request.unique_id,
+            is_politically_exposed=politically_exposed.is_politically_exposed,
+            politically_exposed_names=politically_exposed.politically_exposed_names,
+        )
+
+        context = {
+            "politically_exposed_request": politically_exposed_request,
+            "politically_exposed_data": politically_exposed_data,
+        }
+        await cls.get_precondition_pipeline().run(context=context)
+
+        if await cls.__is_unchanged(context):
+            cls.skipped_writes += 1
+            return
+        if cls.__uses_outbox():
+            await cls.__update_user_with_outbox(politically_exposed_data)
+        elif cls.__uses_conditional_write():
+            await cls.__update_user_and_send_if_changed(politically_exposed_data)
+        else:
+            await cls.__send_to_persephone(politically_exposed_data)
+            await UserRepository.update_user(politically_exposed_data)
+        StepChecker.invalidate_step_us(unique_id=politically_exposed_data.unique_id)
+
+    @classmethod
+    async def update_politically_exposed_data_for_us(
+        cls, politically_exposed_request: PoliticallyExposedRequest
+    ):
+        if not cls.__uses_single_flight():
+            return await cls.__update_politically_exposed_data_for_us(
+                politically_exposed_request
+            )
+        unique_id = politically_exposed_request.unique_id
+        payload_hash = politically_exposed_request.get_payload_hash()
+        return await StageRunner.run(
+            stage="PoliticallyExposedService::update_politically_exposed_data_for_us",
+            operation=lambda: cls.get_single_flight_group().run(
+                key=f"{unique_id}:{payload_hash}",
+                lane=unique_id,
+                operation=lambda: cls.__update_politically_exposed_data_for_us(
+                    politically_exposed_request
+                ),
+            ),
+        )
@@ -0,0 +1,75 @@
+from src.domain.models.jwt_data.model import Jwt
+from src.domain.models.request.model import PoliticallyExposedRequest
+from src.infrastructures.circuit_breaker.infrastructure import CircuitBreakerRegistry
+from src.infrastructures.deadline.infrastructure import StageRunner
+from src.infrastructures.iohttp.infrastructure import RequestInfrastructure
+from src.infrastructures.loop_monitor.infrastructure import EventLoopMonitor
+from src.infrastructures.loop_registry.infrastructure import LoopResourceRegistry
+from src.infrastructures.metrics.infrastructure import MetricsRegistry
+from src.infrastructures.metrics_exporter.infrastructure import (
+    MetricsExporter,
+    PrometheusTextExporter,
+)
+from src.infrastructures.profiler.infrastructure import RequestProfiler
+from src.infrastructures.tracing.infrastructure import Tracer
+from src.repositories.user.repository import UserRepository
+from src.services.employ_data.service import PoliticallyExposedService
+from src.transport.user_step.transport import StepChecker
+
+
+class MetricsService:
+    collectors_registered = False
+    prometheus_exporter = PrometheusTextExporter()
+
+    @staticmethod
+    def __get_optional_stats(component) -> dict:
+        return component.get_stats() if component is not None else {}
+
+    @classmethod
+    def register_collectors(cls):
+        if cls.collectors_registered:
+            return
+        collectors = {
+            "request_pipeline": lambda: cls.__get_optional_stats(
+                PoliticallyExposedRequest.get_pipeline()
+            ),
+            "precondition_pipeline": lambda: cls.__get_optional_stats(
+                PoliticallyExposedService.get_precondition_pipeline()
+            ),
+            "idempotency": PoliticallyExposedService.get_idempotency_stats,
+            "persephone_producer": lambda: cls.__get_optional_stats(
+                PoliticallyExposedService.persephone_producer
+            ),
+            "outbox_relay": lambda: cls.__get_optional_stats(
+                PoliticallyExposedService.outbox_relay
+            ),
+            "single_flight": lambda: cls.__get_optional_stats(
+                PoliticallyExposedService.single_flight_group
+            ),
+            "user_write_coalescer": lambda: cls.__get_optional_stats(
+                UserRepository.write_coalescer
+            ),
+            "step_cache": lambda: cls.__get_optional_stats(StepChecker.step_cache),
+            "hedging": StepChecker.get_hedging_stats,
+            "jwt_decode_cache": lambda: cls.__get_optional_stats(Jwt.decode_cache),
+            "signing_keys": lambda: cls.__get_optional_stats(Jwt.signing_key_set),
+            "http_client": RequestInfrastructure.get_http_client_stats,
+            "circuit_breaker": CircuitBreakerRegistry.get_stats,
+            "loop_registry": LoopResourceRegistry.get_stats,
+            "event_loop": EventLoopMonitor.get_stats,
+            "deadline": lambda: {"expired": StageRunner.expired},
+            "tracing": Tracer.get_stats,
+            "profiler": RequestProfiler.get_stats,
+        }
+        for name, collector in collectors.items():
+            MetricsRegistry.register_collector(name=name, collector=collector)
+        cls.collectors_registered = True
+
+    @classmethod
+    def export(cls, exporter: MetricsExporter):
+        cls.register_collectors()
+        return exporter.export(MetricsRegistry.get_snapshot())
+
+    @classmethod
+    def get_prometheus_metrics(cls) -> str:
+        return cls.export(cls.prometheus_exporter)
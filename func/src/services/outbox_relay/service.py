@@ -0,0 +1,241 @@
+import asyncio
+import threading
+from datetime import datetime, timedelta
+from socket import gethostname
+from typing import List
+from uuid import uuid4
+
+from etria_logger import Gladsheim
+
+from src.domain.enums.circuit_breaker import CircuitBreakerDependency
+from src.domain.enums.persephone_delivery import OutboxStatus
+from src.domain.models.outbox.model import OutboxRecord
+from src.infrastructures.circuit_breaker.infrastructure import CircuitBreakerRegistry
+from src.infrastructures.loop_registry.infrastructure import LoopResourceRegistry
+from src.repositories.outbox.repository import OutboxRepository
+
+
+class OutboxRelay:
+    def __init__(
+        self,
+        persephone_client,
+        batch_size: int,
+        poll_interval_in_seconds: float,
+        lease_in_seconds: float,
+        max_attempts: int,
+        retry_base_delay_in_seconds: float,
+        retry_max_delay_in_seconds: float,
+        send_timeout_in_seconds: float = 10,
+    ):
+        self.persephone_client = persephone_client
+        self.batch_size = batch_size
+        self.poll_interval_in_seconds = poll_interval_in_seconds
+        self.lease_in_seconds = lease_in_seconds
+        self.max_attempts = max_attempts
+        self.retry_base_delay_in_seconds = retry_base_delay_in_seconds
+        self.retry_max_delay_in_seconds = retry_max_delay_in_seconds
+        self.send_timeout_in_seconds = send_timeout_in_seconds
+        self.owner = f"{gethostname()}:{uuid4()}"
+        self.sent = 0
+        self.retries = 0
+        self.dead_lettered = 0
+        self.last_batch_size = 0
+        self.__loop = None
+        self.__thread = None
+        self.__task = None
+        self.__wake_up = None
+        self.__lock = threading.Lock()
+
+    @CircuitBreakerRegistry.protect(CircuitBreakerDependency.PERSEPHONE)
+    async def __send_to_persephone(self, outbox_record: OutboxRecord):
+        return await asyncio.wait_for(
+            self.persephone_client.send_to_persephone(
+                topic=outbox_record.topic,
+                partition=outbox_record.partition,
+                message=outbox_record.message,
+                schema_name=outbox_record.schema_name,
+            ),
+            timeout=self.send_timeout_in_seconds,
+        )
+
+    async def __send(self, outbox_record: OutboxRecord) -> bool:
+        try:
+            (
+                sent_to_persephone,
+                status_sent_to_persephone,
+            ) = await self.__send_to_persephone(outbox_record)
+        except Exception as ex:
+            Gladsheim.error(
+                error=ex,
+                message="OutboxRelay::__send::Failed to send outbox record to Persephone",
+                unique_id=outbox_record.unique_id,
+            )
+            return False
+        return sent_to_persephone is not False
+
+    async def __schedule_retry(self, outbox_record: OutboxRecord):
+        attempts = outbox_record.attempts + 1
+        delay_in_seconds = min(
+            self.retry_base_delay_in_seconds * 2 ** (attempts - 1),
+            self.retry_max_delay_in_seconds,
+        )
+        status = OutboxStatus.PENDING
+        if attempts >= self.max_attempts:
+            status = OutboxStatus.FAILED
+            self.dead_lettered += 1
+            Gladsheim.error(
+                message="OutboxRelay::__schedule_retry::Outbox record exceeded max attempts",
+                unique_id=outbox_record.unique_id,
+                attempts=attempts,
+            )
+        else:
+            self.retries += 1
+        await OutboxRepository.mark_as_failed(
+            outbox_record=outbox_record,
+            next_attempt_at=datetime.utcnow() + timedelta(seconds=delay_in_seconds),
+            status=status,
+        )
+
+    async def __deliver_user_records(self, outbox_records: List[OutboxRecord]) -> list:
+        sent_record_ids = []
+        for outbox_record in outbox_records:
+            claimed = await OutboxRepository.claim(
+                outbox_record=outbox_record,
+                owner=self.owner,
+                lease_in_seconds=self.lease_in_seconds,
+            )
+            if not claimed:
+                break
+            if not await self.__send(outbox_record=outbox_record):
+                await self.__schedule_retry(outbox_record=outbox_record)
+                break
+            sent_record_ids.append(outbox_record.record_id)
+        return sent_record_ids
+
+    @staticmethod
+    def __get_deliverable_records(
+        outbox_records: List[OutboxRecord], now: datetime
+    ) -> List[OutboxRecord]:
+        deliverable_records = []
+        for outbox_record in outbox_records:
+            if outbox_record.next_attempt_at > now:
+                break
+            deliverable_records.append(outbox_record)
+        return deliverable_records
+
+    async def drain_once(self) -> int:
+        now = datetime.utcnow()
+        blocked_unique_ids = await OutboxRepository.get_blocked_unique_ids(now=now)
+        outbox_records = await OutboxRepository.get_pending(
+            limit=self.batch_size,
+            now=now,
+            excluded_unique_ids=blocked_unique_ids,
+        )
+        self.last_batch_size = len(outbox_records)
+        pending_by_user = await OutboxRepository.get_pending_by_user(
+            unique_ids=list(
+                {outbox_record.unique_id for outbox_record in outbox_records}
+            )
+        )
+
+        delivered = await asyncio.gather(
+            *(
+                self.__deliver_user_records(
+                    outbox_records=self.__get_deliverable_records(
+                        outbox_records=user_records, now=now
+                    )
+                )
+                for user_records in pending_by_user.values()
+            )
+        )
+        sent_record_ids = [
+            record_id for record_ids in delivered for record_id in record_ids
+        ]
+        await OutboxRepository.mark_as_sent(record_ids=sent_record_ids)
+        self.sent += len(sent_record_ids)
+        return len(sent_record_ids)
+
+    async def __run(self):
+        while True:
+            self.__wake_up.clear()
+            try:
+                sent = await self.drain_once()
+            except Exception as ex:
+                Gladsheim.error(
+                    error=ex, message="OutboxRelay::__run::Failed to drain outbox"
+                )
+                sent = 0
+            if sent:
+                continue
+            try:
+                await asyncio.wait_for(
+                    self.__wake_up.wait(), timeout=self.poll_interval_in_seconds
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    def __run_in_thread(self, loop: asyncio.AbstractEventLoop):
+        asyncio.set_event_loop(loop)
+        self.__wake_up = asyncio.Event()
+        self.__task = loop.create_task(self.__run())
+        try:
+            loop.run_until_complete(self.__task)
+        except asyncio.CancelledError:
+            pass
+        finally:
+            loop.run_until_complete(LoopResourceRegistry.close_loop_resources())
+            loop.close()
+
+    def is_running(self) -> bool:
+        return self.__thread is not None and self.__thread.is_alive()
+
+    def start(self):
+        with self.__lock:
+            if self.is_running():
+                return
+            self.__loop = asyncio.new_event_loop()
+            self.__thread = threading.Thread(
+                target=self.__run_in_thread,
+                args=(self.__loop,),
+                name="outbox-relay",
+                daemon=True,
+            )
+            self.__thread.start()
+
+    def __wake(self):
+        if self.__wake_up is not None:
+            self.__wake_up.set()
+
+    def notify(self):
+        loop = self.__loop
+        if loop is None or loop.is_closed():
+            return
+        try:
+            loop.call_soon_threadsafe(self.__wake)
+        except RuntimeError:
+            pass
+
+    def __cancel(self):
+        if self.__task is not None:
+            self.__task.cancel()
+
+    async def stop(self):
+        with self.__lock:
+            loop, thread = self.__loop, self.__thread
+            self.__loop = self.__thread = None
+        if thread is None:
+            return
+        try:
+            loop.call_soon_threadsafe(self.__cancel)
+        except RuntimeError:
+            pass
+        await asyncio.get_running_loop().run_in_executor(None, thread.join)
+
+    def get_stats(self) -> dict:
+        stats = {
+            "sent": self.sent,
+            "retries": self.retries,
+            "dead_lettered": self.dead_lettered,
+            "last_batch_size": self.last_batch_size,
+        }
+        return stats
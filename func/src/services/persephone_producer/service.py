@@ -0,0 +1,175 @@
+import asyncio
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+from etria_logger import Gladsheim
+
+from src.infrastructures.deadline.infrastructure import StageRunner
+
+
+class PendingMessage:
+    def __init__(
+        self,
+        topic: str,
+        partition: int,
+        message: dict,
+        schema_name: str,
+        future: asyncio.Future,
+    ):
+        self.topic = topic
+        self.partition = partition
+        self.message = message
+        self.schema_name = schema_name
+        self.future = future
+        self.enqueued_at = perf_counter()
+
+
+class ProducerLoopState:
+    def __init__(self, loop: asyncio.AbstractEventLoop, max_in_flight: int):
+        self.loop = loop
+        self.in_flight = asyncio.Semaphore(max_in_flight)
+        self.buffer: List[PendingMessage] = []
+        self.linger_handle = None
+        self.flushes = set()
+
+
+class BatchingPersephoneProducer:
+    def __init__(
+        self,
+        persephone_client,
+        linger_in_seconds: float,
+        max_batch_size: int,
+        max_in_flight: int,
+    ):
+        self.persephone_client = persephone_client
+        self.linger_in_seconds = linger_in_seconds
+        self.max_batch_size = max_batch_size
+        self.max_in_flight = max_in_flight
+        self.batches = 0
+        self.messages = 0
+        self.failures = 0
+        self.last_batch_size = 0
+        self.linger_wait_in_seconds = 0.0
+        self.adopted = 0
+        self.__states: Dict[asyncio.AbstractEventLoop, ProducerLoopState] = {}
+
+    def __release_closed_loops(self) -> List[PendingMessage]:
+        orphans = []
+        for loop, state in list(self.__states.items()):
+            if loop.is_closed():
+                del self.__states[loop]
+                orphans.extend(state.buffer)
+        return orphans
+
+    def __get_loop_state(self) -> ProducerLoopState:
+        loop = asyncio.get_running_loop()
+        state = self.__states.get(loop)
+        if state is None:
+            orphans = self.__release_closed_loops()
+            state = ProducerLoopState(loop=loop, max_in_flight=self.max_in_flight)
+            self.__states[loop] = state
+            if orphans:
+                Gladsheim.warning(
+                    message="BatchingPersephoneProducer::__get_loop_state::Flushing messages buffered on a closed event loop",
+                    messages=len(orphans),
+                )
+                self.adopted += len(orphans)
+                state.buffer.extend(orphans)
+                self.__flush(state)
+        return state
+
+    @staticmethod
+    def __resolve(pending_message: PendingMessage, result=None, error=None):
+        future = pending_message.future
+        if future.done() or future.get_loop().is_closed():
+            return
+        if error is None:
+            future.set_result(result)
+        else:
+            future.set_exception(error)
+
+    async def __send_one(self, pending_message: PendingMessage):
+        try:
+            result = await self.persephone_client.send_to_persephone(
+                topic=pending_message.topic,
+                partition=pending_message.partition,
+                message=pending_message.message,
+                schema_name=pending_message.schema_name,
+            )
+        except Exception as ex:
+            self.failures += 1
+            Gladsheim.error(
+                error=ex,
+                message="BatchingPersephoneProducer::__send_one::Failed to send message",
+            )
+            self.__resolve(pending_message, error=ex)
+            return
+        if result[0] is False:
+            self.failures += 1
+        self.__resolve(pending_message, result=result)
+
+    async def __send_batch(self, batch: List[PendingMessage]):
+        await asyncio.gather(
+            *(self.__send_one(pending_message) for pending_message in batch)
+        )
+
+    def __flush(self, state: ProducerLoopState):
+        if state.linger_handle is not None:
+            state.linger_handle.cancel()
+            state.linger_handle = None
+        batch, state.buffer = state.buffer, []
+        if not batch:
+            return
+        flushed_at = perf_counter()
+        self.batches += 1
+        self.messages += len(batch)
+        self.last_batch_size = len(batch)
+        self.linger_wait_in_seconds += sum(
+            flushed_at - pending_message.enqueued_at for pending_message in batch
+        )
+        flush = StageRunner.create_detached_task(
+            self.__send_batch(batch), loop=state.loop
+        )
+        state.flushes.add(flush)
+        flush.add_done_callback(state.flushes.discard)
+
+    async def send_to_persephone(
+        self, topic: str, partition: int, message: dict, schema_name: str
+    ) -> Tuple[bool, object]:
+        state = self.__get_loop_state()
+        async with state.in_flight:
+            pending_message = PendingMessage(
+                topic=topic,
+                partition=partition,
+                message=message,
+                schema_name=schema_name,
+                future=state.loop.create_future(),
+            )
+            state.buffer.append(pending_message)
+            if len(state.buffer) >= self.max_batch_size:
+                self.__flush(state)
+            elif state.linger_handle is None:
+                state.linger_handle = state.loop.call_later(
+                    self.linger_in_seconds, self.__flush, state
+                )
+            return await asyncio.shield(pending_message.future)
+
+    async def flush(self):
+        state = self.__states.get(asyncio.get_running_loop())
+        if state is not None:
+            self.__flush(state)
+            await asyncio.gather(*state.flushes)
+
+    def get_stats(self) -> dict:
+        stats = {
+            "batches": self.batches,
+            "messages": self.messages,
+            "failures": self.failures,
+            "adopted": self.adopted,
+            "last_batch_size": self.last_batch_size,
+            "average_batch_size": self.messages / self.batches if self.batches else 0,
+            "average_linger_wait_in_seconds": (
+                self.linger_wait_in_seconds / self.messages if self.messages else 0
+            ),
+        }
+        return stats
@@ -0,0 +1,101 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict
+
+from src.infrastructures.deadline.infrastructure import StageRunner
+
+
+class SingleFlightLoopState:
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        self.flights: Dict[str, asyncio.Task] = {}
+        self.lanes: Dict[str, asyncio.Lock] = {}
+        self.lane_users: Dict[str, int] = {}
+        self.lane_tails: Dict[str, str] = {}
+
+
+class SingleFlightGroup:
+    def __init__(self):
+        self.leaders = 0
+        self.followers = 0
+        self.serialized = 0
+        self.__states: Dict[asyncio.AbstractEventLoop, SingleFlightLoopState] = {}
+
+    def __get_loop_state(self) -> SingleFlightLoopState:
+        loop = asyncio.get_running_loop()
+        state = self.__states.get(loop)
+        if state is None:
+            for known_loop in list(self.__states):
+                if known_loop.is_closed():
+                    del self.__states[known_loop]
+            state = SingleFlightLoopState(loop=loop)
+            self.__states[loop] = state
+        return state
+
+    @staticmethod
+    def __acquire_lane(state: SingleFlightLoopState, lane: str) -> asyncio.Lock:
+        if lane not in state.lanes:
+            state.lanes[lane] = asyncio.Lock()
+            state.lane_users[lane] = 0
+        state.lane_users[lane] += 1
+        return state.lanes[lane]
+
+    @staticmethod
+    def __release_lane(state: SingleFlightLoopState, lane: str):
+        state.lane_users[lane] -= 1
+        if state.lane_users[lane] == 0:
+            del state.lanes[lane]
+            del state.lane_users[lane]
+            del state.lane_tails[lane]
+
+    async def __lead(
+        self,
+        state: SingleFlightLoopState,
+        key: str,
+        lane: str,
+        lane_lock: asyncio.Lock,
+        operation: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        try:
+            if lane_lock.locked():
+                self.serialized += 1
+            async with lane_lock:
+                return await operation()
+        finally:
+            self.__release_lane(state, lane)
+            if state.flights.get(key) is asyncio.current_task():
+                del state.flights[key]
+
+    async def run(
+        self, key: str, lane: str, operation: Callable[[], Awaitable[Any]]
+    ) -> Any:
+        state = self.__get_loop_state()
+        flight = state.flights.get(key)
+        if flight is None or state.lane_tails.get(lane) != key:
+            self.leaders += 1
+            lane_lock = self.__acquire_lane(state, lane)
+            state.lane_tails[lane] = key
+            flight = StageRunner.create_detached_task(
+                self.__lead(
+                    state=state,
+                    key=key,
+                    lane=lane,
+                    lane_lock=lane_lock,
+                    operation=operation,
+                ),
+                loop=state.loop,
+            )
+            state.flights[key] = flight
+        else:
+            self.followers += 1
+        return await asyncio.shield(flight)
+
+    def get_stats(self) -> dict:
+        stats = {
+            "leaders": self.leaders,
+            "followers": self.followers,
+            "serialized": self.serialized,
+            "in_flight": sum(
+                len(state.flights) for state in list(self.__states.values())
+            ),
+        }
+        return stats
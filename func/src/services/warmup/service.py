@@ -0,0 +1,142 @@
+import asyncio
+from threading import Lock
+from time import perf_counter
+
+from decouple import config
+from etria_logger import Gladsheim
+
+from src.domain.enums.http_endpoint import HttpEndpoint
+from src.domain.enums.warmup import WarmupDependency, WarmupStatus
+from src.domain.models.jwt_data.model import Jwt
+from src.infrastructures.mongo_db.infrastructure import MongoDBInfrastructure
+from src.transport.user_step.transport import StepChecker
+
+
+class WarmupService:
+    readiness = {}
+    warmup_started = False
+    warmup_duration_in_seconds = None
+    warmed_loop = None
+    __warmup_lock = Lock()
+
+    @staticmethod
+    async def __pre_connect_step_br():
+        await StepChecker.pre_connect(
+            url=config("URL_ONBOARDING_STEP_BR"),
+            endpoint=HttpEndpoint.ONBOARDING_STEP_BR,
+        )
+
+    @staticmethod
+    async def __pre_connect_step_us():
+        await StepChecker.pre_connect(
+            url=config("URL_ONBOARDING_STEP_US"),
+            endpoint=HttpEndpoint.ONBOARDING_STEP_US,
+        )
+
+    @staticmethod
+    async def __prime_signing_keys():
+        await Jwt.get_signing_key_set().refresh()
+
+    @classmethod
+    def __get_warmups(cls) -> dict:
+        warmups = {
+            WarmupDependency.MONGO_DB: MongoDBInfrastructure.ping,
+            WarmupDependency.ONBOARDING_STEP_BR: cls.__pre_connect_step_br,
+            WarmupDependency.ONBOARDING_STEP_US: cls.__pre_connect_step_us,
+        }
+        offline_verification_enabled = config(
+            "JWT_OFFLINE_VERIFICATION_ENABLED", default=False, cast=bool
+        )
+        if offline_verification_enabled is True:
+            warmups[WarmupDependency.SIGNING_KEYS] = cls.__prime_signing_keys
+        return warmups
+
+    @classmethod
+    async def __warm_up_dependency(
+        cls, dependency: WarmupDependency, warm_up, timeout_in_seconds: float
+    ):
+        start = perf_counter()
+        try:
+            await asyncio.wait_for(warm_up(), timeout=timeout_in_seconds)
+            status = WarmupStatus.WARM
+        except Exception as ex:
+            status = WarmupStatus.FAILED
+            Gladsheim.warning(
+                message="WarmupService::__warm_up_dependency::Failed to warm up dependency",
+                dependency=dependency.value,
+                error=repr(ex),
+            )
+        cls.readiness[dependency.value] = {
+            "status": status.value,
+            "duration_in_seconds": perf_counter() - start,
+        }
+
+    @classmethod
+    async def warm_up(cls):
+        timeout_in_seconds = config("WARMUP_TIMEOUT_IN_SECONDS", default=5, cast=float)
+        warmups = cls.__get_warmups()
+        cls.readiness = {
+            dependency.value: {"status": WarmupStatus.PENDING.value}
+            for dependency in WarmupDependency
+        }
+        for dependency in WarmupDependency:
+            if dependency not in warmups:
+                cls.readiness[dependency.value] = {"status": WarmupStatus.SKIPPED.value}
+
+        start = perf_counter()
+        await asyncio.gather(
+            *(
+                cls.__warm_up_dependency(
+                    dependency=dependency,
+                    warm_up=warm_up,
+                    timeout_in_seconds=timeout_in_seconds,
+                )
+                for dependency, warm_up in warmups.items()
+            )
+        )
+        cls.warmup_duration_in_seconds = perf_counter() - start
+        cls.warmed_loop = asyncio.get_running_loop()
+
+    @staticmethod
+    def __is_warmup_enabled() -> bool:
+        warmup_enabled = config("WARMUP_ENABLED", default=False, cast=bool)
+        return warmup_enabled is True
+
+    @classmethod
+    def __claim_warmup(cls) -> bool:
+        with cls.__warmup_lock:
+            if cls.warmup_started:
+                return False
+            cls.warmup_started = True
+            return True
+
+    @classmethod
+    async def ensure_warm(cls):
+        if not cls.__is_warmup_enabled():
+            return
+        if not cls.__claim_warmup():
+            return
+        await cls.warm_up()
+
+    @classmethod
+    def __has_live_resources(cls) -> bool:
+        return cls.warmed_loop is not None and not cls.warmed_loop.is_closed()
+
+    @classmethod
+    def get_readiness(cls) -> dict:
+        ready_statuses = (WarmupStatus.WARM.value, WarmupStatus.SKIPPED.value)
+        resources_live = cls.__has_live_resources()
+        is_ready = not cls.__is_warmup_enabled() or (
+            resources_live
+            and all(
+                dependency["status"] in ready_statuses
+                for dependency in cls.readiness.values()
+            )
+        )
+        readiness = {
+            "ready": is_ready,
+            "resources_live": resources_live,
+            "warmup_duration_in_seconds": cls.warmup_duration_in_seconds,
+            "dependencies": cls.readiness,
+        }
+        return readiness
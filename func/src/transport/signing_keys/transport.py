@@ -0,0 +1,24 @@
+from decouple import config
+from etria_logger import Gladsheim
+
+from src.domain.enums.http_endpoint import HttpEndpoint
+from src.infrastructures.iohttp.infrastructure import RequestInfrastructure
+
+
+class SigningKeysTransport(RequestInfrastructure):
+    @classmethod
+    async def get_signing_keys(cls) -> dict:
+        signing_keys_url = config("JWT_SIGNING_KEYS_URL")
+        try:
+            session = cls.get_session()
+            async with session.get(
+                signing_keys_url,
+                **cls.get_request_options(HttpEndpoint.SIGNING_KEYS),
+            ) as response:
+                signing_keys = await response.json()
+        except Exception as ex:
+            message = "Error trying to get the JWT signing keys"
+            Gladsheim.error(error=ex, message=message)
+            raise ex
+
+        return signing_keys
@@ -3,20 +3,114 @@ import asyncio
 from decouple import config
 from etria_logger import Gladsheim
 
+from src.domain.enums.circuit_breaker import CircuitBreakerDependency
+from src.domain.enums.http_endpoint import HttpEndpoint
 from src.domain.models.user_data.onboarding_step.model import UserOnboardingStep
+from src.infrastructures.cache.infrastructure import TtlLruCache
+from src.infrastructures.circuit_breaker.infrastructure import CircuitBreakerRegistry
+from src.infrastructures.deadline.infrastructure import StageRunner
+from src.infrastructures.hedging.infrastructure import RequestHedger
 from src.infrastructures.iohttp.infrastructure import RequestInfrastructure
+from src.infrastructures.tracing.infrastructure import Tracer
 
 
 class StepChecker(RequestInfrastructure):
+    step_cache = None
+    negative_ttl_in_seconds = None
+    hedgers = {}
+
+    @classmethod
+    def get_step_cache(cls) -> TtlLruCache:
+        if cls.step_cache is None:
+            cls.negative_ttl_in_seconds = config(
+                "ONBOARDING_STEP_CACHE_NEGATIVE_TTL_IN_SECONDS", default=1, cast=float
+            )
+            cls.step_cache = TtlLruCache(
+                max_size=config(
+                    "ONBOARDING_STEP_CACHE_MAX_SIZE", default=10000, cast=int
+                ),
+                ttl_in_seconds=config(
+                    "ONBOARDING_STEP_CACHE_TTL_IN_SECONDS", default=5, cast=float
+                ),
+            )
+        return cls.step_cache
+
+    @classmethod
+    def get_step_cache_stats(cls) -> dict:
+        return cls.get_step_cache().get_stats()
+
     @classmethod
+    def invalidate_step_us(cls, unique_id: str):
+        if cls.step_cache is not None:
+            cls.step_cache.invalidate((unique_id, "us"))
+
+    @classmethod
+    def get_hedger(cls, endpoint: HttpEndpoint) -> RequestHedger:
+        if endpoint not in cls.hedgers:
+            cls.hedgers[endpoint] = RequestHedger(
+                percentile=config(
+                    "ONBOARDING_STEP_HEDGING_PERCENTILE", default=95, cast=float
+                ),
+                min_delay_in_seconds=config(
+                    "ONBOARDING_STEP_HEDGING_MIN_DELAY_IN_SECONDS",
+                    default=0.005,
+                    cast=float,
+                ),
+                max_delay_in_seconds=config(
+                    "ONBOARDING_STEP_HEDGING_MAX_DELAY_IN_SECONDS",
+                    default=1,
+                    cast=float,
+                ),
+                budget_ratio=config(
+                    "ONBOARDING_STEP_HEDGING_BUDGET_RATIO", default=0.05, cast=float
+                ),
+                budget_burst=config(
+                    "ONBOARDING_STEP_HEDGING_BUDGET_BURST", default=10, cast=float
+                ),
+            )
+        return cls.hedgers[endpoint]
+
+    @classmethod
+    def get_hedging_stats(cls) -> dict:
+        return {
+            endpoint.value: hedger.get_stats()
+            for endpoint, hedger in cls.hedgers.items()
+        }
+
+    @classmethod
+    async def __request_step(
+        cls, get_step_url: str, header: dict, endpoint: HttpEndpoint
+    ) -> str:
+        session = cls.get_session()
+        async with session.get(
+            get_step_url, headers=header, **cls.get_request_options(endpoint)
+        ) as response:
+            steps_response = await response.json()
+            return steps_response["result"]["current_step"]
+
+    @classmethod
+    async def __fetch_step(
+        cls, get_step_url: str, header: dict, endpoint: HttpEndpoint
+    ) -> str:
+        hedging_enabled = config(
+            "ONBOARDING_STEP_HEDGING_ENABLED", default=False, cast=bool
+        )
+        if hedging_enabled is not True:
+            return await cls.__request_step(get_step_url, header, endpoint)
+        return await cls.get_hedger(endpoint).run(
+            lambda: cls.__request_step(get_step_url, header, endpoint)
+        )
+
+    @classmethod
+    @StageRunner.stage("StepChecker::_get_step_br")
+    @CircuitBreakerRegistry.protect(CircuitBreakerDependency.ONBOARDING_STEP_BR)
     async def _get_step_br(cls, x_thebes_answer):
         get_step_url = config("URL_ONBOARDING_STEP_BR")
-        header = {"x_thebes_answer": x_thebes_answer}
+        header = Tracer.inject({"x_thebes_answer": x_thebes_answer})
         try:
-            session = cls.get_session()
-            async with session.get(get_step_url, headers=header) as response:
-                steps_response = await response.json()
-                step = steps_response["result"]["current_step"]
+            step = await cls.__fetch_step(
+                get_step_url, header, HttpEndpoint.ONBOARDING_STEP_BR
+            )
         except Exception as ex:
             message = "Error trying to get the onboarding step in BR"
             Gladsheim.error(error=ex, message=message)
@@ -25,14 +119,15 @@ class StepChecker(RequestInfrastructure):
         return step
 
     @classmethod
+    @StageRunner.stage("StepChecker::_get_step_us")
+    @CircuitBreakerRegistry.protect(CircuitBreakerDependency.ONBOARDING_STEP_US)
     async def _get_step_us(cls, x_thebes_answer):
         get_step_url = config("URL_ONBOARDING_STEP_US")
-        header = {"x_thebes_answer": x_thebes_answer}
+        header = Tracer.inject({"x_thebes_answer": x_thebes_answer})
         try:
-            session = cls.get_session()
-            async with session.get(get_step_url, headers=header) as response:
-                steps_response = await response.json()
-                step = steps_response["result"]["current_step"]
+            step = await cls.__fetch_step(
+                get_step_url, header, HttpEndpoint.ONBOARDING_STEP_US
+            )
         except Exception as ex:
             message = "Error trying to get the onboarding step in US"
             Gladsheim.error(error=ex, message=message)
@@ -41,9 +136,46 @@ class StepChecker(RequestInfrastructure):
         return step
 
     @classmethod
-    async def get_onboarding_step(cls, x_thebes_answer):
-        step_br = cls._get_step_br(x_thebes_answer=x_thebes_answer)
-        step_us = cls._get_step_us(x_thebes_answer=x_thebes_answer)
+    async def __get_step_with_cache(
+        cls, unique_id: str, region: str, get_step, is_expected_step, x_thebes_answer
+    ):
+        step_cache = cls.get_step_cache()
+        cache_key = (unique_id, region)
+        if (step := step_cache.get(cache_key)) is not None:
+            return step
+
+        step = await get_step(x_thebes_answer=x_thebes_answer)
+        ttl_in_seconds = (
+            step_cache.ttl_in_seconds
+            if is_expected_step(step)
+            else cls.negative_ttl_in_seconds
+        )
+        step_cache.set(cache_key, step, ttl_in_seconds=ttl_in_seconds)
+        return step
+
+    @classmethod
+    async def get_onboarding_step(cls, x_thebes_answer, unique_id: str = None):
+        cache_enabled = config(
+            "ONBOARDING_STEP_CACHE_ENABLED", default=False, cast=bool
+        )
+        if unique_id is None or cache_enabled is not True:
+            step_br = cls._get_step_br(x_thebes_answer=x_thebes_answer)
+            step_us = cls._get_step_us(x_thebes_answer=x_thebes_answer)
+        else:
+            step_br = cls.__get_step_with_cache(
+                unique_id=unique_id,
+                region="br",
+                get_step=cls._get_step_br,
+                is_expected_step=UserOnboardingStep.is_expected_step_br,
+                x_thebes_answer=x_thebes_answer,
+            )
+            step_us = cls.__get_step_with_cache(
+                unique_id=unique_id,
+                region="us",
+                get_step=cls._get_step_us,
+                is_expected_step=UserOnboardingStep.is_expected_step_us,
+                x_thebes_answer=x_thebes_answer,
+            )
         step_br, step_us = await asyncio.gather(step_br, step_us)
         user_step = UserOnboardingStep(step_br=step_br, step_us=step_us)
         return user_step
@@ -0,0 +1,23 @@
+from unittest.mock import patch
+
+from src.domain.models.deadline import model
+from src.domain.models.deadline.model import Deadline
+
+
+@patch.object(model, "monotonic")
+def test_get_remaining(monotonic_mock):
+    monotonic_mock.return_value = 100
+    deadline = Deadline(budget_in_seconds=5)
+    monotonic_mock.return_value = 102
+    assert deadline.get_remaining() == 3
+    assert deadline.get_elapsed() == 2
+    assert deadline.is_expired() is False
+
+
+@patch.object(model, "monotonic")
+def test_get_remaining_when_expired(monotonic_mock):
+    monotonic_mock.return_value = 100
+    deadline = Deadline(budget_in_seconds=5)
+    monotonic_mock.return_value = 106
+    assert deadline.get_remaining() == 0
+    assert deadline.is_expired() is True
@@ -0,0 +1,171 @@
+from time import time
+from unittest.mock import patch
+
+import pytest
+from decouple import Config
+from etria_logger import Gladsheim
+from heimdall_client import Heimdall, HeimdallStatusResponses
+
+from src.domain.exceptions.model import UnauthorizedError
+from src.domain.models.jwt_data.model import Jwt
+from src.domain.models.signing_keys.model import SigningKeySet
+from src.infrastructures.cache.infrastructure import TtlLruCache
+from tests.stand_ins.key_server import KeyServerStandIn
+
+decoded_jwt_dummy = {
+    "is_payload_decoded": True,
+    "decoded_jwt": {"user": {"unique_id": "unique_id"}, "exp": time() + 3600},
+    "message": "Jwt decoded",
+}
+decoded_jwt_without_expiration_dummy = {
+    "is_payload_decoded": True,
+    "decoded_jwt": {"user": {"unique_id": "unique_id"}},
+    "message": "Jwt decoded",
+}
+
+
+def env_stub(**env):
+    def get_env(key, default=None, cast=None):
+        return env.get(key, default)
+
+    return get_env
+
+
+cache_enabled_env = env_stub(JWT_DECODE_CACHE_ENABLED=True)
+offline_verification_env = env_stub(JWT_OFFLINE_VERIFICATION_ENABLED=True)
+
+
+class KeyServerTransportDummy:
+    key_server = KeyServerStandIn(kid="signing-key-1")
+
+    @classmethod
+    async def get_signing_keys(cls):
+        return cls.key_server.get_signing_keys()
+
+
+@pytest.fixture
+def decode_cache():
+    cache = TtlLruCache(max_size=10, ttl_in_seconds=30)
+    Jwt.decode_cache = cache
+    yield cache
+    Jwt.decode_cache = None
+
+
+@pytest.fixture
+def signing_key_set():
+    signing_key_set = SigningKeySet(
+        transport=KeyServerTransportDummy,
+        algorithms=["RS256"],
+        refresh_interval_in_seconds=300,
+        min_refresh_interval_in_seconds=0,
+    )
+    Jwt.signing_key_set = signing_key_set
+    yield signing_key_set
+    signing_key_set.stop_background_refresh()
+    Jwt.signing_key_set = None
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=env_stub())
+@patch.object(Heimdall, "decode_payload")
+async def test_build_when_cache_is_disabled(decode_payload_mock, mocked_env):
+    decode_payload_mock.return_value = (
+        decoded_jwt_dummy,
+        HeimdallStatusResponses.SUCCESS,
+    )
+    await Jwt.build(jwt="jwt")
+    jwt = await Jwt.build(jwt="jwt")
+    assert jwt.unique_id == "unique_id"
+    assert decode_payload_mock.call_count == 2
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=cache_enabled_env)
+@patch.object(Heimdall, "decode_payload")
+async def test_build_when_jwt_is_cached(decode_payload_mock, mocked_env, decode_cache):
+    decode_payload_mock.return_value = (
+        decoded_jwt_dummy,
+        HeimdallStatusResponses.SUCCESS,
+    )
+    await Jwt.build(jwt="jwt")
+    jwt = await Jwt.build(jwt="jwt")
+    assert jwt.unique_id == "unique_id"
+    decode_payload_mock.assert_called_once_with(jwt="jwt")
+    stats = Jwt.get_decode_cache_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=cache_enabled_env)
+@patch.object(Heimdall, "decode_payload")
+async def test_build_when_jwt_has_no_expiration(
+    decode_payload_mock, mocked_env, decode_cache
+):
+    decode_payload_mock.return_value = (
+        decoded_jwt_without_expiration_dummy,
+        HeimdallStatusResponses.SUCCESS,
+    )
+    await Jwt.build(jwt="jwt")
+    await Jwt.build(jwt="jwt")
+    assert decode_payload_mock.call_count == 2
+    assert len(decode_cache) == 0
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=cache_enabled_env)
+@patch.object(Heimdall, "decode_payload")
+async def test_build_when_jwt_is_invalid(decode_payload_mock, mocked_env, decode_cache):
+    decode_payload_mock.return_value = (
+        decoded_jwt_dummy,
+        HeimdallStatusResponses.INVALID_TOKEN,
+    )
+    with pytest.raises(UnauthorizedError):
+        await Jwt.build(jwt="jwt")
+    with pytest.raises(UnauthorizedError):
+        await Jwt.build(jwt="jwt")
+    assert decode_payload_mock.call_count == 2
+    assert len(decode_cache) == 0
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=offline_verification_env)
+@patch.object(Heimdall, "decode_payload")
+async def test_build_when_jwt_is_verified_offline(
+    decode_payload_mock, mocked_env, signing_key_set
+):
+    token = KeyServerTransportDummy.key_server.sign(kid="signing-key-1")
+    jwt = await Jwt.build(jwt=token)
+    assert jwt.unique_id == "unique_id"
+    assert not decode_payload_mock.called
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=offline_verification_env)
+@patch.object(Heimdall, "decode_payload")
+async def test_build_when_offline_signature_is_invalid(
+    decode_payload_mock, mocked_env, signing_key_set
+):
+    forger = KeyServerStandIn(kid="signing-key-1")
+    token = forger.sign(kid="signing-key-1")
+    with pytest.raises(UnauthorizedError):
+        await Jwt.build(jwt=token)
+    assert not decode_payload_mock.called
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "warning")
+@patch.object(Config, "__call__", side_effect=offline_verification_env)
+@patch.object(Heimdall, "decode_payload")
+async def test_build_when_signing_key_is_unknown(
+    decode_payload_mock, mocked_env, etria_warning_mock, signing_key_set
+):
+    decode_payload_mock.return_value = (
+        decoded_jwt_dummy,
+        HeimdallStatusResponses.SUCCESS,
+    )
+    token = KeyServerStandIn(kid="unknown-key").sign(kid="unknown-key")
+    jwt = await Jwt.build(jwt=token)
+    assert jwt.unique_id == "unique_id"
+    decode_payload_mock.assert_called_once_with(jwt=token)
+    assert etria_warning_mock.called
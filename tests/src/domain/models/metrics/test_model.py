@@ -0,0 +1,44 @@
+from src.domain.models.metrics.model import LatencyHistogram, MetricsSnapshot
+
+
+def test_observe():
+    histogram = LatencyHistogram(buckets=(0.01, 0.1))
+    for value in [0.005, 0.01, 0.05, 1]:
+        histogram.observe(value)
+    assert histogram.count == 4
+    assert histogram.sum == 1.065
+    assert histogram.get_cumulative_counts() == [
+        ("0.01", 2),
+        ("0.1", 3),
+        ("+Inf", 4),
+    ]
+
+
+def test_copy():
+    histogram = LatencyHistogram(buckets=(0.01,))
+    histogram.observe(0.001)
+    copied_histogram = histogram.copy()
+    histogram.observe(0.001)
+    assert copied_histogram.count == 1
+    assert copied_histogram.get_cumulative_counts() == [("0.01", 1), ("+Inf", 1)]
+
+
+def test_get_outcome_counts():
+    success_histogram = LatencyHistogram()
+    success_histogram.observe(0.001)
+    failure_histogram = LatencyHistogram()
+    failure_histogram.observe(0.001)
+    failure_histogram.observe(0.002)
+    snapshot = MetricsSnapshot(
+        namespace="namespace",
+        histograms={
+            ("step_check", "success"): success_histogram,
+            ("step_check", "InvalidStepError"): failure_histogram,
+            ("auth", "success"): success_histogram,
+        },
+        gauges={},
+    )
+    assert snapshot.get_outcome_counts("step_check") == {
+        "success": 1,
+        "InvalidStepError": 2,
+    }
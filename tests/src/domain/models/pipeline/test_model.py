@@ -0,0 +1,179 @@
+import asyncio
+from time import perf_counter
+
+import pytest
+
+from src.domain.enums.request_stage import RequestStage, StageCost
+from src.domain.models.pipeline.model import PipelineStage, StagedPipeline
+
+
+def build_stage(name, cost, calls, fail=False):
+    async def handler(context):
+        calls.append(name)
+        if fail:
+            raise ValueError(name.value)
+
+    return PipelineStage(name=name, cost=cost, handler=handler)
+
+
+@pytest.mark.asyncio
+async def test_run_orders_stages_by_cost():
+    calls = []
+    pipeline = StagedPipeline(
+        stages=[
+            build_stage(RequestStage.AUTH, StageCost.NETWORK_CALL, calls),
+            build_stage(
+                RequestStage.SCHEMA_VALIDATION, StageCost.LOCAL_VALIDATION, calls
+            ),
+            build_stage(RequestStage.BODY_SIZE_CHECK, StageCost.LOCAL_CHECK, calls),
+            build_stage(RequestStage.STEP_CHECK, StageCost.NETWORK_CALL, calls),
+        ]
+    )
+    context = {"key": "value"}
+    result = await pipeline.run(context)
+    assert result is context
+    assert calls == [
+        RequestStage.BODY_SIZE_CHECK,
+        RequestStage.SCHEMA_VALIDATION,
+        RequestStage.AUTH,
+        RequestStage.STEP_CHECK,
+    ]
+
+
+@pytest.mark.asyncio
+async def test_run_when_stage_short_circuits():
+    calls = []
+    pipeline = StagedPipeline(
+        stages=[
+            build_stage(RequestStage.BODY_SIZE_CHECK, StageCost.LOCAL_CHECK, calls),
+            build_stage(
+                RequestStage.SCHEMA_VALIDATION,
+                StageCost.LOCAL_VALIDATION,
+                calls,
+                fail=True,
+            ),
+            build_stage(RequestStage.AUTH, StageCost.NETWORK_CALL, calls),
+            build_stage(RequestStage.STEP_CHECK, StageCost.NETWORK_CALL, calls),
+        ]
+    )
+    with pytest.raises(ValueError):
+        await pipeline.run({})
+
+    assert calls == [RequestStage.BODY_SIZE_CHECK, RequestStage.SCHEMA_VALIDATION]
+    stats = pipeline.get_stats()
+    assert stats["schema_validation"]["short_circuits"] == 1
+    assert stats["schema_validation"]["saved_cost"] == 2 * StageCost.NETWORK_CALL
+    assert stats["auth"]["executions"] == 0
+    assert stats["auth"]["skipped"] == 1
+    assert stats["body_size_check"]["short_circuits"] == 0
+    assert stats["body_size_check"]["executions"] == 1
+
+
+@pytest.mark.asyncio
+async def test_run_estimates_saved_seconds_from_skipped_stage_duration():
+    calls = []
+    auth_stage = build_stage(RequestStage.AUTH, StageCost.NETWORK_CALL, calls)
+    auth_stage.executions = 2
+    auth_stage.duration_in_seconds = 0.5
+    pipeline = StagedPipeline(
+        stages=[
+            build_stage(
+                RequestStage.SCHEMA_VALIDATION,
+                StageCost.LOCAL_VALIDATION,
+                calls,
+                fail=True,
+            ),
+            auth_stage,
+        ]
+    )
+    with pytest.raises(ValueError):
+        await pipeline.run({})
+
+    stats = pipeline.get_stats()
+    assert stats["schema_validation"]["saved_seconds"] == 0.25
+
+
+def build_delayed_stage(name, delay, events, error=None):
+    async def handler(context):
+        try:
+            await asyncio.sleep(delay)
+        except asyncio.CancelledError:
+            events.append(f"{name.value}_cancelled")
+            raise
+        events.append(f"{name.value}_done")
+        if error is not None:
+            raise error
+
+    return PipelineStage(name=name, cost=StageCost.NETWORK_CALL, handler=handler)
+
+
+@pytest.mark.asyncio
+async def test_run_concurrently():
+    events = []
+    pipeline = StagedPipeline(
+        stages=[
+            build_delayed_stage(RequestStage.STEP_CHECK, 0.05, events),
+            build_delayed_stage(RequestStage.SUITABILITY_LOOKUP, 0.05, events),
+        ],
+        concurrent=True,
+    )
+    start = perf_counter()
+    await pipeline.run({})
+    assert perf_counter() - start < 0.09
+    assert sorted(events) == ["step_check_done", "suitability_lookup_done"]
+
+
+@pytest.mark.asyncio
+async def test_run_concurrently_cancels_later_stages_when_stage_fails():
+    events = []
+    pipeline = StagedPipeline(
+        stages=[
+            build_delayed_stage(
+                RequestStage.STEP_CHECK, 0.01, events, error=KeyError("step")
+            ),
+            build_delayed_stage(RequestStage.SUITABILITY_LOOKUP, 1, events),
+        ],
+        concurrent=True,
+    )
+    with pytest.raises(KeyError):
+        await pipeline.run({})
+    assert events == ["step_check_done", "suitability_lookup_cancelled"]
+    stats = pipeline.get_stats()
+    assert stats["step_check"]["short_circuits"] == 1
+    assert stats["suitability_lookup"]["skipped"] == 1
+
+
+@pytest.mark.asyncio
+async def test_run_concurrently_keeps_error_of_earliest_stage():
+    events = []
+    pipeline = StagedPipeline(
+        stages=[
+            build_delayed_stage(
+                RequestStage.STEP_CHECK, 0.05, events, error=KeyError("step")
+            ),
+            build_delayed_stage(
+                RequestStage.SUITABILITY_LOOKUP, 0.01, events, error=ValueError()
+            ),
+        ],
+        concurrent=True,
+    )
+    with pytest.raises(KeyError):
+        await pipeline.run({})
+    assert events == ["suitability_lookup_done", "step_check_done"]
+
+
+@pytest.mark.asyncio
+async def test_run_concurrently_raises_later_error_when_earlier_stages_succeed():
+    events = []
+    pipeline = StagedPipeline(
+        stages=[
+            build_delayed_stage(RequestStage.STEP_CHECK, 0.05, events),
+            build_delayed_stage(
+                RequestStage.SUITABILITY_LOOKUP, 0.01, events, error=ValueError()
+            ),
+        ],
+        concurrent=True,
+    )
+    with pytest.raises(ValueError):
+        await pipeline.run({})
+    assert events == ["suitability_lookup_done", "step_check_done"]
@@ -0,0 +1,30 @@
+from src.domain.models.profile.model import RequestProfile
+
+
+def test_close_records_self_time():
+    profile = RequestProfile(name="request")
+    stage_frame = profile.root.create_child("stage")
+    cpu_frame = stage_frame.create_child("[cpu] json_encoding")
+    cpu_frame.close(total_in_seconds=0.25)
+    stage_frame.close(total_in_seconds=1)
+    assert profile.self_times[("request", "stage", "[cpu] json_encoding")] == 0.25
+    assert profile.self_times[("request", "stage")] == 0.75
+    assert profile.root.children_in_seconds == 1
+
+
+def test_close_when_children_overlap():
+    profile = RequestProfile(name="request")
+    stage_frame = profile.root.create_child("stage")
+    for name in ["step_br", "step_us"]:
+        stage_frame.create_child(name).close(total_in_seconds=1)
+    stage_frame.close(total_in_seconds=1.2)
+    assert profile.self_times[("request", "stage")] == 0
+
+
+def test_to_collapsed_stacks():
+    profile = RequestProfile(name="request")
+    profile.root.create_child("stage").close(total_in_seconds=0.002)
+    profile.add(stack=("request", "idle"), seconds=0)
+    assert profile.to_collapsed_stacks() == "request;stage 2000"
+    profile.finish()
+    assert profile.duration_in_seconds >= 0
@@ -0,0 +1,92 @@
+from unittest.mock import patch
+
+import pytest
+from decouple import Config
+
+from src.domain.exceptions.model import UnauthorizedError
+from src.domain.models.jwt_data.model import Jwt
+from src.domain.models.request.model import (
+    PoliticallyExposedCondition,
+    PoliticallyExposedRequest,
+)
+
+request_ok = {"is_politically_exposed": True, "politically_exposed_names": ["Giogio"]}
+
+
+def get_env(key, default=None, cast=None):
+    return default
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=get_env)
+@patch.object(Jwt, "build")
+async def test_build(jwt_build_mock, mocked_env):
+    jwt_build_mock.return_value = Jwt(unique_id="unique_id")
+    result = await PoliticallyExposedRequest.build(
+        x_thebes_answer="x_thebes_answer", parameters=request_ok, content_length=10
+    )
+    assert result.unique_id == "unique_id"
+    assert result.x_thebes_answer == "x_thebes_answer"
+    assert result.politically_exposed.politically_exposed_names == ["Giogio"]
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=get_env)
+@patch.object(Jwt, "build")
+async def test_build_validates_schema_before_decoding_jwt(jwt_build_mock, mocked_env):
+    with pytest.raises(ValueError):
+        await PoliticallyExposedRequest.build(
+            x_thebes_answer="x_thebes_answer",
+            parameters={"is_politically_exposed": True},
+        )
+    assert not jwt_build_mock.called
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=get_env)
+@patch.object(Jwt, "build")
+async def test_build_when_body_is_too_large(jwt_build_mock, mocked_env):
+    with pytest.raises(ValueError):
+        await PoliticallyExposedRequest.build(
+            x_thebes_answer="x_thebes_answer",
+            parameters=request_ok,
+            content_length=10**6,
+        )
+    assert not jwt_build_mock.called
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=get_env)
+@patch.object(Jwt, "build")
+async def test_build_when_jwt_is_invalid(jwt_build_mock, mocked_env):
+    jwt_build_mock.side_effect = UnauthorizedError()
+    with pytest.raises(UnauthorizedError):
+        await PoliticallyExposedRequest.build(
+            x_thebes_answer="x_thebes_answer", parameters=request_ok
+        )
+
+
+def test_get_payload_hash():
+    politically_exposed_request = PoliticallyExposedRequest(
+        x_thebes_answer="x_thebes_answer",
+        unique_id="unique_id",
+        politically_exposed=PoliticallyExposedCondition(**request_ok),
+    )
+    same_payload_request = PoliticallyExposedRequest(
+        x_thebes_answer="other_x_thebes_answer",
+        unique_id="unique_id",
+        politically_exposed=PoliticallyExposedCondition(**request_ok),
+    )
+    other_payload_request = PoliticallyExposedRequest(
+        x_thebes_answer="x_thebes_answer",
+        unique_id="unique_id",
+        politically_exposed=PoliticallyExposedCondition(is_politically_exposed=False),
+    )
+    assert (
+        politically_exposed_request.get_payload_hash()
+        == same_payload_request.get_payload_hash()
+    )
+    assert (
+        politically_exposed_request.get_payload_hash()
+        != other_payload_request.get_payload_hash()
+    )
@@ -0,0 +1,175 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from etria_logger import Gladsheim
+
+from src.domain.exceptions.model import SigningKeyNotFoundError, UnauthorizedError
+from src.domain.models.signing_keys.model import SigningKeySet
+from tests.stand_ins.key_server import KeyServerStandIn
+
+
+class KeyServerTransportDummy:
+    def __init__(self, key_server: KeyServerStandIn):
+        self.key_server = key_server
+        self.requests = 0
+        self.fail = False
+
+    async def get_signing_keys(self):
+        self.requests += 1
+        if self.fail:
+            raise ConnectionError()
+        return self.key_server.get_signing_keys()
+
+
+def build_signing_key_set(transport, min_refresh_interval_in_seconds=0):
+    return SigningKeySet(
+        transport=transport,
+        algorithms=["RS256"],
+        refresh_interval_in_seconds=300,
+        min_refresh_interval_in_seconds=min_refresh_interval_in_seconds,
+    )
+
+
+@pytest.mark.asyncio
+async def test_decode_fetches_keys_once():
+    key_server = KeyServerStandIn(kid="signing-key-1")
+    transport = KeyServerTransportDummy(key_server)
+    signing_key_set = build_signing_key_set(transport)
+    token = key_server.sign(kid="signing-key-1")
+
+    await signing_key_set.decode(token=token)
+    payload = await signing_key_set.decode(token=token)
+
+    assert payload["user"]["unique_id"] == "unique_id"
+    assert transport.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_decode_refreshes_when_key_id_is_unknown():
+    key_server = KeyServerStandIn(kid="signing-key-1")
+    transport = KeyServerTransportDummy(key_server)
+    signing_key_set = build_signing_key_set(transport)
+    await signing_key_set.refresh()
+    key_server.add_key(kid="signing-key-2")
+    token = key_server.sign(kid="signing-key-2")
+
+    payload = await signing_key_set.decode(token=token)
+
+    assert payload["user"]["unique_id"] == "unique_id"
+    assert transport.requests == 2
+
+
+@pytest.mark.asyncio
+async def test_decode_does_not_refresh_before_min_interval():
+    key_server = KeyServerStandIn(kid="signing-key-1")
+    transport = KeyServerTransportDummy(key_server)
+    signing_key_set = build_signing_key_set(
+        transport, min_refresh_interval_in_seconds=60
+    )
+    await signing_key_set.refresh()
+    key_server.add_key(kid="signing-key-2")
+    token = key_server.sign(kid="signing-key-2")
+
+    with pytest.raises(SigningKeyNotFoundError):
+        await signing_key_set.decode(token=token)
+    assert transport.requests == 1
+
+
+@pytest.mark.asyncio
+async def test_decode_when_key_server_is_unavailable():
+    key_server = KeyServerStandIn(kid="signing-key-1")
+    transport = KeyServerTransportDummy(key_server)
+    transport.fail = True
+    signing_key_set = build_signing_key_set(transport)
+    token = key_server.sign(kid="signing-key-1")
+
+    with pytest.raises(SigningKeyNotFoundError):
+        await signing_key_set.decode(token=token)
+
+
+@pytest.mark.asyncio
+async def test_decode_when_token_is_expired():
+    key_server = KeyServerStandIn(kid="signing-key-1")
+    signing_key_set = build_signing_key_set(KeyServerTransportDummy(key_server))
+    token = key_server.sign(kid="signing-key-1", expires_in=-60)
+
+    with pytest.raises(UnauthorizedError):
+        await signing_key_set.decode(token=token)
+
+
+@pytest.mark.asyncio
+async def test_decode_when_signature_is_invalid():
+    key_server = KeyServerStandIn(kid="signing-key-1")
+    signing_key_set = build_signing_key_set(KeyServerTransportDummy(key_server))
+    forger = KeyServerStandIn(kid="signing-key-1")
+    token = forger.sign(kid="signing-key-1")
+
+    with pytest.raises(UnauthorizedError):
+        await signing_key_set.decode(token=token)
+
+
+@pytest.mark.asyncio
+async def test_decode_when_token_is_malformed():
+    key_server = KeyServerStandIn(kid="signing-key-1")
+    transport = KeyServerTransportDummy(key_server)
+    signing_key_set = build_signing_key_set(transport)
+
+    with pytest.raises(UnauthorizedError):
+        await signing_key_set.decode(token="not a jwt")
+    assert transport.requests == 0
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "error")
+async def test_refresh_ignores_invalid_keys(etria_error_mock):
+    class InvalidKeyTransportDummy:
+        @staticmethod
+        async def get_signing_keys():
+            return {"keys": [{"kid": "signing-key-1", "kty": "unknown"}]}
+
+    signing_key_set = build_signing_key_set(InvalidKeyTransportDummy)
+    await signing_key_set.refresh()
+    assert signing_key_set.get_stats()["keys"] == 0
+    assert etria_error_mock.called
+
+
+@pytest.mark.asyncio
+async def test_start_background_refresh():
+    key_server = KeyServerStandIn(kid="signing-key-1")
+    transport = KeyServerTransportDummy(key_server)
+    signing_key_set = SigningKeySet(
+        transport=transport,
+        algorithms=["RS256"],
+        refresh_interval_in_seconds=0.01,
+        min_refresh_interval_in_seconds=0,
+    )
+    signing_key_set.start_background_refresh()
+    try:
+        await asyncio.sleep(0.05)
+    finally:
+        signing_key_set.stop_background_refresh()
+    assert transport.requests >= 1
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "warning")
+async def test_background_refresh_failure_is_logged_and_counted(
+    etria_warning_mock,
+):
+    key_server = KeyServerStandIn(kid="signing-key-1")
+    transport = KeyServerTransportDummy(key_server)
+    transport.fail = True
+    signing_key_set = SigningKeySet(
+        transport=transport,
+        algorithms=["RS256"],
+        refresh_interval_in_seconds=0.01,
+        min_refresh_interval_in_seconds=0,
+    )
+    signing_key_set.start_background_refresh()
+    try:
+        await asyncio.sleep(0.05)
+    finally:
+        signing_key_set.stop_background_refresh()
+    assert signing_key_set.get_stats()["refresh_failures"] >= 1
+    assert etria_warning_mock.called
@@ -0,0 +1,41 @@
+from src.domain.models.tracing.model import Span, SpanContext
+
+traceparent_dummy = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+def test_from_traceparent():
+    span_context = SpanContext.from_traceparent(traceparent_dummy)
+    assert span_context.trace_id == "0af7651916cd43dd8448eb211c80319c"
+    assert span_context.span_id == "b7ad6b7169203331"
+    assert span_context.sampled is True
+    assert span_context.to_traceparent() == traceparent_dummy
+
+
+def test_from_traceparent_when_not_sampled():
+    span_context = SpanContext.from_traceparent(traceparent_dummy[:-2] + "00")
+    assert span_context.sampled is False
+
+
+def test_from_traceparent_when_header_is_invalid():
+    assert SpanContext.from_traceparent(None) is None
+    assert SpanContext.from_traceparent("invalid") is None
+    assert SpanContext.from_traceparent(f"00-{'0' * 32}-b7ad6b7169203331-01") is None
+
+
+def test_create_child():
+    parent_context = SpanContext.generate()
+    child_context = parent_context.create_child()
+    assert child_context.trace_id == parent_context.trace_id
+    assert child_context.span_id != parent_context.span_id
+    assert len(child_context.span_id) == 16
+
+
+def test_finish():
+    span = Span(name="stage", context=SpanContext.generate(), parent_span_id="parent")
+    span.set_attribute("attempt", 1)
+    span.finish(outcome="success")
+    span_dict = span.to_dict()
+    assert span_dict["outcome"] == "success"
+    assert span_dict["parent_span_id"] == "parent"
+    assert span_dict["attributes"] == {"attempt": 1}
+    assert span_dict["duration_in_seconds"] >= 0
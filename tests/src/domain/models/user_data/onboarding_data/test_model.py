@@ -0,0 +1,80 @@
+from src.domain.models.user_data.onboarding_data.model import UserOnboardingData
+
+user_document_dummy = {
+    "suitability": {"score": 1},
+    "onboarding_step": {"br": "finished", "us": "politically_exposed"},
+    "external_exchange_requirements": {
+        "us": {
+            "is_politically_exposed": True,
+            "politically_exposed_names": ["Giogio"],
+            "politically_exposed_published_version": "version",
+        }
+    },
+}
+
+
+def test_get_projection():
+    result = UserOnboardingData.get_projection(
+        step_br_field="onboarding_step.br", step_us_field="onboarding_step.us"
+    )
+    assert result == {
+        "_id": False,
+        "suitability": True,
+        "onboarding_step.br": True,
+        "onboarding_step.us": True,
+        "external_exchange_requirements.us.is_politically_exposed": True,
+        "external_exchange_requirements.us.politically_exposed_names": True,
+        "external_exchange_requirements.us.politically_exposed_published_version": True,
+    }
+
+
+def test_from_document():
+    result = UserOnboardingData.from_document(
+        unique_id="unique_id",
+        document=user_document_dummy,
+        step_br_field="onboarding_step.br",
+        step_us_field="onboarding_step.us",
+    )
+    assert result.unique_id == "unique_id"
+    assert result.has_suitability is True
+    assert result.is_politically_exposed is True
+    assert result.politically_exposed_names == ["Giogio"]
+    assert result.published_version == "version"
+    assert result.get_onboarding_step().is_in_correct_step() is True
+
+
+def test_from_document_when_fields_are_missing():
+    result = UserOnboardingData.from_document(
+        unique_id="unique_id",
+        document={"onboarding_step": "invalid"},
+        step_br_field="onboarding_step.br",
+        step_us_field="onboarding_step.us",
+    )
+    assert result.has_suitability is False
+    assert result.is_politically_exposed is None
+    assert result.politically_exposed_names is None
+    assert result.published_version is None
+    assert result.get_onboarding_step() is None
+
+
+def test_get_politically_exposed_data():
+    user_onboarding_data = UserOnboardingData.from_document(
+        unique_id="unique_id",
+        document=user_document_dummy,
+        step_br_field="onboarding_step.br",
+        step_us_field="onboarding_step.us",
+    )
+    result = user_onboarding_data.get_politically_exposed_data()
+    assert result.unique_id == "unique_id"
+    assert result.is_politically_exposed is True
+    assert result.politically_exposed_names == ["Giogio"]
+
+
+def test_get_politically_exposed_data_when_it_was_never_stored():
+    user_onboarding_data = UserOnboardingData.from_document(
+        unique_id="unique_id",
+        document={},
+        step_br_field="onboarding_step.br",
+        step_us_field="onboarding_step.us",
+    )
+    assert user_onboarding_data.get_politically_exposed_data() is None
@@ -0,0 +1,74 @@
+from src.domain.models.user_data.politically_exposed.model import PoliticallyExposedData
+
+
+def build_politically_exposed_data(is_politically_exposed, politically_exposed_names):
+    return PoliticallyExposedData(
+        unique_id="unique_id",
+        is_politically_exposed=is_politically_exposed,
+        politically_exposed_names=politically_exposed_names,
+    )
+
+
+def test_get_data_representation():
+    result = build_politically_exposed_data(True, ["Giogio"]).get_data_representation()
+    assert result == {
+        "external_exchange_requirements.us.is_politically_exposed": True,
+        "external_exchange_requirements.us.politically_exposed_names": ["Giogio"],
+    }
+
+
+def test_get_normalized_names():
+    politically_exposed_data = build_politically_exposed_data(
+        True, ["Zeca", " Giogio", "Giogio ", "Zeca"]
+    )
+    assert politically_exposed_data.get_normalized_names() == ("Giogio", "Zeca")
+
+
+def test_get_normalized_names_without_names():
+    politically_exposed_data = build_politically_exposed_data(False, None)
+    assert politically_exposed_data.get_normalized_names() == ()
+
+
+def test_has_same_content_ignores_name_order_and_duplicates():
+    incoming = build_politically_exposed_data(True, ["Zeca", "Giogio", "Zeca"])
+    stored = build_politically_exposed_data(True, ["Giogio", "Zeca"])
+    assert incoming.has_same_content(stored) is True
+
+
+def test_has_same_content_treats_missing_and_empty_names_alike():
+    incoming = build_politically_exposed_data(False, [])
+    stored = build_politically_exposed_data(False, None)
+    assert incoming.has_same_content(stored) is True
+
+
+def test_has_same_content_when_names_changed():
+    incoming = build_politically_exposed_data(True, ["Giogio", "Zeca"])
+    stored = build_politically_exposed_data(True, ["Giogio"])
+    assert incoming.has_same_content(stored) is False
+
+
+def test_has_same_content_when_condition_changed():
+    incoming = build_politically_exposed_data(False, None)
+    stored = build_politically_exposed_data(True, None)
+    assert incoming.has_same_content(stored) is False
+
+
+def test_get_content_version_ignores_name_order_and_duplicates():
+    incoming = build_politically_exposed_data(True, ["Zeca", "Giogio", "Zeca"])
+    stored = build_politically_exposed_data(True, ["Giogio", "Zeca"])
+    assert incoming.get_content_version() == stored.get_content_version()
+
+
+def test_get_content_version_when_content_changed():
+    incoming = build_politically_exposed_data(False, None)
+    stored = build_politically_exposed_data(True, None)
+    assert incoming.get_content_version() != stored.get_content_version()
+
+
+def test_get_published_representation():
+    politically_exposed_data = build_politically_exposed_data(True, ["Giogio"])
+    assert politically_exposed_data.get_published_representation() == {
+        "external_exchange_requirements.us.politically_exposed_published_version": (
+            politically_exposed_data.get_content_version()
+        )
+    }
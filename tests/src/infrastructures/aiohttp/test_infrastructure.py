@@ -1,22 +1,148 @@
 # OUTSIDE LIBRARIES
+import asyncio
+
+from src.domain.enums.http_endpoint import HttpEndpoint
+from src.domain.exceptions.model import DeadlineExceededError
+from src.infrastructures.deadline.infrastructure import StageRunner
 from src.infrastructures.iohttp.infrastructure import RequestInfrastructure
-from unittest.mock import MagicMock
+from src.infrastructures.loop_registry.infrastructure import LoopResourceRegistry
+from src.transport.user_step.transport import StepChecker
+from tests.stand_ins.key_server import KeyServerStandIn
+from unittest.mock import AsyncMock, MagicMock, patch
 import aiohttp
+from decouple import Config
+from pytest import fixture, mark, raises
 
 
 dummy_env = "dummy env"
 
 
+def http_client_env(key, default=None, cast=None):
+    env = {
+        "HTTP_CLIENT_CONNECT_TIMEOUT_IN_SECONDS": 1,
+        "HTTP_CLIENT_ONBOARDING_STEP_BR_READ_TIMEOUT_IN_SECONDS": 0.5,
+    }
+    return env.get(key, default)
+
+
+@patch.object(LoopResourceRegistry, "resources", {})
 def test_get_session(monkeypatch):
     dummy_connection = "dummy connection"
+    dummy_connector = "dummy connector"
     mock_connection = MagicMock(return_value=dummy_connection)
+    mock_connector = MagicMock(return_value=dummy_connector)
     monkeypatch.setattr(aiohttp, "ClientSession", mock_connection)
+    monkeypatch.setattr(aiohttp, "TCPConnector", mock_connector)
 
     new_connection_created = RequestInfrastructure.get_session()
     assert new_connection_created == dummy_connection
-    mock_connection.assert_called_once_with()
+    mock_connection.assert_called_once()
+    assert mock_connection.call_args.kwargs["connector"] == dummy_connector
+    assert mock_connector.call_args.kwargs["use_dns_cache"] is True
 
-    reused_client = RequestInfrastructure.get_session()
+    reused_client = StepChecker.get_session()
     assert reused_client == new_connection_created
-    mock_connection.assert_called_once_with()
-    RequestInfrastructure._RequestInfrastructure__session = None
+    mock_connection.assert_called_once()
+
+
+@patch.object(Config, "__call__", side_effect=http_client_env)
+def test_get_timeout(mocked_env):
+    timeout = RequestInfrastructure.get_timeout()
+    endpoint_timeout = RequestInfrastructure.get_timeout(
+        endpoint=HttpEndpoint.ONBOARDING_STEP_BR
+    )
+
+    assert (timeout.total, timeout.connect, timeout.sock_read) == (30, 1, 10)
+    assert endpoint_timeout.connect == 1
+    assert endpoint_timeout.sock_read == 0.5
+
+
+@patch.object(Config, "__call__", side_effect=http_client_env)
+def test_get_request_options_caps_timeout_at_remaining_deadline(mocked_env):
+    with patch.object(StageRunner, "get_remaining", return_value=2.5):
+        request_options = RequestInfrastructure.get_request_options(
+            HttpEndpoint.ONBOARDING_STEP_BR
+        )
+    timeout = request_options["timeout"]
+    assert (timeout.total, timeout.connect, timeout.sock_read) == (2.5, 1, 0.5)
+
+
+@patch.object(Config, "__call__", side_effect=http_client_env)
+def test_get_request_options_when_deadline_is_used_up(mocked_env):
+    with patch.object(StageRunner, "get_remaining", return_value=0):
+        with raises(DeadlineExceededError):
+            RequestInfrastructure.get_request_options(HttpEndpoint.ONBOARDING_STEP_BR)
+
+
+@fixture
+def http_client():
+    with patch.object(RequestInfrastructure, "metrics", {}), patch.object(
+        LoopResourceRegistry, "resources", {}
+    ):
+        yield
+
+
+@mark.asyncio
+@patch.object(Config, "__call__", side_effect=http_client_env)
+async def test_get_session_records_request_metrics(mocked_env, http_client):
+    key_server = KeyServerStandIn()
+    signing_keys_url = await key_server.start()
+    try:
+        session = RequestInfrastructure.get_session()
+        for _ in range(2):
+            async with session.get(
+                signing_keys_url,
+                **RequestInfrastructure.get_request_options(HttpEndpoint.SIGNING_KEYS),
+            ) as response:
+                await response.json()
+        await session.close()
+    finally:
+        await key_server.stop()
+
+    stats = RequestInfrastructure.get_http_client_stats()["signing_keys"]
+    assert stats["requests"] == 2
+    assert stats["failures"] == 0
+    assert stats["connections_created"] == 1
+    assert stats["connections_reused"] == 1
+    assert stats["max_latency_in_seconds"] > 0
+
+
+@mark.asyncio
+@patch.object(Config, "__call__", side_effect=http_client_env)
+async def test_get_request_options_applies_endpoint_read_timeout(
+    mocked_env, http_client
+):
+    key_server = KeyServerStandIn(latency_in_seconds=1)
+    signing_keys_url = await key_server.start()
+    try:
+        session = RequestInfrastructure.get_session()
+        with raises(asyncio.TimeoutError):
+            async with session.get(
+                signing_keys_url,
+                **RequestInfrastructure.get_request_options(
+                    HttpEndpoint.ONBOARDING_STEP_BR
+                ),
+            ) as response:
+                await response.json()
+        await session.close()
+    finally:
+        await key_server.stop()
+
+    stats = RequestInfrastructure.get_http_client_stats()["onboarding_step_br"]
+    assert stats["failures"] == 1
+
+
+@mark.asyncio
+async def test_pre_connect(monkeypatch):
+    response_mock = MagicMock(status=401)
+    session_mock = MagicMock()
+    session_mock.head.return_value.__aenter__ = AsyncMock(return_value=response_mock)
+    session_mock.head.return_value.__aexit__ = AsyncMock(return_value=None)
+    monkeypatch.setattr(
+        RequestInfrastructure, "get_session", MagicMock(return_value=session_mock)
+    )
+
+    result = await RequestInfrastructure.pre_connect(url="http://steps")
+
+    assert result == 401
+    session_mock.head.assert_called_once_with("http://steps", allow_redirects=False)
@@ -0,0 +1,74 @@
+from unittest.mock import patch
+
+from src.infrastructures.cache import infrastructure
+from src.infrastructures.cache.infrastructure import TtlLruCache
+
+
+def test_get_when_key_is_missing():
+    cache = TtlLruCache(max_size=2, ttl_in_seconds=10)
+    result = cache.get("key")
+    assert result is None
+    assert cache.misses == 1
+    assert cache.hits == 0
+
+
+def test_get_when_key_is_cached():
+    cache = TtlLruCache(max_size=2, ttl_in_seconds=10)
+    cache.set("key", "value")
+    result = cache.get("key")
+    assert result == "value"
+    assert cache.hits == 1
+
+
+@patch.object(infrastructure, "monotonic")
+def test_get_when_entry_is_expired(monotonic_mock):
+    monotonic_mock.return_value = 100
+    cache = TtlLruCache(max_size=2, ttl_in_seconds=10)
+    cache.set("key", "value", ttl_in_seconds=5)
+    monotonic_mock.return_value = 105
+    result = cache.get("key")
+    assert result is None
+    assert len(cache) == 0
+    assert cache.misses == 1
+
+
+def test_set_when_ttl_is_not_positive():
+    cache = TtlLruCache(max_size=2, ttl_in_seconds=10)
+    cache.set("key", "value", ttl_in_seconds=0)
+    assert len(cache) == 0
+
+
+def test_set_evicts_least_recently_used_entry():
+    cache = TtlLruCache(max_size=2, ttl_in_seconds=10)
+    cache.set("first", 1)
+    cache.set("second", 2)
+    cache.get("first")
+    cache.set("third", 3)
+    assert cache.get("second") is None
+    assert cache.get("first") == 1
+    assert cache.get("third") == 3
+    assert cache.evictions == 1
+
+
+def test_invalidate():
+    cache = TtlLruCache(max_size=2, ttl_in_seconds=10)
+    cache.set("key", "value")
+    cache.invalidate("key")
+    cache.invalidate("unknown_key")
+    assert cache.get("key") is None
+
+
+def test_get_stats():
+    cache = TtlLruCache(max_size=2, ttl_in_seconds=10)
+    cache.set("key", "value")
+    cache.get("key")
+    cache.get("unknown_key")
+    stats = cache.get_stats()
+    assert stats == {
+        "size": 1,
+        "max_size": 2,
+        "hits": 1,
+        "misses": 1,
+        "evictions": 0,
+        "hit_ratio": 0.5,
+    }
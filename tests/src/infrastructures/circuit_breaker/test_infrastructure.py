@@ -0,0 +1,250 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from decouple import Config
+from etria_logger import Gladsheim
+
+from src.domain.enums.circuit_breaker import CircuitBreakerDependency, CircuitState
+from src.domain.exceptions.model import CircuitOpenError, InternalServerError
+from src.infrastructures.circuit_breaker import infrastructure
+from src.infrastructures.circuit_breaker.infrastructure import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+)
+
+
+def build_circuit_breaker(**overrides) -> CircuitBreaker:
+    settings = {
+        "name": "dependency",
+        "window_in_seconds": 10,
+        "minimum_calls": 4,
+        "failure_rate_threshold": 0.5,
+        "slow_call_threshold_in_seconds": 1,
+        "slow_call_rate_threshold": 0.8,
+        "open_duration_in_seconds": 5,
+        "half_open_max_calls": 2,
+    }
+    settings.update(overrides)
+    return CircuitBreaker(**settings)
+
+
+async def succeed():
+    return "result"
+
+
+async def fail():
+    raise InternalServerError()
+
+
+async def call_many(circuit_breaker: CircuitBreaker, operations: list):
+    for operation in operations:
+        try:
+            await circuit_breaker.call(operation)
+        except InternalServerError:
+            pass
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "warning")
+@patch.object(infrastructure, "monotonic", return_value=100)
+async def test_call_opens_when_failure_rate_reaches_threshold(
+    monotonic_mock, warning_mock
+):
+    circuit_breaker = build_circuit_breaker()
+    await call_many(circuit_breaker, [succeed, fail, succeed, fail])
+    assert circuit_breaker.state == CircuitState.OPEN
+    with pytest.raises(CircuitOpenError):
+        await circuit_breaker.call(succeed)
+    assert circuit_breaker.get_stats()["rejected"] == 1
+    assert warning_mock.called
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "warning")
+@patch.object(infrastructure, "monotonic", return_value=100)
+async def test_call_stays_closed_below_minimum_calls(monotonic_mock, warning_mock):
+    circuit_breaker = build_circuit_breaker()
+    await call_many(circuit_breaker, [fail, fail, fail])
+    assert circuit_breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "warning")
+@patch.object(infrastructure, "monotonic")
+async def test_call_forgets_failures_outside_the_window(monotonic_mock, warning_mock):
+    monotonic_mock.return_value = 100
+    circuit_breaker = build_circuit_breaker()
+    await call_many(circuit_breaker, [fail, fail, fail])
+    monotonic_mock.return_value = 111
+    await call_many(circuit_breaker, [fail, succeed, succeed])
+    assert circuit_breaker.state == CircuitState.CLOSED
+    assert circuit_breaker.get_stats()["calls"] == 3
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "warning")
+@patch.object(infrastructure, "monotonic")
+async def test_call_opens_when_slow_call_rate_reaches_threshold(
+    monotonic_mock, warning_mock
+):
+    clock = iter([100, 102] * 4)
+    monotonic_mock.side_effect = lambda: next(clock)
+    circuit_breaker = build_circuit_breaker()
+    await call_many(circuit_breaker, [succeed] * 4)
+    assert circuit_breaker.state == CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "warning")
+@patch.object(infrastructure, "monotonic")
+async def test_call_closes_after_successful_half_open_probes(
+    monotonic_mock, warning_mock
+):
+    monotonic_mock.return_value = 100
+    circuit_breaker = build_circuit_breaker()
+    await call_many(circuit_breaker, [fail] * 4)
+    monotonic_mock.return_value = 105
+    assert await circuit_breaker.call(succeed) == "result"
+    assert circuit_breaker.state == CircuitState.HALF_OPEN
+    await circuit_breaker.call(succeed)
+    assert circuit_breaker.state == CircuitState.CLOSED
+    assert circuit_breaker.get_stats()["calls"] == 0
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "warning")
+@patch.object(infrastructure, "monotonic")
+async def test_call_reopens_when_half_open_probe_fails(monotonic_mock, warning_mock):
+    monotonic_mock.return_value = 100
+    circuit_breaker = build_circuit_breaker()
+    await call_many(circuit_breaker, [fail] * 4)
+    monotonic_mock.return_value = 105
+    await call_many(circuit_breaker, [fail])
+    assert circuit_breaker.state == CircuitState.OPEN
+    assert circuit_breaker.get_stats()["opened"] == 2
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "warning")
+@patch.object(infrastructure, "monotonic")
+async def test_call_limits_concurrent_half_open_probes(monotonic_mock, warning_mock):
+    monotonic_mock.return_value = 100
+    circuit_breaker = build_circuit_breaker(half_open_max_calls=1)
+    await call_many(circuit_breaker, [fail] * 4)
+    monotonic_mock.return_value = 105
+    release = asyncio.Event()
+
+    async def wait_for_release():
+        await release.wait()
+
+    probe = asyncio.ensure_future(circuit_breaker.call(wait_for_release))
+    await asyncio.sleep(0)
+    with pytest.raises(CircuitOpenError):
+        await circuit_breaker.call(succeed)
+    release.set()
+    await probe
+    assert circuit_breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "warning")
+@patch.object(infrastructure, "monotonic")
+async def test_call_releases_probe_when_cancelled(monotonic_mock, warning_mock):
+    monotonic_mock.return_value = 100
+    circuit_breaker = build_circuit_breaker(half_open_max_calls=1)
+    await call_many(circuit_breaker, [fail] * 4)
+    monotonic_mock.return_value = 105
+    probe = asyncio.ensure_future(circuit_breaker.call(asyncio.Event().wait))
+    await asyncio.sleep(0)
+    probe.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+    assert await circuit_breaker.call(succeed) == "result"
+    assert circuit_breaker.state == CircuitState.CLOSED
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "warning")
+@patch.object(infrastructure, "monotonic")
+async def test_call_records_slow_cancellation_as_failure(monotonic_mock, warning_mock):
+    monotonic_mock.return_value = 100
+    circuit_breaker = build_circuit_breaker(minimum_calls=1)
+    call = asyncio.ensure_future(circuit_breaker.call(asyncio.Event().wait))
+    await asyncio.sleep(0)
+    monotonic_mock.return_value = 102
+    call.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+    assert circuit_breaker.get_stats()["failures"] == 1
+    assert circuit_breaker.state == CircuitState.OPEN
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "warning")
+@patch.object(infrastructure, "monotonic", return_value=100)
+async def test_call_ignores_fast_cancellation(monotonic_mock, warning_mock):
+    circuit_breaker = build_circuit_breaker(minimum_calls=1)
+    call = asyncio.ensure_future(circuit_breaker.call(asyncio.Event().wait))
+    await asyncio.sleep(0)
+    call.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await call
+    assert circuit_breaker.get_stats()["calls"] == 0
+
+
+def circuit_breaker_env(key, default=None, cast=None):
+    env = {
+        "CIRCUIT_BREAKER_ENABLED": True,
+        "CIRCUIT_BREAKER_MINIMUM_CALLS": 1,
+        "CIRCUIT_BREAKER_MONGO_DB_MINIMUM_CALLS": 2,
+    }
+    return env.get(key, default)
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "warning")
+@patch.object(Config, "__call__", side_effect=circuit_breaker_env)
+async def test_protect_fails_fast_when_circuit_is_open(mocked_env, warning_mock):
+    calls = []
+
+    @CircuitBreakerRegistry.protect(CircuitBreakerDependency.PERSEPHONE)
+    async def send():
+        calls.append(True)
+        raise InternalServerError()
+
+    with patch.object(CircuitBreakerRegistry, "breakers", {}):
+        with pytest.raises(InternalServerError):
+            await send()
+        with pytest.raises(CircuitOpenError):
+            await send()
+        stats = CircuitBreakerRegistry.get_stats()
+    assert len(calls) == 1
+    assert stats["persephone"]["state"] == "open"
+    assert stats["persephone"]["state_code"] == CircuitState.OPEN.value
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__")
+async def test_protect_when_disabled(mocked_env):
+    @CircuitBreakerRegistry.protect(CircuitBreakerDependency.PERSEPHONE)
+    async def send():
+        return "result"
+
+    with patch.object(CircuitBreakerRegistry, "breakers", {}):
+        assert await send() == "result"
+        assert CircuitBreakerRegistry.get_stats() == {}
+
+
+@patch.object(Config, "__call__", side_effect=circuit_breaker_env)
+def test_get_breaker_uses_dependency_settings(mocked_env):
+    with patch.object(CircuitBreakerRegistry, "breakers", {}):
+        mongo_breaker = CircuitBreakerRegistry.get_breaker(
+            CircuitBreakerDependency.MONGO_DB
+        )
+        persephone_breaker = CircuitBreakerRegistry.get_breaker(
+            CircuitBreakerDependency.PERSEPHONE
+        )
+    assert mongo_breaker.minimum_calls == 2
+    assert persephone_breaker.minimum_calls == 1
+    assert persephone_breaker.open_duration_in_seconds == 5
@@ -0,0 +1,127 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from decouple import Config
+from etria_logger import Gladsheim
+
+from src.domain.exceptions.model import DeadlineExceededError
+from src.domain.models.deadline.model import Deadline
+from src.infrastructures.deadline.infrastructure import StageRunner, current_deadline
+
+
+def start_deadline(budget_in_seconds: float) -> Deadline:
+    deadline = Deadline(budget_in_seconds=budget_in_seconds)
+    current_deadline.set(deadline)
+    return deadline
+
+
+async def succeed():
+    return "result"
+
+
+@pytest.mark.asyncio
+async def test_run_without_deadline():
+    result = await StageRunner.run(stage="stage", operation=succeed)
+    assert result == "result"
+    assert StageRunner.get_remaining() is None
+
+
+@pytest.mark.asyncio
+async def test_run_records_last_stage():
+    request_deadline = start_deadline(budget_in_seconds=5)
+    result = await StageRunner.run(stage="stage", operation=succeed)
+    assert result == "result"
+    assert request_deadline.last_stage == "stage"
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "warning")
+async def test_run_when_deadline_expired_before_stage(warning_mock):
+    request_deadline = start_deadline(budget_in_seconds=0)
+    request_deadline.last_stage = "previous_stage"
+    calls = []
+
+    async def operation():
+        calls.append(True)
+
+    with pytest.raises(DeadlineExceededError):
+        await StageRunner.run(stage="stage", operation=operation)
+    assert not calls
+    assert warning_mock.call_args.kwargs["stage"] == "stage"
+    assert warning_mock.call_args.kwargs["previous_stage"] == "previous_stage"
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "warning")
+async def test_run_when_stage_uses_up_the_deadline(warning_mock):
+    start_deadline(budget_in_seconds=0.01)
+    cancelled = []
+
+    async def operation():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+
+    with pytest.raises(DeadlineExceededError):
+        await StageRunner.run(stage="slow_stage", operation=operation)
+    assert cancelled
+    assert warning_mock.call_args.kwargs["stage"] == "slow_stage"
+
+
+@pytest.mark.asyncio
+async def test_run_when_stage_times_out_on_its_own():
+    start_deadline(budget_in_seconds=5)
+
+    async def operation():
+        raise asyncio.TimeoutError()
+
+    with pytest.raises(asyncio.TimeoutError):
+        await StageRunner.run(stage="stage", operation=operation)
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "warning")
+async def test_stage(warning_mock):
+    @StageRunner.stage("decorated_stage")
+    async def operation(value):
+        return value
+
+    assert await operation("result") == "result"
+    start_deadline(budget_in_seconds=0)
+    with pytest.raises(DeadlineExceededError):
+        await operation("result")
+
+
+def deadline_env(key, default=None, cast=None):
+    env = {"REQUEST_DEADLINE_ENABLED": True, "REQUEST_DEADLINE_IN_SECONDS": 10}
+    return env.get(key, default)
+
+
+@pytest.mark.asyncio
+async def test_create_detached_task_runs_without_the_request_deadline():
+    request_deadline = start_deadline(budget_in_seconds=5)
+
+    async def get_deadline():
+        return StageRunner.get_deadline()
+
+    assert await StageRunner.create_detached_task(get_deadline()) is None
+    assert StageRunner.get_deadline() is request_deadline
+
+
+@patch.object(Config, "__call__", side_effect=deadline_env)
+def test_start_request_deadline(mocked_env):
+    token = StageRunner.start_request_deadline()
+    request_deadline = StageRunner.get_deadline()
+    StageRunner.reset(token)
+    assert request_deadline.budget_in_seconds == 10
+    assert StageRunner.get_deadline() is None
+
+
+@patch.object(Config, "__call__")
+def test_start_request_deadline_when_disabled(mocked_env):
+    token = StageRunner.start_request_deadline()
+    assert token is None
+    assert StageRunner.get_deadline() is None
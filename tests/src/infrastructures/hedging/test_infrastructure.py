@@ -0,0 +1,119 @@
+import asyncio
+
+import pytest
+
+from src.infrastructures.hedging.infrastructure import RequestHedger
+
+
+def build_hedger(**overrides) -> RequestHedger:
+    settings = {
+        "percentile": 50,
+        "min_delay_in_seconds": 0.001,
+        "max_delay_in_seconds": 0.02,
+        "budget_ratio": 0.5,
+        "budget_burst": 1,
+        "min_samples": 4,
+    }
+    settings.update(overrides)
+    return RequestHedger(**settings)
+
+
+class OperationStandIn:
+    def __init__(self, latencies_in_seconds: list, errors: list = None):
+        self.latencies_in_seconds = latencies_in_seconds
+        self.errors = errors or [None] * len(latencies_in_seconds)
+        self.calls = 0
+        self.cancelled = 0
+
+    async def __call__(self):
+        attempt = self.calls
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.latencies_in_seconds[attempt])
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.errors[attempt] is not None:
+            raise self.errors[attempt]
+        return f"attempt_{attempt}"
+
+
+@pytest.mark.asyncio
+async def test_run_when_primary_answers_before_hedge_delay():
+    hedger = build_hedger()
+    operation = OperationStandIn([0])
+    result = await hedger.run(operation)
+    assert result == "attempt_0"
+    assert operation.calls == 1
+    assert hedger.get_stats()["hedges"] == 0
+
+
+@pytest.mark.asyncio
+async def test_run_sends_hedge_when_primary_is_slow():
+    hedger = build_hedger()
+    operation = OperationStandIn([1, 0])
+    result = await hedger.run(operation)
+    await asyncio.sleep(0)
+    assert result == "attempt_1"
+    assert operation.calls == 2
+    assert operation.cancelled == 1
+    assert hedger.get_stats()["hedge_wins"] == 1
+
+
+@pytest.mark.asyncio
+async def test_run_when_budget_is_exhausted():
+    hedger = build_hedger(budget_burst=1, budget_ratio=0)
+    await hedger.run(OperationStandIn([1, 0]))
+    operation = OperationStandIn([0.03, 0])
+    result = await hedger.run(operation)
+    assert result == "attempt_0"
+    assert operation.calls == 1
+    assert hedger.get_stats()["budget_exhausted"] == 1
+
+
+@pytest.mark.asyncio
+async def test_run_when_primary_fails_before_hedge_delay():
+    hedger = build_hedger()
+    operation = OperationStandIn([0], errors=[ValueError()])
+    with pytest.raises(ValueError):
+        await hedger.run(operation)
+    assert operation.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_run_waits_for_hedge_when_primary_fails_after_hedging():
+    hedger = build_hedger()
+    operation = OperationStandIn([0.03, 0.05], errors=[ValueError(), None])
+    result = await hedger.run(operation)
+    assert result == "attempt_1"
+
+
+@pytest.mark.asyncio
+async def test_run_when_all_attempts_fail():
+    hedger = build_hedger()
+    operation = OperationStandIn([0.03, 0], errors=[ValueError(), KeyError()])
+    with pytest.raises((ValueError, KeyError)):
+        await hedger.run(operation)
+    assert operation.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_run_cancels_attempts_when_cancelled():
+    hedger = build_hedger()
+    operation = OperationStandIn([1, 1])
+    run = asyncio.ensure_future(hedger.run(operation))
+    await asyncio.sleep(0.03)
+    run.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await run
+    await asyncio.sleep(0)
+    assert operation.cancelled == 2
+
+
+@pytest.mark.asyncio
+async def test_get_hedge_delay_follows_latency_percentile():
+    hedger = build_hedger(min_samples=4, max_delay_in_seconds=1)
+    assert hedger.get_hedge_delay() == 1
+    for latency_in_seconds in [0.002, 0.004, 0.006, 0.05]:
+        await hedger.run(OperationStandIn([latency_in_seconds]))
+    assert 0.006 <= hedger.get_hedge_delay() < 0.05
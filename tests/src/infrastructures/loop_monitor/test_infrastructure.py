@@ -0,0 +1,112 @@
+import asyncio
+import time
+from unittest.mock import patch
+
+import pytest
+from decouple import Config
+from etria_logger import Gladsheim
+
+from src.infrastructures.loop_monitor.infrastructure import (
+    BlockingCallDetector,
+    EventLoopMonitor,
+    LoopLagMonitor,
+)
+
+
+def block_the_loop(seconds: float):
+    time.sleep(seconds)
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "warning")
+async def test_monitor_records_lag_and_blocking_stack(warning_mock):
+    monitor = LoopLagMonitor(interval_in_seconds=0.01, spike_threshold_in_seconds=0.05)
+    monitor.start()
+    await asyncio.sleep(0.03)
+    block_the_loop(0.15)
+    await asyncio.sleep(0.03)
+    monitor.stop()
+    stats = monitor.get_stats()
+    assert stats["spikes"] >= 1
+    assert stats["stalls"] == 1
+    assert stats["max_lag_in_seconds"] >= 0.1
+    assert "block_the_loop" in monitor.last_blocking_stack
+    assert warning_mock.called
+
+
+@pytest.mark.asyncio
+async def test_monitor_when_loop_is_idle():
+    monitor = LoopLagMonitor(interval_in_seconds=0.01, spike_threshold_in_seconds=0.05)
+    monitor.start()
+    await asyncio.sleep(0.05)
+    monitor.stop()
+    stats = monitor.get_stats()
+    assert stats["samples"] >= 1
+    assert stats["spikes"] == 0
+    assert stats["stalls"] == 0
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "warning")
+async def test_monitor_watchdog_stops_with_its_loop(warning_mock):
+    monitor = LoopLagMonitor(interval_in_seconds=0.01, spike_threshold_in_seconds=0.01)
+
+    async def run_request():
+        monitor.start()
+        await asyncio.sleep(0.03)
+
+    await asyncio.get_running_loop().run_in_executor(None, asyncio.run, run_request())
+    watchdog = monitor._LoopLagMonitor__watchdog
+    watchdog.join(timeout=1)
+    await asyncio.sleep(0.05)
+
+    assert not watchdog.is_alive()
+    assert monitor.get_stats()["stalls"] == 0
+    assert not warning_mock.called
+
+
+@pytest.mark.asyncio
+async def test_monitor_watchdog_stops_when_heartbeat_task_is_cancelled():
+    monitor = LoopLagMonitor(interval_in_seconds=0.01, spike_threshold_in_seconds=0.05)
+    monitor.start()
+    await asyncio.sleep(0.02)
+    monitor._LoopLagMonitor__task.cancel()
+    await asyncio.sleep(0.02)
+    watchdog = monitor._LoopLagMonitor__watchdog
+    watchdog.join(timeout=1)
+
+    assert not watchdog.is_alive()
+
+
+def loop_monitor_env(key, default=None, cast=None):
+    return {"LOOP_MONITOR_ENABLED": True}.get(key, default)
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=loop_monitor_env)
+async def test_ensure_started(mocked_env):
+    with patch.object(EventLoopMonitor, "monitor", None):
+        EventLoopMonitor.ensure_started()
+        EventLoopMonitor.ensure_started()
+        monitor = EventLoopMonitor.get_monitor()
+        assert monitor.is_running_on(asyncio.get_running_loop())
+        EventLoopMonitor.stop()
+    assert not monitor.is_running_on(asyncio.get_running_loop())
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", return_value=False)
+async def test_ensure_started_when_disabled(mocked_env):
+    with patch.object(EventLoopMonitor, "monitor", None):
+        EventLoopMonitor.ensure_started()
+        assert EventLoopMonitor.get_stats() == {}
+
+
+@pytest.mark.asyncio
+async def test_blocking_call_detector():
+    async with BlockingCallDetector(threshold_in_seconds=0.05) as detector:
+        await asyncio.sleep(0.06)
+        block_the_loop(0.06)
+    (blocking_call,) = detector.blocking_calls
+    assert blocking_call[1] >= 0.06
+    assert not asyncio.get_running_loop().get_debug()
@@ -0,0 +1,128 @@
+import asyncio
+from unittest.mock import patch
+
+from etria_logger import Gladsheim
+from pytest import fixture
+
+from src.infrastructures.loop_registry.infrastructure import LoopResourceRegistry
+
+
+class ResourceStandIn:
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+def close_resource(resource: ResourceStandIn):
+    return resource.close()
+
+
+def get_resource() -> ResourceStandIn:
+    return LoopResourceRegistry.get(
+        name="resource", factory=ResourceStandIn, closer=close_resource
+    )
+
+
+@fixture(autouse=True)
+def registry():
+    with patch.object(LoopResourceRegistry, "resources", {}), patch.object(
+        LoopResourceRegistry, "closers", {}
+    ), patch.object(LoopResourceRegistry, "owners", {}), patch.object(
+        LoopResourceRegistry, "watchers", {}
+    ), patch.object(
+        LoopResourceRegistry, "created", 0
+    ), patch.object(
+        LoopResourceRegistry, "reused", 0
+    ), patch.object(
+        LoopResourceRegistry, "closed", 0
+    ), patch.object(
+        LoopResourceRegistry, "cross_loop_uses", 0
+    ), patch.object(
+        LoopResourceRegistry, "discards", set()
+    ):
+        yield
+
+
+def test_get_reuses_resource_within_the_same_loop():
+    async def get_twice():
+        return get_resource(), get_resource()
+
+    first_resource, second_resource = asyncio.run(get_twice())
+
+    assert first_resource is second_resource
+    stats = LoopResourceRegistry.get_stats()
+    assert stats["created"] == 1
+    assert stats["reused"] == 1
+
+
+def test_get_creates_one_resource_per_loop_and_closes_it_with_the_loop():
+    async def get_and_yield():
+        resource = get_resource()
+        await asyncio.sleep(0)
+        return resource
+
+    first_resource = asyncio.run(get_and_yield())
+    second_resource = asyncio.run(get_and_yield())
+
+    assert first_resource is not second_resource
+    assert first_resource.loop is not second_resource.loop
+    assert first_resource.closed is True
+    assert second_resource.closed is True
+    assert LoopResourceRegistry.get_stats()["loops"] == 0
+    assert LoopResourceRegistry.get_stats()["closed"] == 2
+
+
+def test_get_releases_resources_of_loops_closed_without_shutdown():
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(asyncio.sleep(0))
+
+    async def get():
+        resource = get_resource()
+        await asyncio.sleep(0)
+        return resource
+
+    first_resource = loop.run_until_complete(get())
+    loop.close()
+    second_resource = asyncio.run(get())
+
+    assert first_resource is not second_resource
+    assert first_resource.closed is True
+    assert LoopResourceRegistry.get_stats()["closed"] == 2
+
+
+def test_get_closes_resources_of_closed_loops_outside_any_loop():
+    loop = asyncio.new_event_loop()
+
+    async def get():
+        return get_resource()
+
+    resource = loop.run_until_complete(get())
+    loop.close()
+    LoopResourceRegistry.get(name="other", factory=object)
+
+    assert resource.closed is True
+    assert LoopResourceRegistry.get_stats()["closed"] == 1
+
+
+@patch.object(Gladsheim, "warning")
+def test_check_loop_reports_use_from_a_different_loop(etria_warning_mock):
+    loop = asyncio.new_event_loop()
+
+    async def get():
+        return get_resource()
+
+    async def check(resource):
+        return LoopResourceRegistry.check_loop(name="resource", resource=resource)
+
+    resource = loop.run_until_complete(get())
+    same_loop = loop.run_until_complete(check(resource))
+    other_loop = asyncio.run(check(resource))
+    loop.close()
+
+    assert same_loop is True
+    assert other_loop is False
+    assert LoopResourceRegistry.get_stats()["cross_loop_uses"] == 1
+    assert etria_warning_mock.called
@@ -0,0 +1,77 @@
+from unittest.mock import patch
+
+import pytest
+from decouple import Config
+from etria_logger import Gladsheim
+
+from src.domain.exceptions.model import InvalidStepError
+from src.infrastructures.metrics.infrastructure import MetricsRegistry
+
+
+@pytest.fixture
+def metrics_registry():
+    with patch.object(MetricsRegistry, "enabled", True), patch.object(
+        MetricsRegistry, "histograms", {}
+    ), patch.object(MetricsRegistry, "collectors", {}):
+        yield MetricsRegistry
+
+
+def test_measure_records_success(metrics_registry):
+    with metrics_registry.measure(stage="stage"):
+        pass
+    histogram = metrics_registry.histograms[("stage", "success")]
+    assert histogram.count == 1
+
+
+def test_measure_records_error_outcome(metrics_registry):
+    with pytest.raises(InvalidStepError):
+        with metrics_registry.measure(stage="step_check"):
+            raise InvalidStepError()
+    assert ("step_check", "InvalidStepError") in metrics_registry.histograms
+
+
+def test_observe_when_disabled(metrics_registry):
+    with patch.object(MetricsRegistry, "enabled", False):
+        MetricsRegistry.observe(
+            stage="stage", outcome="success", duration_in_seconds=0.1
+        )
+    assert metrics_registry.histograms == {}
+
+
+@patch.object(Config, "__call__", return_value=False)
+def test_is_enabled_reads_config_once(mocked_env):
+    with patch.object(MetricsRegistry, "enabled", None):
+        assert MetricsRegistry.is_enabled() is False
+        assert MetricsRegistry.is_enabled() is False
+    mocked_env.assert_called_once()
+
+
+@patch.object(Gladsheim, "warning")
+@patch.object(Config, "__call__", side_effect=lambda key, default=None: default)
+def test_get_snapshot_flattens_collector_stats(
+    mocked_env, warning_mock, metrics_registry
+):
+    def failing_collector():
+        raise ValueError()
+
+    metrics_registry.observe(stage="auth", outcome="success", duration_in_seconds=0.1)
+    metrics_registry.register_collector(
+        name="circuit_breaker",
+        collector=lambda: {
+            "mongo_db": {"state": "open", "state_code": 2, "rejected": 3}
+        },
+    )
+    metrics_registry.register_collector(
+        name="single_flight", collector=lambda: {"followers": 1, "enabled": True}
+    )
+    metrics_registry.register_collector(name="broken", collector=failing_collector)
+    snapshot = metrics_registry.get_snapshot()
+    assert snapshot.namespace == "onboarding_pep_us"
+    assert snapshot.histograms[("auth", "success")].count == 1
+    assert snapshot.gauges == {
+        "onboarding_pep_us_circuit_breaker_state_code": {(("key", "mongo_db"),): 2},
+        "onboarding_pep_us_circuit_breaker_rejected": {(("key", "mongo_db"),): 3},
+        "onboarding_pep_us_single_flight_followers": {(): 1},
+        "onboarding_pep_us_single_flight_enabled": {(): 1},
+    }
+    assert warning_mock.called
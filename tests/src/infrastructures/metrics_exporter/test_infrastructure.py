@@ -0,0 +1,41 @@
+from src.domain.models.metrics.model import LatencyHistogram, MetricsSnapshot
+from src.infrastructures.metrics_exporter.infrastructure import (
+    InMemoryMetricsExporter,
+    PrometheusTextExporter,
+)
+
+
+def build_snapshot() -> MetricsSnapshot:
+    histogram = LatencyHistogram(buckets=(0.01, 0.1))
+    histogram.observe(0.005)
+    histogram.observe(0.05)
+    snapshot = MetricsSnapshot(
+        namespace="pep",
+        histograms={("step_check", "InvalidStepError"): histogram},
+        gauges={"pep_circuit_breaker_state_code": {(("key", 'mongo"db'),): 2}},
+    )
+    return snapshot
+
+
+def test_in_memory_exporter():
+    exporter = InMemoryMetricsExporter()
+    snapshot = build_snapshot()
+    exporter.export(snapshot)
+    assert exporter.snapshots == [snapshot]
+
+
+def test_prometheus_text_exporter():
+    result = PrometheusTextExporter().export(build_snapshot())
+    labels = 'stage="step_check",outcome="InvalidStepError"'
+    assert result.splitlines() == [
+        "# TYPE pep_stage_duration_seconds histogram",
+        f'pep_stage_duration_seconds_bucket{{{labels},le="0.01"}} 1',
+        f'pep_stage_duration_seconds_bucket{{{labels},le="0.1"}} 2',
+        f'pep_stage_duration_seconds_bucket{{{labels},le="+Inf"}} 2',
+        f"pep_stage_duration_seconds_sum{{{labels}}} 0.055",
+        f"pep_stage_duration_seconds_count{{{labels}}} 2",
+        "# TYPE pep_stage_outcomes_total counter",
+        f"pep_stage_outcomes_total{{{labels}}} 2",
+        "# TYPE pep_circuit_breaker_state_code gauge",
+        'pep_circuit_breaker_state_code{key="mongo\\"db"} 2',
+    ]
@@ -1,13 +1,18 @@
 # OUTSIDE LIBRARIES
+from src.infrastructures.loop_registry.infrastructure import LoopResourceRegistry
 from src.infrastructures.mongo_db.infrastructure import MongoDBInfrastructure
 from unittest.mock import patch, MagicMock
 from decouple import AutoConfig
 from motor import motor_asyncio
+from pytest import mark, raises
+
+from tests.stand_ins.mongo import MongoClientStandIn
 
 
 dummy_env = "dummy env"
 
 
+@patch.object(LoopResourceRegistry, "resources", {})
 @patch.object(AutoConfig, "__call__", return_value=dummy_env)
 def test_get_client(mocked_env, monkeypatch):
     dummy_connection = "dummy connection"
@@ -23,4 +28,47 @@ def test_get_client(mocked_env, monkeypatch):
     assert reused_client == new_connection_created
     mock_connection.assert_called_once_with(dummy_env)
     mocked_env.assert_called_once()
-    MongoDBInfrastructure.client = None
+
+
+@mark.asyncio
+async def test_run_in_transaction():
+    mongo_client = MongoClientStandIn()
+
+    async def callback(session):
+        await mongo_client["database"]["collection"].insert_one(
+            {"key": "value"}, session=session
+        )
+        return "result"
+
+    with patch.object(MongoDBInfrastructure, "get_client", return_value=mongo_client):
+        result = await MongoDBInfrastructure.run_in_transaction(callback)
+
+    assert result == "result"
+    assert len(mongo_client["database"]["collection"].documents) == 1
+
+
+@mark.asyncio
+async def test_run_in_transaction_when_callback_fails():
+    mongo_client = MongoClientStandIn()
+
+    async def callback(session):
+        await mongo_client["database"]["collection"].insert_one(
+            {"key": "value"}, session=session
+        )
+        raise ValueError()
+
+    with patch.object(MongoDBInfrastructure, "get_client", return_value=mongo_client):
+        with raises(ValueError):
+            await MongoDBInfrastructure.run_in_transaction(callback)
+
+    assert mongo_client["database"]["collection"].documents == []
+
+
+@mark.asyncio
+async def test_ping():
+    mongo_client = MongoClientStandIn(connect_latency_in_seconds=0.01)
+
+    with patch.object(MongoDBInfrastructure, "get_client", return_value=mongo_client):
+        await MongoDBInfrastructure.ping()
+
+    assert mongo_client.connections == 1
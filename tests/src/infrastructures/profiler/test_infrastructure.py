@@ -0,0 +1,96 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from src.domain.enums.profile import CpuSection
+from src.infrastructures.profiler import infrastructure
+from src.infrastructures.profiler.infrastructure import (
+    RequestProfiler,
+    SlowRequestSampler,
+)
+
+
+def build_sampler(**overrides) -> SlowRequestSampler:
+    settings = {
+        "latency_threshold_in_seconds": 0,
+        "sample_ratio": 1,
+        "max_captures_per_minute": 2,
+        "ring_buffer_size": 10,
+    }
+    settings.update(overrides)
+    return SlowRequestSampler(**settings)
+
+
+@pytest.fixture
+def sampler():
+    sampler = build_sampler()
+    with patch.object(RequestProfiler, "enabled", True), patch.object(
+        RequestProfiler, "sampler", sampler
+    ):
+        yield sampler
+
+
+@pytest.mark.asyncio
+async def test_profile_records_frames_and_cpu_sections(sampler):
+    async def run_stage(name: str):
+        with RequestProfiler.frame(name):
+            await asyncio.sleep(0.01)
+
+    token = RequestProfiler.start(name="request")
+    with RequestProfiler.frame("pipeline"):
+        await asyncio.gather(run_stage("step_br"), run_stage("step_us"))
+        with RequestProfiler.cpu_section(CpuSection.JSON_ENCODING):
+            sum(range(1000))
+    RequestProfiler.finish(token)
+
+    (profile,) = RequestProfiler.get_profiles()
+    stacks = {";".join(stack) for stack in profile.self_times}
+    assert stacks >= {
+        "request;pipeline;step_br",
+        "request;pipeline;step_us",
+        "request;pipeline;[cpu] json_encoding",
+    }
+    assert profile.self_times[("request", "pipeline", "step_br")] >= 0.01
+    assert "request;pipeline;step_us " in RequestProfiler.get_collapsed_stacks()
+    assert sampler.get_stats()["captured"] == 1
+
+
+def test_finish_when_request_is_fast(sampler):
+    sampler.latency_threshold_in_seconds = 10
+    RequestProfiler.finish(RequestProfiler.start(name="request"))
+    assert RequestProfiler.get_profiles() == []
+
+
+@patch.object(infrastructure, "monotonic")
+def test_start_is_rate_limited_before_profiling(monotonic_mock):
+    monotonic_mock.return_value = 100
+    sampler = build_sampler(max_captures_per_minute=2)
+    with patch.object(RequestProfiler, "enabled", True), patch.object(
+        RequestProfiler, "sampler", sampler
+    ):
+        tokens = [RequestProfiler.start(name="request") for _ in range(3)]
+        for token in reversed(tokens):
+            RequestProfiler.finish(token)
+        monotonic_mock.return_value = 130
+        RequestProfiler.finish(RequestProfiler.start(name="request"))
+    assert tokens[2] is None
+    assert sampler.get_stats() == {
+        "sampled": 3,
+        "captured": 3,
+        "rate_limited": 1,
+        "buffered": 3,
+    }
+
+
+def test_start_when_request_is_not_sampled(sampler):
+    sampler.sample_ratio = 0
+    assert RequestProfiler.start(name="request") is None
+    with RequestProfiler.frame("stage"):
+        pass
+    assert sampler.get_stats()["sampled"] == 0
+
+
+def test_start_when_disabled():
+    with patch.object(RequestProfiler, "enabled", False):
+        assert RequestProfiler.start(name="request") is None
@@ -0,0 +1,101 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from decouple import Config
+from etria_logger import Gladsheim
+
+from src.domain.exceptions.model import InvalidStepError
+from src.infrastructures.tracing.infrastructure import Tracer
+from src.infrastructures.tracing_exporter.infrastructure import (
+    InMemorySpanExporter,
+    LogSpanExporter,
+)
+
+traceparent_dummy = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+
+
+@pytest.fixture
+def span_exporter():
+    exporter = InMemorySpanExporter()
+    with patch.object(Tracer, "enabled", True), patch.object(
+        Tracer, "exporters", [exporter]
+    ):
+        yield exporter
+
+
+def test_span_nests_children(span_exporter):
+    with Tracer.span(name="request") as request_span:
+        with Tracer.span(name="stage") as stage_span:
+            assert Tracer.get_current_span() is stage_span
+        assert Tracer.get_current_span() is request_span
+    assert Tracer.get_current_span() is None
+    assert span_exporter.spans == [stage_span, request_span]
+    assert stage_span.context.trace_id == request_span.context.trace_id
+    assert stage_span.parent_span_id == request_span.context.span_id
+    assert request_span.parent_span_id is None
+
+
+def test_span_continues_incoming_trace(span_exporter):
+    with Tracer.span(name="request", traceparent=traceparent_dummy) as span:
+        headers = Tracer.inject({"x_thebes_answer": "jwt"})
+    assert span.context.trace_id == "0af7651916cd43dd8448eb211c80319c"
+    assert span.parent_span_id == "b7ad6b7169203331"
+    assert headers["traceparent"] == span.context.to_traceparent()
+
+
+def test_span_records_error_outcome(span_exporter):
+    with pytest.raises(InvalidStepError):
+        with Tracer.span(name="stage"):
+            raise InvalidStepError()
+    (span,) = span_exporter.spans
+    assert span.outcome == "InvalidStepError"
+
+
+def test_span_when_trace_is_not_sampled(span_exporter):
+    with Tracer.span(name="request", traceparent=traceparent_dummy[:-2] + "00"):
+        pass
+    assert span_exporter.spans == []
+
+
+@pytest.mark.asyncio
+async def test_span_is_isolated_between_tasks(span_exporter):
+    async def run_stage(name: str):
+        with Tracer.span(name=name) as span:
+            await asyncio.sleep(0)
+            assert Tracer.get_current_span() is span
+
+    with Tracer.span(name="request") as request_span:
+        await asyncio.gather(run_stage("step_br"), run_stage("step_us"))
+    parents = {span.parent_span_id for span in span_exporter.get_spans("step_br")}
+    parents |= {span.parent_span_id for span in span_exporter.get_spans("step_us")}
+    assert parents == {request_span.context.span_id}
+
+
+@patch.object(Gladsheim, "warning")
+def test_span_when_exporter_fails(warning_mock, span_exporter):
+    class FailingExporter(InMemorySpanExporter):
+        def export(self, span):
+            raise ValueError()
+
+    Tracer.exporters.insert(0, FailingExporter())
+    with patch.object(Tracer, "export_failures", 0):
+        with Tracer.span(name="request"):
+            pass
+        assert Tracer.export_failures == 1
+    assert len(span_exporter.spans) == 1
+    assert warning_mock.called
+
+
+def test_span_when_disabled():
+    with patch.object(Tracer, "enabled", False):
+        with Tracer.span(name="request") as span:
+            assert Tracer.inject({}) == {}
+    assert span is None
+
+
+@patch.object(Config, "__call__", side_effect=lambda key, default=None: default)
+def test_get_exporters_from_config(mocked_env):
+    with patch.object(Tracer, "exporters", None):
+        (exporter,) = Tracer.get_exporters()
+    assert isinstance(exporter, LogSpanExporter)
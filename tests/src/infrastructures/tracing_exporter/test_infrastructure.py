@@ -0,0 +1,31 @@
+from unittest.mock import patch
+
+from etria_logger import Gladsheim
+
+from src.domain.models.tracing.model import Span, SpanContext
+from src.infrastructures.tracing_exporter.infrastructure import (
+    InMemorySpanExporter,
+    LogSpanExporter,
+)
+
+
+def build_span(name: str) -> Span:
+    span = Span(name=name, context=SpanContext.generate())
+    span.finish(outcome="success")
+    return span
+
+
+def test_in_memory_exporter():
+    exporter = InMemorySpanExporter()
+    request_span, stage_span = build_span("request"), build_span("stage")
+    exporter.export(request_span)
+    exporter.export(stage_span)
+    assert exporter.spans == [request_span, stage_span]
+    assert exporter.get_spans("stage") == [stage_span]
+
+
+@patch.object(Gladsheim, "info")
+def test_log_exporter(info_mock):
+    span = build_span("request")
+    LogSpanExporter().export(span)
+    info_mock.assert_called_once_with(message="Span finished", **span.to_dict())
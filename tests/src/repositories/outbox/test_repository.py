@@ -0,0 +1,211 @@
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from etria_logger import Gladsheim
+from pytest import fixture, mark, raises
+from decouple import Config
+
+from src.domain.enums.persephone_delivery import OutboxStatus
+from src.domain.exceptions.model import InternalServerError
+from src.domain.models.outbox.model import OutboxRecord
+from src.infrastructures.mongo_db.infrastructure import MongoDBInfrastructure
+from tests.stand_ins.mongo import MongoClientStandIn
+
+with patch.object(Config, "__call__"):
+    from src.repositories.outbox.repository import OutboxRepository
+
+
+def build_outbox_record(unique_id="unique_id", created_at=None):
+    return OutboxRecord(
+        unique_id=unique_id,
+        topic="topic",
+        partition=8,
+        schema_name="schema_name",
+        message={"unique_id": unique_id},
+        created_at=created_at,
+    )
+
+
+@fixture
+def mongo_client():
+    mongo_client = MongoClientStandIn()
+    with patch.object(
+        MongoDBInfrastructure, "get_client", return_value=mongo_client
+    ), patch.object(OutboxRepository, "sequence_collection", "outbox_sequences"):
+        yield mongo_client
+
+
+def get_outbox_documents(mongo_client):
+    return mongo_client[OutboxRepository.database][
+        OutboxRepository.collection
+    ].documents
+
+
+@mark.asyncio
+async def test_enqueue(mongo_client):
+    await OutboxRepository.enqueue(build_outbox_record())
+    documents = get_outbox_documents(mongo_client)
+    assert len(documents) == 1
+    assert documents[0]["status"] == OutboxStatus.PENDING.value
+    assert documents[0]["attempts"] == 0
+
+
+@mark.asyncio
+@patch.object(Gladsheim, "error")
+@patch.object(OutboxRepository, "_OutboxRepository__get_collection")
+async def test_enqueue_when_exception_happens(get_collection_mock, etria_error_mock):
+    get_collection_mock.side_effect = Exception()
+    with raises(InternalServerError):
+        await OutboxRepository.enqueue(build_outbox_record())
+    assert etria_error_mock.called
+
+
+@mark.asyncio
+async def test_enqueue_assigns_a_sequence_per_user(mongo_client):
+    for unique_id in ["user_1", "user_2", "user_1"]:
+        await OutboxRepository.enqueue(build_outbox_record(unique_id))
+
+    documents = get_outbox_documents(mongo_client)
+
+    assert [
+        (document["unique_id"], document["sequence"]) for document in documents
+    ] == [
+        ("user_1", 1),
+        ("user_2", 1),
+        ("user_1", 2),
+    ]
+
+
+@mark.asyncio
+async def test_get_pending_does_not_order_by_created_at(mongo_client):
+    now = datetime.utcnow()
+    await OutboxRepository.enqueue(build_outbox_record("first", now))
+    await OutboxRepository.enqueue(build_outbox_record("second", now - timedelta(1)))
+    sent_record = build_outbox_record("sent", now - timedelta(2))
+    sent_record.status = OutboxStatus.SENT
+    await OutboxRepository.enqueue(sent_record)
+
+    result = await OutboxRepository.get_pending(limit=10)
+
+    assert [record.unique_id for record in result] == ["first", "second"]
+    assert all(record.record_id is not None for record in result)
+
+
+@mark.asyncio
+async def test_claim_is_exclusive_while_lease_is_valid(mongo_client):
+    await OutboxRepository.enqueue(build_outbox_record())
+    (outbox_record,) = await OutboxRepository.get_pending(limit=10)
+
+    first_claim = await OutboxRepository.claim(outbox_record, "relay-1", 30)
+    second_claim = await OutboxRepository.claim(outbox_record, "relay-2", 30)
+
+    assert first_claim is True
+    assert second_claim is False
+
+
+@mark.asyncio
+async def test_claim_when_lease_is_expired(mongo_client):
+    await OutboxRepository.enqueue(build_outbox_record())
+    (outbox_record,) = await OutboxRepository.get_pending(limit=10)
+
+    await OutboxRepository.claim(outbox_record, "relay-1", -1)
+    result = await OutboxRepository.claim(outbox_record, "relay-2", 30)
+
+    assert result is True
+
+
+@mark.asyncio
+async def test_mark_as_sent(mongo_client):
+    await OutboxRepository.enqueue(build_outbox_record())
+    (outbox_record,) = await OutboxRepository.get_pending(limit=10)
+
+    await OutboxRepository.mark_as_sent([outbox_record.record_id])
+
+    assert await OutboxRepository.get_pending(limit=10) == []
+    assert get_outbox_documents(mongo_client)[0]["status"] == OutboxStatus.SENT.value
+
+
+@mark.asyncio
+async def test_mark_as_failed(mongo_client):
+    await OutboxRepository.enqueue(build_outbox_record())
+    (outbox_record,) = await OutboxRepository.get_pending(limit=10)
+    next_attempt_at = datetime.utcnow() + timedelta(seconds=5)
+
+    await OutboxRepository.mark_as_failed(
+        outbox_record, next_attempt_at=next_attempt_at, status=OutboxStatus.PENDING
+    )
+
+    assert await OutboxRepository.get_pending(limit=10) == []
+    (result,) = await OutboxRepository.get_pending(limit=10, now=next_attempt_at)
+    assert result.attempts == 1
+    assert result.next_attempt_at == next_attempt_at
+
+
+@mark.asyncio
+async def test_get_pending_skips_backed_off_records_ahead_of_ready_ones(
+    mongo_client,
+):
+    now = datetime.utcnow()
+    for index in range(3):
+        backed_off_record = build_outbox_record(
+            f"backed_off_{index}", now - timedelta(seconds=10 - index)
+        )
+        backed_off_record.next_attempt_at = now + timedelta(seconds=60)
+        await OutboxRepository.enqueue(backed_off_record)
+    await OutboxRepository.enqueue(build_outbox_record("ready", now))
+
+    result = await OutboxRepository.get_pending(limit=3, now=now)
+
+    assert [record.unique_id for record in result] == ["ready"]
+
+
+@mark.asyncio
+async def test_get_pending_skips_records_with_valid_lease(mongo_client):
+    await OutboxRepository.enqueue(build_outbox_record("leased"))
+    (outbox_record,) = await OutboxRepository.get_pending(limit=10)
+    await OutboxRepository.claim(outbox_record, "relay-1", 30)
+
+    assert await OutboxRepository.get_pending(limit=10) == []
+
+
+@mark.asyncio
+async def test_get_pending_excludes_users(mongo_client):
+    await OutboxRepository.enqueue(build_outbox_record("user_1"))
+    await OutboxRepository.enqueue(build_outbox_record("user_2"))
+
+    result = await OutboxRepository.get_pending(
+        limit=10, excluded_unique_ids=["user_1"]
+    )
+
+    assert [record.unique_id for record in result] == ["user_2"]
+
+
+@mark.asyncio
+async def test_get_blocked_unique_ids(mongo_client):
+    now = datetime.utcnow()
+    backed_off_record = build_outbox_record("backed_off", now)
+    backed_off_record.next_attempt_at = now + timedelta(seconds=60)
+    await OutboxRepository.enqueue(backed_off_record)
+    await OutboxRepository.enqueue(build_outbox_record("leased", now))
+    await OutboxRepository.enqueue(build_outbox_record("ready", now))
+    (leased_record, *_) = await OutboxRepository.get_pending(limit=10, now=now)
+    await OutboxRepository.claim(leased_record, "relay-1", 30)
+
+    result = await OutboxRepository.get_blocked_unique_ids(now=now)
+
+    assert sorted(result) == ["backed_off", "leased"]
+
+
+@mark.asyncio
+async def test_get_pending_by_user(mongo_client):
+    for unique_id in ["user_1", "user_1", "user_2", "user_1"]:
+        await OutboxRepository.enqueue(build_outbox_record(unique_id))
+    (first_record, *_) = await OutboxRepository.get_pending(limit=10)
+    await OutboxRepository.mark_as_sent([first_record.record_id])
+
+    result = await OutboxRepository.get_pending_by_user(["user_1", "user_2"])
+
+    assert {
+        unique_id: [record.sequence for record in records]
+        for unique_id, records in result.items()
+    } == {"user_1": [2, 3], "user_2": [1]}
@@ -4,8 +4,13 @@ from etria_logger import Gladsheim
 from pytest import mark, raises
 from decouple import Config
 
+from src.domain.enums.user_write_mode import UserUpdateStatus
 from src.domain.exceptions.model import InternalServerError
 from src.domain.models.user_data.model import UserData
+from src.domain.models.user_data.onboarding_data.model import UserOnboardingData
+from src.domain.models.user_data.politically_exposed.model import PoliticallyExposedData
+from src.infrastructures.tracing.infrastructure import Tracer
+from tests.stand_ins.mongo import CollectionStandIn
 with patch.object(Config, "__call__"):
     from src.repositories.user.repository import UserRepository
 
@@ -93,3 +98,278 @@ async def test_verify_if_user_has_suitability_when_exception_happens(
             user_data_dummy
         )
     assert etria_error_mock.called
+
+
+def get_default_env(key, default=None, cast=None):
+    return default
+
+
+@mark.asyncio
+@patch.object(Config, "__call__", side_effect=get_default_env)
+@patch.object(Gladsheim, "error")
+@patch.object(UserRepository, "_UserRepository__get_collection")
+async def test_get_user_onboarding_data(
+    get_collection_mock, etria_error_mock, mocked_env
+):
+    collection_mock = AsyncMock()
+    collection_mock.find_one.return_value = {
+        "suitability": {"score": 1},
+        "onboarding_step": {"br": "finished", "us": "politically_exposed"},
+    }
+    get_collection_mock.return_value = collection_mock
+    result = await UserRepository.get_user_onboarding_data(user_data_dummy)
+    assert result.has_suitability is True
+    assert result.get_onboarding_step().is_in_correct_step() is True
+    filter_, projection = collection_mock.find_one.call_args.args
+    assert filter_ == {"unique_id": user_data_dummy.unique_id}
+    assert projection["suitability"] is True
+    assert projection["onboarding_step.br"] is True
+    assert not etria_error_mock.called
+
+
+@mark.asyncio
+@patch.object(Config, "__call__", side_effect=get_default_env)
+@patch.object(Gladsheim, "error")
+@patch.object(UserRepository, "_UserRepository__get_collection")
+async def test_get_user_onboarding_data_when_user_is_not_found(
+    get_collection_mock, etria_error_mock, mocked_env
+):
+    collection_mock = AsyncMock()
+    collection_mock.find_one.return_value = None
+    get_collection_mock.return_value = collection_mock
+    result = await UserRepository.get_user_onboarding_data(user_data_dummy)
+    assert result is None
+
+
+@mark.asyncio
+@patch.object(Config, "__call__", side_effect=get_default_env)
+@patch.object(Gladsheim, "error")
+@patch.object(UserRepository, "_UserRepository__get_collection")
+async def test_get_user_onboarding_data_when_exception_happens(
+    get_collection_mock, etria_error_mock, mocked_env
+):
+    get_collection_mock.side_effect = Exception()
+    with raises(InternalServerError):
+        await UserRepository.get_user_onboarding_data(user_data_dummy)
+    assert etria_error_mock.called
+
+
+class PoliticallyExposedDataDummy(UserData):
+    unique_id = "unique_id"
+
+    def get_data_representation(self):
+        return {"external_exchange_requirements.us.is_politically_exposed": True}
+
+
+@mark.asyncio
+@patch.object(Config, "__call__", side_effect=get_default_env)
+@patch.object(Gladsheim, "error")
+@patch.object(UserRepository, "_UserRepository__get_collection")
+async def test_update_user_if_has_suitability(
+    get_collection_mock, etria_error_mock, mocked_env
+):
+    collection_mock = AsyncMock()
+    collection_mock.find_one_and_update.return_value = {"suitability": {"score": 1}}
+    get_collection_mock.return_value = collection_mock
+    status, previous_user_data = await UserRepository.update_user_if_has_suitability(
+        PoliticallyExposedDataDummy()
+    )
+    assert status == UserUpdateStatus.UPDATED
+    assert previous_user_data.has_suitability is True
+    filter_, update = collection_mock.find_one_and_update.call_args.args
+    assert filter_ == {"unique_id": "unique_id"}
+    assert update == [
+        {
+            "$set": {
+                "external_exchange_requirements.us.is_politically_exposed": {
+                    "$cond": [
+                        UserOnboardingData.get_suitability_condition(),
+                        {"$literal": True},
+                        "$external_exchange_requirements.us.is_politically_exposed",
+                    ]
+                }
+            }
+        }
+    ]
+    assert not etria_error_mock.called
+
+
+@mark.asyncio
+@patch.object(Config, "__call__", side_effect=get_default_env)
+@patch.object(Gladsheim, "error")
+@patch.object(UserRepository, "_UserRepository__get_collection")
+async def test_update_user_if_has_suitability_when_user_has_no_suitability(
+    get_collection_mock, etria_error_mock, mocked_env
+):
+    collection_mock = AsyncMock()
+    collection_mock.find_one_and_update.return_value = {}
+    get_collection_mock.return_value = collection_mock
+    status, previous_user_data = await UserRepository.update_user_if_has_suitability(
+        PoliticallyExposedDataDummy()
+    )
+    assert status == UserUpdateStatus.SUITABILITY_REQUIRED
+    assert previous_user_data.has_suitability is False
+
+
+@mark.asyncio
+@patch.object(Config, "__call__", side_effect=get_default_env)
+@patch.object(Gladsheim, "error")
+@patch.object(UserRepository, "_UserRepository__get_collection")
+async def test_update_user_if_has_suitability_when_user_is_not_found(
+    get_collection_mock, etria_error_mock, mocked_env
+):
+    collection_mock = AsyncMock()
+    collection_mock.find_one_and_update.return_value = None
+    get_collection_mock.return_value = collection_mock
+    status, previous_user_data = await UserRepository.update_user_if_has_suitability(
+        PoliticallyExposedDataDummy()
+    )
+    assert status == UserUpdateStatus.USER_NOT_FOUND
+    assert previous_user_data is None
+
+
+@mark.asyncio
+@patch.object(Config, "__call__", side_effect=get_default_env)
+@patch.object(Gladsheim, "error")
+@patch.object(UserRepository, "_UserRepository__get_collection")
+async def test_update_user_if_has_suitability_when_exception_happens(
+    get_collection_mock, etria_error_mock, mocked_env
+):
+    get_collection_mock.side_effect = Exception()
+    with raises(InternalServerError):
+        await UserRepository.update_user_if_has_suitability(
+            PoliticallyExposedDataDummy()
+        )
+    assert etria_error_mock.called
+
+
+@mark.asyncio
+@patch.object(Config, "__call__", side_effect=get_default_env)
+@patch.object(UserRepository, "_UserRepository__get_collection")
+async def test_update_user_if_has_suitability_agrees_with_the_write_condition(
+    get_collection_mock, mocked_env
+):
+    collection = CollectionStandIn()
+    get_collection_mock.return_value = collection
+    for unique_id, suitability in [
+        ("empty", {}),
+        ("zero", 0),
+        ("null", None),
+        ("filled", {"score": 1}),
+    ]:
+        await collection.insert_one({"unique_id": unique_id, "suitability": suitability})
+
+    results = {}
+    for unique_id in ["empty", "zero", "null", "filled"]:
+        politically_exposed_data = PoliticallyExposedDataDummy()
+        politically_exposed_data.unique_id = unique_id
+        status, _ = await UserRepository.update_user_if_has_suitability(
+            politically_exposed_data
+        )
+        document = await collection.find_one({"unique_id": unique_id})
+        results[unique_id] = (status, "external_exchange_requirements" in document)
+
+    assert results == {
+        "empty": (UserUpdateStatus.SUITABILITY_REQUIRED, False),
+        "zero": (UserUpdateStatus.SUITABILITY_REQUIRED, False),
+        "null": (UserUpdateStatus.SUITABILITY_REQUIRED, False),
+        "filled": (UserUpdateStatus.UPDATED, True),
+    }
+
+
+def write_coalescing_env(key, default=None, cast=None):
+    return {"USER_WRITE_COALESCING_ENABLED": True}.get(key, default)
+
+
+@mark.asyncio
+@patch.object(Config, "__call__", side_effect=write_coalescing_env)
+@patch.object(UserRepository, "write_coalescer", None)
+@patch.object(UserRepository, "_UserRepository__get_collection")
+async def test_update_user_with_write_coalescing(get_collection_mock, mocked_env):
+    collection_mock = AsyncMock()
+    get_collection_mock.return_value = collection_mock
+    await UserRepository.update_user(user_data_dummy)
+    assert collection_mock.bulk_write.called
+    assert not collection_mock.update_one.called
+    assert UserRepository.get_write_coalescer().get_stats()["operations"] == 1
+
+
+@mark.asyncio
+@patch.object(Config, "__call__", side_effect=write_coalescing_env)
+@patch.object(UserRepository, "write_coalescer", None)
+@patch.object(UserRepository, "_UserRepository__get_collection")
+async def test_update_user_with_write_coalescing_inside_a_session(
+    get_collection_mock, mocked_env
+):
+    collection_mock = AsyncMock()
+    get_collection_mock.return_value = collection_mock
+    await UserRepository.update_user(user_data_dummy, session="session")
+    assert collection_mock.update_one.called
+    assert not collection_mock.bulk_write.called
+
+
+@mark.asyncio
+@patch.object(Gladsheim, "error")
+@patch.object(Config, "__call__", side_effect=write_coalescing_env)
+@patch.object(UserRepository, "write_coalescer", None)
+@patch.object(UserRepository, "_UserRepository__get_collection")
+async def test_update_user_with_write_coalescing_when_exception_happens(
+    get_collection_mock, mocked_env, etria_error_mock
+):
+    collection_mock = AsyncMock()
+    collection_mock.bulk_write.side_effect = Exception()
+    get_collection_mock.return_value = collection_mock
+    with raises(InternalServerError):
+        await UserRepository.update_user(user_data_dummy)
+    assert etria_error_mock.called
+
+
+@mark.asyncio
+@patch.object(UserRepository, "_UserRepository__get_collection")
+async def test_verify_if_user_has_suitability_attaches_trace_context(
+    get_collection_mock,
+):
+    collection_mock = AsyncMock()
+    collection_mock.find_one.return_value = {"suitability": {"score": 1}}
+    get_collection_mock.return_value = collection_mock
+    with patch.object(Tracer, "enabled", True), patch.object(
+        Tracer, "exporters", []
+    ), Tracer.span(name="request") as span:
+        await UserRepository.verify_if_user_has_suitability(user_data_dummy)
+    ((user_filter, _), _) = collection_mock.find_one.call_args
+    assert user_filter["unique_id"] == user_data_dummy.unique_id
+    assert user_filter["$comment"].startswith(f"00-{span.context.trace_id}-")
+
+
+@mark.asyncio
+@patch.object(UserRepository, "_UserRepository__get_collection")
+async def test_update_published_version(get_collection_mock):
+    collection_mock = AsyncMock()
+    get_collection_mock.return_value = collection_mock
+    politically_exposed_data = PoliticallyExposedData(
+        unique_id="unique_id",
+        is_politically_exposed=True,
+        politically_exposed_names=["Giogio"],
+    )
+    await UserRepository.update_published_version(politically_exposed_data)
+    collection_mock.update_one.assert_called_once_with(
+        {"unique_id": "unique_id"},
+        {"$set": politically_exposed_data.get_published_representation()},
+    )
+
+
+@mark.asyncio
+@patch.object(Gladsheim, "error")
+@patch.object(UserRepository, "_UserRepository__get_collection")
+async def test_update_published_version_when_exception_happens(
+    get_collection_mock, etria_error_mock
+):
+    get_collection_mock.side_effect = Exception()
+    politically_exposed_data = PoliticallyExposedData(
+        unique_id="unique_id",
+        is_politically_exposed=True,
+        politically_exposed_names=["Giogio"],
+    )
+    with raises(InternalServerError):
+        await UserRepository.update_published_version(politically_exposed_data)
+    assert etria_error_mock.called
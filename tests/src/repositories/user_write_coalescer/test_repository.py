@@ -0,0 +1,158 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import AsyncMock, patch
+
+from etria_logger import Gladsheim
+from pymongo.errors import BulkWriteError
+from pytest import mark, raises
+
+from src.repositories.user_write_coalescer.repository import UserWriteCoalescer
+from tests.stand_ins.mongo import CollectionStandIn
+
+
+def build_coalescer(collection, flush_interval_in_seconds=0.01, max_batch_size=100):
+    async def get_collection():
+        return collection
+
+    return UserWriteCoalescer(
+        get_collection=get_collection,
+        flush_interval_in_seconds=flush_interval_in_seconds,
+        max_batch_size=max_batch_size,
+    )
+
+
+async def build_users_collection(*unique_ids):
+    collection = CollectionStandIn()
+    for unique_id in unique_ids:
+        await collection.insert_one({"unique_id": unique_id})
+    return collection
+
+
+@mark.asyncio
+async def test_update_user_coalesces_concurrent_writes_into_one_bulk_write():
+    collection = await build_users_collection("user_1", "user_2", "user_3")
+    coalescer = build_coalescer(collection)
+
+    result = await asyncio.gather(
+        *(
+            coalescer.update_user(unique_id=unique_id, update_set={"pep": True})
+            for unique_id in ("user_1", "user_2", "user_3")
+        )
+    )
+
+    assert result == [True, True, True]
+    assert collection.operations.count("bulk_write") == 1
+    assert all(document["pep"] is True for document in collection.documents)
+    assert coalescer.get_stats()["average_batch_size"] == 3
+
+
+@mark.asyncio
+async def test_update_user_keeps_last_write_for_same_unique_id():
+    collection = await build_users_collection("user_1")
+    coalescer = build_coalescer(collection)
+
+    result = await asyncio.gather(
+        coalescer.update_user(unique_id="user_1", update_set={"names": ["first"]}),
+        coalescer.update_user(unique_id="user_1", update_set={"names": ["last"]}),
+    )
+
+    assert result == [True, True]
+    assert collection.documents[0]["names"] == ["last"]
+    stats = coalescer.get_stats()
+    assert stats["operations"] == 1
+    assert stats["superseded"] == 1
+
+
+@mark.asyncio
+async def test_update_user_flushes_when_batch_is_full():
+    collection = await build_users_collection("user_1", "user_2")
+    coalescer = build_coalescer(
+        collection, flush_interval_in_seconds=10, max_batch_size=2
+    )
+
+    await asyncio.wait_for(
+        asyncio.gather(
+            coalescer.update_user(unique_id="user_1", update_set={"pep": True}),
+            coalescer.update_user(unique_id="user_2", update_set={"pep": True}),
+        ),
+        timeout=1,
+    )
+
+    assert coalescer.get_stats()["flushes"] == 1
+
+
+@mark.asyncio
+async def test_update_user_maps_bulk_write_errors_to_each_request():
+    collection = AsyncMock()
+    collection.bulk_write.side_effect = BulkWriteError(
+        {"writeErrors": [{"index": 1, "code": 121, "errmsg": "invalid"}]}
+    )
+    coalescer = build_coalescer(collection)
+
+    result = await asyncio.gather(
+        coalescer.update_user(unique_id="user_1", update_set={"pep": True}),
+        coalescer.update_user(unique_id="user_2", update_set={"pep": True}),
+        return_exceptions=True,
+    )
+
+    assert result[0] is True
+    assert isinstance(result[1], BulkWriteError)
+    assert coalescer.get_stats()["failed"] == 1
+
+
+@mark.asyncio
+@patch.object(Gladsheim, "error")
+async def test_update_user_fails_every_request_when_bulk_write_fails(
+    etria_error_mock,
+):
+    collection = AsyncMock()
+    collection.bulk_write.side_effect = ConnectionError()
+    coalescer = build_coalescer(collection)
+
+    with raises(ConnectionError):
+        await coalescer.update_user(unique_id="user_1", update_set={"pep": True})
+    assert etria_error_mock.called
+
+
+def test_update_user_keeps_writes_of_concurrent_loops_apart():
+    collection = asyncio.run(build_users_collection("user_1", "user_2"))
+    coalescer = build_coalescer(collection, flush_interval_in_seconds=0.05)
+
+    def update_from_loop(unique_id):
+        return asyncio.run(
+            coalescer.update_user(unique_id=unique_id, update_set={"pep": True})
+        )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        result = list(executor.map(update_from_loop, ["user_1", "user_2"]))
+
+    assert result == [True, True]
+    assert all(document["pep"] is True for document in collection.documents)
+    assert coalescer.get_stats()["flushes"] == 2
+
+
+def test_update_user_flushes_writes_left_on_a_closed_loop():
+    collection = asyncio.run(build_users_collection("user_1", "user_2"))
+    coalescer = build_coalescer(collection, flush_interval_in_seconds=10)
+
+    async def buffer_and_leave():
+        asyncio.ensure_future(
+            coalescer.update_user(unique_id="user_1", update_set={"pep": True})
+        )
+        await asyncio.sleep(0)
+
+    closed_loop = asyncio.new_event_loop()
+    closed_loop.run_until_complete(buffer_and_leave())
+    closed_loop.close()
+
+    async def update_and_flush():
+        pending_update = asyncio.ensure_future(
+            coalescer.update_user(unique_id="user_2", update_set={"pep": False})
+        )
+        await asyncio.sleep(0)
+        await coalescer.flush()
+        return await pending_update
+
+    assert asyncio.run(update_and_flush()) is True
+    assert [document["pep"] for document in collection.documents] == [True, False]
+    assert coalescer.get_stats()["adopted"] == 1
@@ -1,9 +1,12 @@
-from unittest.mock import patch
+import asyncio
+from unittest.mock import patch, MagicMock
 
 import pytest
 from decouple import Config
+from etria_logger import Gladsheim
 from persephone_client import Persephone
 
+from src.domain.enums.user_write_mode import UserUpdateStatus
 from src.domain.exceptions.model import (
     InternalServerError,
     InvalidStepError,
@@ -13,11 +16,15 @@ from src.domain.models.request.model import (
     PoliticallyExposedCondition,
     PoliticallyExposedRequest,
 )
+from src.domain.models.user_data.onboarding_data.model import UserOnboardingData
 from src.domain.models.user_data.onboarding_step.model import UserOnboardingStep
 from src.domain.models.user_data.politically_exposed.model import PoliticallyExposedData
+from src.infrastructures.mongo_db.infrastructure import MongoDBInfrastructure
+from src.repositories.outbox.repository import OutboxRepository
 from src.repositories.user.repository import UserRepository
 from src.services.employ_data.service import PoliticallyExposedService
 from src.transport.user_step.transport import StepChecker
+from tests.stand_ins.mongo import MongoClientStandIn
 
 politically_exposed_model_dummy = PoliticallyExposedCondition(
     **{"is_politically_exposed": True, "politically_exposed_names": ["Giogio"]}
@@ -56,7 +63,11 @@ def test___model_company_director_data_to_persephone():
 @patch.object(Persephone, "send_to_persephone")
 @patch.object(StepChecker, "get_onboarding_step")
 async def test_update_politically_exposed_data_for_us(
-    get_onboarding_step_mock, persephone_client_mock, update_user_mock, verify_risk, mocked_env
+    get_onboarding_step_mock,
+    persephone_client_mock,
+    update_user_mock,
+    verify_risk,
+    mocked_env,
 ):
     verify_risk.return_value = True
     get_onboarding_step_mock.return_value = onboarding_step_correct_stub
@@ -73,6 +84,33 @@ async def test_update_politically_exposed_data_for_us(
     assert update_user_mock.called
 
 
+@pytest.mark.asyncio
+@patch.object(Config, "__call__")
+@patch.object(StepChecker, "invalidate_step_us")
+@patch.object(UserRepository, "verify_if_user_has_suitability")
+@patch.object(UserRepository, "update_user")
+@patch.object(Persephone, "send_to_persephone")
+@patch.object(StepChecker, "get_onboarding_step")
+async def test_update_politically_exposed_data_for_us_invalidates_step_us(
+    get_onboarding_step_mock,
+    persephone_client_mock,
+    update_user_mock,
+    verify_risk,
+    invalidate_step_us_mock,
+    mocked_env,
+):
+    verify_risk.return_value = True
+    get_onboarding_step_mock.return_value = onboarding_step_correct_stub
+    persephone_client_mock.return_value = (True, 0)
+    await PoliticallyExposedService.update_politically_exposed_data_for_us(
+        politically_exposed_request_dummy
+    )
+    get_onboarding_step_mock.assert_called_once_with(
+        x_thebes_answer="x_thebes_answer", unique_id="unique_id"
+    )
+    invalidate_step_us_mock.assert_called_once_with(unique_id="unique_id")
+
+
 @pytest.mark.asyncio
 @patch.object(UserRepository, "verify_if_user_has_suitability")
 @patch.object(UserRepository, "update_user")
@@ -102,7 +140,11 @@ async def test_update_politically_exposed_data_for_us_when_user_is_in_wrong_step
 @patch.object(Persephone, "send_to_persephone")
 @patch.object(StepChecker, "get_onboarding_step")
 async def test_update_politically_exposed_data_for_us_when_cant_send_to_persephone(
-    get_onboarding_step_mock, persephone_client_mock, update_user_mock, verify_risk, mocked_env
+    get_onboarding_step_mock,
+    persephone_client_mock,
+    update_user_mock,
+    verify_risk,
+    mocked_env,
 ):
     verify_risk.return_value = True
     get_onboarding_step_mock.return_value = onboarding_step_correct_stub
@@ -138,3 +180,527 @@ async def test_update_politically_exposed_data_for_us_when_user_doesnt_have_high
     assert get_onboarding_step_mock.called
     assert not persephone_client_mock.called
     assert not update_user_mock.called
+
+
+def user_document_env(http_fallback_enabled=True):
+    env = {
+        "ONBOARDING_STEP_RESOLUTION_MODE": "user_document",
+        "ONBOARDING_STEP_HTTP_FALLBACK_ENABLED": http_fallback_enabled,
+    }
+
+    def get_env(key, default=None, cast=None):
+        return env.get(key, default)
+
+    return get_env
+
+
+def build_user_onboarding_data(
+    step_br="finished", step_us="politically_exposed", has_suitability=True
+):
+    return UserOnboardingData(
+        unique_id="unique_id",
+        step_br=step_br,
+        step_us=step_us,
+        has_suitability=has_suitability,
+        is_politically_exposed=None,
+        politically_exposed_names=None,
+    )
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=user_document_env())
+@patch.object(UserRepository, "get_user_onboarding_data")
+@patch.object(UserRepository, "verify_if_user_has_suitability")
+@patch.object(UserRepository, "update_user")
+@patch.object(Persephone, "send_to_persephone")
+@patch.object(StepChecker, "get_onboarding_step")
+async def test_update_politically_exposed_data_for_us_when_step_is_read_from_user_document(
+    get_onboarding_step_mock,
+    persephone_client_mock,
+    update_user_mock,
+    verify_risk,
+    get_user_onboarding_data_mock,
+    mocked_env,
+):
+    get_user_onboarding_data_mock.return_value = build_user_onboarding_data()
+    persephone_client_mock.return_value = (True, 0)
+    await PoliticallyExposedService.update_politically_exposed_data_for_us(
+        politically_exposed_request_dummy
+    )
+    get_user_onboarding_data_mock.assert_called_once()
+    assert not get_onboarding_step_mock.called
+    assert not verify_risk.called
+    assert update_user_mock.called
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=user_document_env())
+@patch.object(UserRepository, "get_user_onboarding_data")
+@patch.object(UserRepository, "update_user")
+@patch.object(Persephone, "send_to_persephone")
+@patch.object(StepChecker, "get_onboarding_step")
+async def test_update_politically_exposed_data_for_us_when_user_document_has_no_step(
+    get_onboarding_step_mock,
+    persephone_client_mock,
+    update_user_mock,
+    get_user_onboarding_data_mock,
+    mocked_env,
+):
+    get_user_onboarding_data_mock.return_value = build_user_onboarding_data(
+        step_br=None, step_us=None
+    )
+    get_onboarding_step_mock.return_value = onboarding_step_correct_stub
+    persephone_client_mock.return_value = (True, 0)
+    await PoliticallyExposedService.update_politically_exposed_data_for_us(
+        politically_exposed_request_dummy
+    )
+    get_user_onboarding_data_mock.assert_called_once()
+    assert get_onboarding_step_mock.called
+    assert update_user_mock.called
+
+
+@pytest.mark.asyncio
+@patch.object(
+    Config, "__call__", side_effect=user_document_env(http_fallback_enabled=False)
+)
+@patch.object(UserRepository, "get_user_onboarding_data")
+@patch.object(UserRepository, "update_user")
+@patch.object(Persephone, "send_to_persephone")
+@patch.object(StepChecker, "get_onboarding_step")
+async def test_update_politically_exposed_data_for_us_when_http_fallback_is_disabled(
+    get_onboarding_step_mock,
+    persephone_client_mock,
+    update_user_mock,
+    get_user_onboarding_data_mock,
+    mocked_env,
+):
+    get_user_onboarding_data_mock.return_value = build_user_onboarding_data(
+        step_br=None, step_us=None
+    )
+    with pytest.raises(InternalServerError):
+        await PoliticallyExposedService.update_politically_exposed_data_for_us(
+            politically_exposed_request_dummy
+        )
+    assert not get_onboarding_step_mock.called
+    assert not persephone_client_mock.called
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=user_document_env())
+@patch.object(UserRepository, "get_user_onboarding_data")
+@patch.object(UserRepository, "update_user")
+@patch.object(Persephone, "send_to_persephone")
+@patch.object(StepChecker, "get_onboarding_step")
+async def test_update_politically_exposed_data_for_us_when_user_document_has_no_suitability(
+    get_onboarding_step_mock,
+    persephone_client_mock,
+    update_user_mock,
+    get_user_onboarding_data_mock,
+    mocked_env,
+):
+    get_user_onboarding_data_mock.return_value = build_user_onboarding_data(
+        has_suitability=False
+    )
+    with pytest.raises(SuitabilityRequiredError):
+        await PoliticallyExposedService.update_politically_exposed_data_for_us(
+            politically_exposed_request_dummy
+        )
+    assert not persephone_client_mock.called
+    assert not update_user_mock.called
+
+
+@pytest.mark.asyncio
+@patch.object(UserRepository, "verify_if_user_has_suitability")
+@patch.object(UserRepository, "update_user")
+@patch.object(Persephone, "send_to_persephone")
+@patch.object(StepChecker, "get_onboarding_step")
+async def test_update_politically_exposed_data_for_us_when_all_preconditions_fail(
+    get_onboarding_step_mock, persephone_client_mock, update_user_mock, verify_risk
+):
+    async def get_onboarding_step(**kwargs):
+        await asyncio.sleep(0.01)
+        return onboarding_step_incorrect_stub
+
+    verify_risk.return_value = False
+    get_onboarding_step_mock.side_effect = get_onboarding_step
+    with pytest.raises(InvalidStepError):
+        await PoliticallyExposedService.update_politically_exposed_data_for_us(
+            politically_exposed_request_dummy
+        )
+    assert not persephone_client_mock.called
+    assert not update_user_mock.called
+
+
+def conditional_write_env(key, default=None, cast=None):
+    return {"USER_WRITE_MODE": "conditional"}.get(key, default)
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=conditional_write_env)
+@patch.object(UserRepository, "update_user_if_has_suitability")
+@patch.object(UserRepository, "verify_if_user_has_suitability")
+@patch.object(UserRepository, "update_user")
+@patch.object(Persephone, "send_to_persephone")
+@patch.object(StepChecker, "get_onboarding_step")
+async def test_update_politically_exposed_data_for_us_with_conditional_write(
+    get_onboarding_step_mock,
+    persephone_client_mock,
+    update_user_mock,
+    verify_risk,
+    update_user_if_has_suitability_mock,
+    mocked_env,
+):
+    get_onboarding_step_mock.return_value = onboarding_step_correct_stub
+    update_user_if_has_suitability_mock.return_value = (UserUpdateStatus.UPDATED, None)
+    persephone_client_mock.return_value = (True, 0)
+    await PoliticallyExposedService.update_politically_exposed_data_for_us(
+        politically_exposed_request_dummy
+    )
+    assert update_user_if_has_suitability_mock.called
+    assert persephone_client_mock.called
+    assert not verify_risk.called
+    assert not update_user_mock.called
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=conditional_write_env)
+@patch.object(UserRepository, "update_user_if_has_suitability")
+@patch.object(Persephone, "send_to_persephone")
+@patch.object(StepChecker, "get_onboarding_step")
+async def test_update_politically_exposed_data_for_us_with_conditional_write_when_user_has_no_suitability(
+    get_onboarding_step_mock,
+    persephone_client_mock,
+    update_user_if_has_suitability_mock,
+    mocked_env,
+):
+    get_onboarding_step_mock.return_value = onboarding_step_correct_stub
+    update_user_if_has_suitability_mock.return_value = (
+        UserUpdateStatus.SUITABILITY_REQUIRED,
+        None,
+    )
+    with pytest.raises(SuitabilityRequiredError):
+        await PoliticallyExposedService.update_politically_exposed_data_for_us(
+            politically_exposed_request_dummy
+        )
+    assert not persephone_client_mock.called
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=conditional_write_env)
+@patch.object(UserRepository, "update_user_if_has_suitability")
+@patch.object(Persephone, "send_to_persephone")
+@patch.object(StepChecker, "get_onboarding_step")
+async def test_update_politically_exposed_data_for_us_with_conditional_write_when_user_is_not_found(
+    get_onboarding_step_mock,
+    persephone_client_mock,
+    update_user_if_has_suitability_mock,
+    mocked_env,
+):
+    get_onboarding_step_mock.return_value = onboarding_step_correct_stub
+    update_user_if_has_suitability_mock.return_value = (
+        UserUpdateStatus.USER_NOT_FOUND,
+        None,
+    )
+    with pytest.raises(InternalServerError):
+        await PoliticallyExposedService.update_politically_exposed_data_for_us(
+            politically_exposed_request_dummy
+        )
+    assert not persephone_client_mock.called
+
+
+def outbox_env(key, default=None, cast=None):
+    env = {"PERSEPHONE_DELIVERY_MODE": "outbox", "PERSEPHONE_TOPIC_USER": "topic"}
+    return env.get(key, default)
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=outbox_env)
+@patch.object(UserRepository, "verify_if_user_has_suitability", return_value=True)
+@patch.object(Persephone, "send_to_persephone")
+@patch.object(StepChecker, "get_onboarding_step")
+async def test_update_politically_exposed_data_for_us_with_outbox(
+    get_onboarding_step_mock, persephone_client_mock, verify_risk, mocked_env
+):
+    get_onboarding_step_mock.return_value = onboarding_step_correct_stub
+    mongo_client = MongoClientStandIn()
+    users = mongo_client[UserRepository.database][UserRepository.collection]
+    await users.insert_one({"unique_id": "unique_id", "suitability": {"score": 1}})
+    outbox_relay_mock = MagicMock()
+
+    with patch.object(
+        MongoDBInfrastructure, "get_client", return_value=mongo_client
+    ), patch.object(
+        PoliticallyExposedService, "get_outbox_relay", return_value=outbox_relay_mock
+    ):
+        await PoliticallyExposedService.update_politically_exposed_data_for_us(
+            politically_exposed_request_dummy
+        )
+        (outbox_record,) = await OutboxRepository.get_pending(limit=10)
+
+    user_document = await users.find_one({"unique_id": "unique_id"})
+    assert user_document["external_exchange_requirements"]["us"] == {
+        "is_politically_exposed": True,
+        "politically_exposed_names": ["Giogio"],
+    }
+    assert outbox_record.topic == "topic"
+    assert outbox_record.message["politically_exposed_names"] == ["Giogio"]
+    assert not persephone_client_mock.called
+    assert outbox_relay_mock.start.called
+    assert outbox_relay_mock.notify.called
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=outbox_env)
+@patch.object(UserRepository, "verify_if_user_has_suitability", return_value=True)
+@patch.object(OutboxRepository, "enqueue", side_effect=InternalServerError())
+@patch.object(StepChecker, "get_onboarding_step")
+async def test_update_politically_exposed_data_for_us_with_outbox_when_enqueue_fails(
+    get_onboarding_step_mock, enqueue_mock, verify_risk, mocked_env
+):
+    get_onboarding_step_mock.return_value = onboarding_step_correct_stub
+    mongo_client = MongoClientStandIn()
+    users = mongo_client[UserRepository.database][UserRepository.collection]
+    await users.insert_one({"unique_id": "unique_id", "suitability": {"score": 1}})
+
+    with patch.object(MongoDBInfrastructure, "get_client", return_value=mongo_client):
+        with pytest.raises(InternalServerError):
+            await PoliticallyExposedService.update_politically_exposed_data_for_us(
+                politically_exposed_request_dummy
+            )
+
+    user_document = await users.find_one({"unique_id": "unique_id"})
+    assert "external_exchange_requirements" not in user_document
+
+
+def batched_env(key, default=None, cast=None):
+    return {"PERSEPHONE_DELIVERY_MODE": "batched"}.get(key, default)
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=batched_env)
+@patch.object(UserRepository, "verify_if_user_has_suitability", return_value=True)
+@patch.object(UserRepository, "update_user")
+@patch.object(Persephone, "send_to_persephone")
+@patch.object(StepChecker, "get_onboarding_step")
+async def test_update_politically_exposed_data_for_us_with_batched_persephone_delivery(
+    get_onboarding_step_mock,
+    persephone_client_mock,
+    update_user_mock,
+    verify_risk,
+    mocked_env,
+):
+    get_onboarding_step_mock.return_value = onboarding_step_correct_stub
+    persephone_client_mock.return_value = (True, 0)
+    with patch.object(PoliticallyExposedService, "persephone_producer", None):
+        await asyncio.gather(
+            *(
+                PoliticallyExposedService.update_politically_exposed_data_for_us(
+                    politically_exposed_request_dummy
+                )
+                for _ in range(3)
+            )
+        )
+        persephone_producer = PoliticallyExposedService.get_persephone_producer()
+    assert persephone_client_mock.call_count == 3
+    assert update_user_mock.call_count == 3
+    assert persephone_producer.get_stats()["messages"] == 3
+
+
+def idempotent_writes_env(user_write_mode="two_step"):
+    env = {"IDEMPOTENT_WRITES_ENABLED": True, "USER_WRITE_MODE": user_write_mode}
+
+    def get_env(key, default=None, cast=None):
+        return env.get(key, default)
+
+    return get_env
+
+
+def build_stored_user_onboarding_data(
+    politically_exposed_names, published_version=None
+):
+    return UserOnboardingData(
+        unique_id="unique_id",
+        step_br="finished",
+        step_us="politically_exposed",
+        has_suitability=True,
+        is_politically_exposed=True,
+        politically_exposed_names=politically_exposed_names,
+        published_version=published_version,
+    )
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=idempotent_writes_env())
+@patch.object(UserRepository, "get_user_onboarding_data")
+@patch.object(UserRepository, "verify_if_user_has_suitability")
+@patch.object(UserRepository, "update_user")
+@patch.object(Persephone, "send_to_persephone")
+@patch.object(StepChecker, "get_onboarding_step")
+async def test_update_politically_exposed_data_for_us_when_data_is_unchanged(
+    get_onboarding_step_mock,
+    persephone_client_mock,
+    update_user_mock,
+    verify_risk,
+    get_user_onboarding_data_mock,
+    mocked_env,
+):
+    get_onboarding_step_mock.return_value = onboarding_step_correct_stub
+    get_user_onboarding_data_mock.return_value = build_stored_user_onboarding_data(
+        ["Giogio", "Giogio"]
+    )
+    with patch.object(PoliticallyExposedService, "skipped_writes", 0):
+        await PoliticallyExposedService.update_politically_exposed_data_for_us(
+            politically_exposed_request_dummy
+        )
+        stats = PoliticallyExposedService.get_idempotency_stats()
+    get_user_onboarding_data_mock.assert_called_once()
+    assert not verify_risk.called
+    assert not persephone_client_mock.called
+    assert not update_user_mock.called
+    assert stats["skipped_writes"] == 1
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=idempotent_writes_env())
+@patch.object(UserRepository, "get_user_onboarding_data")
+@patch.object(UserRepository, "update_user")
+@patch.object(Persephone, "send_to_persephone")
+@patch.object(StepChecker, "get_onboarding_step")
+async def test_update_politically_exposed_data_for_us_when_data_changed(
+    get_onboarding_step_mock,
+    persephone_client_mock,
+    update_user_mock,
+    get_user_onboarding_data_mock,
+    mocked_env,
+):
+    get_onboarding_step_mock.return_value = onboarding_step_correct_stub
+    get_user_onboarding_data_mock.return_value = build_stored_user_onboarding_data(
+        ["Zeca"]
+    )
+    persephone_client_mock.return_value = (True, 0)
+    with patch.object(PoliticallyExposedService, "skipped_writes", 0):
+        await PoliticallyExposedService.update_politically_exposed_data_for_us(
+            politically_exposed_request_dummy
+        )
+        stats = PoliticallyExposedService.get_idempotency_stats()
+    assert persephone_client_mock.called
+    assert update_user_mock.called
+    assert stats["skipped_writes"] == 0
+
+
+@pytest.mark.asyncio
+@patch.object(
+    Config, "__call__", side_effect=idempotent_writes_env(user_write_mode="conditional")
+)
+@patch.object(UserRepository, "update_user_if_has_suitability")
+@patch.object(Persephone, "send_to_persephone")
+@patch.object(StepChecker, "get_onboarding_step")
+async def test_update_politically_exposed_data_for_us_with_conditional_write_when_data_is_unchanged(
+    get_onboarding_step_mock,
+    persephone_client_mock,
+    update_user_if_has_suitability_mock,
+    mocked_env,
+):
+    get_onboarding_step_mock.return_value = onboarding_step_correct_stub
+    published_version = PoliticallyExposedData(
+        unique_id="unique_id",
+        is_politically_exposed=True,
+        politically_exposed_names=["Giogio"],
+    ).get_content_version()
+    update_user_if_has_suitability_mock.return_value = (
+        UserUpdateStatus.UPDATED,
+        build_stored_user_onboarding_data(["Giogio"], published_version),
+    )
+    with patch.object(PoliticallyExposedService, "skipped_publishes", 0):
+        await PoliticallyExposedService.update_politically_exposed_data_for_us(
+            politically_exposed_request_dummy
+        )
+        stats = PoliticallyExposedService.get_idempotency_stats()
+    assert update_user_if_has_suitability_mock.called
+    assert not persephone_client_mock.called
+    assert stats["skipped_publishes"] == 1
+
+
+@pytest.mark.asyncio
+@patch.object(
+    Config, "__call__", side_effect=idempotent_writes_env(user_write_mode="conditional")
+)
+@patch.object(Persephone, "send_to_persephone")
+@patch.object(StepChecker, "get_onboarding_step")
+async def test_update_politically_exposed_data_for_us_with_conditional_write_retries_failed_publish(
+    get_onboarding_step_mock,
+    persephone_client_mock,
+    mocked_env,
+):
+    get_onboarding_step_mock.return_value = onboarding_step_correct_stub
+    persephone_client_mock.side_effect = [(False, 0), (True, 0)]
+    mongo_client = MongoClientStandIn()
+    users = mongo_client[UserRepository.database][UserRepository.collection]
+    await users.insert_one({"unique_id": "unique_id", "suitability": {"score": 1}})
+
+    with patch.object(
+        MongoDBInfrastructure, "get_client", return_value=mongo_client
+    ), patch.object(PoliticallyExposedService, "skipped_publishes", 0), patch.object(
+        PoliticallyExposedService, "unpublished_writes", 0
+    ), patch.object(
+        Gladsheim, "error"
+    ) as etria_error_mock:
+        with pytest.raises(InternalServerError):
+            await PoliticallyExposedService.update_politically_exposed_data_for_us(
+                politically_exposed_request_dummy
+            )
+        await PoliticallyExposedService.update_politically_exposed_data_for_us(
+            politically_exposed_request_dummy
+        )
+        await PoliticallyExposedService.update_politically_exposed_data_for_us(
+            politically_exposed_request_dummy
+        )
+        stats = PoliticallyExposedService.get_idempotency_stats()
+
+    assert persephone_client_mock.call_count == 2
+    assert stats["skipped_publishes"] == 1
+    assert stats["unpublished_writes"] == 1
+    assert etria_error_mock.called
+
+
+def single_flight_env(key, default=None, cast=None):
+    return {"SINGLE_FLIGHT_ENABLED": True}.get(key, default)
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=single_flight_env)
+@patch.object(UserRepository, "verify_if_user_has_suitability", return_value=True)
+@patch.object(UserRepository, "update_user")
+@patch.object(Persephone, "send_to_persephone")
+@patch.object(StepChecker, "get_onboarding_step")
+async def test_update_politically_exposed_data_for_us_with_single_flight(
+    get_onboarding_step_mock,
+    persephone_client_mock,
+    update_user_mock,
+    verify_risk,
+    mocked_env,
+):
+    get_onboarding_step_mock.return_value = onboarding_step_correct_stub
+    persephone_client_mock.return_value = (True, 0)
+    other_payload_request = PoliticallyExposedRequest(
+        x_thebes_answer="x_thebes_answer",
+        unique_id="unique_id",
+        politically_exposed=PoliticallyExposedCondition(is_politically_exposed=False),
+    )
+    with patch.object(PoliticallyExposedService, "single_flight_group", None):
+        await asyncio.gather(
+            *(
+                PoliticallyExposedService.update_politically_exposed_data_for_us(
+                    politically_exposed_request_dummy
+                )
+                for _ in range(3)
+            ),
+            PoliticallyExposedService.update_politically_exposed_data_for_us(
+                other_payload_request
+            ),
+        )
+        stats = PoliticallyExposedService.get_single_flight_group().get_stats()
+    assert persephone_client_mock.call_count == 2
+    assert update_user_mock.call_count == 2
+    assert stats["followers"] == 2
+    assert stats["serialized"] == 1
@@ -0,0 +1,47 @@
+from unittest.mock import patch
+
+import pytest
+from decouple import Config
+
+from src.domain.exceptions.model import InvalidStepError
+from src.domain.models.pipeline.model import PipelineStage, StagedPipeline
+from src.domain.enums.request_stage import RequestStage, StageCost
+from src.infrastructures.metrics.infrastructure import MetricsRegistry
+from src.infrastructures.metrics_exporter.infrastructure import InMemoryMetricsExporter
+from src.services.metrics.service import MetricsService
+
+
+async def check_step(context: dict):
+    raise InvalidStepError()
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", side_effect=lambda key, default=None: default)
+async def test_export_records_pipeline_stage_outcomes(mocked_env):
+    pipeline = StagedPipeline(
+        stages=[
+            PipelineStage(
+                name=RequestStage.STEP_CHECK,
+                cost=StageCost.NETWORK_CALL,
+                handler=check_step,
+            )
+        ]
+    )
+    exporter = InMemoryMetricsExporter()
+    with patch.object(MetricsRegistry, "enabled", True), patch.object(
+        MetricsRegistry, "histograms", {}
+    ), patch.object(MetricsRegistry, "collectors", {}), patch.object(
+        MetricsService, "collectors_registered", False
+    ):
+        with pytest.raises(InvalidStepError):
+            await pipeline.run(context={})
+        MetricsService.export(exporter)
+        metrics = MetricsService.get_prometheus_metrics()
+
+    (snapshot,) = exporter.snapshots
+    assert snapshot.get_outcome_counts("step_check") == {"InvalidStepError": 1}
+    assert "onboarding_pep_us_loop_registry_created" in snapshot.gauges
+    assert (
+        'onboarding_pep_us_stage_outcomes_total{stage="step_check",'
+        'outcome="InvalidStepError"} 1' in metrics
+    )
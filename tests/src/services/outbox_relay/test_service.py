@@ -0,0 +1,254 @@
+import asyncio
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from bson import ObjectId
+from decouple import Config
+from etria_logger import Gladsheim
+from pytest import fixture, mark
+
+from src.domain.enums.persephone_delivery import OutboxStatus
+from src.domain.models.outbox.model import OutboxRecord
+from src.infrastructures.mongo_db.infrastructure import MongoDBInfrastructure
+from tests.stand_ins.mongo import MongoClientStandIn
+from tests.stand_ins.persephone import PersephoneStandIn
+
+with patch.object(Config, "__call__"):
+    from src.repositories.outbox.repository import OutboxRepository
+    from src.services.outbox_relay.service import OutboxRelay
+
+
+def build_relay(persephone_client, max_attempts=3, batch_size=100):
+    return OutboxRelay(
+        persephone_client=persephone_client,
+        batch_size=batch_size,
+        poll_interval_in_seconds=0.01,
+        lease_in_seconds=30,
+        max_attempts=max_attempts,
+        retry_base_delay_in_seconds=0,
+        retry_max_delay_in_seconds=0,
+    )
+
+
+async def enqueue(unique_id, sequence, created_at=None, record_id=None):
+    await OutboxRepository.enqueue(
+        OutboxRecord(
+            unique_id=unique_id,
+            topic="topic",
+            partition=8,
+            schema_name="schema_name",
+            message={"unique_id": unique_id, "sequence": sequence},
+            created_at=created_at,
+            record_id=record_id,
+        )
+    )
+
+
+@fixture
+def mongo_client():
+    mongo_client = MongoClientStandIn()
+    with patch.object(
+        MongoDBInfrastructure, "get_client", return_value=mongo_client
+    ), patch.object(OutboxRepository, "sequence_collection", "outbox_sequences"):
+        yield mongo_client
+
+
+def get_sent_messages(persephone_client, unique_id):
+    return [
+        sent["message"]["sequence"]
+        for sent in persephone_client.messages
+        if sent["message"]["unique_id"] == unique_id
+    ]
+
+
+@mark.asyncio
+async def test_drain_once_sends_pending_records_in_order_per_user(mongo_client):
+    persephone_client = PersephoneStandIn()
+    relay = build_relay(persephone_client)
+    for sequence in range(3):
+        await enqueue("user_1", sequence)
+        await enqueue("user_2", sequence)
+
+    result = await relay.drain_once()
+
+    assert result == 6
+    assert get_sent_messages(persephone_client, "user_1") == [0, 1, 2]
+    assert get_sent_messages(persephone_client, "user_2") == [0, 1, 2]
+    assert await OutboxRepository.get_pending(limit=10) == []
+    assert relay.get_stats()["sent"] == 6
+
+
+@mark.asyncio
+async def test_drain_once_stops_user_records_after_failure(mongo_client):
+    persephone_client = PersephoneStandIn(failures=1)
+    relay = build_relay(persephone_client, batch_size=2)
+    await enqueue("user_1", 0)
+    await enqueue("user_1", 1)
+
+    first_result = await relay.drain_once()
+    second_result = await relay.drain_once()
+
+    assert first_result == 0
+    assert second_result == 2
+    assert get_sent_messages(persephone_client, "user_1") == [0, 1]
+    assert relay.get_stats()["retries"] == 1
+
+
+@mark.asyncio
+async def test_drain_once_blocks_user_while_retry_is_not_due(mongo_client):
+    persephone_client = PersephoneStandIn(failures=1)
+    relay = build_relay(persephone_client)
+    relay.retry_base_delay_in_seconds = relay.retry_max_delay_in_seconds = 60
+    await enqueue("user_1", 0)
+    await enqueue("user_1", 1)
+    await enqueue("user_2", 0)
+
+    await relay.drain_once()
+    result = await relay.drain_once()
+
+    assert result == 0
+    assert get_sent_messages(persephone_client, "user_1") == []
+    assert get_sent_messages(persephone_client, "user_2") == [0]
+
+
+@mark.asyncio
+async def test_drain_once_reaches_ready_record_behind_full_backed_off_batch(
+    mongo_client,
+):
+    persephone_client = PersephoneStandIn(failures=2)
+    relay = build_relay(persephone_client, batch_size=2)
+    relay.retry_base_delay_in_seconds = relay.retry_max_delay_in_seconds = 60
+    await enqueue("user_1", 0)
+    await enqueue("user_2", 1)
+    await enqueue("user_3", 2)
+
+    await relay.drain_once()
+    result = await relay.drain_once()
+
+    assert result == 1
+    assert get_sent_messages(persephone_client, "user_3") == [2]
+    assert relay.get_stats()["retries"] == 2
+
+
+@mark.asyncio
+async def test_drain_once_is_not_starved_by_records_behind_a_backed_off_one(
+    mongo_client,
+):
+    persephone_client = PersephoneStandIn(failures=1)
+    relay = build_relay(persephone_client, batch_size=2)
+    relay.retry_base_delay_in_seconds = relay.retry_max_delay_in_seconds = 60
+    for sequence in range(3):
+        await enqueue("user_1", sequence)
+    await enqueue("user_2", 0)
+
+    await relay.drain_once()
+    result = await relay.drain_once()
+
+    assert result == 1
+    assert get_sent_messages(persephone_client, "user_1") == []
+    assert get_sent_messages(persephone_client, "user_2") == [0]
+
+
+@mark.asyncio
+@patch.object(Gladsheim, "error")
+async def test_drain_once_dead_letters_after_max_attempts(
+    etria_error_mock, mongo_client
+):
+    persephone_client = PersephoneStandIn(failures=2)
+    relay = build_relay(persephone_client, max_attempts=2)
+    await enqueue("user_1", 0)
+    await enqueue("user_1", 1)
+
+    await relay.drain_once()
+    await relay.drain_once()
+    await relay.drain_once()
+
+    assert get_sent_messages(persephone_client, "user_1") == [1]
+    outbox_documents = mongo_client[OutboxRepository.database][
+        OutboxRepository.collection
+    ].documents
+    assert outbox_documents[0]["status"] == OutboxStatus.FAILED.value
+    assert relay.get_stats()["dead_lettered"] == 1
+    assert etria_error_mock.called
+
+
+@mark.asyncio
+@patch.object(Gladsheim, "error")
+async def test_drain_once_when_persephone_raises(etria_error_mock, mongo_client):
+    class FailingPersephoneStandIn:
+        @staticmethod
+        async def send_to_persephone(**kwargs):
+            raise ConnectionError()
+
+    relay = build_relay(FailingPersephoneStandIn)
+    await enqueue("user_1", 0)
+
+    result = await relay.drain_once()
+
+    assert result == 0
+    assert relay.get_stats()["retries"] == 1
+    assert etria_error_mock.called
+
+
+@mark.asyncio
+async def test_drain_once_keeps_user_order_when_created_at_is_skewed(mongo_client):
+    persephone_client = PersephoneStandIn()
+    relay = build_relay(persephone_client)
+    await enqueue("user_1", 0, created_at=datetime.utcnow() - timedelta(minutes=1))
+    await enqueue("user_1", 1, created_at=datetime.utcnow() - timedelta(minutes=5))
+
+    result = await relay.drain_once()
+
+    assert result == 2
+    assert get_sent_messages(persephone_client, "user_1") == [0, 1]
+
+
+@mark.asyncio
+async def test_drain_once_sends_earlier_record_outside_the_batch_first(mongo_client):
+    persephone_client = PersephoneStandIn()
+    relay = build_relay(persephone_client, batch_size=1)
+    later_record_id, earlier_record_id = ObjectId(), ObjectId()
+    await enqueue("user_1", 0, record_id=earlier_record_id)
+    await enqueue("user_1", 1, record_id=later_record_id)
+
+    result = await relay.drain_once()
+
+    assert result == 2
+    assert get_sent_messages(persephone_client, "user_1") == [0, 1]
+
+
+@mark.asyncio
+@patch.object(Gladsheim, "error")
+async def test_drain_once_when_persephone_hangs(etria_error_mock, mongo_client):
+    relay = build_relay(PersephoneStandIn(latency_in_seconds=1))
+    relay.send_timeout_in_seconds = 0.01
+    await enqueue("user_1", 0)
+
+    result = await relay.drain_once()
+
+    assert result == 0
+    assert relay.get_stats()["retries"] == 1
+    assert etria_error_mock.called
+
+
+@mark.asyncio
+async def test_start_drains_in_a_background_thread(mongo_client):
+    persephone_client = PersephoneStandIn()
+    relay = build_relay(persephone_client)
+    relay.poll_interval_in_seconds = 10
+    await enqueue("user_1", 0)
+
+    relay.start()
+    relay.start()
+    try:
+        assert relay.is_running()
+        relay.notify()
+        for _ in range(100):
+            if persephone_client.messages:
+                break
+            await asyncio.sleep(0.01)
+    finally:
+        await relay.stop()
+
+    assert get_sent_messages(persephone_client, "user_1") == [0]
+    assert not relay.is_running()
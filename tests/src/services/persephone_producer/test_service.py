@@ -0,0 +1,160 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+from pytest import mark
+
+from src.services.persephone_producer.service import BatchingPersephoneProducer
+from tests.stand_ins.persephone import PersephoneStandIn
+
+
+def build_producer(
+    persephone_client, linger_in_seconds=0.01, max_batch_size=100, max_in_flight=100
+):
+    return BatchingPersephoneProducer(
+        persephone_client=persephone_client,
+        linger_in_seconds=linger_in_seconds,
+        max_batch_size=max_batch_size,
+        max_in_flight=max_in_flight,
+    )
+
+
+async def send(producer, sequence):
+    return await producer.send_to_persephone(
+        topic="topic",
+        partition=8,
+        message={"sequence": sequence},
+        schema_name="schema_name",
+    )
+
+
+@mark.asyncio
+async def test_send_to_persephone_flushes_messages_after_linger():
+    persephone_client = PersephoneStandIn()
+    producer = build_producer(persephone_client)
+
+    result = await asyncio.gather(*(send(producer, sequence) for sequence in range(5)))
+
+    assert result == [(True, "sent")] * 5
+    assert len(persephone_client.messages) == 5
+    assert producer.get_stats()["batches"] == 1
+    assert producer.get_stats()["average_batch_size"] == 5
+
+
+@mark.asyncio
+async def test_send_to_persephone_flushes_when_batch_is_full():
+    persephone_client = PersephoneStandIn()
+    producer = build_producer(persephone_client, linger_in_seconds=10, max_batch_size=2)
+
+    result = await asyncio.wait_for(
+        asyncio.gather(*(send(producer, sequence) for sequence in range(4))),
+        timeout=1,
+    )
+
+    assert result == [(True, "sent")] * 4
+    assert producer.get_stats()["batches"] == 2
+
+
+@mark.asyncio
+async def test_send_to_persephone_resolves_each_caller_with_its_own_result():
+    persephone_client = PersephoneStandIn(failures=1)
+    producer = build_producer(persephone_client)
+
+    result = await asyncio.gather(*(send(producer, sequence) for sequence in range(3)))
+
+    assert sorted(result) == [(False, "failed"), (True, "sent"), (True, "sent")]
+    assert producer.get_stats()["failures"] == 1
+
+
+@mark.asyncio
+async def test_send_to_persephone_raises_caller_exception():
+    class FailingPersephone:
+        @staticmethod
+        async def send_to_persephone(message, **kwargs):
+            if message["sequence"] == 1:
+                raise ConnectionError()
+            return True, "sent"
+
+    producer = build_producer(FailingPersephone)
+
+    result = await asyncio.gather(
+        *(send(producer, sequence) for sequence in range(3)), return_exceptions=True
+    )
+
+    assert result[0] == (True, "sent")
+    assert isinstance(result[1], ConnectionError)
+    assert result[2] == (True, "sent")
+
+
+@mark.asyncio
+async def test_send_to_persephone_applies_backpressure_over_max_in_flight():
+    persephone_client = PersephoneStandIn(latency_in_seconds=0.05)
+    producer = build_producer(
+        persephone_client, linger_in_seconds=10, max_batch_size=2, max_in_flight=2
+    )
+
+    sends = [asyncio.ensure_future(send(producer, sequence)) for sequence in range(4)]
+    await asyncio.sleep(0.01)
+
+    assert persephone_client.calls == 2
+    await asyncio.gather(*sends)
+    assert persephone_client.calls == 4
+
+
+@mark.asyncio
+async def test_flush_sends_buffered_messages_immediately():
+    persephone_client = PersephoneStandIn()
+    producer = build_producer(persephone_client, linger_in_seconds=10)
+
+    pending_send = asyncio.ensure_future(send(producer, 0))
+    await asyncio.sleep(0)
+    await producer.flush()
+
+    assert await pending_send == (True, "sent")
+
+
+def test_send_to_persephone_keeps_batches_of_concurrent_loops_apart():
+    persephone_client = PersephoneStandIn()
+    producer = build_producer(persephone_client, linger_in_seconds=0.05)
+
+    async def send_from_loop(first_sequence):
+        return await asyncio.gather(
+            *(
+                send(producer, sequence)
+                for sequence in range(first_sequence, first_sequence + 3)
+            )
+        )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(
+            executor.map(lambda sequence: asyncio.run(send_from_loop(sequence)), [0, 3])
+        )
+
+    assert results == [[(True, "sent")] * 3] * 2
+    assert len(persephone_client.messages) == 6
+    assert producer.get_stats()["batches"] == 2
+
+
+def test_send_to_persephone_flushes_messages_left_on_a_closed_loop():
+    persephone_client = PersephoneStandIn()
+    producer = build_producer(persephone_client, linger_in_seconds=10)
+
+    async def buffer_and_leave():
+        asyncio.ensure_future(send(producer, 0))
+        await asyncio.sleep(0)
+
+    closed_loop = asyncio.new_event_loop()
+    closed_loop.run_until_complete(buffer_and_leave())
+    closed_loop.close()
+
+    async def send_and_flush():
+        pending_send = asyncio.ensure_future(send(producer, 1))
+        await asyncio.sleep(0)
+        await producer.flush()
+        return await pending_send
+
+    assert asyncio.run(send_and_flush()) == (True, "sent")
+    assert [sent["message"] for sent in persephone_client.messages] == [
+        {"sequence": 0},
+        {"sequence": 1},
+    ]
+    assert producer.get_stats()["adopted"] == 1
@@ -0,0 +1,169 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.services.single_flight.service import SingleFlightGroup
+
+
+class OperationStandIn:
+    def __init__(self, result=None, error: Exception = None, latency_in_seconds=0.01):
+        self.result = result
+        self.error = error
+        self.latency_in_seconds = latency_in_seconds
+        self.calls = 0
+        self.running = 0
+        self.max_running = 0
+
+    async def __call__(self):
+        self.calls += 1
+        self.running += 1
+        self.max_running = max(self.max_running, self.running)
+        try:
+            await asyncio.sleep(self.latency_in_seconds)
+        finally:
+            self.running -= 1
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+
+@pytest.mark.asyncio
+async def test_run_coalesces_concurrent_calls_with_the_same_key():
+    single_flight_group = SingleFlightGroup()
+    operation = OperationStandIn(result="result")
+    results = await asyncio.gather(
+        *(
+            single_flight_group.run(key="user:hash", lane="user", operation=operation)
+            for _ in range(5)
+        )
+    )
+    assert results == ["result"] * 5
+    assert operation.calls == 1
+    assert single_flight_group.get_stats() == {
+        "leaders": 1,
+        "followers": 4,
+        "serialized": 0,
+        "in_flight": 0,
+    }
+
+
+@pytest.mark.asyncio
+async def test_run_serializes_different_keys_in_the_same_lane():
+    single_flight_group = SingleFlightGroup()
+    operation = OperationStandIn()
+    await asyncio.gather(
+        single_flight_group.run(key="user:first", lane="user", operation=operation),
+        single_flight_group.run(key="user:second", lane="user", operation=operation),
+    )
+    assert operation.calls == 2
+    assert operation.max_running == 1
+    assert single_flight_group.get_stats()["serialized"] == 1
+
+
+@pytest.mark.asyncio
+async def test_run_keeps_different_lanes_concurrent():
+    single_flight_group = SingleFlightGroup()
+    operation = OperationStandIn()
+    await asyncio.gather(
+        single_flight_group.run(key="first:hash", lane="first", operation=operation),
+        single_flight_group.run(key="second:hash", lane="second", operation=operation),
+    )
+    assert operation.calls == 2
+    assert operation.max_running == 2
+
+
+@pytest.mark.asyncio
+async def test_run_shares_the_leader_error_with_followers():
+    single_flight_group = SingleFlightGroup()
+    operation = OperationStandIn(error=ValueError("failed"))
+    results = await asyncio.gather(
+        *(
+            single_flight_group.run(key="user:hash", lane="user", operation=operation)
+            for _ in range(3)
+        ),
+        return_exceptions=True,
+    )
+    assert operation.calls == 1
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_run_starts_a_new_flight_after_the_previous_one_finished():
+    single_flight_group = SingleFlightGroup()
+    operation = OperationStandIn()
+    await single_flight_group.run(key="user:hash", lane="user", operation=operation)
+    await single_flight_group.run(key="user:hash", lane="user", operation=operation)
+    assert operation.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_run_when_leader_is_cancelled_followers_still_get_the_result():
+    single_flight_group = SingleFlightGroup()
+    operation = OperationStandIn(result="result")
+    leader = asyncio.ensure_future(
+        single_flight_group.run(key="user:hash", lane="user", operation=operation)
+    )
+    await asyncio.sleep(0)
+    follower = asyncio.ensure_future(
+        single_flight_group.run(key="user:hash", lane="user", operation=operation)
+    )
+    await asyncio.sleep(0)
+    leader.cancel()
+    assert await follower == "result"
+    assert operation.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_run_does_not_coalesce_past_a_different_key_queued_in_the_lane():
+    single_flight_group = SingleFlightGroup()
+    applied = []
+
+    def build_operation(payload):
+        async def operation():
+            await asyncio.sleep(0.01)
+            applied.append(payload)
+            return payload
+
+        return operation
+
+    results = await asyncio.gather(
+        single_flight_group.run(
+            key="user:p1", lane="user", operation=build_operation("A")
+        ),
+        single_flight_group.run(
+            key="user:p2", lane="user", operation=build_operation("B")
+        ),
+        single_flight_group.run(
+            key="user:p1", lane="user", operation=build_operation("C")
+        ),
+    )
+    assert applied == ["A", "B", "C"]
+    assert results == ["A", "B", "C"]
+    assert single_flight_group.get_stats()["in_flight"] == 0
+
+
+def test_run_keeps_flights_of_concurrent_loops_apart():
+    single_flight_group = SingleFlightGroup()
+    operation = OperationStandIn(result="result", latency_in_seconds=0.05)
+
+    async def run_from_loop():
+        return await asyncio.gather(
+            *(
+                single_flight_group.run(
+                    key="user:hash", lane="user", operation=operation
+                )
+                for _ in range(3)
+            )
+        )
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        results = list(executor.map(lambda _: asyncio.run(run_from_loop()), range(2)))
+
+    assert results == [["result"] * 3] * 2
+    assert single_flight_group.get_stats() == {
+        "leaders": 2,
+        "followers": 4,
+        "serialized": 0,
+        "in_flight": 0,
+    }
@@ -0,0 +1,135 @@
+import asyncio
+from unittest.mock import patch, AsyncMock
+
+from decouple import Config
+from etria_logger import Gladsheim
+from pytest import fixture, mark
+
+from src.domain.models.jwt_data.model import Jwt
+from src.infrastructures.mongo_db.infrastructure import MongoDBInfrastructure
+from src.services.warmup.service import WarmupService
+from src.transport.user_step.transport import StepChecker
+
+
+def warmup_env(offline_verification_enabled=False):
+    env = {
+        "WARMUP_ENABLED": True,
+        "WARMUP_TIMEOUT_IN_SECONDS": 0.05,
+        "URL_ONBOARDING_STEP_BR": "http://steps_br",
+        "URL_ONBOARDING_STEP_US": "http://steps_us",
+        "JWT_OFFLINE_VERIFICATION_ENABLED": offline_verification_enabled,
+    }
+
+    def get_env(key, default=None, cast=None):
+        return env.get(key, default)
+
+    return get_env
+
+
+@fixture(autouse=True)
+def reset_warmup():
+    with patch.object(WarmupService, "readiness", {}), patch.object(
+        WarmupService, "warmup_started", False
+    ), patch.object(WarmupService, "warmup_duration_in_seconds", None), patch.object(
+        WarmupService, "warmed_loop", None
+    ):
+        yield
+
+
+@mark.asyncio
+@patch.object(Config, "__call__", side_effect=warmup_env())
+@patch.object(StepChecker, "pre_connect")
+@patch.object(MongoDBInfrastructure, "ping")
+async def test_ensure_warm(ping_mock, pre_connect_mock, mocked_env):
+    await asyncio.gather(WarmupService.ensure_warm(), WarmupService.ensure_warm())
+
+    assert ping_mock.call_count == 1
+    assert pre_connect_mock.call_count == 2
+    readiness = WarmupService.get_readiness()
+    assert readiness["ready"] is True
+    assert readiness["dependencies"]["mongo_db"]["status"] == "warm"
+    assert readiness["dependencies"]["onboarding_step_br"]["status"] == "warm"
+    assert readiness["dependencies"]["signing_keys"]["status"] == "skipped"
+    assert readiness["warmup_duration_in_seconds"] is not None
+
+
+@mark.asyncio
+@patch.object(Config, "__call__", side_effect=warmup_env())
+@patch.object(StepChecker, "pre_connect")
+@patch.object(MongoDBInfrastructure, "ping")
+async def test_ensure_warm_runs_once_per_process(
+    ping_mock, pre_connect_mock, mocked_env
+):
+    await WarmupService.ensure_warm()
+    await asyncio.get_running_loop().run_in_executor(
+        None, asyncio.run, WarmupService.ensure_warm()
+    )
+
+    assert ping_mock.call_count == 1
+    assert WarmupService.get_readiness()["ready"] is True
+
+
+@mark.asyncio
+@patch.object(Config, "__call__", side_effect=warmup_env())
+@patch.object(StepChecker, "pre_connect")
+@patch.object(MongoDBInfrastructure, "ping")
+async def test_get_readiness_when_warmed_loop_is_gone(
+    ping_mock, pre_connect_mock, mocked_env
+):
+    await asyncio.get_running_loop().run_in_executor(
+        None, asyncio.run, WarmupService.ensure_warm()
+    )
+
+    readiness = WarmupService.get_readiness()
+    assert readiness["ready"] is False
+    assert readiness["resources_live"] is False
+    assert readiness["dependencies"]["mongo_db"]["status"] == "warm"
+
+
+@mark.asyncio
+@patch.object(Config, "__call__", side_effect=warmup_env())
+@patch.object(Gladsheim, "warning")
+@patch.object(StepChecker, "pre_connect")
+@patch.object(MongoDBInfrastructure, "ping")
+async def test_ensure_warm_when_dependency_fails_or_hangs(
+    ping_mock, pre_connect_mock, etria_warning_mock, mocked_env
+):
+    async def hang(url):
+        await asyncio.sleep(1)
+
+    ping_mock.side_effect = ConnectionError()
+    pre_connect_mock.side_effect = hang
+
+    await WarmupService.ensure_warm()
+
+    readiness = WarmupService.get_readiness()
+    assert readiness["ready"] is False
+    assert readiness["dependencies"]["mongo_db"]["status"] == "failed"
+    assert readiness["dependencies"]["onboarding_step_us"]["status"] == "failed"
+    assert etria_warning_mock.call_count == 3
+
+
+@mark.asyncio
+@patch.object(Config, "__call__", side_effect=warmup_env(True))
+@patch.object(StepChecker, "pre_connect")
+@patch.object(MongoDBInfrastructure, "ping")
+async def test_ensure_warm_primes_signing_keys(ping_mock, pre_connect_mock, mocked_env):
+    signing_key_set_mock = AsyncMock()
+    with patch.object(Jwt, "signing_key_set", signing_key_set_mock):
+        await WarmupService.ensure_warm()
+
+    assert signing_key_set_mock.refresh.called
+    readiness = WarmupService.get_readiness()
+    assert readiness["dependencies"]["signing_keys"]["status"] == "warm"
+
+
+@mark.asyncio
+@patch.object(
+    Config, "__call__", side_effect=lambda key, default=None, cast=None: default
+)
+@patch.object(MongoDBInfrastructure, "ping")
+async def test_ensure_warm_when_warmup_is_disabled(ping_mock, mocked_env):
+    await WarmupService.ensure_warm()
+
+    assert not ping_mock.called
+    assert WarmupService.get_readiness()["ready"] is True
@@ -0,0 +1,46 @@
+from unittest.mock import patch
+
+import aiohttp
+import pytest
+from decouple import Config
+from etria_logger import Gladsheim
+
+from src.transport.signing_keys.transport import SigningKeysTransport
+from tests.stand_ins.key_server import KeyServerStandIn
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "error")
+async def test_get_signing_keys(etria_error_mock):
+    key_server = KeyServerStandIn(kid="signing-key-1")
+    signing_keys_url = await key_server.start()
+    session = aiohttp.ClientSession()
+    try:
+        with patch.object(
+            Config,
+            "__call__",
+            side_effect=lambda key, default=None, cast=None: (
+                signing_keys_url if key == "JWT_SIGNING_KEYS_URL" else default
+            ),
+        ), patch.object(SigningKeysTransport, "get_session", return_value=session):
+            result = await SigningKeysTransport.get_signing_keys()
+    finally:
+        await session.close()
+        await key_server.stop()
+
+    assert [key["kid"] for key in result["keys"]] == ["signing-key-1"]
+    assert key_server.requests == 1
+    assert not etria_error_mock.called
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "error")
+@patch.object(Config, "__call__")
+@patch.object(SigningKeysTransport, "get_session")
+async def test_get_signing_keys_when_exception_occurs(
+    get_session_mock, mocked_env, etria_error_mock
+):
+    get_session_mock.side_effect = Exception()
+    with pytest.raises(Exception):
+        await SigningKeysTransport.get_signing_keys()
+    assert etria_error_mock.called
@@ -4,7 +4,13 @@ import pytest
 from decouple import Config
 from etria_logger import Gladsheim
 
+from src.domain.enums.circuit_breaker import CircuitBreakerDependency
+from src.domain.exceptions.model import CircuitOpenError
 from src.domain.models.user_data.onboarding_step.model import UserOnboardingStep
+from src.infrastructures.cache.infrastructure import TtlLruCache
+from src.infrastructures.circuit_breaker.infrastructure import CircuitBreakerRegistry
+from src.infrastructures.tracing.infrastructure import Tracer
+from src.infrastructures.tracing_exporter.infrastructure import InMemorySpanExporter
 from src.transport.user_step.transport import StepChecker
 
 
@@ -93,3 +99,134 @@ async def test_get_onboarding_step_when_one_step_is_false(steps_br_mock, steps_u
     result = await StepChecker.get_onboarding_step("x-thebes-answer")
     assert isinstance(result, UserOnboardingStep)
     assert result.is_in_correct_step() is False
+
+
+@pytest.fixture
+def step_cache():
+    StepChecker.negative_ttl_in_seconds = 1
+    StepChecker.step_cache = TtlLruCache(max_size=10, ttl_in_seconds=5)
+    yield StepChecker.step_cache
+    StepChecker.step_cache = None
+    StepChecker.negative_ttl_in_seconds = None
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", return_value=True)
+@patch.object(StepChecker, "_get_step_br", return_value="finished")
+@patch.object(StepChecker, "_get_step_us", return_value="politically_exposed")
+async def test_get_onboarding_step_when_steps_are_cached(
+    steps_us_mock, steps_br_mock, mocked_env, step_cache
+):
+    await StepChecker.get_onboarding_step("x-thebes-answer", unique_id="unique_id")
+    result = await StepChecker.get_onboarding_step(
+        "x-thebes-answer", unique_id="unique_id"
+    )
+    assert result.is_in_correct_step() is True
+    steps_br_mock.assert_called_once_with(x_thebes_answer="x-thebes-answer")
+    steps_us_mock.assert_called_once_with(x_thebes_answer="x-thebes-answer")
+    assert StepChecker.get_step_cache_stats()["hits"] == 2
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", return_value=True)
+@patch.object(StepChecker, "_get_step_br", return_value="finished")
+@patch.object(StepChecker, "_get_step_us", return_value="some_step")
+async def test_get_onboarding_step_caches_wrong_step_with_negative_ttl(
+    steps_us_mock, steps_br_mock, mocked_env, step_cache
+):
+    with patch.object(step_cache, "set") as cache_set_mock:
+        result = await StepChecker.get_onboarding_step(
+            "x-thebes-answer", unique_id="unique_id"
+        )
+    assert result.is_in_correct_step() is False
+    cache_set_mock.assert_any_call(("unique_id", "br"), "finished", ttl_in_seconds=5)
+    cache_set_mock.assert_any_call(("unique_id", "us"), "some_step", ttl_in_seconds=1)
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", return_value=False)
+@patch.object(StepChecker, "_get_step_br", return_value="finished")
+@patch.object(StepChecker, "_get_step_us", return_value="politically_exposed")
+async def test_get_onboarding_step_when_cache_is_disabled(
+    steps_us_mock, steps_br_mock, mocked_env, step_cache
+):
+    await StepChecker.get_onboarding_step("x-thebes-answer", unique_id="unique_id")
+    await StepChecker.get_onboarding_step("x-thebes-answer", unique_id="unique_id")
+    assert steps_br_mock.call_count == 2
+    assert len(step_cache) == 0
+
+
+@pytest.mark.asyncio
+@patch.object(Config, "__call__", return_value=True)
+@patch.object(StepChecker, "_get_step_br", return_value="finished")
+@patch.object(StepChecker, "_get_step_us", return_value="politically_exposed")
+async def test_invalidate_step_us(steps_us_mock, steps_br_mock, mocked_env, step_cache):
+    await StepChecker.get_onboarding_step("x-thebes-answer", unique_id="unique_id")
+    StepChecker.invalidate_step_us(unique_id="unique_id")
+    await StepChecker.get_onboarding_step("x-thebes-answer", unique_id="unique_id")
+    assert steps_br_mock.call_count == 1
+    assert steps_us_mock.call_count == 2
+
+
+def circuit_breaker_env(key, default=None, cast=None):
+    env = {"CIRCUIT_BREAKER_ENABLED": True, "CIRCUIT_BREAKER_MINIMUM_CALLS": 1}
+    return env.get(key, default)
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "warning")
+@patch.object(Gladsheim, "error")
+@patch.object(Config, "__call__", side_effect=circuit_breaker_env)
+@patch.object(StepChecker, "get_session")
+async def test__get_step_br_when_circuit_is_open(
+    get_session_mock, mocked_env, etria_error_mock, etria_warning_mock
+):
+    get_session_mock.side_effect = Exception()
+    with patch.object(CircuitBreakerRegistry, "breakers", {}):
+        with pytest.raises(Exception):
+            await StepChecker._get_step_br("x-thebes-answer")
+        with pytest.raises(CircuitOpenError):
+            await StepChecker._get_step_br("x-thebes-answer")
+        circuit_breaker = CircuitBreakerRegistry.get_breaker(
+            CircuitBreakerDependency.ONBOARDING_STEP_BR
+        )
+    assert get_session_mock.call_count == 1
+    assert circuit_breaker.get_stats()["rejected"] == 1
+
+
+def hedging_env(key, default=None, cast=None):
+    return {"ONBOARDING_STEP_HEDGING_ENABLED": True}.get(key, default)
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "error")
+@patch.object(Config, "__call__", side_effect=hedging_env)
+@patch.object(StepChecker, "get_session")
+async def test__get_step_us_with_hedging(get_session_mock, mocked_env, etria_error_mock):
+    steps_response_dummy = {"result": {"current_step": "politically_exposed"}}
+    get_session_mock.return_value = SessionMock(steps_response_dummy)
+    with patch.object(StepChecker, "hedgers", {}):
+        result = await StepChecker._get_step_us("x-thebes-answer")
+        hedging_stats = StepChecker.get_hedging_stats()
+    assert result == "politically_exposed"
+    assert hedging_stats["onboarding_step_us"]["requests"] == 1
+
+
+@pytest.mark.asyncio
+@patch.object(Gladsheim, "error")
+@patch.object(Config, "__call__")
+@patch.object(StepChecker, "get_session")
+async def test__get_step_br_propagates_trace_context(
+    get_session_mock, mocked_env, etria_error_mock
+):
+    session_mock = SessionMock({"result": {"current_step": "finished"}})
+    get_session_mock.return_value = session_mock
+    span_exporter = InMemorySpanExporter()
+    with patch.object(Tracer, "enabled", True), patch.object(
+        Tracer, "exporters", [span_exporter]
+    ), patch.object(session_mock, "get", wraps=session_mock.get) as get_mock:
+        await StepChecker._get_step_br("x-thebes-answer")
+    (stage_span,) = span_exporter.get_spans("StepChecker::_get_step_br")
+    headers = get_mock.call_args.kwargs["headers"]
+    assert headers["x_thebes_answer"] == "x-thebes-answer"
+    assert headers["traceparent"] == stage_span.context.to_traceparent()
@@ -0,0 +1,50 @@
+import asyncio
+from collections import Counter
+from random import Random
+
+
+class FaultProfile:
+    def __init__(
+        self,
+        name: str,
+        seed: int = 0,
+        latency_in_seconds: float = 0,
+        tail_ratio: float = 0,
+        tail_latency_in_seconds: float = 0,
+        error_ratio: float = 0,
+    ):
+        self.name = name
+        self.seed = seed
+        self.latency_in_seconds = latency_in_seconds
+        self.tail_ratio = tail_ratio
+        self.tail_latency_in_seconds = tail_latency_in_seconds
+        self.error_ratio = error_ratio
+        self.enabled = True
+        self.calls = 0
+        self.tails = 0
+        self.errors = 0
+        self.__calls_per_key = Counter()
+
+    def __get_random(self, key: str) -> Random:
+        call = self.__calls_per_key[key]
+        self.__calls_per_key[key] += 1
+        return Random(f"{self.seed}:{self.name}:{key}:{call}")
+
+    async def inject(self, key: str) -> bool:
+        if not self.enabled:
+            return False
+        self.calls += 1
+        random = self.__get_random(key)
+        latency_in_seconds = self.latency_in_seconds
+        if random.random() < self.tail_ratio:
+            self.tails += 1
+            latency_in_seconds += self.tail_latency_in_seconds
+        if latency_in_seconds:
+            await asyncio.sleep(latency_in_seconds)
+        fails = random.random() < self.error_ratio
+        self.errors += int(fails)
+        return fails
+
+    def get_stats(self) -> dict:
+        stats = {"calls": self.calls, "tails": self.tails, "errors": self.errors}
+        return stats
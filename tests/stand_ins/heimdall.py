@@ -0,0 +1,27 @@
+import asyncio
+
+from heimdall_client import HeimdallStatusResponses
+
+from tests.stand_ins.faults import FaultProfile
+
+
+class HeimdallStandIn:
+    def __init__(
+        self, latency_in_seconds: float = 0, fault_profile: FaultProfile = None
+    ):
+        self.latency_in_seconds = latency_in_seconds
+        self.fault_profile = fault_profile
+        self.calls = 0
+
+    async def decode_payload(self, jwt: str):
+        self.calls += 1
+        if self.latency_in_seconds:
+            await asyncio.sleep(self.latency_in_seconds)
+        if self.fault_profile is not None and await self.fault_profile.inject(key=jwt):
+            raise ConnectionError("Injected Heimdall fault")
+        jwt_content = {
+            "is_payload_decoded": True,
+            "decoded_jwt": {"user": {"unique_id": jwt}},
+            "message": "Jwt decoded",
+        }
+        return jwt_content, HeimdallStatusResponses.SUCCESS
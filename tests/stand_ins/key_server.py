@@ -0,0 +1,61 @@
+import asyncio
+import json
+from time import time
+
+import jwt
+from aiohttp import web
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jwt.algorithms import RSAAlgorithm
+
+
+class KeyServerStandIn:
+    def __init__(self, kid: str = "signing-key-1", latency_in_seconds: float = 0):
+        self.private_keys = {}
+        self.latency_in_seconds = latency_in_seconds
+        self.requests = 0
+        self.__runner = None
+        self.add_key(kid=kid)
+
+    def add_key(self, kid: str):
+        self.private_keys[kid] = rsa.generate_private_key(
+            public_exponent=65537, key_size=2048
+        )
+
+    def sign(self, kid: str, payload: dict = None, expires_in: float = 3600) -> str:
+        payload = payload or {"user": {"unique_id": "unique_id"}}
+        payload = {"exp": int(time() + expires_in), **payload}
+        token = jwt.encode(
+            payload,
+            self.private_keys[kid],
+            algorithm="RS256",
+            headers={"kid": kid},
+        )
+        return token
+
+    def get_signing_keys(self) -> dict:
+        keys = []
+        for kid, private_key in self.private_keys.items():
+            public_key = json.loads(RSAAlgorithm.to_jwk(private_key.public_key()))
+            keys.append({**public_key, "kid": kid, "alg": "RS256", "use": "sig"})
+        return {"keys": keys}
+
+    async def __handle_signing_keys(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        if self.latency_in_seconds:
+            await asyncio.sleep(self.latency_in_seconds)
+        return web.json_response(self.get_signing_keys())
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_get("/signing_keys", self.__handle_signing_keys)
+        self.__runner = web.AppRunner(app)
+        await self.__runner.setup()
+        site = web.TCPSite(self.__runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}/signing_keys"
+
+    async def stop(self):
+        if self.__runner is not None:
+            await self.__runner.cleanup()
+            self.__runner = None
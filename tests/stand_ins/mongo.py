@@ -0,0 +1,387 @@
+import asyncio
+from copy import deepcopy
+
+from bson import ObjectId
+from pymongo import ReturnDocument
+from pymongo.errors import AutoReconnect
+
+from tests.stand_ins.faults import FaultProfile
+
+_MISSING = object()
+
+
+def get_field(document: dict, field: str):
+    value = document
+    for key in field.split("."):
+        if not isinstance(value, dict) or key not in value:
+            return _MISSING
+        value = value[key]
+    return value
+
+
+def set_field(document: dict, field: str, value):
+    keys = field.split(".")
+    for key in keys[:-1]:
+        document = document.setdefault(key, {})
+    document[keys[-1]] = value
+
+
+def unset_field(document: dict, field: str):
+    keys = field.split(".")
+    for key in keys[:-1]:
+        document = document.get(key)
+        if not isinstance(document, dict):
+            return
+    document.pop(keys[-1], None)
+
+
+def matches_condition(value, condition) -> bool:
+    if isinstance(condition, dict) and any(key.startswith("$") for key in condition):
+        for operator, operand in condition.items():
+            if operator == "$exists" and (value is not _MISSING) != operand:
+                return False
+            if operator == "$eq" and not matches_condition(value, operand):
+                return False
+            if operator == "$ne" and matches_condition(value, operand):
+                return False
+            if operator == "$in" and not any(
+                matches_condition(value, item) for item in operand
+            ):
+                return False
+            if operator == "$nin" and any(
+                matches_condition(value, item) for item in operand
+            ):
+                return False
+            if operator in ("$lt", "$lte", "$gt", "$gte"):
+                if value is _MISSING or value is None:
+                    return False
+                comparison = {
+                    "$lt": value < operand,
+                    "$lte": value <= operand,
+                    "$gt": value > operand,
+                    "$gte": value >= operand,
+                }
+                if not comparison[operator]:
+                    return False
+        return True
+    if condition is None:
+        return value is _MISSING or value is None
+    return value == condition
+
+
+def matches(document: dict, query: dict) -> bool:
+    for key, condition in query.items():
+        if key == "$comment":
+            continue
+        if key == "$or":
+            if not any(matches(document, sub_query) for sub_query in condition):
+                return False
+            continue
+        if key == "$and":
+            if not all(matches(document, sub_query) for sub_query in condition):
+                return False
+            continue
+        if not matches_condition(get_field(document, key), condition):
+            return False
+    return True
+
+
+def evaluate(document: dict, expression):
+    if isinstance(expression, str) and expression.startswith("$"):
+        return get_field(document, expression[1:])
+    if isinstance(expression, list):
+        return [evaluate(document, item) for item in expression]
+    if isinstance(expression, dict):
+        if "$literal" in expression:
+            return expression["$literal"]
+        if "$cond" in expression:
+            condition = expression["$cond"]
+            if isinstance(condition, dict):
+                condition = [condition["if"], condition["then"], condition["else"]]
+            if_value = evaluate(document, condition[0])
+            is_true = if_value not in (_MISSING, None, False, 0)
+            return evaluate(document, condition[1] if is_true else condition[2])
+        if "$not" in expression:
+            (value,) = expression["$not"]
+            return evaluate(document, value) in (_MISSING, None, False, 0)
+        if "$in" in expression:
+            value, candidates = evaluate(document, expression["$in"])
+            return any(
+                value == candidate and type(value) is type(candidate)
+                for candidate in candidates
+            )
+        if "$ifNull" in expression:
+            value, replacement = expression["$ifNull"]
+            value = evaluate(document, value)
+            if value in (_MISSING, None):
+                return evaluate(document, replacement)
+            return value
+        return {key: evaluate(document, value) for key, value in expression.items()}
+    return expression
+
+
+def apply_update(document: dict, update):
+    if isinstance(update, list):
+        for stage in update:
+            for field, expression in stage.get("$set", {}).items():
+                value = evaluate(document, expression)
+                if value is not _MISSING:
+                    set_field(document, field, deepcopy(value))
+        return
+    for field, value in update.get("$set", {}).items():
+        set_field(document, field, deepcopy(value))
+    for field in update.get("$unset", {}):
+        unset_field(document, field)
+    for field, value in update.get("$inc", {}).items():
+        current = get_field(document, field)
+        set_field(document, field, (0 if current is _MISSING else current) + value)
+
+
+def project(document: dict, projection) -> dict:
+    if projection is None:
+        return deepcopy(document)
+    if isinstance(projection, (list, tuple)):
+        projection = {field: True for field in projection}
+    projected = {}
+    if projection.get("_id", True):
+        projected["_id"] = document["_id"]
+    for field, include in projection.items():
+        if field == "_id" or not include:
+            continue
+        value = get_field(document, field)
+        if value is not _MISSING:
+            set_field(projected, field, deepcopy(value))
+    return projected
+
+
+class UpdateResultStandIn:
+    def __init__(self, matched_count: int, modified_count: int):
+        self.matched_count = matched_count
+        self.modified_count = modified_count
+
+
+class BulkWriteResultStandIn:
+    def __init__(self, matched_count: int, modified_count: int):
+        self.matched_count = matched_count
+        self.modified_count = modified_count
+
+
+class CursorStandIn:
+    def __init__(self, documents: list):
+        self.documents = documents
+
+    def sort(self, keys: list):
+        for field, direction in reversed(keys):
+            self.documents.sort(
+                key=lambda document: get_field(document, field),
+                reverse=direction < 0,
+            )
+        return self
+
+    def limit(self, limit: int):
+        self.documents = self.documents[:limit]
+        return self
+
+    async def to_list(self, length: int = None):
+        return self.documents[:length]
+
+
+class CollectionStandIn:
+    def __init__(self, client=None):
+        self.client = client
+        self.documents = []
+        self.operations = []
+
+    async def __connect(self, query: dict = None):
+        if self.client is not None:
+            await self.client.connect()
+            await self.client.inject_fault(query=query)
+
+    def __find_document(self, query: dict):
+        for document in self.documents:
+            if matches(document, query):
+                return document
+        return None
+
+    async def insert_one(self, document: dict, session=None):
+        await self.__connect()
+        self.operations.append("insert_one")
+        document = deepcopy(document)
+        document.setdefault("_id", ObjectId())
+        self.documents.append(document)
+        return document["_id"]
+
+    async def find_one(self, query: dict, projection=None, session=None, **kwargs):
+        await self.__connect(query=query)
+        self.operations.append("find_one")
+        document = self.__find_document(query)
+        return None if document is None else project(document, projection)
+
+    def find(self, query: dict = None, projection=None, **kwargs):
+        self.operations.append("find")
+        documents = [
+            project(document, projection)
+            for document in self.documents
+            if matches(document, query or {})
+        ]
+        return CursorStandIn(documents)
+
+    async def update_one(self, query: dict, update, session=None, **kwargs):
+        await self.__connect(query=query)
+        self.operations.append("update_one")
+        document = self.__find_document(query)
+        if document is None:
+            return UpdateResultStandIn(matched_count=0, modified_count=0)
+        previous = deepcopy(document)
+        apply_update(document, update)
+        return UpdateResultStandIn(
+            matched_count=1, modified_count=int(previous != document)
+        )
+
+    async def update_many(self, query: dict, update, session=None, **kwargs):
+        await self.__connect(query=query)
+        self.operations.append("update_many")
+        matched_count = 0
+        for document in self.documents:
+            if matches(document, query):
+                apply_update(document, update)
+                matched_count += 1
+        return UpdateResultStandIn(
+            matched_count=matched_count, modified_count=matched_count
+        )
+
+    async def bulk_write(self, requests: list, ordered=True, session=None, **kwargs):
+        await self.__connect()
+        self.operations.append("bulk_write")
+        matched_count = 0
+        modified_count = 0
+        for request in requests:
+            document = self.__find_document(request._filter)
+            if document is None:
+                continue
+            previous = deepcopy(document)
+            apply_update(document, request._doc)
+            matched_count += 1
+            modified_count += int(previous != document)
+        return BulkWriteResultStandIn(
+            matched_count=matched_count, modified_count=modified_count
+        )
+
+    async def find_one_and_update(
+        self,
+        query: dict,
+        update,
+        projection=None,
+        return_document=ReturnDocument.BEFORE,
+        session=None,
+        upsert=False,
+        **kwargs,
+    ):
+        await self.__connect(query=query)
+        self.operations.append("find_one_and_update")
+        document = self.__find_document(query)
+        if document is None and not upsert:
+            return None
+        if document is None:
+            document = {
+                key: deepcopy(value)
+                for key, value in query.items()
+                if not key.startswith("$") and not isinstance(value, dict)
+            }
+            document.setdefault("_id", ObjectId())
+            self.documents.append(document)
+            apply_update(document, update)
+            if return_document == ReturnDocument.AFTER:
+                return project(document, projection)
+            return None
+        previous = project(document, projection)
+        apply_update(document, update)
+        if return_document == ReturnDocument.AFTER:
+            return project(document, projection)
+        return previous
+
+
+class DatabaseStandIn(dict):
+    def __init__(self, client=None):
+        super().__init__()
+        self.client = client
+
+    def __missing__(self, name):
+        collection = CollectionStandIn(client=self.client)
+        self[name] = collection
+        return collection
+
+    async def command(self, name: str, *args, **kwargs):
+        if self.client is not None:
+            await self.client.connect()
+        return {"ok": 1.0}
+
+
+class SessionStandIn:
+    def __init__(self, client):
+        self.client = client
+        self.transactions = 0
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    async def with_transaction(self, callback):
+        snapshot = {
+            database_name: {
+                collection_name: deepcopy(collection.documents)
+                for collection_name, collection in database.items()
+            }
+            for database_name, database in self.client.items()
+        }
+        try:
+            result = await callback(self)
+        except Exception:
+            for database_name, database in self.client.items():
+                for collection_name, collection in database.items():
+                    collection.documents = snapshot.get(database_name, {}).get(
+                        collection_name, []
+                    )
+            raise
+        self.transactions += 1
+        return result
+
+
+class MongoClientStandIn(dict):
+    def __init__(
+        self, connect_latency_in_seconds: float = 0, fault_profile: FaultProfile = None
+    ):
+        super().__init__()
+        self.connect_latency_in_seconds = connect_latency_in_seconds
+        self.fault_profile = fault_profile
+        self.connections = 0
+        self.__connecting = None
+
+    @property
+    def admin(self):
+        return self["admin"]
+
+    async def connect(self):
+        if self.__connecting is None:
+            self.connections += 1
+            self.__connecting = asyncio.ensure_future(
+                asyncio.sleep(self.connect_latency_in_seconds)
+            )
+        await asyncio.shield(self.__connecting)
+
+    async def inject_fault(self, query: dict = None):
+        if self.fault_profile is None:
+            return
+        key = (query or {}).get("unique_id")
+        if await self.fault_profile.inject(key=key):
+            raise AutoReconnect("Injected Mongo fault")
+
+    def __missing__(self, name):
+        database = DatabaseStandIn(client=self)
+        self[name] = database
+        return database
+
+    async def start_session(self):
+        return SessionStandIn(self)
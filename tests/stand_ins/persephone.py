@@ -0,0 +1,44 @@
+import asyncio
+
+from tests.stand_ins.faults import FaultProfile
+
+
+class PersephoneStandIn:
+    def __init__(
+        self,
+        latency_in_seconds: float = 0,
+        failures: int = 0,
+        record_messages: bool = True,
+        fault_profile: FaultProfile = None,
+    ):
+        self.latency_in_seconds = latency_in_seconds
+        self.failures = failures
+        self.record_messages = record_messages
+        self.fault_profile = fault_profile
+        self.messages = []
+        self.calls = 0
+
+    async def send_to_persephone(
+        self, topic: str, partition: int, message: dict, schema_name: str
+    ):
+        self.calls += 1
+        if self.latency_in_seconds:
+            await asyncio.sleep(self.latency_in_seconds)
+        if self.fault_profile is not None and await self.fault_profile.inject(
+            key=message.get("unique_id")
+        ):
+            return False, "failed"
+        if self.failures:
+            self.failures -= 1
+            return False, "failed"
+        if not self.record_messages:
+            return True, "sent"
+        self.messages.append(
+            {
+                "topic": topic,
+                "partition": partition,
+                "message": message,
+                "schema_name": schema_name,
+            }
+        )
+        return True, "sent"
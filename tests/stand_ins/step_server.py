@@ -0,0 +1,63 @@
+import asyncio
+from random import Random
+
+from aiohttp import web
+
+from tests.stand_ins.faults import FaultProfile
+
+
+class StepServerStandIn:
+    def __init__(
+        self,
+        step_br: str = "finished",
+        step_us: str = "politically_exposed",
+        latency_in_seconds: float = 0,
+        handshake_latency_in_seconds: float = 0,
+        slow_ratio: float = 0,
+        slow_latency_in_seconds: float = 0,
+        seed: int = 0,
+        fault_profile: FaultProfile = None,
+    ):
+        self.steps = {"br": step_br, "us": step_us}
+        self.latency_in_seconds = latency_in_seconds
+        self.handshake_latency_in_seconds = handshake_latency_in_seconds
+        self.slow_ratio = slow_ratio
+        self.slow_latency_in_seconds = slow_latency_in_seconds
+        self.__random = Random(seed)
+        self.fault_profile = fault_profile
+        self.requests = 0
+        self.connections = set()
+        self.__runner = None
+
+    async def __handle_step(self, request: web.Request) -> web.Response:
+        self.requests += 1
+        if request.transport not in self.connections:
+            self.connections.add(request.transport)
+            if self.handshake_latency_in_seconds:
+                await asyncio.sleep(self.handshake_latency_in_seconds)
+        latency_in_seconds = self.latency_in_seconds
+        if self.slow_ratio and self.__random.random() < self.slow_ratio:
+            latency_in_seconds = self.slow_latency_in_seconds
+        if latency_in_seconds:
+            await asyncio.sleep(latency_in_seconds)
+        if self.fault_profile is not None and await self.fault_profile.inject(
+            key=request.headers.get("x_thebes_answer")
+        ):
+            return web.json_response({"error": "injected fault"}, status=503)
+        current_step = self.steps[request.match_info["region"]]
+        return web.json_response({"result": {"current_step": current_step}})
+
+    async def start(self) -> str:
+        app = web.Application()
+        app.router.add_route("*", "/steps_{region}", self.__handle_step)
+        self.__runner = web.AppRunner(app)
+        await self.__runner.setup()
+        site = web.TCPSite(self.__runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        return f"http://127.0.0.1:{port}"
+
+    async def stop(self):
+        if self.__runner is not None:
+            await self.__runner.cleanup()
+            self.__runner = None
@@ -0,0 +1,222 @@
+import logging.config
+from json import dumps, loads
+from unittest.mock import patch
+
+from decouple import RepositoryEnv, Config
+from pytest import mark
+
+with patch.object(RepositoryEnv, "__init__", return_value=None):
+    with patch.object(Config, "__init__", return_value=None):
+        with patch.object(Config, "__call__"):
+            with patch.object(logging.config, "dictConfig"):
+                from heimdall_client.bifrost import Heimdall, HeimdallStatusResponses
+                from etria_logger import Gladsheim
+                from src.domain.exceptions.model import SuitabilityRequiredError
+                from asgi import app
+                from src.infrastructures.loop_registry.infrastructure import (
+                    LoopResourceRegistry,
+                )
+                from src.services.employ_data.service import PoliticallyExposedService
+                from src.services.metrics.service import MetricsService
+                from src.services.warmup.service import WarmupService
+
+request_ok = {"is_politically_exposed": True, "politically_exposed_names": ["Giogio"]}
+decoded_jwt_ok = {
+    "is_payload_decoded": True,
+    "decoded_jwt": {"user": {"unique_id": "test"}},
+    "message": "Jwt decoded",
+}
+
+
+async def call_app(scope: dict, messages: list) -> list:
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        sent.append(message)
+
+    await app(scope, receive, send)
+    return sent
+
+
+async def call_http(method: str, path: str, body: bytes = b"") -> tuple:
+    scope = {
+        "type": "http",
+        "method": method,
+        "path": path,
+        "headers": [(b"x-thebes-answer", b"test")],
+    }
+    sent = await call_app(scope, [{"type": "http.request", "body": body}])
+    return sent[0]["status"], loads(sent[1]["body"])
+
+
+@mark.asyncio
+@patch.object(Heimdall, "decode_payload")
+@patch.object(PoliticallyExposedService, "update_politically_exposed_data_for_us")
+async def test_app_when_request_is_ok(
+    update_politically_exposed_data_for_us_mock, decode_payload_mock
+):
+    update_politically_exposed_data_for_us_mock.return_value = None
+    decode_payload_mock.return_value = (decoded_jwt_ok, HeimdallStatusResponses.SUCCESS)
+
+    status, body = await call_http(
+        "PUT", "/onboarding/politically_exposed_us", dumps(request_ok).encode()
+    )
+
+    assert status == 200
+    assert body == {
+        "result": None,
+        "message": "Register Updated.",
+        "success": True,
+        "code": 0,
+    }
+
+
+@mark.asyncio
+@patch.object(Gladsheim, "error")
+@patch.object(Heimdall, "decode_payload")
+@patch.object(PoliticallyExposedService, "update_politically_exposed_data_for_us")
+async def test_app_when_user_has_no_suitability(
+    update_politically_exposed_data_for_us_mock, decode_payload_mock, etria_mock
+):
+    update_politically_exposed_data_for_us_mock.side_effect = SuitabilityRequiredError()
+    decode_payload_mock.return_value = (decoded_jwt_ok, HeimdallStatusResponses.SUCCESS)
+
+    status, body = await call_http(
+        "PUT", "/onboarding/politically_exposed_us", dumps(request_ok).encode()
+    )
+
+    assert status == 401
+    assert body["code"] == 10
+
+
+@mark.asyncio
+@patch.object(Gladsheim, "error")
+async def test_app_when_body_is_not_json(etria_mock):
+    status, body = await call_http("PUT", "/onboarding/politically_exposed_us", b"{")
+
+    assert status == 400
+    assert body["code"] == 10
+    assert body["message"] == "Invalid parameters"
+    assert etria_mock.called
+
+
+@mark.asyncio
+@patch.object(Gladsheim, "error")
+async def test_app_when_body_is_not_a_json_object(etria_mock):
+    status, body = await call_http(
+        "PUT", "/onboarding/politically_exposed_us", dumps([request_ok]).encode()
+    )
+
+    assert status == 400
+    assert body["code"] == 10
+    assert body["message"] == "Invalid parameters"
+
+
+@mark.asyncio
+@patch.object(WarmupService, "get_readiness")
+async def test_app_readiness(get_readiness_mock):
+    get_readiness_mock.return_value = {"ready": False, "dependencies": {}}
+
+    status, body = await call_http("GET", "/readiness")
+
+    assert status == 503
+    assert body["success"] is False
+
+
+@mark.asyncio
+@patch.object(MetricsService, "get_prometheus_metrics")
+async def test_app_metrics(get_prometheus_metrics_mock):
+    get_prometheus_metrics_mock.return_value = "metric 1\n"
+    scope = {"type": "http", "method": "GET", "path": "/metrics/", "headers": []}
+
+    sent = await call_app(scope, [{"type": "http.request", "body": b""}])
+
+    assert sent[0]["status"] == 200
+    assert (b"content-type", b"text/plain; version=0.0.4; charset=utf-8") in sent[0][
+        "headers"
+    ]
+    assert sent[1]["body"] == b"metric 1\n"
+
+
+@mark.asyncio
+async def test_app_when_route_is_unknown():
+    status, body = await call_http("DELETE", "/onboarding/politically_exposed_us")
+
+    assert status == 404
+
+
+@mark.asyncio
+@patch.object(PoliticallyExposedService, "stop_outbox_relay")
+@patch.object(PoliticallyExposedService, "start_outbox_relay")
+@patch.object(LoopResourceRegistry, "close_loop_resources")
+@patch.object(WarmupService, "ensure_warm")
+async def test_app_lifespan(
+    ensure_warm_mock,
+    close_loop_resources_mock,
+    start_outbox_relay_mock,
+    stop_outbox_relay_mock,
+):
+    sent = await call_app(
+        {"type": "lifespan"},
+        [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}],
+    )
+
+    assert [message["type"] for message in sent] == [
+        "lifespan.startup.complete",
+        "lifespan.shutdown.complete",
+    ]
+    assert ensure_warm_mock.called
+    assert close_loop_resources_mock.called
+    assert start_outbox_relay_mock.called
+    assert stop_outbox_relay_mock.called
+
+
+def small_body_env(key, default=None, cast=None):
+    return 10 if key == "REQUEST_MAX_BODY_SIZE_IN_BYTES" else default
+
+
+@mark.asyncio
+@patch.object(Config, "__call__", side_effect=small_body_env)
+@patch.object(Gladsheim, "error")
+async def test_app_stops_reading_body_over_max_size(etria_mock, mocked_env):
+    scope = {
+        "type": "http",
+        "method": "PUT",
+        "path": "/onboarding/politically_exposed_us",
+        "headers": [(b"x-thebes-answer", b"test")],
+    }
+    messages = [
+        {"type": "http.request", "body": b"{" * 8, "more_body": True},
+        {"type": "http.request", "body": b"{" * 8, "more_body": True},
+        {"type": "http.request", "body": b"}", "more_body": False},
+    ]
+
+    sent = await call_app(scope, messages)
+
+    assert sent[0]["status"] == 413
+    assert loads(sent[1]["body"])["message"] == "Request body too large"
+    assert len(messages) == 1
+    assert etria_mock.called
+
+
+@mark.asyncio
+@patch.object(Config, "__call__", side_effect=small_body_env)
+@patch.object(Gladsheim, "error")
+async def test_app_rejects_declared_content_length_over_max_size(
+    etria_mock, mocked_env
+):
+    scope = {
+        "type": "http",
+        "method": "PUT",
+        "path": "/onboarding/politically_exposed_us",
+        "headers": [(b"x-thebes-answer", b"test"), (b"content-length", b"100")],
+    }
+    messages = [{"type": "http.request", "body": b"{" * 100}]
+
+    sent = await call_app(scope, messages)
+
+    assert sent[0]["status"] == 413
+    assert len(messages) == 1
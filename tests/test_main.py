@@ -13,12 +13,25 @@ with patch.object(RepositoryEnv, "__init__", return_value=None):
                 from heimdall_client.bifrost import Heimdall, HeimdallStatusResponses
                 from etria_logger import Gladsheim
                 from src.domain.exceptions.model import (
+                    DeadlineExceededError,
                     InvalidStepError,
                     InternalServerError,
                     SuitabilityRequiredError,
                 )
-                from main import update_politically_exposed_us
+                from main import update_politically_exposed_us, get_readiness
+                from src.infrastructures.loop_monitor.infrastructure import (
+                    BlockingCallDetector,
+                )
+                from src.infrastructures.profiler.infrastructure import (
+                    RequestProfiler,
+                    SlowRequestSampler,
+                )
+                from src.infrastructures.tracing.infrastructure import Tracer
+                from src.infrastructures.tracing_exporter.infrastructure import (
+                    InMemorySpanExporter,
+                )
                 from src.services.employ_data.service import PoliticallyExposedService
+                from src.services.warmup.service import WarmupService
 
 request_ok = {"is_politically_exposed": True, "politically_exposed_names": ["Giogio"]}
 requests_invalid = [
@@ -227,6 +240,129 @@ async def test_update_politically_exposed_us_when_internal_server_error_occurs(
         assert etria_mock.called
 
 
+@mark.asyncio
+@patch.object(Heimdall, "decode_payload")
+@patch.object(PoliticallyExposedService, "update_politically_exposed_data_for_us")
+async def test_update_politically_exposed_us_continues_incoming_trace(
+    update_politically_exposed_us_residence_mock,
+    decode_payload_mock,
+):
+    update_politically_exposed_us_residence_mock.return_value = None
+    decode_payload_mock.return_value = (decoded_jwt_ok, HeimdallStatusResponses.SUCCESS)
+    traceparent = "00-0af7651916cd43dd8448eb211c80319c-b7ad6b7169203331-01"
+    span_exporter = InMemorySpanExporter()
+
+    app = Flask(__name__)
+    with app.test_request_context(
+        json=request_ok,
+        headers=Headers({"x-thebes-answer": "test", "traceparent": traceparent}),
+    ).request as request, patch.object(Tracer, "enabled", True), patch.object(
+        Tracer, "exporters", [span_exporter]
+    ):
+
+        result = await update_politically_exposed_us(request)
+
+    (request_span,) = span_exporter.get_spans("request")
+    (jwt_span,) = span_exporter.get_spans("Jwt::build")
+    spans = span_exporter.spans
+    assert result.status_code == 200
+    assert request_span.context.trace_id == "0af7651916cd43dd8448eb211c80319c"
+    assert request_span.parent_span_id == "b7ad6b7169203331"
+    parent_span_ids = {span.context.span_id: span.parent_span_id for span in spans}
+    ancestor_span_id = jwt_span.parent_span_id
+    while ancestor_span_id != request_span.context.span_id:
+        ancestor_span_id = parent_span_ids[ancestor_span_id]
+    assert {span.context.trace_id for span in spans} == {
+        "0af7651916cd43dd8448eb211c80319c"
+    }
+
+
+@mark.asyncio
+@patch.object(Heimdall, "decode_payload")
+@patch.object(PoliticallyExposedService, "update_politically_exposed_data_for_us")
+async def test_update_politically_exposed_us_captures_slow_request_profile(
+    update_politically_exposed_us_residence_mock,
+    decode_payload_mock,
+):
+    update_politically_exposed_us_residence_mock.return_value = None
+    decode_payload_mock.return_value = (decoded_jwt_ok, HeimdallStatusResponses.SUCCESS)
+    sampler = SlowRequestSampler(
+        latency_threshold_in_seconds=0,
+        sample_ratio=1,
+        max_captures_per_minute=1,
+        ring_buffer_size=1,
+    )
+
+    app = Flask(__name__)
+    with app.test_request_context(
+        json=request_ok,
+        headers=Headers({"x-thebes-answer": "test"}),
+    ).request as request, patch.object(RequestProfiler, "enabled", True), patch.object(
+        RequestProfiler, "sampler", sampler
+    ):
+
+        await update_politically_exposed_us(request)
+        collapsed_stacks = RequestProfiler.get_collapsed_stacks()
+
+    assert "update_politically_exposed_us;request;auth;Jwt::build " in collapsed_stacks
+    assert (
+        "update_politically_exposed_us;request;schema_validation;"
+        "[cpu] pydantic_validation " in collapsed_stacks
+    )
+    assert "update_politically_exposed_us;[cpu] json_encoding " in collapsed_stacks
+
+
+@mark.asyncio
+@patch.object(Heimdall, "decode_payload")
+@patch.object(PoliticallyExposedService, "update_politically_exposed_data_for_us")
+async def test_update_politically_exposed_us_does_not_block_the_event_loop(
+    update_politically_exposed_us_residence_mock,
+    decode_payload_mock,
+):
+    update_politically_exposed_us_residence_mock.return_value = None
+    decode_payload_mock.return_value = (decoded_jwt_ok, HeimdallStatusResponses.SUCCESS)
+
+    app = Flask(__name__)
+    with app.test_request_context(
+        json=request_ok,
+        headers=Headers({"x-thebes-answer": "test"}),
+    ).request as request:
+
+        async with BlockingCallDetector(threshold_in_seconds=0.05) as detector:
+            result = await update_politically_exposed_us(request)
+
+    assert result.status_code == 200
+    assert detector.blocking_calls == []
+
+
+@mark.asyncio
+@patch.object(Gladsheim, "error")
+@patch.object(Heimdall, "decode_payload")
+@patch.object(PoliticallyExposedService, "update_politically_exposed_data_for_us")
+async def test_update_politically_exposed_us_when_deadline_is_exceeded(
+    update_politically_exposed_us_residence_mock,
+    decode_payload_mock,
+    etria_mock,
+):
+    update_politically_exposed_us_residence_mock.side_effect = DeadlineExceededError()
+    decode_payload_mock.return_value = (decoded_jwt_ok, HeimdallStatusResponses.SUCCESS)
+
+    app = Flask(__name__)
+    with app.test_request_context(
+        json=request_ok,
+        headers=Headers({"x-thebes-answer": "test"}),
+    ).request as request:
+
+        result = await update_politically_exposed_us(request)
+
+        assert result.status_code == 504
+        assert (
+            result.data
+            == b'{"result": null, "message": "Request deadline exceeded", "success": false, "code": 101}'
+        )
+        assert etria_mock.called
+
+
 @mark.asyncio
 @patch.object(Heimdall, "decode_payload")
 @patch.object(Gladsheim, "error")
@@ -253,3 +389,26 @@ async def test_update_politically_exposed_us_when_generic_exception_happens(
         )
         assert update_politically_exposed_us_residence_mock.called
         etria_mock.assert_called()
+
+
+@mark.asyncio
+@patch.object(WarmupService, "get_readiness")
+async def test_get_readiness(get_readiness_mock):
+    get_readiness_mock.return_value = {"ready": True, "dependencies": {}}
+
+    result = await get_readiness()
+
+    assert result.status_code == 200
+
+
+@mark.asyncio
+@patch.object(WarmupService, "get_readiness")
+async def test_get_readiness_when_dependencies_are_not_warm(get_readiness_mock):
+    get_readiness_mock.return_value = {
+        "ready": False,
+        "dependencies": {"mongo_db": {"status": "failed"}},
+    }
+
+    result = await get_readiness()
+
+    assert result.status_code == 503